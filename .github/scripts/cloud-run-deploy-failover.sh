@@ -224,11 +224,15 @@ while IFS=$'\t' read -r channel modal_app_name package_versions_json; do
   apply_worker_scaling_controls \
     "${worker_service}" \
     "${worker_scaling_concurrency_target}"
+  # Workers warm their parameter caches in the background after boot and
+  # report ready only once warm, so probe readiness rather than liveness:
+  # the revision takes no failover traffic while it is still cold.
   apply_startup_probe \
     "${worker_service}" \
     "${worker_probe_period_seconds}" \
     "${worker_probe_timeout_seconds}" \
-    "${worker_probe_failure_threshold}"
+    "${worker_probe_failure_threshold}" \
+    /readiness_check
 
   worker_url="$(
     "${gcloud_bin}" run services describe "${worker_service}" \
@@ -205,6 +205,7 @@ apply_startup_probe() {
   local period_seconds="${2:?period seconds is required}"
   local timeout_seconds="${3:?timeout seconds is required}"
   local failure_threshold="${4:?failure threshold is required}"
+  local path="${5:-/liveness_check}"
   local service_yaml
 
   service_yaml="$(mktemp)"
@@ -215,7 +216,7 @@ apply_startup_probe() {
   "${uv_bin}" run python "${startup_probe_script}" \
     --input-yaml "${service_yaml}" \
     --output-yaml "${service_yaml}" \
-    --path /liveness_check \
+    --path "${path}" \
     --period-seconds "${period_seconds}" \
     --timeout-seconds "${timeout_seconds}" \
     --failure-threshold "${failure_threshold}"
@@ -156,11 +156,12 @@ def test_cloud_run_deploy_failover_deploys_workers_manifest_and_gateway(
     assert "--scaling-concurrency-target 0.3" in log
     # Startup probes: applied to both workers and the gateway so a revision
     # whose app cannot serve HTTP fails the deploy instead of passing on the
-    # default TCP port check.
+    # default TCP port check. Workers are probed on readiness, which holds
+    # until their background warmup has built the parameter caches.
     assert log.count("cloud_run_apply_startup_probe.py") == 3
     assert (
         log.count(
-            "--path /liveness_check --period-seconds 5 "
+            "--path /readiness_check --period-seconds 5 "
             "--timeout-seconds 3 --failure-threshold 60"
         )
         == 2
@@ -0,0 +1,101 @@
+"""Axes scan latency and peak memory, chunked vs. one core expansion.
+
+Each case sweeps one adult's employment income over ``count`` points in
+a two-person US household requesting income tax, SNAP and net income.
+``single`` expands the whole grid in one simulation, as core does;
+``chunked`` evaluates it in slices sized to ``--memory-budget-mib``.
+Peak memory is the tracemalloc peak of one calculate (numpy reports its
+buffers to tracemalloc), measured on a separate, untimed run.
+"""
+
+import argparse
+import statistics
+import time
+import tracemalloc
+from unittest import mock
+
+from policyengine_household_api.axes import AxesChunkConfig
+from policyengine_household_api.country import COUNTRIES
+
+
+def _household(count: int) -> dict:
+    return {
+        "people": {
+            "adult": {
+                "age": {"2026": 40},
+                "employment_income": {"2026": None},
+            },
+            "child": {"age": {"2026": 5}},
+        },
+        "tax_units": {
+            "tax_unit": {
+                "members": ["adult", "child"],
+                "income_tax": {"2026": None},
+            }
+        },
+        "spm_units": {
+            "spm_unit": {"members": ["adult", "child"], "snap": {"2026": None}}
+        },
+        "households": {
+            "household": {
+                "members": ["adult", "child"],
+                "state_name": {"2026": "CA"},
+                "household_net_income": {"2026": None},
+            }
+        },
+        "axes": [
+            [
+                {
+                    "name": "employment_income",
+                    "count": count,
+                    "min": 0,
+                    "max": 200_000,
+                    "period": "2026",
+                }
+            ]
+        ],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--counts", type=int, nargs="+", default=[100, 1_000, 5_000]
+    )
+    parser.add_argument("--memory-budget-mib", type=int, default=128)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    country = COUNTRIES["us"]
+    configs = {
+        "single": AxesChunkConfig(memory_budget_bytes=2**62, workers=1),
+        "chunked": AxesChunkConfig(
+            memory_budget_bytes=args.memory_budget_mib * 1024 * 1024,
+            workers=1,
+        ),
+    }
+    # Untimed pass so formula and parameter caches are warm.
+    country.calculate(_household(2))
+
+    for count in args.counts:
+        household = _household(count)
+        for case, config in configs.items():
+            with mock.patch.object(country, "_axes_chunking", config):
+                seconds = []
+                for _ in range(args.repeats):
+                    started_at = time.perf_counter()
+                    country.calculate(household)
+                    seconds.append(time.perf_counter() - started_at)
+                tracemalloc.start()
+                country.calculate(household)
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+            print(
+                f"us sweep count={count:<6} {case:<8} "
+                f"p50 {statistics.median(seconds) * 1000:9.1f} ms  "
+                f"peak {peak / 2**20:8.1f} MiB  n={len(seconds)}"
+            )
+
+
+if __name__ == "__main__":
+    main()
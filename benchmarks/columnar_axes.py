@@ -0,0 +1,55 @@
+"""Axes scan response size, household vs. columnar format.
+
+Each case sweeps one adult's employment income over ``count`` points in
+the household of ``benchmarks.axes_chunking`` and serialises the
+response the way the endpoint does. ``household`` echoes the household
+with a list in every requested slot; ``columnar`` returns the swept
+axis once and each requested array keyed by variable, period and
+entity.
+"""
+
+import argparse
+import json
+import statistics
+import time
+
+from benchmarks.axes_chunking import _household
+from policyengine_household_api.country import (
+    COLUMNAR_FORMAT,
+    COUNTRIES,
+    HOUSEHOLD_FORMAT,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--counts", type=int, nargs="+", default=[100, 1_000, 5_000]
+    )
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    country = COUNTRIES["us"]
+    # Untimed pass so formula and parameter caches are warm.
+    country.calculate(_household(2))
+
+    for count in args.counts:
+        household = _household(count)
+        for response_format in (HOUSEHOLD_FORMAT, COLUMNAR_FORMAT):
+            result = country.calculate(
+                household, response_format=response_format
+            )
+            seconds = []
+            for _ in range(args.repeats):
+                started_at = time.perf_counter()
+                body = json.dumps({"status": "ok", "result": result})
+                seconds.append(time.perf_counter() - started_at)
+            print(
+                f"us sweep count={count:<6} {response_format:<9} "
+                f"{len(body) / 1024:9.1f} KiB  "
+                f"dumps p50 {statistics.median(seconds) * 1000:7.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
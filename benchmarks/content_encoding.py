@@ -0,0 +1,81 @@
+"""Response body size and codec time under each Content-Encoding.
+
+Each case sweeps one adult's employment income over ``count`` points in
+the household of ``benchmarks.axes_chunking`` and serializes the JSON
+response as the endpoint does, then compresses it with each encoding at
+the configured level: compressed size, compress time (worker) and
+decompress time (client).
+"""
+
+import argparse
+import gzip
+import statistics
+import time
+
+import zstandard
+
+from benchmarks.axes_chunking import _household
+from policyengine_household_api.country import COUNTRIES
+from policyengine_household_common import json_codec
+from policyengine_household_common.content_encoding import (
+    SUPPORTED_CONTENT_ENCODINGS,
+    compress_body,
+    compression_config,
+)
+
+DECOMPRESS = {
+    "gzip": gzip.decompress,
+    "zstd": zstandard.ZstdDecompressor().decompress,
+}
+
+
+def _p50_ms(function, repeats: int) -> float:
+    seconds = []
+    for _ in range(repeats):
+        started_at = time.perf_counter()
+        function()
+        seconds.append(time.perf_counter() - started_at)
+    return statistics.median(seconds) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--counts", type=int, nargs="+", default=[100, 1_000, 5_000]
+    )
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    config = compression_config()
+    country = COUNTRIES["us"]
+    for count in args.counts:
+        body = json_codec.dumps(
+            {
+                "status": "ok",
+                "message": None,
+                "result": country.calculate(_household(count)),
+                "policyengine_bundle": dict(country.policyengine_bundle),
+            }
+        )
+        print(
+            f"us sweep count={count:<6} identity {len(body) / 1024:9.1f} KiB"
+        )
+        for encoding in SUPPORTED_CONTENT_ENCODINGS:
+            compressed = compress_body(body, encoding, config)
+            compress_ms = _p50_ms(
+                lambda: compress_body(body, encoding, config), args.repeats
+            )
+            decompress_ms = _p50_ms(
+                lambda: DECOMPRESS[encoding](compressed), args.repeats
+            )
+            print(
+                f"us sweep count={count:<6} {encoding:<8} "
+                f"{len(compressed) / 1024:9.1f} KiB  "
+                f"ratio {len(body) / len(compressed):5.1f}  "
+                f"compress p50 {compress_ms:7.2f} ms  "
+                f"decompress p50 {decompress_ms:6.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""API startup time and memory per ``app.countries`` configuration.
+
+Each configuration starts a fresh interpreter that imports the API app
+(building the prewarmed countries), then serves one US calculate. It
+reports the time to import the app, resident memory once started, the
+first US calculate's latency (which builds the US system when it was
+not prewarmed) and resident memory after it.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+CONFIGURATIONS = {
+    "all, prewarm all": ("uk,us,ca,ng,il", "uk,us,ca,ng,il"),
+    "all, lazy": ("uk,us,ca,ng,il", ""),
+    "us, prewarm us": ("us", "us"),
+    "us, lazy": ("us", ""),
+}
+
+PROBE = """
+import json
+import time
+
+def rss_mib():
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+
+started_at = time.perf_counter()
+from policyengine_household_api.api import app
+startup_s = time.perf_counter() - started_at
+startup_rss = rss_mib()
+
+from tests.data.customer_households import amplifi_household
+
+client = app.test_client()
+started_at = time.perf_counter()
+response = client.post("/us/calculate", json={"household": amplifi_household})
+first_request_s = time.perf_counter() - started_at
+assert response.status_code == 200, response.status_code
+print(json.dumps({
+    "startup_s": startup_s,
+    "startup_rss": startup_rss,
+    "first_request_s": first_request_s,
+    "rss": rss_mib(),
+}))
+"""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--configurations",
+        nargs="+",
+        choices=list(CONFIGURATIONS),
+        default=list(CONFIGURATIONS),
+    )
+    args = parser.parse_args()
+
+    for name in args.configurations:
+        serve, prewarm = CONFIGURATIONS[name]
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE],
+            env={
+                **os.environ,
+                "APP__COUNTRIES__SERVE": serve,
+                "APP__COUNTRIES__PREWARM": prewarm,
+            },
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(
+            f"{name:<17} startup {result['startup_s']:6.1f} s  "
+            f"rss {result['startup_rss']:7.0f} MiB  "
+            f"first us calculate {result['first_request_s']:6.1f} s  "
+            f"rss {result['rss']:7.0f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Per-request latency of a household session's patch vs. a full request.
+
+Each customer household is posted to ``/us/calculate`` with
+``"start_session": true``; each round then changes one earnings input,
+sending it both as the full household (bypassing the result cache) and
+as a ``patch`` to the session, and checks the two results agree.
+"""
+
+import argparse
+import copy
+import statistics
+import time
+
+from policyengine_household_api.api import app, limiter
+from tests.data.customer_households import (
+    amplifi_household,
+    impactica_household,
+    my_friend_ben_household,
+)
+
+HOUSEHOLDS = {
+    "amplifi": amplifi_household,
+    "impactica": impactica_household,
+    "my_friend_ben": my_friend_ben_household,
+}
+
+EARNINGS = ("employment_income", "self_employment_income")
+
+
+def _earnings_slot(household: dict) -> tuple[str, str, str]:
+    for person_id, person in household["people"].items():
+        for variable_name in EARNINGS:
+            for period, value in person.get(variable_name, {}).items():
+                if isinstance(value, (int, float)):
+                    return person_id, variable_name, period
+    raise ValueError("household has no earnings input")
+
+
+def _post(client, request: dict, headers=None) -> tuple[float, dict]:
+    started_at = time.perf_counter()
+    response = client.post("/us/calculate", json=request, headers=headers)
+    seconds = time.perf_counter() - started_at
+    assert response.status_code == 200, response.text
+    return seconds, response.get_json()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeats", type=int, default=10)
+    args = parser.parse_args()
+
+    # Hundreds of requests in a few seconds; the per-client rate limit
+    # is not what is measured.
+    limiter.enabled = False
+    client = app.test_client()
+    no_cache = {"Cache-Control": "no-cache"}
+
+    for name, household in HOUSEHOLDS.items():
+        household = copy.deepcopy(household)
+        person_id, variable_name, period = _earnings_slot(household)
+        _, started = _post(
+            client, {"household": household, "start_session": True}
+        )
+        session_id = started["session_id"]
+        full, patched = [], []
+        for round_ in range(args.repeats):
+            value = 10_000 + 2_500 * round_
+            household["people"][person_id][variable_name][period] = value
+            seconds, expected = _post(
+                client, {"household": household}, no_cache
+            )
+            full.append(seconds)
+            seconds, result = _post(
+                client,
+                {
+                    "session_id": session_id,
+                    "patch": {
+                        "people": {person_id: {variable_name: {period: value}}}
+                    },
+                },
+            )
+            patched.append(seconds)
+            assert result["result"] == expected["result"], name
+        print(
+            f"{name:<14} full p50 {statistics.median(full) * 1000:7.1f} ms  "
+            f"patch p50 {statistics.median(patched) * 1000:7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Per-request cost of sending a household vs. a template's values.
+
+Each customer household is registered as a template, then posted to
+``/us/calculate`` through the Flask app both as the household and as
+``{template_id, values}``, bypassing the result cache. ``overhead``
+times the request with the calculation itself stubbed out -- request
+parsing, validation, the household walk and the computation plan, the
+template fill and the response -- and ``end to end`` the whole request.
+"""
+
+import argparse
+import json
+import statistics
+import time
+from unittest import mock
+
+from policyengine_household_api.api import app, limiter
+from policyengine_household_api.country import COUNTRIES
+from tests.data.customer_households import (
+    amplifi_household,
+    amplifi_household_2025,
+    impactica_household,
+    my_friend_ben_household,
+)
+
+HOUSEHOLDS = {
+    "amplifi": amplifi_household,
+    "amplifi_2025": amplifi_household_2025,
+    "impactica": impactica_household,
+    "my_friend_ben": my_friend_ben_household,
+}
+
+
+def _latencies(client, request: dict, repeats: int) -> list[float]:
+    headers = {"Cache-Control": "no-cache"}
+    seconds = []
+    for _ in range(repeats):
+        started_at = time.perf_counter()
+        response = client.post("/us/calculate", json=request, headers=headers)
+        seconds.append(time.perf_counter() - started_at)
+        assert response.status_code == 200, response.text
+    return seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeats", type=int, default=10)
+    args = parser.parse_args()
+
+    # Hundreds of requests in a few seconds; the per-client rate limit
+    # is not what is measured.
+    limiter.enabled = False
+    client = app.test_client()
+
+    for name, household in HOUSEHOLDS.items():
+        registered = client.post(
+            "/us/templates", json={"household": household}
+        )
+        assert registered.status_code == 200, registered.text
+        template = registered.get_json()["result"]
+        values = [
+            household[slot["entity_group"]][slot["entity"]][slot["variable"]][
+                slot["period"]
+            ]
+            for slot in template["inputs"]
+        ]
+        requests = {
+            "household": {"household": household},
+            "template": {
+                "template_id": template["template_id"],
+                "values": values,
+            },
+        }
+        # Untimed pass so formula and parameter caches are warm.
+        _latencies(client, requests["household"], 1)
+        for case, request in requests.items():
+            with mock.patch.object(
+                COUNTRIES["us"], "_calculate", return_value={}
+            ):
+                overhead = _latencies(client, request, args.repeats * 10)
+            end_to_end = _latencies(client, request, args.repeats)
+            print(
+                f"{name:<14} {case:<9} "
+                f"body {len(json.dumps(request)) / 1024:6.1f} KiB  "
+                f"overhead p50 {statistics.median(overhead) * 1000:6.2f} ms  "
+                f"end to end p50 {statistics.median(end_to_end) * 1000:7.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
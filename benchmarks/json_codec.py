@@ -0,0 +1,100 @@
+"""JSON encode/decode time per request hop, stdlib vs. orjson codec.
+
+For each customer household, every JSON step a calculate request takes
+on its way through the failover gateway to a Cloud Run worker and back
+is timed under both codecs:
+
+- ``request``: parse the request body (gateway, then worker).
+- ``dispatch``: encode the dispatch envelope in the gateway and parse
+  it in the worker, and the same for the response envelope.
+- ``response``: serialize the calculated response body.
+"""
+
+import argparse
+import statistics
+import time
+
+from policyengine_household_api.country import COUNTRIES
+from policyengine_household_common.dispatch_codec import (
+    encode_dispatch_request,
+    encode_dispatch_response,
+)
+from policyengine_household_common.json_codec import (
+    ORJSON_CODEC,
+    STDLIB_CODEC,
+)
+from tests.data.customer_households import (
+    amplifi_household,
+    impactica_household,
+    my_friend_ben_household,
+)
+
+HOUSEHOLDS = {
+    "amplifi": ("us", amplifi_household),
+    "impactica": ("us", impactica_household),
+    "my_friend_ben": ("us", my_friend_ben_household),
+}
+
+
+def _p50_ms(function, repeats: int) -> float:
+    seconds = []
+    for _ in range(repeats):
+        started_at = time.perf_counter()
+        function()
+        seconds.append(time.perf_counter() - started_at)
+    return statistics.median(seconds) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeats", type=int, default=200)
+    args = parser.parse_args()
+
+    for name, (country_id, household) in HOUSEHOLDS.items():
+        country = COUNTRIES[country_id]
+        request_body = STDLIB_CODEC.dumps({"household": household})
+        response_payload = {
+            "status": "ok",
+            "message": None,
+            "result": country.calculate(household),
+            "policyengine_bundle": dict(country.policyengine_bundle),
+        }
+        response_body = STDLIB_CODEC.dumps(response_payload)
+        for codec in (STDLIB_CODEC, ORJSON_CODEC):
+
+            def request():
+                for _ in range(2):
+                    codec.loads(request_body)
+
+            def dispatch():
+                envelope = codec.dumps(
+                    encode_dispatch_request(
+                        {"path": "us/calculate", "body": request_body}
+                    )
+                )
+                codec.loads(envelope)
+                envelope = codec.dumps(
+                    encode_dispatch_response(
+                        {"status_code": 200, "body": response_body}
+                    )
+                )
+                codec.loads(envelope)
+
+            timings = {
+                "request": _p50_ms(request, args.repeats),
+                "dispatch": _p50_ms(dispatch, args.repeats),
+                "response": _p50_ms(
+                    lambda: codec.dumps(response_payload), args.repeats
+                ),
+            }
+            print(
+                f"{name:<14} {codec.name:<7} "
+                + "  ".join(
+                    f"{stage} {ms:7.3f} ms" for stage, ms in timings.items()
+                )
+                + f"  total {sum(timings.values()):7.3f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Per-worker memory of a preloading gunicorn, with and without freezing.
+
+Starts ``gunicorn --preload`` serving the API, once as before (workers
+build parameter projections lazily and collect the shared heap) and
+once with ``policyengine_household_api.gunicorn_config`` (the master
+builds everything and freezes its heap before forking). After the
+workers answer a round of US calculates, it reports each worker's
+unique set size (memory only it holds), its proportional set size and
+the sum of all processes' PSS (the real total).
+"""
+
+import argparse
+import os
+from pathlib import Path
+import signal
+import subprocess
+import sys
+import time
+import urllib.request
+
+from policyengine_household_common.process_memory import process_memory
+
+from tests.data.customer_households import amplifi_household
+
+from policyengine_household_common import json_codec
+
+MODES = {
+    "preload": [],
+    "preload + freeze": [
+        "-c",
+        "python:policyengine_household_api.gunicorn_config",
+    ],
+}
+
+
+def _wait_until_up(url: str, process: subprocess.Popen) -> None:
+    while True:
+        if process.poll() is not None:
+            raise RuntimeError("gunicorn exited during startup")
+        try:
+            urllib.request.urlopen(f"{url}/liveness_check", timeout=5)
+            return
+        except OSError:
+            time.sleep(1)
+
+
+def _calculate(url: str) -> None:
+    request = urllib.request.Request(
+        f"{url}/us/calculate",
+        data=json_codec.dumps({"household": amplifi_household}),
+        headers={"Content-Type": "application/json"},
+    )
+    with urllib.request.urlopen(request, timeout=600) as response:
+        response.read()
+
+
+def _workers(master_pid: int) -> list[int]:
+    children = Path(f"/proc/{master_pid}/task/{master_pid}/children")
+    return [int(pid) for pid in children.read_text().split()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--requests", type=int, default=8)
+    parser.add_argument("--countries", default="us")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    url = f"http://127.0.0.1:{args.port}"
+    env = {
+        **os.environ,
+        "APP__COUNTRIES__SERVE": args.countries,
+        "APP__COUNTRIES__PREWARM": args.countries,
+    }
+    for mode, options in MODES.items():
+        process = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "gunicorn",
+                *options,
+                "--preload",
+                "--workers",
+                str(args.workers),
+                "--timeout",
+                "900",
+                "-b",
+                f"127.0.0.1:{args.port}",
+                "policyengine_household_api.api:app",
+            ],
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            _wait_until_up(url, process)
+            for _ in range(args.requests):
+                _calculate(url)
+            workers = _workers(process.pid)
+            memory = {pid: process_memory(pid) for pid in workers}
+            master = process_memory(process.pid)
+        finally:
+            process.send_signal(signal.SIGTERM)
+            process.wait()
+
+        total_pss = master["pss"] + sum(m["pss"] for m in memory.values())
+        print(f"{mode}: total pss {total_pss / 2**20:6.0f} MiB")
+        for pid, worker in memory.items():
+            print(
+                f"  worker {pid}  uss {worker['private'] / 2**20:6.0f} MiB  "
+                f"pss {worker['pss'] / 2**20:6.0f} MiB  "
+                f"rss {worker['rss'] / 2**20:6.0f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
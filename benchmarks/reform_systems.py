@@ -0,0 +1,79 @@
+"""Compare full-clone and overlay construction of reformed systems.
+
+Reproduces what a request with a never-seen ``policy`` used to pay
+(``TaxBenefitSystem.clone()`` plus a cold at-instant projection build)
+against ``reform_overlay.overlay_reform``, on a system prewarmed the way
+the Modal and Cloud Run workers prewarm theirs.
+"""
+
+import argparse
+import statistics
+import time
+
+from policyengine_household_api.country import COUNTRIES
+from policyengine_household_api.deployment import prewarm_parameter_caches
+from policyengine_household_api.reform_overlay import overlay_reform
+
+REFORMS = {
+    "us": {
+        "gov.irs.deductions.standard.amount.SINGLE": {
+            "2024-01-01.2024-12-31": 30_000,
+        },
+    },
+    "uk": {
+        "gov.hmrc.income_tax.allowances.personal_allowance.amount": {
+            "2024-01-01.2024-12-31": 15_000,
+        },
+    },
+}
+
+
+def _time(function) -> tuple[float, object]:
+    started_at = time.perf_counter()
+    result = function()
+    return time.perf_counter() - started_at, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--country", choices=sorted(REFORMS), default="us")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--instant", default="2024-06-01")
+    args = parser.parse_args()
+
+    country = COUNTRIES[args.country]
+    system = country.tax_benefit_system
+    prewarm_parameter_caches({args.country: system})
+    reform = country._cast_reform_values(REFORMS[args.country])
+
+    timings: dict[str, list[float]] = {
+        "clone: build": [],
+        "clone: first lookup": [],
+        "overlay: build": [],
+        "overlay: first lookup": [],
+    }
+    for _ in range(args.repeats):
+        seconds, cloned = _time(lambda: country._cloned_reform_system(reform))
+        timings["clone: build"].append(seconds)
+        seconds, _ = _time(
+            lambda: cloned.get_parameters_at_instant(args.instant)
+        )
+        timings["clone: first lookup"].append(seconds)
+
+        seconds, overlay = _time(lambda: overlay_reform(system, reform))
+        timings["overlay: build"].append(seconds)
+        seconds, _ = _time(
+            lambda: overlay.get_parameters_at_instant(args.instant)
+        )
+        timings["overlay: first lookup"].append(seconds)
+
+    for case, seconds in timings.items():
+        print(
+            f"{args.country} {case:<22} "
+            f"median {statistics.median(seconds) * 1000:10.1f} ms  "
+            f"min {min(seconds) * 1000:10.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Calculate response encoding time and size: JSON, MessagePack, Arrow.
+
+Each case sweeps one adult's employment income over ``count`` points in
+the household of ``benchmarks.axes_chunking`` and encodes the response
+body the way the endpoint does for each ``Accept`` type: the echoed
+household as JSON and MessagePack, and the columnar result as JSON,
+MessagePack and an Arrow IPC stream.
+"""
+
+import argparse
+import statistics
+import time
+
+from benchmarks.axes_chunking import _household
+from policyengine_household_api.country import (
+    COLUMNAR_FORMAT,
+    COUNTRIES,
+    HOUSEHOLD_FORMAT,
+)
+from policyengine_household_api.response_encoding import (
+    ARROW_STREAM_MEDIA_TYPE,
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    encode_response_body,
+)
+
+MEDIA_TYPES = {
+    HOUSEHOLD_FORMAT: (JSON_MEDIA_TYPE, MSGPACK_MEDIA_TYPE),
+    COLUMNAR_FORMAT: (
+        JSON_MEDIA_TYPE,
+        MSGPACK_MEDIA_TYPE,
+        ARROW_STREAM_MEDIA_TYPE,
+    ),
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--counts", type=int, nargs="+", default=[100, 1_000, 5_000]
+    )
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    country = COUNTRIES["us"]
+    for count in args.counts:
+        household = _household(count)
+        for response_format, media_types in MEDIA_TYPES.items():
+            payload = {
+                "status": "ok",
+                "message": None,
+                "result": country.calculate(
+                    household, response_format=response_format
+                ),
+                "policyengine_bundle": dict(country.policyengine_bundle),
+            }
+            for media_type in media_types:
+                # Untimed pass so lazy imports are not counted.
+                body = encode_response_body(payload, media_type)
+                seconds = []
+                for _ in range(args.repeats):
+                    started_at = time.perf_counter()
+                    encode_response_body(payload, media_type)
+                    seconds.append(time.perf_counter() - started_at)
+                print(
+                    f"us sweep count={count:<6} {response_format:<9} "
+                    f"{media_type:<36} {len(body) / 1024:9.1f} KiB  "
+                    f"encode p50 {statistics.median(seconds) * 1000:7.2f} ms"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""Result extraction cost for customer households with many outputs.
+
+The amplifi and my_friend_ben households request dozens of outputs per
+entity. Each household's simulation is built and fully calculated once;
+the timed part is turning the calculated arrays into the response
+household, through ``PolicyEngineCountry._calculate`` (one calculate
+and conversion per requested array) and through the per-slot loop it
+replaced (a dpath scan for requested values, then one calculate and
+conversion per requested entity value). The ``x<N>`` cases stack N
+copies of a household the way ``calculate_batch`` does, where the
+per-slot loop's index lookups and list conversions grow with the
+number of entities.
+"""
+
+import argparse
+import json
+import statistics
+import time
+from unittest import mock
+
+import dpath
+from policyengine_core.model_api import Enum
+
+from policyengine_household_api.batch import stack_households
+from policyengine_household_api.country import (
+    COUNTRIES,
+    _normalize_period_keys,
+    get_requested_computations,
+)
+from tests.data.customer_households.amplifi import (
+    amplifi_household,
+    amplifi_household_2025,
+)
+from tests.data.customer_households.my_friend_ben import (
+    my_friend_ben_household,
+)
+
+HOUSEHOLDS = {
+    "amplifi": amplifi_household,
+    "amplifi_2025": amplifi_household_2025,
+    "my_friend_ben": my_friend_ben_household,
+}
+
+
+def _per_slot_extraction(system, simulation, household: dict) -> dict:
+    household = json.loads(json.dumps(household))
+    for path, _ in dpath.search(
+        household, "*/*/*/*", afilter=lambda t: t is None, yielded=True
+    ):
+        entity_plural, entity_id, variable_name, period = path.split("/")
+        variable = system.get_variable(variable_name)
+        result = simulation.calculate(variable_name, period)
+        entity_index = simulation.get_population(entity_plural).get_index(
+            entity_id
+        )
+        if variable.value_type == Enum:
+            value = result.decode()[entity_index].name
+        elif variable.value_type is float:
+            value = float(str(result[entity_index]))
+        elif variable.value_type is str:
+            value = str(result[entity_index])
+        else:
+            value = result.tolist()[entity_index]
+        household[entity_plural][entity_id][variable_name][period] = value
+    return household
+
+
+def _latencies(extract, repeats: int) -> list[float]:
+    seconds = []
+    for _ in range(repeats):
+        started_at = time.perf_counter()
+        extract()
+        seconds.append(time.perf_counter() - started_at)
+    return seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeats", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, default=50)
+    args = parser.parse_args()
+
+    country = COUNTRIES["us"]
+    cases = dict(HOUSEHOLDS)
+    for name, household in HOUSEHOLDS.items():
+        cases[f"{name} x{args.batch_size}"] = stack_households(
+            [household] * args.batch_size, country.tax_benefit_system
+        ).household
+
+    for name, household in cases.items():
+        system, simulation = country._build_simulation(
+            _normalize_period_keys(household, country.tax_benefit_system),
+            None,
+        )
+        # Untimed pass: every requested array is calculated and cached
+        # on the simulation before either extraction runs.
+        _per_slot_extraction(system, simulation, household)
+
+        with (
+            mock.patch.object(
+                country,
+                "_build_simulation",
+                lambda *_: (system, simulation),
+            ),
+            mock.patch(
+                "policyengine_household_api.country._split_year_inputs",
+                return_value=(household, {}),
+            ),
+        ):
+            timings = {
+                "grouped": _latencies(
+                    lambda: country._calculate(household, None),
+                    args.repeats,
+                ),
+            }
+        timings["per_slot"] = _latencies(
+            lambda: _per_slot_extraction(system, simulation, household),
+            args.repeats,
+        )
+        outputs = len(get_requested_computations(household))
+        for case, seconds in timings.items():
+            print(
+                f"us {name:<18} outputs={outputs:<5} {case:<9} "
+                f"p50 {statistics.median(seconds) * 1000:8.2f} ms  "
+                f"max {max(seconds) * 1000:8.2f} ms  "
+                f"n={len(seconds)}"
+            )
+
+
+if __name__ == "__main__":
+    main()
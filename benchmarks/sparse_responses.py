@@ -0,0 +1,65 @@
+"""Calculate response size and latency, household vs. sparse format.
+
+Each customer household is posted to ``/us/calculate`` through the
+Flask app, bypassing the result cache, so the timing covers request
+parsing, validation, the simulation and response serialization.
+``household`` echoes every input with the requested values filled in;
+``sparse`` returns the requested values alone.
+"""
+
+import argparse
+import statistics
+import time
+
+from policyengine_household_api.api import app
+from policyengine_household_api.country import (
+    HOUSEHOLD_FORMAT,
+    SPARSE_FORMAT,
+)
+from tests.data.customer_households import (
+    amplifi_household,
+    amplifi_household_2025,
+    impactica_household,
+    my_friend_ben_household,
+)
+
+HOUSEHOLDS = {
+    "amplifi": amplifi_household,
+    "amplifi_2025": amplifi_household_2025,
+    "impactica": impactica_household,
+    "my_friend_ben": my_friend_ben_household,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeats", type=int, default=10)
+    args = parser.parse_args()
+
+    client = app.test_client()
+    headers = {"Cache-Control": "no-cache"}
+
+    for name, household in HOUSEHOLDS.items():
+        request = {"household": household}
+        # Untimed pass so formula and parameter caches are warm.
+        client.post("/us/calculate", json=request, headers=headers)
+        for response_format in (HOUSEHOLD_FORMAT, SPARSE_FORMAT):
+            seconds = []
+            for _ in range(args.repeats):
+                started_at = time.perf_counter()
+                response = client.post(
+                    f"/us/calculate?format={response_format}",
+                    json=request,
+                    headers=headers,
+                )
+                seconds.append(time.perf_counter() - started_at)
+                assert response.status_code == 200, response.text
+            print(
+                f"{name:<14} {response_format:<9} "
+                f"{len(response.data) / 1024:7.1f} KiB  "
+                f"p50 {statistics.median(seconds) * 1000:7.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Startup of every country with its parameter caches, by worker count.
+
+Each worker count starts a fresh interpreter that runs what a Modal
+snapshot build runs: ``start_countries`` over every country with the
+full parameter prewarm window. It reports the wall time, the summed
+per-country step times (what building them one after another costs)
+and the slowest country's timeline.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+PROBE = """
+import json
+import time
+
+from policyengine_household_api.deployment import parameter_prewarm_instants
+from policyengine_household_api.startup import start_countries
+
+started_at = time.perf_counter()
+timeline = start_countries(instants=parameter_prewarm_instants())
+wall_s = time.perf_counter() - started_at
+print(json.dumps({"wall_s": wall_s, **timeline.fields()}))
+"""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", nargs="+", type=int, default=[1, 5])
+    args = parser.parse_args()
+
+    print(f"cpus {os.cpu_count()}")
+    for workers in args.workers:
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE],
+            env={**os.environ, "APP__STARTUP__WORKERS": str(workers)},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        countries = result["countries"]
+        slowest = max(countries, key=lambda c: countries[c]["total_ms"])
+        steps = ", ".join(
+            f"{name[: -len('_ms')]} {duration / 1000:.1f}s"
+            for name, duration in countries[slowest].items()
+            if name.endswith("_ms") and name != "total_ms"
+        )
+        summed = sum(c["total_ms"] for c in countries.values()) / 1000
+        print(
+            f"workers {workers}  wall {result['wall_s']:6.1f} s  "
+            f"summed steps {summed:6.1f} s  slowest {slowest} ({steps})"
+        )
+
+
+if __name__ == "__main__":
+    main()
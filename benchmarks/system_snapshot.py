@@ -0,0 +1,79 @@
+"""Cloud Run worker prewarm with and without a system snapshot.
+
+Writes each country's system snapshot to a temporary directory, as the
+worker image build does, then starts a fresh interpreter per case that
+builds the country and prewarms the full parameter instant window:
+once building every projection, once loading them from the snapshot.
+It reports the snapshot's size and each case's step timeline.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from policyengine_household_api.system_snapshot import snapshot_path
+
+WRITE = """
+import sys
+from policyengine_household_api.deployment import write_system_snapshots
+write_system_snapshots(sys.argv[1], workers=1)
+"""
+
+PROBE = """
+import json
+import sys
+
+from policyengine_household_api.deployment import parameter_prewarm_instants
+from policyengine_household_api.startup import start_countries
+
+timeline = start_countries(
+    [sys.argv[1]],
+    instants=parameter_prewarm_instants(),
+    snapshot_dir=sys.argv[2] or None,
+)
+print(json.dumps(timeline.fields()["countries"][sys.argv[1]]))
+"""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--countries", nargs="+", default=["us", "uk"])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        subprocess.run(
+            [sys.executable, "-c", WRITE, directory],
+            env={
+                **os.environ,
+                "APP__COUNTRIES__SERVE": ",".join(args.countries),
+            },
+            capture_output=True,
+            check=True,
+        )
+        for country_id in args.countries:
+            size = snapshot_path(directory, country_id).stat().st_size
+            print(f"{country_id} snapshot {size / 2**20:.0f} MiB")
+            for case, snapshot_dir in (
+                ("built", ""),
+                ("snapshot", directory),
+            ):
+                output = subprocess.run(
+                    [sys.executable, "-c", PROBE, country_id, snapshot_dir],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                ).stdout
+                result = json.loads(output.strip().splitlines()[-1])
+                steps = "  ".join(
+                    f"{name[: -len('_ms')]} {duration / 1000:5.1f} s"
+                    for name, duration in result.items()
+                    if name.endswith("_ms") and name != "total_ms"
+                )
+                print(f"  {case:<8}  {steps}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Per-request UK calculate latency: shared-system factory vs wrapper.
+
+Calculates every household in ``tests/data/uk_households.py`` under
+current law and under the personal allowance reform, once through
+``PolicyEngineCountry``'s UK simulation factory and once through
+policyengine-uk's own ``Simulation`` constructor (a fresh system per
+request, the path the API used before).
+"""
+
+import argparse
+import statistics
+import time
+from unittest import mock
+
+from policyengine_household_api.country import (
+    COUNTRIES,
+    _set_spread_year_inputs,
+)
+from policyengine_household_api.deployment import prewarm_parameter_caches
+from tests.data import uk_households
+
+HOUSEHOLDS = {
+    name: household
+    for name, household in vars(uk_households).items()
+    if name.startswith("uk_household_")
+}
+REFORMS = {
+    "baseline": None,
+    "personal_allowance": uk_households.uk_personal_allowance_reform,
+}
+
+
+def _wrapper_simulation(country):
+    def build(normalized_household, reform, spread=None):
+        scenario = None
+        if reform:
+            scenario = country.country_package.Scenario.from_reform(reform)
+            scenario.applied_before_data_load = True
+        simulation = country.country_package.Simulation(
+            scenario=scenario,
+            situation=normalized_household,
+        )
+        if spread:
+            _set_spread_year_inputs(simulation, spread)
+        return country.tax_benefit_system, simulation
+
+    return build
+
+
+def _latencies(country, reform, repeats: int) -> list[float]:
+    seconds = []
+    for _ in range(repeats):
+        for household in HOUSEHOLDS.values():
+            started_at = time.perf_counter()
+            country.calculate(household, reform)
+            seconds.append(time.perf_counter() - started_at)
+    return seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    country = COUNTRIES["uk"]
+    prewarm_parameter_caches({"uk": country.tax_benefit_system})
+
+    for reform_name, reform in REFORMS.items():
+        # One untimed pass so both paths start from built caches.
+        country.calculate(next(iter(HOUSEHOLDS.values())), reform)
+        cases = {"factory": _latencies(country, reform, args.repeats)}
+        with mock.patch.object(
+            country, "_build_simulation", _wrapper_simulation(country)
+        ):
+            cases["wrapper"] = _latencies(country, reform, args.repeats)
+        for case, seconds in cases.items():
+            print(
+                f"uk {reform_name:<18} {case:<8} "
+                f"p50 {statistics.median(seconds) * 1000:8.1f} ms  "
+                f"max {max(seconds) * 1000:8.1f} ms  "
+                f"n={len(seconds)}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""First-request latency after the Modal snapshot hook, with and without
+the warm-up corpus.
+
+Each mode starts a fresh interpreter serving the US and UK that runs
+what the snapshot hook runs -- import the API app, prewarm the
+parameter caches and, with the corpus, replay it -- so it is in the
+state a restored container starts in. It then times the first
+calculate of a household outside the corpus per country, and a second
+US one for the fully warm latency.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+MODES = ("parameters", "households")
+
+PROBE = """
+import json
+import sys
+import time
+
+from policyengine_household_api.api import app
+from policyengine_household_api.deployment import prewarm_parameter_caches
+from policyengine_household_api.warmup import replay_corpus
+
+from tests.data.uk_households import uk_household_single_adult_no_income
+
+US_HOUSEHOLD = {
+    "people": {
+        "parent": {
+            "age": {"2026": 35},
+            "employment_income": {"2026": 28_000},
+        },
+        "child": {"age": {"2026": 6}},
+    },
+    "tax_units": {
+        "tax_unit": {
+            "members": ["parent", "child"],
+            "eitc": {"2026": None},
+            "income_tax": {"2026": None},
+        }
+    },
+    "spm_units": {
+        "spm_unit": {
+            "members": ["parent", "child"],
+            "snap": {"2026": None},
+        }
+    },
+    "households": {
+        "household": {
+            "members": ["parent", "child"],
+            "state_code_str": {"2026": "TX"},
+        }
+    },
+}
+
+started_at = time.perf_counter()
+prewarm_parameter_caches()
+prewarm_s = time.perf_counter() - started_at
+started_at = time.perf_counter()
+if sys.argv[1] == "households":
+    replay_corpus(app)
+corpus_s = time.perf_counter() - started_at
+
+client = app.test_client()
+headers = {"Cache-Control": "no-cache"}
+
+
+def calculate(country_id, household):
+    started_at = time.perf_counter()
+    response = client.post(
+        f"/{country_id}/calculate",
+        json={"household": household},
+        headers=headers,
+    )
+    assert response.status_code == 200, response.text
+    return time.perf_counter() - started_at
+
+
+print(json.dumps({
+    "prewarm_s": prewarm_s,
+    "corpus_s": corpus_s,
+    "first_us_s": calculate("us", US_HOUSEHOLD),
+    "first_uk_s": calculate("uk", uk_household_single_adult_no_income),
+    "second_us_s": calculate("us", US_HOUSEHOLD),
+}))
+"""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--modes", nargs="+", choices=MODES, default=list(MODES)
+    )
+    args = parser.parse_args()
+
+    for mode in args.modes:
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE, mode],
+            env={**os.environ, "APP__COUNTRIES__SERVE": "us,uk"},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(
+            f"{mode:<10} prewarm {result['prewarm_s']:5.1f} s  "
+            f"corpus {result['corpus_s']:5.1f} s  "
+            f"first us {result['first_us_s'] * 1000:7.0f} ms  "
+            f"first uk {result['first_uk_s'] * 1000:7.0f} ms  "
+            f"second us {result['second_us_s'] * 1000:7.0f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -17,9 +17,14 @@ import flask
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 import yaml
+from policyengine_household_common.content_encoding import (
+    init_content_encoding,
+)
+from policyengine_household_common.json_codec import JsonCodecProvider
 from policyengine_household_common.observability.flask import (
     init_observability,
 )
+from policyengine_observability import set_attribute
 
 # Internal imports
 from .decorators.auth import ANALYTICS_READ_SCOPE, create_auth_decorator
@@ -29,12 +34,22 @@ from policyengine_household_analytics.analytics_setup import (
 from policyengine_household_api.decorators.analytics import (
     log_analytics_if_enabled,
 )
+from policyengine_household_api.preload import (
+    memory_usage as get_memory_usage,
+)
+from policyengine_household_api.warmup import (
+    WARMUP,
+    replaying,
+    warm_systems,
+)
 
 # Endpoints
 from .endpoints import (
     get_home,
     get_calculate_analytics_requests,
     get_calculate,
+    get_calculate_batch,
+    get_templates,
 )
 
 # Create the authentication decorator (will be either Auth0 or no-op based on config)
@@ -45,6 +60,7 @@ print("Initialising API...")
 
 logger = logging.getLogger(__name__)
 app = application = flask.Flask(__name__)
+app.json = JsonCodecProvider(app)
 OPENAPI_SPEC_PATH = Path(__file__).with_name("openapi_spec.yaml")
 PACKAGE_NAME = "policyengine-household-api"
 PYPROJECT_PATH = Path(__file__).resolve().parents[1] / "pyproject.toml"
@@ -58,6 +74,9 @@ init_observability(app, service_role="api")
 app.config["MAX_CONTENT_LENGTH"] = int(
     os.getenv("MAX_CONTENT_LENGTH", 10 * 1024 * 1024)
 )
+# gzip/zstd request bodies are inflated before that limit is applied,
+# and responses are compressed for the client's ``Accept-Encoding``.
+init_content_encoding(app)
 
 try:
     configure_analytics_db_if_enabled(app)
@@ -70,6 +89,16 @@ except Exception:
 
 CORS(app)
 
+# Countries in ``app.countries.prewarm`` are built now, side by side;
+# every other served country is built by the first request that needs it.
+warm_systems()
+
+
+@app.before_request
+def set_warm_level():
+    set_attribute("warm_level", WARMUP.level)
+
+
 # Use in-memory storage for rate limiting
 # Note that this provides limits per-instance;
 # rate limits not shared if scaling more than 1 instance.
@@ -79,6 +108,8 @@ limiter = Limiter(
     default_limits=[],
     storage_uri="memory://",
 )
+# Corpus households replayed to warm the process are not client traffic.
+limiter.request_filter(replaying)
 
 app.route("/", methods=["GET"])(get_home)
 
@@ -91,6 +122,21 @@ def calculate(country_id):
     return get_calculate(country_id)
 
 
+@app.route("/<country_id>/calculate_batch", methods=["POST"])
+@require_auth_if_enabled()
+@limiter.limit("60 per minute")
+@log_analytics_if_enabled
+def calculate_batch(country_id):
+    return get_calculate_batch(country_id)
+
+
+@app.route("/<country_id>/templates", methods=["POST"])
+@require_auth_if_enabled()
+@limiter.limit("60 per minute")
+def templates(country_id):
+    return get_templates(country_id)
+
+
 @app.route("/analytics/calculate/requests", methods=["GET"])
 @require_auth_if_enabled([ANALYTICS_READ_SCOPE])
 @limiter.limit("60 per minute")
@@ -107,11 +153,21 @@ def liveness_check():
 
 @app.route("/readiness_check", methods=["GET"])
 def readiness_check():
+    # Not ready until warmed to ``app.warmup.ready_level``; the 503 body
+    # reports how far the warmup has got.
+    if not WARMUP.ready():
+        return flask.jsonify(WARMUP.status()), 503
     return flask.Response(
         "OK", status=200, headers={"Content-Type": "text/plain"}
     )
 
 
+@app.route("/memory_usage", methods=["GET"])
+@require_auth_if_enabled()
+def memory_usage():
+    return flask.jsonify(get_memory_usage())
+
+
 @app.route("/specification", methods=["GET"])
 def specification():
     spec = load_openapi_spec()
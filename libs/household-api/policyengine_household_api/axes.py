@@ -0,0 +1,379 @@
+"""Evaluate large axes scans in memory-bounded chunks.
+
+policyengine-core expands an axes scan by replicating the whole
+situation once per grid cell inside a single simulation, so its memory
+grows with ``count_0 * count_1 * ...`` times every variable the scan
+touches. A scan larger than the configured memory budget is evaluated
+as a sequence of smaller simulations instead. Each chunk is the
+household replicated for a contiguous run of grid cells (stacked the
+way ``batch`` stacks households), with every swept variable set to the
+exact value core's expansion gives that cell. Requested arrays are then
+concatenated in cell order, which is the layout core's own expansion
+produces, so callers reshape them exactly as they would an unchunked
+result.
+
+Scans that fit in one chunk, or whose axes core would interpret
+differently from the plain list-of-parallel-axes form, are left to
+core's expansion.
+"""
+
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import math
+
+import numpy as np
+
+from policyengine_household_common.config_loader import get_config_value
+
+from policyengine_household_api.batch import stack_households
+
+DEFAULT_MEMORY_BUDGET_BYTES = 128 * 1024 * 1024
+DEFAULT_WORKERS = 1
+
+# Simulation memory per entity instance per grid cell, measured on US
+# earnings sweeps (see benchmarks/axes_chunking.py) and rounded up.
+ESTIMATED_BYTES_PER_ENTITY_CELL = 16 * 1024
+
+
+@dataclass(frozen=True)
+class AxesChunkConfig:
+    memory_budget_bytes: int
+    workers: int
+
+
+def axes_chunk_config() -> AxesChunkConfig:
+    return AxesChunkConfig(
+        memory_budget_bytes=int(
+            get_config_value(
+                "app.axes.memory_budget_bytes", DEFAULT_MEMORY_BUDGET_BYTES
+            )
+        ),
+        workers=max(
+            1, int(get_config_value("app.axes.workers", DEFAULT_WORKERS))
+        ),
+    )
+
+
+@dataclass(frozen=True)
+class _SweptVariable:
+    """One axis: a variable set on one entity instance in every cell."""
+
+    entity_plural: str
+    entity_id: str
+    name: str
+    period: str
+    value_type: type
+    dtype: np.dtype
+    dimension: int
+    count: int
+    min: float
+    max: float
+
+
+@dataclass(frozen=True)
+class AxesGrid:
+    """The grid core expands a household's axes into.
+
+    ``prototype`` is the household without its ``axes``; ``shape`` is
+    the count of each perpendicular dimension, in payload order. Cells
+    are numbered in core's expansion order.
+    """
+
+    prototype: dict
+    swept: tuple[_SweptVariable, ...]
+    shape: tuple[int, ...]
+    cell_count: int
+
+    def values(self, axis: _SweptVariable, cells: range) -> np.ndarray:
+        # Mirrors `SimulationBuilder.expand_axes`: a single dimension is a
+        # linspace; a grid scales `meshgrid` (default "xy" indexing)
+        # indices by the axis step, operation for operation.
+        if len(self.shape) == 1:
+            return np.linspace(axis.min, axis.max, num=axis.count)[
+                cells.start : cells.stop
+            ]
+        if axis.count == 1:
+            return np.full(len(cells), axis.min, dtype=float)
+        mesh_shape = list(self.shape)
+        mesh_position = axis.dimension
+        if len(mesh_shape) > 1:
+            mesh_shape[0], mesh_shape[1] = mesh_shape[1], mesh_shape[0]
+            mesh_position = {0: 1, 1: 0}.get(mesh_position, mesh_position)
+        mesh = np.unravel_index(
+            np.arange(cells.start, cells.stop), mesh_shape
+        )[mesh_position].astype(float)
+        return axis.min + mesh * (axis.max - axis.min) / (axis.count - 1)
+
+    def coordinates(self) -> list[dict]:
+        """Each axis's value at every cell, in cell order, as an array.
+
+        Values are the points requested along the axis; integer
+        variables get them truncated, as the engine does.
+        """
+        coordinates = []
+        for axis in self.swept:
+            values = self.values(axis, range(self.cell_count))
+            if axis.value_type is int:
+                values = values.astype(axis.dtype)
+            coordinates.append(
+                {
+                    "name": axis.name,
+                    "period": axis.period,
+                    "entity": axis.entity_id,
+                    "values": values,
+                }
+            )
+        return coordinates
+
+
+@dataclass(frozen=True)
+class AxesScan:
+    """An axes grid split into runs of ``chunk_cells`` cells."""
+
+    grid: AxesGrid
+    chunk_cells: int
+
+    def chunks(self) -> list[range]:
+        return [
+            range(start, min(start + self.chunk_cells, self.grid.cell_count))
+            for start in range(0, self.grid.cell_count, self.chunk_cells)
+        ]
+
+    def situation(self, cells: range, system) -> dict:
+        """Build the stacked situation for ``cells``, in cell order."""
+        grid = self.grid
+        stacked = stack_households([grid.prototype] * len(cells), system)
+        stacked_ids = {
+            (entity_plural, index, entity_id): stacked_id
+            for (entity_plural, stacked_id), (
+                index,
+                entity_id,
+            ) in stacked.entity_ids.items()
+        }
+        for axis in grid.swept:
+            values = grid.values(axis, cells).astype(axis.dtype).tolist()
+            for index, value in enumerate(values):
+                # `stack_households` shares period maps with the
+                # prototype, so the swept one is replaced, not edited.
+                entity = stacked.household[axis.entity_plural][
+                    stacked_ids[(axis.entity_plural, index, axis.entity_id)]
+                ]
+                entity[axis.name] = {
+                    **(entity.get(axis.name) or {}),
+                    axis.period: value,
+                }
+        return stacked.household
+
+
+def axes_grid(household: dict, system, default_period) -> AxesGrid | None:
+    """Mirror core's expansion of ``household``'s axes, or return ``None``.
+
+    ``None`` means the axes are not in the shape this module mirrors:
+    each entry a list of parallel axes with numeric bounds, on variables
+    of the entity the entry's first axis belongs to.
+    """
+    dimensions = household.get("axes")
+    if not isinstance(dimensions, list) or not dimensions:
+        return None
+    prototype = {
+        key: value for key, value in household.items() if key != "axes"
+    }
+
+    shape = []
+    swept = []
+    for dimension, parallel_axes in enumerate(dimensions):
+        planned = _plan_dimension(
+            prototype,
+            system,
+            parallel_axes,
+            dimension,
+            single=len(dimensions) == 1,
+            default_period=default_period,
+        )
+        if planned is None:
+            return None
+        shape.append(planned[0].count)
+        swept.extend(planned)
+
+    return AxesGrid(
+        prototype=prototype,
+        swept=tuple(swept),
+        shape=tuple(shape),
+        cell_count=math.prod(shape),
+    )
+
+
+def plan_axes_scan(
+    household: dict,
+    system,
+    default_period,
+    config: AxesChunkConfig,
+) -> AxesScan | None:
+    """Plan a chunked scan of ``household``'s axes, or return ``None``.
+
+    ``None`` means core should expand the axes itself: the grid fits in
+    one chunk, ``axes_grid`` cannot mirror it, or it sweeps a
+    non-numeric variable, which a situation cannot set from a number.
+    """
+    grid = axes_grid(household, system, default_period)
+    if grid is None or any(
+        axis.value_type not in (int, float) for axis in grid.swept
+    ):
+        return None
+
+    entities_per_cell = sum(
+        len(grid.prototype.get(entity.plural) or {}) or 1
+        for entity in system.entities
+    )
+    chunk_cells = max(
+        1,
+        config.memory_budget_bytes
+        // (entities_per_cell * ESTIMATED_BYTES_PER_ENTITY_CELL),
+    )
+    if grid.cell_count <= chunk_cells:
+        return None
+    return AxesScan(grid=grid, chunk_cells=chunk_cells)
+
+
+def _plan_dimension(
+    prototype: dict,
+    system,
+    parallel_axes,
+    dimension: int,
+    *,
+    single: bool,
+    default_period,
+) -> list[_SweptVariable] | None:
+    if not isinstance(parallel_axes, list) or not parallel_axes:
+        return None
+    if not all(isinstance(axis, dict) for axis in parallel_axes):
+        return None
+    first = system.variables.get(parallel_axes[0].get("name"))
+    count = parallel_axes[0].get("count")
+    if first is None or not isinstance(count, int) or count < 1:
+        return None
+    entity = first.entity
+    if entity.plural in prototype:
+        instances = list(prototype[entity.plural] or {})
+    else:
+        # Groups the payload omits get one default instance per cell.
+        instances = [entity.key]
+
+    planned = []
+    for axis in parallel_axes:
+        variable = system.variables.get(axis.get("name"))
+        index = axis.get("index", 0)
+        # Core reads the period with `get(..., default)` for a single
+        # dimension but `get(...) or default` for a grid.
+        period = (
+            axis.get("period", default_period)
+            if single
+            else axis.get("period") or default_period
+        )
+        if (
+            variable is None
+            or variable.entity.key != entity.key
+            or not isinstance(index, int)
+            or not 0 <= index < len(instances)
+            or period is None
+            or not all(
+                isinstance(axis.get(bound), (int, float))
+                and not isinstance(axis.get(bound), bool)
+                for bound in ("min", "max")
+            )
+        ):
+            return None
+        planned.append(
+            _SweptVariable(
+                entity_plural=entity.plural,
+                entity_id=instances[index],
+                name=variable.name,
+                period=str(period),
+                value_type=variable.value_type,
+                dtype=np.dtype(variable.dtype),
+                dimension=dimension,
+                count=count,
+                min=axis["min"],
+                max=axis["max"],
+            )
+        )
+    return planned
+
+
+def evaluate_axes_scan(
+    scan: AxesScan,
+    system,
+    build_simulation: Callable[[dict], object],
+    requests: list[tuple[str, str]],
+    workers: int = 1,
+) -> dict[tuple[str, str], np.ndarray | Exception]:
+    """Calculate each ``(variable_name, period)`` across the whole grid.
+
+    Chunks run one after another, or on a thread pool of ``workers``;
+    each chunk's simulation is released once its requested arrays are
+    read, so peak memory is about ``workers`` chunks. A request that
+    raises in any chunk maps to the exception instead of an array.
+    """
+
+    def evaluate(cells: range) -> dict:
+        simulation = build_simulation(scan.situation(cells, system))
+        arrays = {}
+        for variable_name, period in requests:
+            try:
+                arrays[(variable_name, period)] = simulation.calculate(
+                    variable_name, period
+                )
+            except Exception as e:
+                arrays[(variable_name, period)] = e
+        _release_simulation(simulation)
+        return arrays
+
+    chunks = scan.chunks()
+    if workers > 1 and len(chunks) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return _stitch(pool.map(evaluate, chunks), requests)
+    return _stitch(map(evaluate, chunks), requests)
+
+
+def _release_simulation(simulation) -> None:
+    # Simulations are reference cycles (populations and holders point
+    # back at their simulation), so only the cyclic collector would free
+    # a chunk's simulation, and a full collection over the loaded
+    # tax-benefit systems costs seconds. The chunk's simulation and its
+    # branches (formulas' counterfactual clones, the UK wrapper's
+    # baseline) are never used again, so their attributes are cleared to
+    # break the cycles and let reference counting free them now. Arrays
+    # already read into the results stay alive through those references.
+    pending = [simulation]
+    released = []
+    while pending:
+        current = pending.pop()
+        if any(current is seen for seen in released):
+            continue
+        released.append(current)
+        pending.extend(current.branches.values())
+        baseline = getattr(current, "baseline", None)
+        if baseline is not None:
+            pending.append(baseline)
+    for current in released:
+        for population in current.populations.values():
+            vars(population).clear()
+        vars(current).clear()
+
+
+def _stitch(
+    chunk_arrays: Iterator[dict], requests: list[tuple[str, str]]
+) -> dict[tuple[str, str], np.ndarray | Exception]:
+    parts: dict[tuple[str, str], list] = {key: [] for key in requests}
+    failures: dict[tuple[str, str], Exception] = {}
+    for arrays in chunk_arrays:
+        for key, array in arrays.items():
+            if isinstance(array, Exception):
+                failures.setdefault(key, array)
+            elif key not in failures:
+                parts[key].append(array)
+    return {
+        key: failures[key] if key in failures else np.concatenate(parts[key])
+        for key in requests
+    }
@@ -0,0 +1,143 @@
+"""Stack independent households into one situation and split results back.
+
+A batch request carries many unrelated households. Building one
+``Simulation`` per household pays construction, formula dispatch and
+response building N times; stacking them into a single entity-stacked
+situation runs each formula once over every entity in the batch. Entity
+IDs are namespaced per household so they cannot collide, and the layout
+recorded while stacking maps each stacked ID back to its household and
+original ID when the result is split.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+
+@dataclass
+class StackedHouseholds:
+    """A merged situation plus the bookkeeping needed to split it again.
+
+    ``entity_groups`` keeps each household's own entity groups in payload
+    order. ``entity_ids`` maps ``(entity_plural, stacked_id)`` to the
+    household's index in the batch and its original entity ID.
+    ``default_groups`` records the group instances added for households
+    that omitted an entity group; they are dropped when the result is
+    split.
+    """
+
+    household: dict
+    entity_groups: list[list[str]]
+    entity_ids: dict[tuple[str, str], tuple[int, str]] = field(
+        default_factory=dict
+    )
+    default_groups: set[tuple[str, str]] = field(default_factory=set)
+
+
+def can_stack(household: dict) -> bool:
+    """True when a household can share a simulation with others.
+
+    Axes scans replicate the whole situation along the axis grid, so a
+    household carrying ``axes`` must run in its own simulation.
+    """
+    return isinstance(household, dict) and "axes" not in household
+
+
+def stack_households(households: list[dict], system) -> StackedHouseholds:
+    """Merge ``households`` into one situation with namespaced entity IDs.
+
+    policyengine-core puts every person in a single default group when a
+    situation omits a group entity altogether, but gives each person their
+    own group when the entity is present and they are not a member of any
+    instance. Once another household in the batch declares the group, the
+    second rule would apply, so an explicit default group holding all of
+    the household's people is added to keep single-household semantics.
+    """
+    person_plural = system.person_entity.plural
+    stacked = StackedHouseholds(
+        household={},
+        entity_groups=[list(household) for household in households],
+    )
+
+    for index, household in enumerate(households):
+        prefix = _prefix(index)
+        person_ids = list((household.get(person_plural) or {}).keys())
+
+        for entity_plural, entities in household.items():
+            target = stacked.household.setdefault(entity_plural, {})
+            for entity_id, entity_data in entities.items():
+                stacked_id = prefix + entity_id
+                target[stacked_id] = _namespaced_entity(entity_data, prefix)
+                stacked.entity_ids[(entity_plural, stacked_id)] = (
+                    index,
+                    entity_id,
+                )
+
+        for entity in system.group_entities:
+            if entity.plural in household:
+                continue
+            role = entity.roles[0]
+            stacked_id = prefix + entity.key
+            stacked.household.setdefault(entity.plural, {})[stacked_id] = {
+                role.plural or role.key: [
+                    prefix + person_id for person_id in person_ids
+                ]
+            }
+            stacked.entity_ids[(entity.plural, stacked_id)] = (
+                index,
+                entity.key,
+            )
+            stacked.default_groups.add((entity.plural, stacked_id))
+
+    return stacked
+
+
+def unstack_result(stacked: StackedHouseholds, result: dict) -> list[dict]:
+    """Split a calculated stacked situation back into per-household results.
+
+    Entity groups and entity order are preserved from each household's
+    own payload, so every item echoes its input the way a single
+    ``/calculate`` would.
+    """
+    households: list[dict] = [
+        {entity_plural: {} for entity_plural in entity_groups}
+        for entity_groups in stacked.entity_groups
+    ]
+    for entity_plural, entities in result.items():
+        for stacked_id, entity_data in entities.items():
+            if (entity_plural, stacked_id) in stacked.default_groups:
+                continue
+            index, entity_id = stacked.entity_ids[(entity_plural, stacked_id)]
+            prefix = _prefix(index)
+            households[index][entity_plural][entity_id] = _original_entity(
+                entity_data, prefix
+            )
+    return households
+
+
+def _prefix(index: int) -> str:
+    return f"batch_{index}:"
+
+
+def _namespaced_entity(entity_data: dict, prefix: str) -> dict:
+    # Role lists (``members`` and friends) are the only list-valued keys
+    # in a situation; every other value is a period map.
+    return {
+        key: (
+            [prefix + member for member in value]
+            if isinstance(value, list)
+            else value
+        )
+        for key, value in entity_data.items()
+    }
+
+
+def _original_entity(entity_data: dict, prefix: str) -> dict:
+    return {
+        key: (
+            [member[len(prefix) :] for member in value]
+            if isinstance(value, list)
+            else value
+        )
+        for key, value in entity_data.items()
+    }
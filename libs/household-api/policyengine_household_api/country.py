@@ -1,10 +1,60 @@
+from collections.abc import Callable, Mapping, Sequence
 import importlib
+import logging
+import threading
+import time
 from flask import Response
-import json
 from policyengine_core.taxbenefitsystems import TaxBenefitSystem
-from policyengine_household_api.constants import COUNTRY_PACKAGE_VERSIONS
+from policyengine_household_api.constants import (
+    COUNTRIES as COUNTRY_IDS,
+    COUNTRY_PACKAGE_NAMES,
+    COUNTRY_PACKAGE_VERSIONS,
+)
 from typing import Union
-from policyengine_household_api.utils.json import get_safe_json
+from policyengine_household_api.utils.json import (
+    get_safe_json,
+    hash_object,
+)
+from policyengine_household_api.utils.lru_cache import BoundedLRUCache
+from policyengine_household_common import json_codec
+from policyengine_household_common.config_loader import get_config_value
+from policyengine_household_common.deprecated_inputs import (
+    DEPRECATED_VARIABLES,
+    DeprecatedVariableWarning,
+)
+from policyengine_household_common.household import VARIABLE_BLACKLIST
+from policyengine_household_common.household_copy import (
+    CopyOnWriteHousehold,
+)
+from policyengine_household_common.models.analytics import (
+    VariableUsageSummary,
+)
+from policyengine_household_common.variable_usage_analytics import (
+    VariableUsageCollector,
+)
+from policyengine_household_common.observability.segments import SegmentName
+from policyengine_observability import segment, set_attribute
+from policyengine_household_api.axes import (
+    axes_chunk_config,
+    axes_grid,
+    evaluate_axes_scan,
+    plan_axes_scan,
+)
+from policyengine_household_api.incremental import IncrementalCalculation
+from policyengine_household_api.reform_overlay import overlay_reform
+from policyengine_household_api.uk_simulation import UKSimulationFactory
+from policyengine_household_api.utils.variable_validation import (
+    HouseholdVariableValidationError,
+)
+from policyengine_household_api.result_cache import (
+    RESULT_CACHE,
+    result_cache_key,
+)
+from policyengine_household_api.batch import (
+    can_stack,
+    stack_households,
+    unstack_result,
+)
 from policyengine_core.parameters import (
     ParameterNode,
     Parameter,
@@ -14,11 +64,12 @@ from policyengine_core.parameters import (
 from policyengine_core.parameters import get_parameter
 from policyengine_core.model_api import Enum
 from policyengine_core.periods import instant, period as parse_period
-import copy
-import dpath
-import math
-from dataclasses import dataclass
+import numpy as np
+from dataclasses import dataclass, field
+import functools
+import weakref
 
+logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
 # Period key parsing
@@ -30,11 +81,14 @@ from dataclasses import dataclass
 # distinguishes year vs. month, so we wrap that parser here.
 
 
+@functools.lru_cache(maxsize=4096)
 def _parsed_period(period_key: str):
     """Return a Period for a string key, or None if it doesn't parse.
 
     Wrapping policyengine-core's parser keeps the rest of this module free
     of regex and gives one place to handle malformed keys (e.g. ``"2026-15"``).
+    Memoized: partners send the same handful of year and month keys on
+    every request, and Periods are immutable.
     """
     try:
         return parse_period(period_key)
@@ -42,17 +96,39 @@ def _parsed_period(period_key: str):
         return None
 
 
-def _is_year_key(period_key: str) -> bool:
-    parsed = _parsed_period(period_key)
-    return parsed is not None and parsed.unit == "year"
+# A requested (``None``) slot may also be keyed by a range of months,
+# answered with one value per month, in order: ``"2026-01:12"`` is
+# twelve months from January 2026 and ``"2026:months"`` the months of
+# 2026. The engine never sees these keys; ``_calculate`` asks it for
+# each month.
+PERIOD_RANGE_MONTHS = "months"
+MAX_PERIOD_RANGE_MONTHS = 120
 
 
-def _month_key_year(period_key: str) -> str | None:
-    """Return the four-digit year if ``period_key`` parses as a month, else None."""
-    parsed = _parsed_period(period_key)
-    if parsed is None or parsed.unit != "month":
+@functools.lru_cache(maxsize=1024)
+def _period_range_months(period_key: str) -> tuple[str, ...] | None:
+    """The month keys a period range covers, or None if it isn't one."""
+    if not isinstance(period_key, str):
         return None
-    return f"{parsed.start.year:04d}"
+    start_key, separator, length = period_key.partition(":")
+    if not separator:
+        return None
+    start = _parsed_period(start_key)
+    if start is None:
+        return None
+    if length == PERIOD_RANGE_MONTHS and start.unit == "year":
+        count = 12
+    elif length.isdigit() and start.unit == "month":
+        count = int(length)
+        if not 1 <= count <= MAX_PERIOD_RANGE_MONTHS:
+            return None
+    else:
+        return None
+    first = start.start.year * 12 + start.start.month - 1
+    return tuple(
+        f"{month // 12:04d}-{month % 12 + 1:02d}"
+        for month in range(first, first + count)
+    )
 
 
 def _is_numeric(value) -> bool:
@@ -64,56 +140,362 @@ def _is_numeric(value) -> bool:
 # Household walk
 # ---------------------------------------------------------------------------
 #
-# Validation, warning detection, and YEAR-key expansion all need the same
-# household traversal: skip the top-level ``axes`` list, descend into each
-# entity instance, and yield each ``(variable, period_map)`` pair. A single
-# slot walker lets each pass focus on its rule instead of repeating the
-# nested-loop boilerplate.
+# Variable validation, deprecated-input filtering, period-key and budget
+# validation, warning detection, YEAR-key expansion and analytics variable
+# usage all read the same slots: each entity instance's
+# ``{variable: {period: value}}`` maps, plus the top-level ``axes`` list.
+# ``walk_household`` visits every slot once and produces all of their
+# results; ``validate_period_keys`` and the other rule functions below
+# are views over it. Variable metadata comes from a per-system index and
+# period keys go through the memoized ``_parsed_period``, so a walk costs
+# dictionary lookups per slot rather than policyengine-core calls.
 
 
 @dataclass(frozen=True)
-class _VariableSlot:
-    """A located period-map for one variable on one entity instance.
+class _VariableMeta:
+    is_month: bool
+    is_numeric: bool
+
+
+# A system's variable definitions are fixed once the API has built it
+# (reforms change parameters, not definition periods or value types), so
+# each index is built on first use and lives as long as its system.
+_VARIABLE_INDEXES = weakref.WeakKeyDictionary()
+
+
+def _variable_index(system) -> dict[str, _VariableMeta]:
+    index = _VARIABLE_INDEXES.get(system)
+    if index is None:
+        index = {
+            variable_name: _VariableMeta(
+                is_month=variable.definition_period == "month",
+                is_numeric=_is_numeric_value_type(variable),
+            )
+            for variable_name, variable in system.variables.items()
+        }
+        _VARIABLE_INDEXES[system] = index
+    return index
+
 
-    ``period_map`` is the live dict, so callers that want to mutate it
-    (the normalizer) and callers that only read (the validators and the
-    warning detector) can share the same iterator.
+@dataclass
+class _PeriodMapScan:
+    """One pass over a period map, grouped the way the period rules read it.
+
+    Unparseable keys appear only as ``invalid_key`` (the first one); keys
+    that parse as neither a year nor a month are dropped. Period ranges
+    on requested (``None``) values are listed in ``range_keys``; a range
+    holding a value is invalid.
     """
 
-    entity_plural: str
-    entity_id: str
-    variable_name: str
-    variable: object
-    period_map: dict
+    invalid_key: str | None = None
+    range_keys: list[str] = field(default_factory=list)
+    year_entries: list[tuple[str, object]] = field(default_factory=list)
+    # Month-keyed values as (four-digit year, month, value), in period-map
+    # order, and the same (month, value) pairs grouped by year.
+    month_entries: list[tuple[str, int, object]] = field(default_factory=list)
+    month_entries_by_year: dict[str, list[tuple[int, object]]] = field(
+        default_factory=dict
+    )
 
 
-def _walk_variable_slots(household: dict, system):
-    """Yield a ``_VariableSlot`` for every (entity, variable) period map.
+def _scan_period_map(period_map: dict) -> _PeriodMapScan:
+    scan = _PeriodMapScan()
+    for period_key, value in period_map.items():
+        parsed = _parsed_period(period_key)
+        if parsed is None:
+            if value is None and _period_range_months(period_key):
+                scan.range_keys.append(period_key)
+            elif scan.invalid_key is None:
+                scan.invalid_key = period_key
+        elif parsed.unit == "year":
+            scan.year_entries.append((period_key, value))
+        elif parsed.unit == "month":
+            year = f"{parsed.start.year:04d}"
+            month = parsed.start.month
+            scan.month_entries.append((year, month, value))
+            scan.month_entries_by_year.setdefault(year, []).append(
+                (month, value)
+            )
+    return scan
 
-    Skips the top-level ``axes`` list, any non-dict value, and any
-    variable name the system doesn't recognize (Pydantic rejects unknown
-    names upstream; this is defense-in-depth so a stray key can't crash
-    the walk).
+
+@dataclass(frozen=True)
+class HouseholdWalk:
+    """Every per-household result the calculate path needs, from one walk.
+
+    ``household`` is ``source`` with deprecated inputs removed: ``source``
+    itself when there are none, otherwise a copy of just the containers
+    that lost a key. The period errors are the first of their kind in
+    walk order; ``period_expansions`` lists the ``(entity_plural,
+    entity_id, variable_name)`` slots whose YEAR-keyed inputs
+    ``_split_year_inputs`` (or, for axes, ``_normalize_period_keys``)
+    spreads across months. ``period_budget_slots`` are the numeric
+    monthly inputs with a YEAR key, the only period maps the budget rule
+    reads (see ``period_budget_error``). Period results ignore unknown
+    and deprecated variables. ``variable_usage`` is only collected when
+    asked for.
     """
-    for entity_plural, entities in (household or {}).items():
+
+    source: object
+    system: object
+    household: object
+    variable_errors: list[HouseholdVariableValidationError]
+    deprecation_warnings: list[DeprecatedVariableWarning]
+    period_key_error: str | None
+    period_budget_error: str | None
+    period_warnings: list
+    period_expansions: tuple[tuple[str, str, str], ...]
+    period_budget_slots: tuple[tuple[str, str, str], ...] = ()
+    variable_usage: list[VariableUsageSummary] | None = None
+
+
+def walk_household(
+    household: dict,
+    system,
+    *,
+    model_version: str | None = None,
+    collect_usage: bool = False,
+) -> HouseholdWalk:
+    """Walk ``household`` once and derive every per-household result.
+
+    Tolerates any payload shape (the analytics decorator walks requests
+    before their schema is checked): non-dict containers are skipped the
+    way each rule function always skipped them.
+    """
+    usage = VariableUsageCollector(system) if collect_usage else None
+    if not isinstance(household, dict):
+        return HouseholdWalk(
+            source=household,
+            system=system,
+            household=household,
+            variable_errors=[],
+            deprecation_warnings=[],
+            period_key_error=None,
+            period_budget_error=None,
+            period_warnings=[],
+            period_expansions=(),
+            variable_usage=[] if usage is not None else None,
+        )
+
+    index = _variable_index(system)
+    variable_errors: list[HouseholdVariableValidationError] = []
+    deprecation_warnings: list[DeprecatedVariableWarning] = []
+    deprecated_slots: list[tuple[str, str, str]] = []
+    period_key_error = None
+    period_budget_error = None
+    warning_inputs = _PeriodWarningInputs()
+    period_expansions: list[tuple[str, str, str]] = []
+    period_budget_slots: list[tuple[str, str, str]] = []
+
+    for entity_plural, entities in household.items():
         if entity_plural == "axes" or not isinstance(entities, dict):
             continue
-        for entity_id, entity_data in entities.items():
-            if not isinstance(entity_data, dict):
+        for entity_id, variables in entities.items():
+            if not isinstance(variables, dict):
                 continue
-            for variable_name, period_map in entity_data.items():
+            for variable_name, period_map in variables.items():
+                if variable_name in VARIABLE_BLACKLIST:
+                    continue
+                if usage is not None:
+                    usage.add_entity_variable(
+                        entity_plural, entity_id, variable_name, period_map
+                    )
+                hint = DEPRECATED_VARIABLES.get(variable_name)
+                if hint is not None:
+                    deprecation_warnings.append(
+                        DeprecatedVariableWarning(
+                            variable=variable_name,
+                            entity_plural=entity_plural,
+                            entity_id=entity_id,
+                            hint=hint,
+                        )
+                    )
+                    deprecated_slots.append(
+                        (entity_plural, entity_id, variable_name)
+                    )
+                    continue
                 if not isinstance(period_map, dict):
                     continue
-                variable = system.variables.get(variable_name)
-                if variable is None:
+                meta = index.get(variable_name)
+                if meta is None:
+                    variable_errors.append(
+                        HouseholdVariableValidationError(
+                            variable=variable_name,
+                            entity_plural=entity_plural,
+                            entity_id=entity_id,
+                            model_version=model_version,
+                        )
+                    )
                     continue
-                yield _VariableSlot(
-                    entity_plural=entity_plural,
-                    entity_id=entity_id,
-                    variable_name=variable_name,
-                    variable=variable,
-                    period_map=period_map,
+
+                scan = _scan_period_map(period_map)
+                if scan.invalid_key is not None and period_key_error is None:
+                    period_key_error = _invalid_period_key_message(
+                        scan.invalid_key,
+                        variable_name,
+                        entity_plural,
+                        entity_id,
+                    )
+                if scan.range_keys and period_key_error is None:
+                    period_key_error = _period_range_error(
+                        scan.range_keys[0],
+                        meta,
+                        "axes" in household,
+                        variable_name,
+                        entity_plural,
+                        entity_id,
+                    )
+                if not meta.is_month:
+                    continue
+                if meta.is_numeric and scan.year_entries:
+                    period_budget_slots.append(
+                        (entity_plural, entity_id, variable_name)
+                    )
+                    if period_budget_error is None:
+                        period_budget_error = _year_budget_error(
+                            scan, variable_name, entity_plural, entity_id
+                        )
+                warning_inputs.add(
+                    variable_name, entity_plural, entity_id, scan
                 )
+                if any(value is not None for _, value in scan.year_entries):
+                    period_expansions.append(
+                        (entity_plural, entity_id, variable_name)
+                    )
+
+    retained_axes = _walk_axes(
+        household.get("axes"),
+        index,
+        model_version,
+        usage,
+        variable_errors,
+        deprecation_warnings,
+    )
+
+    return HouseholdWalk(
+        source=household,
+        system=system,
+        household=_without_deprecated_inputs(
+            household, deprecated_slots, retained_axes
+        ),
+        variable_errors=variable_errors,
+        deprecation_warnings=deprecation_warnings,
+        period_key_error=period_key_error,
+        period_budget_error=period_budget_error,
+        period_warnings=warning_inputs.warnings(),
+        period_expansions=tuple(period_expansions),
+        period_budget_slots=tuple(period_budget_slots),
+        variable_usage=usage.summaries() if usage is not None else None,
+    )
+
+
+def _walk_axes(
+    axes,
+    index: dict[str, _VariableMeta],
+    model_version: str | None,
+    usage: VariableUsageCollector | None,
+    variable_errors: list[HouseholdVariableValidationError],
+    deprecation_warnings: list[DeprecatedVariableWarning],
+) -> list | None:
+    """Check each axis name; return the retained axes if any were dropped.
+
+    Entries may be a single axis or a list of crossed axes, as in
+    policyengine-core. Returns ``None`` when no axis was deprecated.
+    """
+    if not isinstance(axes, list):
+        return None
+
+    changed = False
+    retained_entries = []
+    for entry_index, entry in enumerate(axes):
+        if isinstance(entry, list):
+            retained_axes = []
+            for axis_index, axis in enumerate(entry):
+                if _visit_axis(
+                    axis,
+                    f"{entry_index}][{axis_index}",
+                    index,
+                    model_version,
+                    usage,
+                    variable_errors,
+                    deprecation_warnings,
+                ):
+                    changed = True
+                    continue
+                retained_axes.append(axis)
+            if retained_axes:
+                retained_entries.append(retained_axes)
+            continue
+        if _visit_axis(
+            entry,
+            str(entry_index),
+            index,
+            model_version,
+            usage,
+            variable_errors,
+            deprecation_warnings,
+        ):
+            changed = True
+            continue
+        retained_entries.append(entry)
+
+    return retained_entries if changed else None
+
+
+def _visit_axis(
+    axis,
+    location: str,
+    index: dict[str, _VariableMeta],
+    model_version: str | None,
+    usage: VariableUsageCollector | None,
+    variable_errors: list[HouseholdVariableValidationError],
+    deprecation_warnings: list[DeprecatedVariableWarning],
+) -> bool:
+    """Record one axis's results; return True if it is deprecated."""
+    if not isinstance(axis, dict):
+        return False
+    variable_name = axis.get("name")
+    if not isinstance(variable_name, str) or variable_name == "":
+        return False
+    if usage is not None:
+        usage.add_axis(axis)
+    hint = DEPRECATED_VARIABLES.get(variable_name)
+    if hint is not None:
+        deprecation_warnings.append(
+            DeprecatedVariableWarning(
+                variable=variable_name,
+                entity_plural="axes",
+                entity_id=location,
+                hint=hint,
+            )
+        )
+        return True
+    if variable_name not in index:
+        variable_errors.append(
+            HouseholdVariableValidationError(
+                variable=variable_name,
+                entity_plural="axes",
+                entity_id=location,
+                model_version=model_version,
+            )
+        )
+    return False
+
+
+def _without_deprecated_inputs(
+    household: dict,
+    deprecated_slots: list[tuple[str, str, str]],
+    retained_axes: list | None,
+) -> dict:
+    cleaned = CopyOnWriteHousehold(household)
+    for entity_plural, entity_id, variable_name in deprecated_slots:
+        del cleaned.writable(entity_plural, entity_id)[variable_name]
+    if retained_axes is not None:
+        if retained_axes:
+            cleaned.writable()["axes"] = retained_axes
+        else:
+            del cleaned.writable()["axes"]
+    return cleaned.household
 
 
 # ---------------------------------------------------------------------------
@@ -130,16 +512,45 @@ def validate_period_keys(household: dict, system) -> None:
     key gives them an explicit signal. Pydantic doesn't validate
     period-key strings today, so this is the single defensive checkpoint.
     """
-    for slot in _walk_variable_slots(household, system):
-        for period_key in slot.period_map:
-            if _parsed_period(period_key) is None:
-                raise ValueError(
-                    f"Invalid period key `{period_key}` for "
-                    f"`{slot.variable_name}` on "
-                    f"`{slot.entity_plural}/{slot.entity_id}`. "
-                    f'Expected a year (e.g. "2026") or a month '
-                    f'(e.g. "2026-01").'
-                )
+    error = walk_household(household, system).period_key_error
+    if error is not None:
+        raise ValueError(error)
+
+
+def _invalid_period_key_message(
+    period_key: str,
+    variable_name: str,
+    entity_plural: str,
+    entity_id: str,
+) -> str:
+    return (
+        f"Invalid period key `{period_key}` for "
+        f"`{variable_name}` on "
+        f"`{entity_plural}/{entity_id}`. "
+        f'Expected a year (e.g. "2026") or a month '
+        f'(e.g. "2026-01"), or for a requested (null) value a range of '
+        f'months (e.g. "2026-01:12" or "2026:months").'
+    )
+
+
+def _period_range_error(
+    period_key: str,
+    meta: _VariableMeta,
+    has_axes: bool,
+    variable_name: str,
+    entity_plural: str,
+    entity_id: str,
+) -> str | None:
+    if has_axes:
+        reason = "is not available for households with axes"
+    elif not meta.is_month:
+        reason = f"needs a variable defined by month; `{variable_name}` is not"
+    else:
+        return None
+    return (
+        f"Period range `{period_key}` for `{variable_name}` on "
+        f"`{entity_plural}/{entity_id}` {reason}."
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -198,78 +609,77 @@ def detect_period_warnings(household: dict, system) -> list[PeriodWarning]:
     The hosted v1 API doesn't emit any warnings; this is purely additive
     partner-facing diagnostic — the numeric output is unchanged.
     """
-    warnings: list[PeriodWarning] = []
-    annual_month_output_years: set[str] = set()
-    monthly_inputs: dict[tuple[str, str, str, str], set[int]] = {}
-    # `(variable, entity, year)` tuples whose period map already carries a
-    # non-null year-key input. The normalizer fills the unset months from
-    # the year-input remainder, so the partial-monthly hazard does not
-    # apply — the unset months don't read the engine's fallback.
-    years_with_year_input: set[tuple[str, str, str, str]] = set()
-
-    for slot in _walk_variable_slots(household, system):
-        is_month_var = slot.variable.definition_period == "month"
-        for period_key, value in slot.period_map.items():
+    return walk_household(household, system).period_warnings
+
+
+class _PeriodWarningInputs:
+    """What the warning rule needs from each MONTH-defined period map."""
+
+    def __init__(self):
+        self.annual_month_output_years: set[str] = set()
+        self.monthly_inputs: dict[tuple[str, str, str, str], set[int]] = {}
+        # `(variable, entity, year)` tuples whose period map already
+        # carries a non-null year-key input. The normalizer fills the
+        # unset months from the year-input remainder, so the
+        # partial-monthly hazard does not apply — the unset months don't
+        # read the engine's fallback.
+        self.years_with_year_input: set[tuple[str, str, str, str]] = set()
+
+    def add(
+        self,
+        variable_name: str,
+        entity_plural: str,
+        entity_id: str,
+        scan: _PeriodMapScan,
+    ) -> None:
+        for period_key, value in scan.year_entries:
             if value is None:
                 # Annual nulls on MONTH vars arm the missing-month
                 # hazard. YEAR-defined vars don't have months.
-                if is_month_var and _is_year_key(period_key):
-                    annual_month_output_years.add(period_key)
-                continue
-            if not is_month_var:
-                continue
-            if _is_year_key(period_key):
-                years_with_year_input.add(
-                    (
-                        slot.variable_name,
-                        slot.entity_plural,
-                        slot.entity_id,
-                        period_key,
-                    )
+                self.annual_month_output_years.add(period_key)
+            else:
+                self.years_with_year_input.add(
+                    (variable_name, entity_plural, entity_id, period_key)
                 )
+        for year, month, value in scan.month_entries:
+            if value is None:
                 continue
-            year = _month_key_year(period_key)
-            if year is None:
-                continue
-            parsed = _parsed_period(period_key)
-            key = (
-                slot.variable_name,
-                slot.entity_plural,
-                slot.entity_id,
-                year,
-            )
-            monthly_inputs.setdefault(key, set()).add(parsed.start.month)
-
-    for (
-        variable_name,
-        entity_plural,
-        entity_id,
-        year,
-    ), months in monthly_inputs.items():
-        if year not in annual_month_output_years:
-            continue
-        if len(months) >= 12:
-            continue
-        # If the same period map also has a non-null year input for this
-        # year, the normalizer fills the unset months from the remainder
-        # — there's no missing-month hazard to warn about.
-        if (
+            self.monthly_inputs.setdefault(
+                (variable_name, entity_plural, entity_id, year), set()
+            ).add(month)
+
+    def warnings(self) -> list[PeriodWarning]:
+        warnings: list[PeriodWarning] = []
+        for (
             variable_name,
             entity_plural,
             entity_id,
             year,
-        ) in years_with_year_input:
-            continue
-        warnings.append(
-            PartialMonthlyInputWarning(
-                variable=variable_name,
-                entity_plural=entity_plural,
-                entity_id=entity_id,
-                year=year,
-                months_set=tuple(sorted(months)),
+        ), months in self.monthly_inputs.items():
+            if year not in self.annual_month_output_years:
+                continue
+            if len(months) >= 12:
+                continue
+            # If the same period map also has a non-null year input for
+            # this year, the normalizer fills the unset months from the
+            # remainder — there's no missing-month hazard to warn about.
+            if (
+                variable_name,
+                entity_plural,
+                entity_id,
+                year,
+            ) in self.years_with_year_input:
+                continue
+            warnings.append(
+                PartialMonthlyInputWarning(
+                    variable=variable_name,
+                    entity_plural=entity_plural,
+                    entity_id=entity_id,
+                    year=year,
+                    months_set=tuple(sorted(months)),
+                )
             )
-        )
-    return warnings
+        return warnings
 
 
 # ---------------------------------------------------------------------------
@@ -306,39 +716,56 @@ def validate_period_budgets(household: dict, system) -> None:
     even when the remainder is negative. We mirror that exact rule so
     partner integrations match v1 byte-for-byte.
     """
-    for slot in _walk_variable_slots(household, system):
-        if slot.variable.definition_period != "month":
-            continue
-        if not _is_numeric_value_type(slot.variable):
-            continue
-        _check_year_budget(
-            period_map=slot.period_map,
-            variable_name=slot.variable_name,
-            entity_plural=slot.entity_plural,
-            entity_id=slot.entity_id,
+    error = walk_household(household, system).period_budget_error
+    if error is not None:
+        raise ValueError(error)
+
+
+def period_budget_error(
+    household: dict, slots: Sequence[tuple[str, str, str]]
+) -> str | None:
+    """The budget rule's first error among ``slots``' period maps.
+
+    ``slots`` are a walk's ``period_budget_slots``. The rule is the only
+    period check that reads input values, so a household whose structure
+    was walked before (a household template) re-runs just this one.
+    """
+    for entity_plural, entity_id, variable_name in slots:
+        error = _year_budget_error(
+            _scan_period_map(
+                household[entity_plural][entity_id][variable_name]
+            ),
+            variable_name,
+            entity_plural,
+            entity_id,
         )
+        if error is not None:
+            return error
+    return None
 
 
-def _check_year_budget(
-    period_map: dict,
+def _explicit_months(
+    month_entries: list[tuple[int, object]],
+) -> dict[int, float]:
+    explicit_months: dict[int, float] = {}
+    for month, value in month_entries:
+        if _is_numeric(value):
+            explicit_months[month] = float(value)
+    return explicit_months
+
+
+def _year_budget_error(
+    scan: _PeriodMapScan,
     variable_name: str,
     entity_plural: str,
     entity_id: str,
-) -> None:
-    for period_key, value in list(period_map.items()):
-        if not _is_year_key(period_key):
-            continue
+) -> str | None:
+    for year, value in scan.year_entries:
         if not _is_numeric(value):
             continue
-        year = period_key
-        explicit_months: dict[int, float] = {}
-        for inner_key, inner_value in period_map.items():
-            if _month_key_year(inner_key) != year:
-                continue
-            if not _is_numeric(inner_value):
-                continue
-            month = _parsed_period(inner_key).start.month
-            explicit_months[month] = float(inner_value)
+        explicit_months = _explicit_months(
+            scan.month_entries_by_year.get(year, [])
+        )
         # v1 raises only when every month is explicit and the sum
         # disagrees with the annual; partial monthlies are silently
         # distributed (even if the remainder is negative).
@@ -346,15 +773,20 @@ def _check_year_budget(
             continue
         explicit_sum = sum(explicit_months.values())
         if explicit_sum != float(value):
-            raise ValueError(
+            return (
                 f"Inconsistent input: monthly values for `{variable_name}` on "
                 f"`{entity_plural}/{entity_id}` in {year} sum to "
                 f"{explicit_sum}, which doesn't match the annual total {value}."
             )
+    return None
 
 
-def _normalize_period_keys(household: dict, system) -> dict:
-    """Return a deep-copied household with YEAR-keyed inputs expanded to months.
+def _normalize_period_keys(
+    household: dict,
+    system,
+    expansions: tuple[tuple[str, str, str], ...] | None = None,
+) -> dict:
+    """Return the household with YEAR-keyed inputs expanded to months.
 
     policyengine-core's ``Simulation(situation=...)`` silently drops a year-
     period assignment on a MONTH-defined variable (see issue #1489). The
@@ -377,35 +809,63 @@ def _normalize_period_keys(household: dict, system) -> dict:
       returns the annual sum across the 12 monthly values.
 
     The original household is never mutated, so the response can echo the
-    partner's keys verbatim.
+    partner's keys verbatim: only the rewritten period maps (and the
+    containers above them) are copied; everything else is shared.
+    ``expansions`` is ``walk_household``'s ``period_expansions`` for
+    ``household``, when the caller already walked it.
     """
-    normalized = copy.deepcopy(household)
-    for slot in _walk_variable_slots(normalized, system):
-        if slot.variable.definition_period != "month":
-            continue
-        _expand_year_keys_in_place(slot.period_map, slot.variable)
-    return normalized
+    if expansions is None:
+        expansions = walk_household(household, system).period_expansions
+    normalized = CopyOnWriteHousehold(household)
+    index = _variable_index(system)
+    for entity_plural, entity_id, variable_name in expansions:
+        _expand_year_keys_in_place(
+            normalized.writable(entity_plural, entity_id, variable_name),
+            index[variable_name].is_numeric,
+        )
+    return normalized.household
 
 
-def _expand_year_keys_in_place(period_map: dict, variable) -> None:
-    is_numeric = _is_numeric_value_type(variable)
-    for period_key in list(period_map.keys()):
-        if not _is_year_key(period_key):
-            continue
-        value = period_map[period_key]
+def _expand_year_keys_in_place(period_map: dict, is_numeric: bool) -> None:
+    years, months = _year_input_months(period_map, is_numeric)
+    for year in years:
+        del period_map[year]
+    period_map.update(months)
+
+
+def _year_input_months(
+    period_map: dict, is_numeric: bool
+) -> tuple[list[str], dict[str, object]]:
+    """The YEAR keys in ``period_map`` holding inputs, and the month
+    values those inputs spread to (month key -> value, in order)."""
+    scan = _scan_period_map(period_map)
+    years: list[str] = []
+    months: dict[str, object] = {}
+    for year, value in scan.year_entries:
         if value is None:
             # Output request — keep the YEAR key so the engine sums the months.
             continue
-        year = period_key
+        years.append(year)
         if is_numeric and _is_numeric(value):
-            _distribute_numeric_year_value(period_map, year, float(value))
+            months.update(
+                _distributed_year_value(
+                    period_map,
+                    year,
+                    float(value),
+                    scan.month_entries_by_year.get(year, []),
+                )
+            )
         else:
-            _broadcast_year_value(period_map, year, value)
+            months.update(_broadcast_year_value(period_map, year, value))
+    return years, months
 
 
-def _distribute_numeric_year_value(
-    period_map: dict, year: str, annual_value: float
-) -> None:
+def _distributed_year_value(
+    period_map: dict,
+    year: str,
+    annual_value: float,
+    month_entries: list[tuple[int, object]],
+) -> dict[str, float]:
     """Distribute an annual numeric V across the 12 months of ``year``.
 
     Explicit monthly values for the same year are preserved (the partner
@@ -416,49 +876,124 @@ def _distribute_numeric_year_value(
     months > annual). ``validate_period_budgets`` only rejects the
     fully-explicit-12-months case where sum != annual; partial monthlies
     are silently distributed even if that pushes the unset months
-    negative, exactly like v1.
+    negative, exactly like v1. ``month_entries`` are the map's
+    ``(month, value)`` pairs for ``year``, from ``_scan_period_map``.
     """
-    explicit_months: dict[int, float] = {}
-    for inner_key, inner_value in period_map.items():
-        if _month_key_year(inner_key) != year:
-            continue
-        if not _is_numeric(inner_value):
-            continue
-        month = _parsed_period(inner_key).start.month
-        explicit_months[month] = float(inner_value)
+    explicit_months = _explicit_months(month_entries)
 
     unset_count = 12 - len(explicit_months)
     if unset_count <= 0:
         # All 12 months are explicit. validate_period_budgets has already
-        # confirmed they sum to == annual_value, so just remove the YEAR key.
-        del period_map[year]
-        return
+        # confirmed they sum to == annual_value, so only the YEAR key goes.
+        return {}
 
     remainder = annual_value - sum(explicit_months.values())
     per_unset = remainder / unset_count
-    del period_map[year]
+    months = {}
     for month in range(1, 13):
         month_key = f"{year}-{month:02d}"
         if month in explicit_months:
             continue
-        # Overwrite missing slots and None (output-request) slots; explicit
+        # Fill missing slots and None (output-request) slots; explicit
         # non-null monthly inputs are already in `explicit_months` so this
         # branch only fires for unset / null slots.
         if period_map.get(month_key) is None:
-            period_map[month_key] = per_unset
+            months[month_key] = per_unset
+    return months
 
 
-def _broadcast_year_value(period_map: dict, year: str, value) -> None:
+def _broadcast_year_value(period_map: dict, year: str, value) -> dict:
     """Broadcast a non-numeric annual value (bool/str/enum) to every month.
 
     Explicit monthly values already in the period map win — partners can
     set a year-wide value and override one month explicitly.
     """
-    del period_map[year]
-    for month in range(1, 13):
-        month_key = f"{year}-{month:02d}"
-        if period_map.get(month_key) is None:
-            period_map[month_key] = value
+    return {
+        month_key: value
+        for month_key in (f"{year}-{month:02d}" for month in range(1, 13))
+        if period_map.get(month_key) is None
+    }
+
+
+# The month values a household's YEAR-keyed inputs spread to, by
+# (entity_plural, variable_name, month key), then entity id.
+SpreadYearInputs = dict[tuple[str, str, str], dict[str, object]]
+
+
+def _split_year_inputs(
+    household: dict,
+    system,
+    expansions: tuple[tuple[str, str, str], ...] | None = None,
+) -> tuple[dict, SpreadYearInputs]:
+    """Take the YEAR-keyed inputs ``_normalize_period_keys`` would expand
+    out of ``household``, spread to months the same way.
+
+    Returns ``household`` without those YEAR keys (only the period maps
+    that lost one are copied) and their month values, which
+    ``_set_spread_year_inputs`` hands to a simulation built from it. The
+    situation builder then parses the partner's own keys alone instead
+    of up to twelve written-out months per input, and each variable's
+    month is set once for every entity that spread to it.
+    """
+    if expansions is None:
+        expansions = walk_household(household, system).period_expansions
+    situation = CopyOnWriteHousehold(household)
+    index = _variable_index(system)
+    spread: SpreadYearInputs = {}
+    for entity_plural, entity_id, variable_name in expansions:
+        period_map = situation.writable(
+            entity_plural, entity_id, variable_name
+        )
+        years, months = _year_input_months(
+            period_map, index[variable_name].is_numeric
+        )
+        for year in years:
+            del period_map[year]
+        for month_key, value in months.items():
+            spread.setdefault((entity_plural, variable_name, month_key), {})[
+                entity_id
+            ] = value
+    return situation.household, spread
+
+
+def _set_spread_year_inputs(simulation, spread: SpreadYearInputs) -> None:
+    """Set ``_split_year_inputs``'s month values on ``simulation``.
+
+    Each month's array is built the way policyengine-core's situation
+    builder builds it from written-out keys: the month's other inputs
+    (or the variable's default) with each entity's value checked and
+    cast by the variable, so the simulation holds byte-identical inputs.
+    """
+    indices: dict[str, dict[str, int]] = {}
+    set_variables: dict[str, None] = {}
+    for (entity_plural, variable_name, month_key), values in spread.items():
+        holder = simulation.get_holder(variable_name)
+        variable = holder.variable
+        period = _parsed_period(month_key)
+        if variable.end is not None and period.start.date > variable.end:
+            # The builder skips inputs after a variable's end date too.
+            continue
+        population = holder.population
+        index_by_id = indices.get(entity_plural)
+        if index_by_id is None:
+            index_by_id = indices[entity_plural] = _index_by_id(population)
+        known = holder.get_array(period)
+        array = (
+            variable.default_array(population.count)
+            if known is None
+            else known.copy()
+        )
+        for entity_id, value in values.items():
+            array[index_by_id[entity_id]] = variable.check_set_value(value)
+        holder.set_input(period, array)
+        set_variables[variable_name] = None
+    input_variables = getattr(simulation, "input_variables", None)
+    if input_variables is not None:
+        # Core lists the variables with inputs once the situation is
+        # built; formulas (e.g. marginal tax rates) read it.
+        simulation.input_variables = list(
+            dict.fromkeys([*input_variables, *set_variables])
+        )
 
 
 def validate_policy_periods(policy_json: Union[dict, None]) -> None:
@@ -531,11 +1066,42 @@ def _cast_bool(value) -> bool:
     )
 
 
+DEFAULT_REFORM_SYSTEM_CACHE_MAX_ENTRIES = 8
+
+# `calculate` response formats: the household with computed values
+# filled in, (axes households only) one dense block of values, or only
+# the requested slots.
+HOUSEHOLD_FORMAT = "household"
+COLUMNAR_FORMAT = "columnar"
+SPARSE_FORMAT = "sparse"
+RESPONSE_FORMATS = (HOUSEHOLD_FORMAT, COLUMNAR_FORMAT, SPARSE_FORMAT)
+
+
+def reform_system_cache_max_entries() -> int:
+    return int(
+        get_config_value(
+            "app.reform_system_cache.max_entries",
+            DEFAULT_REFORM_SYSTEM_CACHE_MAX_ENTRIES,
+        )
+    )
+
+
+# Country packages share circular imports inside policyengine-core (its
+# country template), which a second thread can observe half-initialised
+# when two packages are imported at the same time; imports take turns.
+_PACKAGE_IMPORT_LOCK = threading.Lock()
+
+
+def import_country_package(package_name: str):
+    with _PACKAGE_IMPORT_LOCK:
+        return importlib.import_module(package_name)
+
+
 class PolicyEngineCountry:
     def __init__(self, country_package_name: str, country_id: str):
         self.country_package_name = country_package_name
         self.country_id = country_id
-        self.country_package = importlib.import_module(country_package_name)
+        self.country_package = import_country_package(country_package_name)
         self.tax_benefit_system: TaxBenefitSystem = (
             self.country_package.CountryTaxBenefitSystem()
         )
@@ -546,15 +1112,29 @@ class PolicyEngineCountry:
         # UK-specific accommodation lives in a UK strategy function and
         # all other countries share the standard core path.
         if country_id == "uk":
+            self._uk_simulations = UKSimulationFactory(self.country_package)
+            self._uk_simulations.prepare_system(self.tax_benefit_system)
             self._build_simulation = self._build_simulation_uk
-            self._axes_result_values = self._axes_result_values_uk
-            self._enum_result_name = self._enum_result_name_uk
+            self._build_reformed_system = self._uk_simulations.reformed_system
+            self._axes_result_rows = self._axes_result_rows_uk
+            self._enum_result_names = self._enum_result_names_uk
         else:
             self._build_simulation = self._build_simulation_standard
-            self._axes_result_values = self._axes_result_values_standard
-            self._enum_result_name = self._enum_result_name_standard
+            self._build_reformed_system = self._overlay_reform_system
+            self._axes_result_rows = self._axes_result_rows_standard
+            self._enum_result_names = self._enum_result_names_standard
+        # Reformed copies of ``tax_benefit_system``, keyed on the cast
+        # reform. Each holds its own variables and projections, so the
+        # bound is a small entry count rather than a byte size.
+        self._reformed_systems = BoundedLRUCache(
+            max_entries=reform_system_cache_max_entries()
+        )
+        self._axes_chunking = axes_chunk_config()
+        # Core fills in this period for axes that do not name one.
+        self._default_input_period = getattr(
+            self.country_package.Simulation, "default_input_period", None
+        )
         self.policyengine_bundle = self.build_policyengine_bundle()
-        self.build_metadata()
 
     def build_policyengine_bundle(self) -> dict:
         return {
@@ -563,8 +1143,14 @@ class PolicyEngineCountry:
             "dataset": None,
         }
 
-    def build_metadata(self):
-        self.metadata = dict(
+    @functools.cached_property
+    def metadata(self) -> dict:
+        # Built on first use: no request path reads it, and it walks
+        # every variable and parameter in the system.
+        return self.build_metadata()
+
+    def build_metadata(self) -> dict:
+        return dict(
             status="ok",
             message=None,
             result=dict(
@@ -880,87 +1466,134 @@ class PolicyEngineCountry:
             }
         return cast
 
+    def _reformed_system(self, reform: dict) -> TaxBenefitSystem:
+        """Return a system with ``reform`` applied, reusing a cached one.
+
+        ``reform`` must already be cast by ``_cast_reform_values``, so
+        equivalent policies (``"30000"`` vs ``30000``, any key order)
+        canonicalize to the same key. A cached system keeps the
+        parameter at-instant projections earlier requests built on it.
+        Simulations only read parameters, so concurrent requests can
+        share one reformed system the same way they share the baseline.
+        New systems come from the country's reformed-system builder.
+        """
+        key = hash_object(reform)
+        system = self._reformed_systems.get(key)
+        if system is not None:
+            set_attribute("reform_system_cache", "hit")
+            return system
+
+        set_attribute("reform_system_cache", "miss")
+        system = self._build_reformed_system(reform)
+        evicted = self._reformed_systems.put(key, system)
+        if evicted:
+            set_attribute("reform_system_cache_evictions", evicted)
+        return system
+
+    def _overlay_reform_system(self, reform: dict) -> TaxBenefitSystem:
+        """Overlay ``reform`` on the shared system (see ``reform_overlay``).
+
+        Falls back to a full clone for reforms an overlay cannot express.
+        """
+        system = overlay_reform(self.tax_benefit_system, reform)
+        if system is None:
+            set_attribute("reform_system_build", "clone")
+            return self._cloned_reform_system(reform)
+        set_attribute("reform_system_build", "overlay")
+        return system
+
+    def _cloned_reform_system(self, reform: dict) -> TaxBenefitSystem:
+        """Apply ``reform`` to a full clone of the shared system.
+
+        The fallback for reforms ``overlay_reform`` cannot express.
+        """
+        system = self.tax_benefit_system.clone()
+        for parameter_name, changes in reform.items():
+            parameter = get_parameter(system.parameters, parameter_name)
+            for time_period, value in changes.items():
+                start_instant, end_instant = time_period.split(".")
+                parameter.update(
+                    start=instant(start_instant),
+                    stop=instant(end_instant),
+                    value=value,
+                )
+        return system
+
     def _build_simulation_standard(
         self,
         normalized_household: dict,
         reform: Union[dict, None],
+        spread: SpreadYearInputs | None = None,
     ):
         """Build a core-style Simulation (US, CA, NG, IL).
 
-        Reforms are applied by mutating a clone of the shared system
-        before construction, so the shared instance stays pristine for
-        concurrent requests.
+        Reforms are applied to a copy-on-write copy of the shared
+        system, so the shared instance stays pristine for concurrent
+        requests; see ``_reformed_system``. ``spread`` holds the YEAR
+        inputs ``_split_year_inputs`` took out of the household.
         """
         system = self.tax_benefit_system
         if reform:
-            system = self.tax_benefit_system.clone()
-            for parameter_name, changes in reform.items():
-                parameter = get_parameter(system.parameters, parameter_name)
-                for time_period, value in changes.items():
-                    start_instant, end_instant = time_period.split(".")
-                    parameter.update(
-                        start=instant(start_instant),
-                        stop=instant(end_instant),
-                        value=value,
-                    )
+            system = self._reformed_system(reform)
         simulation = self.country_package.Simulation(
             tax_benefit_system=system,
             situation=normalized_household,
         )
+        if spread:
+            _set_spread_year_inputs(simulation, spread)
         return system, simulation
 
     def _build_simulation_uk(
         self,
         normalized_household: dict,
         reform: Union[dict, None],
+        spread: SpreadYearInputs | None = None,
     ):
         """Build a policyengine-uk wrapper-style Simulation.
 
-        The wrapper constructs its own tax-benefit system internally, so
-        reforms go in through its Scenario mechanism rather than a mutated
-        clone. ``applied_before_data_load`` must be True: the wrapper
-        creates structural reforms from parameter values during
-        construction, so parameter changes applied afterwards (the
-        default for ``Simulation(reform=...)``) never activate the
-        structural reforms they gate. Note the wrapper samples those
-        trigger parameters at its ``default_input_period``, so a reform
+        The wrapper builds its own tax-benefit system on construction, so
+        ``UKSimulationFactory`` builds the simulation on the shared
+        system instead, or on a cached system with the reform applied
+        the way the wrapper applies an ``applied_before_data_load``
+        Scenario. Structural reforms gated by reform parameters are
+        sampled at the wrapper's ``default_input_period``, so a reform
         must cover that instant — not just the calculation period — to
-        activate a structural reform.
+        activate one.
         """
-        scenario = None
+        system = self.tax_benefit_system
         if reform:
-            scenario = self.country_package.Scenario.from_reform(reform)
-            scenario.applied_before_data_load = True
-        simulation = self.country_package.Simulation(
-            scenario=scenario,
-            situation=normalized_household,
+            system = self._reformed_system(reform)
+        simulation = self._uk_simulations.simulation(
+            system,
+            normalized_household,
+            baseline_system=self.tax_benefit_system if reform else None,
+            prepare=(
+                functools.partial(_set_spread_year_inputs, spread=spread)
+                if spread
+                else None
+            ),
         )
-        # The shared system serves variable metadata in the response
-        # loop; the wrapper's internal system is the one calculated on.
-        return self.tax_benefit_system, simulation
+        return system, simulation
 
-    def _axes_result_values_standard(
-        self, result, count_entities: int, entity_index: int, variable
-    ) -> list:
-        """Reshape an axes-scan result into this entity's value list.
+    def _axes_result_rows_standard(
+        self, result, count_entities: int, variable
+    ) -> list[Union[list, None]]:
+        """Reshape an axes-scan result into one value array per entity.
 
         Core-style results cast cleanly to float — including EnumArray,
         which yields the enum's numeric indices (documented behavior the
-        US API has always exposed).
+        US API has always exposed). A row holding an infinite value
+        comes back as ``None``, which leaves that entity's slot unfilled.
         """
-        values = (
-            result.astype(float)
-            .reshape((-1, count_entities))
-            .T[entity_index]
-            .tolist()
-        )
-        if any(math.isinf(value) for value in values):
-            raise ValueError("Infinite value")
-        return values
-
-    def _axes_result_values_uk(
-        self, result, count_entities: int, entity_index: int, variable
-    ) -> list:
+        rows = result.astype(float).reshape((-1, count_entities)).T
+        return [
+            None if infinite else row
+            for row, infinite in zip(rows, np.isinf(rows).any(axis=1))
+        ]
+
+    def _axes_result_rows_uk(
+        self, result, count_entities: int, variable
+    ) -> list[Union[list, None]]:
         """UK axes results: enums arrive as decoded string arrays.
 
         The wrapper Simulation decodes enum results before returning, so
@@ -968,135 +1601,620 @@ class PolicyEngineCountry:
         would silently null the slot; return the names instead.
         """
         if variable.value_type == Enum:
-            return (
-                result.reshape((-1, count_entities)).T[entity_index].tolist()
-            )
-        return self._axes_result_values_standard(
-            result, count_entities, entity_index, variable
+            return list(result.reshape((-1, count_entities)).T)
+        return self._axes_result_rows_standard(
+            result, count_entities, variable
         )
 
     @staticmethod
-    def _enum_result_name_standard(result, entity_index: int) -> str:
-        return result.decode()[entity_index].name
+    def _enum_result_names_standard(result) -> list[str]:
+        return [item.name for item in result.decode()]
 
     @staticmethod
-    def _enum_result_name_uk(result, entity_index: int) -> str:
+    def _enum_result_names_uk(result) -> list[str]:
         # The wrapper's calculate() has already decoded enum results to
         # plain string arrays.
-        return str(result[entity_index])
+        return [str(value) for value in result]
+
+    def _result_values(self, result, variable) -> list:
+        """Convert a whole result array to JSON-ready Python values."""
+        if variable.value_type == Enum:
+            return self._enum_result_names(result)
+        if variable.value_type is float:
+            # `str` first: float32 results would otherwise widen to
+            # float64 noise (0.1 -> 0.10000000149011612).
+            return [_json_float(float(str(value))) for value in result]
+        if variable.value_type is str:
+            return [str(value) for value in result]
+        return result.tolist()
 
     def calculate(
         self,
         household: dict,
         reform: Union[dict, None] = None,
+        *,
+        use_cache: bool = False,
+        period_expansions: tuple[tuple[str, str, str], ...] | None = None,
+        response_format: str = HOUSEHOLD_FORMAT,
+        requested: Sequence[tuple[str, str, str, str]] | None = None,
+        incremental: IncrementalCalculation | None = None,
     ):
+        """Calculate every requested (``None``) value in ``household``.
+
+        With ``use_cache``, identical requests are served from the
+        process-wide result cache (see ``result_cache``) when it is
+        enabled. ``period_expansions`` is the household's
+        ``walk_household`` result and ``requested`` its
+        ``get_requested_computations`` result, for callers that already
+        have them. ``incremental`` (households without axes) adopts the
+        built simulation, seeding it with the values an earlier
+        calculation of the household left (see ``incremental``); such a
+        calculation bypasses the result cache.
+
+        ``response_format`` ``"columnar"`` (axes households only) returns
+        ``{"axes": [...], "values": {variable: {period: {entity_id:
+        array}}}}`` instead of the household with values filled in:
+        each axis's coordinates once, then one numpy array per requested
+        value, both in grid-cell order. A value that could not be
+        calculated is ``None``. The arrays are left for the response
+        encoder (see ``response_encoding``) to serialize.
+        """
         reform = self._cast_reform_values(reform)
+        if not use_cache or RESULT_CACHE is None or incremental is not None:
+            return self._calculate(
+                household,
+                reform,
+                period_expansions,
+                response_format,
+                requested,
+                incremental,
+            )
+        key = result_cache_key(
+            self.country_id,
+            household,
+            reform,
+            self.policyengine_bundle["model_version"],
+            response_format,
+        )
+        return RESULT_CACHE.get_or_calculate(
+            key,
+            lambda: self._calculate(
+                household,
+                reform,
+                period_expansions,
+                response_format,
+                requested,
+            ),
+        )
 
-        # Hand a normalized copy to the engine so YEAR-keyed inputs on
+    def _calculate(
+        self,
+        household: dict,
+        reform: Union[dict, None],
+        period_expansions: tuple[tuple[str, str, str], ...] | None = None,
+        response_format: str = HOUSEHOLD_FORMAT,
+        requested: Sequence[tuple[str, str, str, str]] | None = None,
+        incremental: IncrementalCalculation | None = None,
+    ):
+        # Hand a normalized view to the engine so YEAR-keyed inputs on
         # MONTH-defined variables behave like the hosted v1 API instead of
-        # being silently dropped (issue #1489). The normalizer deep-copies
-        # internally so the original `household` is intact and the response
-        # can echo back the partner's keys. It reads only variable
-        # metadata, which a parametric reform never changes, so the shared
-        # system serves both builders here.
-        normalized_household = _normalize_period_keys(
-            household, self.tax_benefit_system
-        )
+        # being silently dropped (issue #1489). Only the period maps that
+        # change are copied, so the original `household` is intact and
+        # the response can echo back the partner's keys. Both paths read
+        # only variable metadata, which a parametric reform never
+        # changes, so the shared system serves both builders here.
+        has_axes = "axes" in household
+        spread = None
+        if has_axes:
+            # Axes scans build their situations from the household
+            # itself, so the months are written into it.
+            normalized_household = _normalize_period_keys(
+                household, self.tax_benefit_system, period_expansions
+            )
+        else:
+            # Otherwise the months go to the simulation directly, once
+            # it is built (see `_split_year_inputs`).
+            normalized_household, spread = _split_year_inputs(
+                household, self.tax_benefit_system, period_expansions
+            )
 
-        system, simulation = self._build_simulation(
-            normalized_household, reform
+        if requested is None:
+            requested = get_requested_computations(household)
+        normalized_household = _without_period_ranges(
+            normalized_household, requested
         )
 
-        # Independent clone for the response-building loop below, which
-        # mutates `household` to fill in computed values. Not related to
-        # the normalizer above — that one's already a separate copy.
-        household = json.loads(json.dumps(household))
-
-        requested_computations = get_requested_computations(household)
+        # The response echoes `household` with computed values filled
+        # in; only the period maps that receive a value are copied. A
+        # sparse response holds the requested slots alone.
+        if response_format == SPARSE_FORMAT:
+            response = _SparseResult(requested)
+        else:
+            response = CopyOnWriteHousehold(household)
 
+        # Requests for the same array (one variable and period, asked of
+        # several entities) are calculated and converted once, then
+        # scattered to the entities that asked for them.
+        requested_entities: dict[tuple[str, str, str], list[str]] = {}
         for (
             entity_plural,
             entity_id,
             variable_name,
             period,
-        ) in requested_computations:
+        ) in requested:
+            requested_entities.setdefault(
+                (entity_plural, variable_name, period), []
+            ).append(entity_id)
+
+        columns = None
+        if response_format == COLUMNAR_FORMAT:
+            grid = axes_grid(
+                normalized_household,
+                self.tax_benefit_system,
+                self._default_input_period,
+            )
+            if grid is None:
+                raise ValueError(
+                    "Columnar results need axes given as lists of "
+                    "parallel axes with numeric bounds."
+                )
+            columns = {}
+            for (
+                _,
+                variable_name,
+                period,
+            ), entity_ids in requested_entities.items():
+                columns.setdefault(variable_name, {}).setdefault(
+                    period, {}
+                ).update(dict.fromkeys(entity_ids))
+
+        scan = None
+        if has_axes:
+            scan = plan_axes_scan(
+                normalized_household,
+                self.tax_benefit_system,
+                self._default_input_period,
+                self._axes_chunking,
+            )
+        if scan is None:
+            system, simulation = self._build_simulation(
+                normalized_household, reform, spread
+            )
+            if incremental is not None:
+                incremental.adopt(simulation, reform)
+            calculate_array = simulation.calculate
+        else:
+            # Large scans run as a sequence of smaller simulations; see
+            # `axes`. Each array is stitched back in cell order, so it
+            # reshapes exactly like an unchunked scan's.
+            system = (
+                self._reformed_system(reform)
+                if reform
+                else self.tax_benefit_system
+            )
+            set_attribute("axes_chunks", len(scan.chunks()))
+            arrays = evaluate_axes_scan(
+                scan,
+                system,
+                lambda situation: self._build_simulation(situation, reform)[1],
+                list(
+                    dict.fromkeys(
+                        (variable_name, period)
+                        for _, variable_name, period in requested_entities
+                    )
+                ),
+                workers=self._axes_chunking.workers,
+            )
+
+            def calculate_array(variable_name, period):
+                array = arrays[(variable_name, period)]
+                if isinstance(array, Exception):
+                    raise array
+                return array
+
+        # Each array is converted once, so the months of a period range
+        # are shared with any other range or single month that asks for
+        # them.
+        converted: dict[tuple[str, str], list] = {}
+
+        def period_values(variable, period) -> list:
+            values = converted.get((variable.name, period))
+            if values is None:
+                values = converted[(variable.name, period)] = (
+                    self._result_values(
+                        calculate_array(variable.name, period), variable
+                    )
+                )
+            return values
+
+        entity_indices: dict[str, dict[str, int]] = {}
+        for (
+            entity_plural,
+            variable_name,
+            period,
+        ), entity_ids in requested_entities.items():
+            entities = household[entity_plural]
             try:
                 variable = system.get_variable(variable_name)
-                result = simulation.calculate(variable_name, period)
-                population = simulation.get_population(entity_plural)
-                if "axes" in household:
-                    count_entities = len(household[entity_plural])
-                    entity_index = 0
-                    for _entity_id in household[entity_plural].keys():
-                        if _entity_id == entity_id:
-                            break
-                        entity_index += 1
-                    household[entity_plural][entity_id][variable_name][
-                        period
-                    ] = self._axes_result_values(
-                        result, count_entities, entity_index, variable
+                if has_axes:
+                    result = calculate_array(variable_name, period)
+                    rows = self._axes_result_rows(
+                        result, len(entities), variable
                     )
+                    index_by_id = {
+                        entity_id: index
+                        for index, entity_id in enumerate(entities)
+                    }
                 else:
-                    entity_index = population.get_index(entity_id)
-                    if variable.value_type == Enum:
-                        entity_result = self._enum_result_name(
-                            result, entity_index
-                        )
-                    elif variable.value_type is float:
-                        entity_result = float(str(result[entity_index]))
-                        # Convert infinities to JSON infinities
-                        if entity_result == float("inf"):
-                            entity_result = "Infinity"
-                        elif entity_result == float("-inf"):
-                            entity_result = "-Infinity"
-                    elif variable.value_type is str:
-                        entity_result = str(result[entity_index])
+                    months = _period_range_months(period)
+                    if months is None:
+                        values = period_values(variable, period)
                     else:
-                        entity_result = result.tolist()[entity_index]
-
-                    household[entity_plural][entity_id][variable_name][
-                        period
-                    ] = entity_result
+                        # One list of monthly values per entity.
+                        values = [
+                            list(entity_months)
+                            for entity_months in zip(
+                                *(
+                                    period_values(variable, month)
+                                    for month in months
+                                )
+                            )
+                        ]
+                    index_by_id = entity_indices.get(entity_plural)
+                    if index_by_id is None:
+                        index_by_id = entity_indices[entity_plural] = (
+                            _index_by_id(
+                                simulation.get_population(entity_plural)
+                            )
+                        )
             except Exception as e:
-                if "axes" in household:
-                    pass
-                else:
-                    household[entity_plural][entity_id][variable_name][
-                        period
-                    ] = None
+                # Failed slots keep the `None` the partner sent.
+                if not has_axes:
+                    for entity_id in entity_ids:
+                        print(
+                            f"Error computing {variable_name} for "
+                            f"{entity_id}: {e}"
+                        )
+                continue
+
+            for entity_id in entity_ids:
+                if columns is not None:
+                    columns[variable_name][period][entity_id] = rows[
+                        index_by_id[entity_id]
+                    ]
+                    continue
+                if has_axes:
+                    entity_values = rows[index_by_id[entity_id]]
+                    if entity_values is not None:
+                        response.writable(
+                            entity_plural, entity_id, variable_name
+                        )[period] = entity_values.tolist()
+                    continue
+                try:
+                    entity_result = values[index_by_id[entity_id]]
+                except (IndexError, KeyError) as e:
                     print(
                         f"Error computing {variable_name} for {entity_id}: {e}"
                     )
+                    continue
+                response.writable(entity_plural, entity_id, variable_name)[
+                    period
+                ] = entity_result
+
+        if columns is not None:
+            return {"axes": grid.coordinates(), "values": columns}
+        return response.household
+
+    def calculate_batch(
+        self,
+        households: list[dict],
+        reform: Union[dict, None] = None,
+        *,
+        use_cache: bool = False,
+    ) -> list[Union[dict, Exception]]:
+        """Calculate many independent households under one policy.
+
+        Households without axes are stacked into a single situation so
+        each formula runs once across every entity in the batch. Returns
+        one entry per household, in order: the calculated household, or
+        the exception that household raised. If the stacked simulation
+        fails (one household can poison the shared situation, e.g. with
+        a membership the engine rejects), every stacked household is
+        recalculated on its own so the error lands on the item that
+        caused it. ``use_cache`` applies to households calculated on
+        their own; a stacked situation is never cached.
+        """
+        results: list = [None] * len(households)
+        stackable = [
+            index
+            for index, household in enumerate(households)
+            if can_stack(household)
+        ]
+        if len(stackable) > 1:
+            stacked = stack_households(
+                [households[index] for index in stackable],
+                self.tax_benefit_system,
+            )
+            try:
+                stacked_result = self._calculate(
+                    stacked.household, self._cast_reform_values(reform)
+                )
+            except Exception:
+                logging.exception(
+                    "Stacked batch calculation failed; recalculating "
+                    "households individually."
+                )
+            else:
+                for index, household_result in zip(
+                    stackable, unstack_result(stacked, stacked_result)
+                ):
+                    results[index] = household_result
+
+        for index, household in enumerate(households):
+            if results[index] is not None:
+                continue
+            try:
+                results[index] = self.calculate(
+                    household, reform, use_cache=use_cache
+                )
+            except Exception as e:
+                results[index] = e
+        return results
 
-        return household
+
+def _json_float(value: float) -> Union[float, str]:
+    # Infinities have no JSON literal; send the strings JSON parsers
+    # conventionally accept instead.
+    if value == float("inf"):
+        return "Infinity"
+    if value == float("-inf"):
+        return "-Infinity"
+    return value
+
+
+def _index_by_id(population) -> dict[str, int]:
+    """Map entity ids to array positions (``population.get_index`` in one
+    pass; it scans the id list on every call)."""
+    index_by_id: dict[str, int] = {}
+    for index, entity_id in enumerate(population.ids):
+        index_by_id.setdefault(entity_id, index)
+    return index_by_id
 
 
 def get_requested_computations(household: dict):
-    requested_computations = dpath.search(
-        household,
-        "*/*/*/*",
-        afilter=lambda t: t is None,
-        yielded=True,
-    )
+    """List ``(entity_plural, entity_id, variable_name, period)`` for
+    every ``None`` value in ``household``, in payload order."""
     requested_computation_data = []
+    for entity_plural, entities in household.items():
+        if not isinstance(entities, dict):
+            continue
+        for entity_id, entity in entities.items():
+            if not isinstance(entity, dict):
+                continue
+            for variable_name, values in entity.items():
+                if not isinstance(values, dict):
+                    continue
+                for period, value in values.items():
+                    if value is None:
+                        requested_computation_data.append(
+                            (entity_plural, entity_id, variable_name, period)
+                        )
+
+    return requested_computation_data
 
-    for computation in requested_computations:
-        path = computation[0]
-        entity_plural, entity_id, variable_name, period = path.split("/")
-        requested_computation_data.append(
-            (entity_plural, entity_id, variable_name, period)
+
+def _without_period_ranges(
+    household: dict, requested: list[tuple[str, str, str, str]]
+) -> dict:
+    """``household`` without its period-range slots, which the engine
+    cannot parse; only the maps that held one are copied."""
+    engine_household = CopyOnWriteHousehold(household)
+    for entity_plural, entity_id, variable_name, period in requested:
+        if _period_range_months(period) is not None:
+            del engine_household.writable(
+                entity_plural, entity_id, variable_name
+            )[period]
+    return engine_household.household
+
+
+class _SparseResult:
+    """The requested slots of a household alone, each ``None`` until a
+    value is written; ``_calculate`` writes through it as it would a
+    ``CopyOnWriteHousehold``."""
+
+    def __init__(self, requested: list[tuple[str, str, str, str]]):
+        self.household: dict = {}
+        for entity_plural, entity_id, variable_name, period in requested:
+            self.writable(entity_plural, entity_id, variable_name)[period] = (
+                None
+            )
+
+    def writable(
+        self, entity_plural: str, entity_id: str, variable_name: str
+    ) -> dict:
+        return (
+            self.household.setdefault(entity_plural, {})
+            .setdefault(entity_id, {})
+            .setdefault(variable_name, {})
         )
 
-    return requested_computation_data
 
+def with_requested_outputs(household: dict, outputs, system) -> dict:
+    """``household`` with a ``None`` slot for every entry of ``outputs``.
 
-COUNTRIES = {
-    "uk": PolicyEngineCountry("policyengine_uk", "uk"),
-    "us": PolicyEngineCountry("policyengine_us", "us"),
-    "ca": PolicyEngineCountry("policyengine_canada", "ca"),
-    "ng": PolicyEngineCountry("policyengine_ng", "ng"),
-    "il": PolicyEngineCountry("policyengine_il", "il"),
-}
+    Each entry is ``{"variable": name, "period": key}``, plus an optional
+    ``"entities"`` list of ids in the variable's entity group (default:
+    all of them), so partners can name the values they want instead of
+    writing placeholders. Only the maps that gain a slot are copied.
+    Raises ``ValueError`` with a partner-facing message for a malformed
+    entry, an unknown variable or entity, or a slot that holds an input.
+    """
+    if not isinstance(outputs, list):
+        raise ValueError("'outputs' must be a list")
+    response = CopyOnWriteHousehold(household)
+    for index, output in enumerate(outputs):
+        if not isinstance(output, dict):
+            raise ValueError(f"'outputs[{index}]' must be an object")
+        variable_name = output.get("variable")
+        period = output.get("period")
+        if not isinstance(variable_name, str) or not isinstance(period, str):
+            raise ValueError(
+                f"'outputs[{index}]' must name a 'variable' and a 'period'"
+            )
+        variable = system.variables.get(variable_name)
+        if variable is None:
+            raise ValueError(
+                f"'outputs[{index}]' asks for `{variable_name}`, which is "
+                "not a variable in this model"
+            )
+        entity_plural = variable.entity.plural
+        entities = household.get(entity_plural)
+        if not isinstance(entities, dict):
+            raise ValueError(
+                f"'outputs[{index}]' asks for `{variable_name}`, but the "
+                f"household has no `{entity_plural}`"
+            )
+        entity_ids = output.get("entities", list(entities))
+        if not isinstance(entity_ids, list):
+            raise ValueError(f"'outputs[{index}].entities' must be a list")
+        for entity_id in entity_ids:
+            if not isinstance(entity_id, str) or entity_id not in entities:
+                raise ValueError(
+                    f"'outputs[{index}]' asks for `{variable_name}` on "
+                    f"`{entity_plural}/{entity_id}`, which is not in the "
+                    "household"
+                )
+            values = entities[entity_id].get(variable_name) or {}
+            if values.get(period) is not None:
+                raise ValueError(
+                    f"'outputs[{index}]' asks for `{variable_name}` on "
+                    f"`{entity_plural}/{entity_id}` in {period}, which is "
+                    "an input"
+                )
+            entity = response.writable(entity_plural, entity_id)
+            entity[variable_name] = {**values, period: None}
+    return response.household
+
+
+def _configured_country_ids(path: str, default: tuple[str, ...]) -> tuple:
+    value = get_config_value(path, None)
+    if value is None:
+        return default
+    if isinstance(value, str):
+        # Environment overrides (APP__COUNTRIES__SERVE=us,uk) are strings.
+        value = [part for part in value.split(",") if part.strip()]
+    if not isinstance(value, (list, tuple)):
+        raise ValueError(f"{path} must be a list of country ids")
+    country_ids = tuple(str(country_id).strip() for country_id in value)
+    unknown = [
+        country_id
+        for country_id in country_ids
+        if country_id not in COUNTRY_PACKAGES
+    ]
+    if unknown:
+        raise ValueError(
+            f"{path} must only name countries among "
+            f"{', '.join(COUNTRY_PACKAGES)}; got {', '.join(unknown)}"
+        )
+    return country_ids
+
+
+def served_country_ids() -> tuple[str, ...]:
+    return _configured_country_ids(
+        "app.countries.serve", tuple(COUNTRY_PACKAGES)
+    )
+
+
+def prewarm_country_ids() -> tuple[str, ...]:
+    return _configured_country_ids(
+        "app.countries.prewarm", served_country_ids()
+    )
+
+
+class CountryRegistry(Mapping):
+    """The countries this process serves, each built on first use.
+
+    Building a country imports its package and constructs its
+    tax-benefit system, which takes seconds and hundreds of MiB, so a
+    process only pays for the countries it is asked about. Membership,
+    iteration and ``len`` never build anything; looking a country up
+    builds it once, however many threads ask for it at the same time,
+    and a build that raises is retried by the next lookup.
+    """
+
+    def __init__(
+        self,
+        package_names: Mapping[str, str],
+        factory: Callable[[str, str], PolicyEngineCountry] = (
+            PolicyEngineCountry
+        ),
+    ):
+        self._package_names = dict(package_names)
+        self._factory = factory
+        self._countries: dict[str, PolicyEngineCountry] = {}
+        self._locks = {
+            country_id: threading.Lock() for country_id in package_names
+        }
+
+    def __getitem__(self, country_id: str) -> PolicyEngineCountry:
+        country = self._countries.get(country_id)
+        if country is not None:
+            return country
+        package_name = self._package_names[country_id]
+        with self._locks[country_id]:
+            country = self._countries.get(country_id)
+            if country is None:
+                country = self._build(package_name, country_id)
+                self._countries[country_id] = country
+        return country
+
+    def __contains__(self, country_id) -> bool:
+        return country_id in self._package_names
+
+    def __iter__(self):
+        return iter(self._package_names)
+
+    def __len__(self) -> int:
+        return len(self._package_names)
+
+    def package_name(self, country_id: str) -> str:
+        return self._package_names[country_id]
+
+    def loaded(self) -> tuple[str, ...]:
+        """The served countries built so far, in serving order."""
+        return tuple(
+            country_id
+            for country_id in self._package_names
+            if country_id in self._countries
+        )
+
+    def prewarm(self, country_ids: Sequence[str] | None = None) -> None:
+        """Build ``country_ids`` (default: ``app.countries.prewarm``) now."""
+        if country_ids is None:
+            country_ids = prewarm_country_ids()
+        for country_id in country_ids:
+            if country_id in self:
+                self[country_id]
+
+    def _build(self, package_name: str, country_id: str):
+        started_at = time.perf_counter()
+        with segment(SegmentName.COUNTRY_LOAD, country_id=country_id):
+            country = self._factory(package_name, country_id)
+        logger.info(
+            "Built the %s tax-benefit system in %.1fs",
+            country_id,
+            time.perf_counter() - started_at,
+        )
+        return country
+
+
+COUNTRY_PACKAGES = dict(zip(COUNTRY_IDS, COUNTRY_PACKAGE_NAMES))
+COUNTRIES = CountryRegistry(
+    {
+        country_id: COUNTRY_PACKAGES[country_id]
+        for country_id in served_country_ids()
+    }
+)
 
 
 def validate_country(country_id: str) -> Union[None, Response]:
@@ -1113,5 +2231,5 @@ def validate_country(country_id: str) -> Union[None, Response]:
             status="error",
             message=f"Country {country_id} not found. Available countries are: {', '.join(COUNTRIES.keys())}",
         )
-        return Response(json.dumps(body), status=404)
+        return Response(json_codec.dumps(body), status=404)
     return None
@@ -26,9 +26,6 @@ from policyengine_household_common.routing_metadata import (
     REQUESTED_VERSION_ENVIRON_KEY,
     RESOLVED_CHANNEL_ENVIRON_KEY,
 )
-from policyengine_household_common.variable_usage_analytics import (
-    extract_variable_usage,
-)
 from policyengine_household_common.config_loader import get_config_value
 
 logger = logging.getLogger(__name__)
@@ -148,26 +145,30 @@ def _build_analytics_context(args, kwargs) -> AnalyticsContext:
     if country_id is None or not _collect_variable_usage():
         return context
 
-    from policyengine_household_api.country import COUNTRIES
+    from policyengine_household_api.country import COUNTRIES, walk_household
 
     country = COUNTRIES.get(country_id)
     if country is None:
         return context
+    model_version = country.policyengine_bundle.get("model_version")
     variable_summaries: tuple[VariableUsageSummary, ...] = ()
     if isinstance(payload, dict):
         household = payload.get("household", {})
         if isinstance(household, dict):
-            variable_summaries = tuple(
-                extract_variable_usage(
-                    household,
-                    country.tax_benefit_system,
-                )
+            # The calculate endpoint reuses this walk for its own checks.
+            walk = walk_household(
+                household,
+                country.tax_benefit_system,
+                model_version=model_version,
+                collect_usage=True,
             )
+            g.household_walk = walk
+            variable_summaries = tuple(walk.variable_usage)
 
     return context.model_copy(
         update={
             "record_calculate_request": True,
-            "model_version": country.policyengine_bundle.get("model_version"),
+            "model_version": model_version,
             "variable_summaries": variable_summaries,
         },
     )
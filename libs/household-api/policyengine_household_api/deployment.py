@@ -6,6 +6,7 @@ Run worker Dockerfile imports them without the modal SDK installed.
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 import importlib
 import json
 import logging
@@ -89,38 +90,50 @@ def prewarm_parameter_caches(
     """Eagerly build parameter at-instant projections on the runtime systems.
 
     Must run against the tax-benefit system instances that serve
-    requests (the caches live on the instances): defaults to the
-    ``COUNTRIES`` singletons. Called from the Modal worker's
+    requests (the caches live on the instances): defaults to every
+    country the process serves, building any ``COUNTRIES`` has not
+    loaded yet. Called from the Modal worker's
     memory-snapshot hook so the populated caches ride the snapshot and
     restored containers serve their first heavy request warm instead of
     paying a 60-105s build against the failover gateway's 90s budget
-    (issue #1624).
+    (issue #1624). The Cloud Run worker runs it on a background thread
+    from boot (see ``policyengine_household_api.warmup``), where
+    projections are loaded from the image's system snapshots when
+    ``app.startup.snapshot_dir`` is set. Countries are warmed
+    concurrently, each on one thread (see
+    ``policyengine_household_api.startup``).
     """
-    logger = logging.getLogger(__name__)
-
-    if tax_benefit_systems is None:
-        from policyengine_household_api.country import COUNTRIES
+    from policyengine_household_api.startup import prewarm_systems
 
-        tax_benefit_systems = {
-            country_id: country.tax_benefit_system
-            for country_id, country in COUNTRIES.items()
-        }
     if instants is None:
         instants = parameter_prewarm_instants()
 
-    for country_id, system in tax_benefit_systems.items():
-        started_at = time.monotonic()
-        for instant in instants:
-            system.get_parameters_at_instant(instant)
-        logger.info(
-            "Pre-built %d parameter instants for %s in %.1fs",
-            len(instants),
-            country_id,
-            time.monotonic() - started_at,
-        )
+    if tax_benefit_systems is None:
+        from policyengine_household_api.warmup import warm_parameters
+
+        warm_parameters(instants)
+    else:
+        prewarm_systems(tax_benefit_systems, instants)
+
 
+PRELOAD_PACKAGE_NAMES = (
+    "policyengine_uk",
+    "policyengine_us",
+    "policyengine_canada",
+    "policyengine_ng",
+    "policyengine_il",
+)
 
-def preload_country_packages() -> None:
+
+def _preload_country_package(package_name: str) -> tuple[float, float]:
+    started_at = time.monotonic()
+    country_package = importlib.import_module(package_name)
+    imported_at = time.monotonic()
+    country_package.CountryTaxBenefitSystem()
+    return imported_at - started_at, time.monotonic() - imported_at
+
+
+def preload_country_packages(workers: int | None = None) -> None:
     """Import and build the country packages during the image build.
 
     Runs via ``Image.run_function``, which snapshots the resulting
@@ -129,21 +142,99 @@ def preload_country_packages() -> None:
     in-memory system instances built here are discarded; memory-state
     warming belongs in the worker's ``@modal.enter(snap=True)`` hook
     (see ``prewarm_parameter_caches``).
+
+    Since nothing built here is kept, each package builds in its own
+    process (``workers`` at a time, default one per CPU), clear of the
+    GIL; ``workers=1`` builds them in this process, one after another.
     """
 
     logging.basicConfig(level=logging.INFO)
     logger = logging.getLogger(__name__)
 
-    country_package_names = (
-        "policyengine_uk",
-        "policyengine_us",
-        "policyengine_canada",
-        "policyengine_ng",
-        "policyengine_il",
+    if workers is None:
+        workers = min(len(PRELOAD_PACKAGE_NAMES), os.cpu_count() or 1)
+    started_at = time.monotonic()
+    if workers == 1:
+        timings = []
+        for package_name in PRELOAD_PACKAGE_NAMES:
+            logger.info("Pre-loading %s tax-benefit system...", package_name)
+            timings.append(_preload_country_package(package_name))
+    else:
+        logger.info(
+            "Pre-loading %s tax-benefit systems in %d processes...",
+            ", ".join(PRELOAD_PACKAGE_NAMES),
+            workers,
+        )
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            timings = list(
+                pool.map(_preload_country_package, PRELOAD_PACKAGE_NAMES)
+            )
+
+    for package_name, (import_seconds, build_seconds) in zip(
+        PRELOAD_PACKAGE_NAMES, timings
+    ):
+        logger.info(
+            "Pre-loaded %s: import %.1fs, system build %.1fs",
+            package_name,
+            import_seconds,
+            build_seconds,
+        )
+    logger.info(
+        "Household API tax-benefit systems pre-loaded in %.1fs",
+        time.monotonic() - started_at,
     )
-    for package_name in country_package_names:
-        logger.info("Pre-loading %s tax-benefit system...", package_name)
-        country_package = importlib.import_module(package_name)
-        country_package.CountryTaxBenefitSystem()
 
-    logger.info("Household API tax-benefit systems pre-loaded")
+
+def _write_system_snapshot(
+    country_id: str, directory: str, instants: Sequence[str]
+) -> float:
+    from policyengine_household_api.country import COUNTRIES
+    from policyengine_household_api.system_snapshot import write_snapshot
+
+    started_at = time.monotonic()
+    write_snapshot(COUNTRIES[country_id], directory, instants)
+    return time.monotonic() - started_at
+
+
+def write_system_snapshots(
+    directory: str,
+    instants: Sequence[str] | None = None,
+    workers: int | None = None,
+) -> None:
+    """Write each served country's system snapshot during the image build.
+
+    The Cloud Run worker has no memory snapshot, so its image carries
+    the prewarmed parameter projections on disk instead, and the worker
+    loads them at boot from ``app.startup.snapshot_dir`` (see
+    ``policyengine_household_api.system_snapshot``). Like
+    ``preload_country_packages``, each country builds in its own process
+    (``workers`` at a time, default one per CPU).
+    """
+    from policyengine_household_api.country import served_country_ids
+
+    logging.basicConfig(level=logging.INFO)
+    logger = logging.getLogger(__name__)
+
+    country_ids = served_country_ids()
+    if instants is None:
+        instants = parameter_prewarm_instants()
+    if workers is None:
+        workers = min(len(country_ids), os.cpu_count() or 1)
+    arguments = (
+        country_ids,
+        [directory] * len(country_ids),
+        [tuple(instants)] * len(country_ids),
+    )
+    if workers == 1:
+        durations = list(map(_write_system_snapshot, *arguments))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            durations = list(pool.map(_write_system_snapshot, *arguments))
+
+    for country_id, duration in zip(country_ids, durations):
+        logger.info(
+            "Wrote the %s system snapshot (%d parameter instants) in %.1fs",
+            country_id,
+            len(instants),
+            duration,
+        )
@@ -3,3 +3,5 @@ from .analytics import (
 )
 from .home import get_home as get_home
 from .household import get_calculate as get_calculate
+from .household import get_calculate_batch as get_calculate_batch
+from .household import get_templates as get_templates
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
-import json
 import logging
 from typing import Any
 
@@ -18,6 +17,7 @@ from policyengine_household_analytics.orm import (
     CalculateRequest,
     CalculateRequestVariable,
 )
+from policyengine_household_common import json_codec
 from policyengine_household_common.models.analytics import ModalResolvedChannel
 
 
@@ -393,7 +393,7 @@ def _datetime_to_json(value: datetime | None) -> str | None:
 
 def _json_response(payload: dict[str, Any], *, status: int = 200) -> Response:
     return Response(
-        json.dumps(payload),
+        json_codec.dumps(payload),
         status=status,
         mimetype="application/json",
     )
@@ -1,6 +1,5 @@
-import json
-
 from flask import Response
+from policyengine_household_common import json_codec
 
 
 def get_home() -> Response:
@@ -29,7 +28,7 @@ def get_home() -> Response:
     }
 
     return Response(
-        json.dumps(response_body),
+        json_codec.dumps(response_body),
         status=200,
         mimetype="application/json",
     )
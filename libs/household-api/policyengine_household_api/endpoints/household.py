@@ -1,37 +1,60 @@
-import json
+from collections.abc import Callable
+from dataclasses import dataclass
 import logging
-from flask import Response, request
+from flask import Response, g, request
 from policyengine_observability import record_error
 from policyengine_observability import segment
 from policyengine_observability import set_attribute
 from pydantic import ValidationError
 from policyengine_household_api.country import (
+    COLUMNAR_FORMAT,
     COUNTRIES,
-    detect_period_warnings,
-    validate_period_budgets,
-    validate_period_keys,
+    HOUSEHOLD_FORMAT,
+    RESPONSE_FORMATS,
+    HouseholdWalk,
+    period_budget_error,
     validate_policy_periods,
+    walk_household,
+    with_requested_outputs,
 )
+from policyengine_household_common import json_codec
 from policyengine_household_common.models.household import (
     HouseholdModelGeneric,
     HouseholdModelUK,
     HouseholdModelUS,
 )
 from policyengine_household_common.observability.segments import SegmentName
-from policyengine_household_common.deprecated_inputs import (
-    drop_deprecated_inputs,
+from policyengine_household_api.incremental import IncrementalCalculation
+from policyengine_household_api.response_encoding import (
+    JSON_MEDIA_TYPE,
+    encode_response_body,
+    negotiate_media_type,
 )
-from policyengine_household_api.utils.variable_validation import (
-    validate_household_variables,
+from policyengine_household_api.result_cache import cache_bypass_requested
+from policyengine_household_api.sessions import (
+    SESSIONS,
+    HouseholdSession,
+)
+from policyengine_household_api.templates import (
+    TEMPLATES,
+    household_template,
 )
 from policyengine_household_api.utils.validate_country import validate_country
 
 
 # Limits for reform-style "axes" scans. Axes multiply the computation
 # cost by count_0 * count_1 * ... for each entry, so uncapped axes can
-# be used to DoS the compute pool. Keep these conservative.
+# be used to DoS the compute pool. Scans larger than the configured
+# memory budget are evaluated in chunks (see `axes`), which bounds their
+# memory but not their time, so the grid as a whole is capped too.
 MAX_AXES_ENTRIES = 10
-MAX_AXES_COUNT = 100
+MAX_AXES_COUNT = 10_000
+MAX_AXES_CELLS = 10_000
+
+# Upper bound on households per /calculate_batch request. Stacking keeps
+# the per-household cost low, but the stacked simulation's memory grows
+# with every entity in the batch.
+MAX_BATCH_HOUSEHOLDS = 100
 
 
 # Per-country household schemas used to validate inbound /calculate
@@ -79,10 +102,21 @@ def _validate_axes(household_json: dict) -> None:
             f"got {len(axes)}"
         )
 
+    cell_count = 1
     for i, entry in enumerate(axes):
-        for axis in _axes_entry_specs(entry, i):
+        specs = _axes_entry_specs(entry, i)
+        for axis in specs:
             _validate_axis_name(axis, i)
             _validate_axis_count(axis, i)
+        # Parallel axes in one entry share its first axis's count.
+        if specs and specs[0].get("count") is not None:
+            cell_count *= _parse_axis_count(specs[0]["count"], i)
+
+    if cell_count > MAX_AXES_CELLS:
+        raise ValueError(
+            f"'axes' may span at most {MAX_AXES_CELLS} grid points in "
+            f"total; got {cell_count}"
+        )
 
 
 def _axes_entry_specs(entry, index: int) -> list[dict]:
@@ -123,6 +157,44 @@ def _parse_axis_count(count, index: int) -> int:
         raise ValueError(f"'axes[{index}].count' must be an integer")
 
 
+@dataclass(frozen=True)
+class _PreparedHousehold:
+    """A household that passed every per-household check.
+
+    ``household`` is the deprecated-input-stripped copy handed to the
+    engine; ``warnings`` are the partner-facing messages that accompany
+    its result; ``period_expansions`` saves ``calculate`` re-walking it,
+    and a template's ``requested`` saves it listing the requested slots.
+    """
+
+    household: dict
+    warnings: list[str]
+    period_expansions: tuple[tuple[str, str, str], ...]
+    period_budget_slots: tuple[tuple[str, str, str], ...] = ()
+    requested: tuple[tuple[str, str, str, str], ...] | None = None
+
+
+class _CalculateRequestError(Exception):
+    """A household or policy rejected before reaching the compute layer."""
+
+    def __init__(
+        self,
+        message: str,
+        status: int,
+        errors: list[str] | None = None,
+    ):
+        super().__init__(message)
+        self.message = message
+        self.status = status
+        self.errors = errors
+
+    def response_body(self) -> dict:
+        body = {"status": "error", "message": self.message}
+        if self.errors is not None:
+            body["errors"] = self.errors
+        return body
+
+
 @validate_country
 def get_calculate(country_id: str, add_missing: bool = False) -> Response:
     """Lightweight endpoint for passing in household JSON objects and calculating without storing data.
@@ -137,9 +209,153 @@ def get_calculate(country_id: str, add_missing: bool = False) -> Response:
     set_attribute("country_id", country_id)
 
     with segment(SegmentName.REQUEST_PARSE):
-        payload = request.json or {}
+        payload = json_codec.request_json() or {}
         household_json = payload.get("household", {})
         policy_json = payload.get("policy", {})
+        outputs_json = payload.get("outputs")
+        template_id = payload.get("template_id")
+        session_id = payload.get("session_id")
+
+    country = COUNTRIES.get(country_id)
+    set_attribute(
+        "model_version",
+        country.policyengine_bundle.get("model_version"),
+    )
+
+    session = None
+    try:
+        if session_id is not None:
+            session = _household_session(country_id, session_id, payload)
+            response_format = _response_format(session.household)
+        else:
+            if template_id is None:
+                prepared = _prepare_household(
+                    country_id, country, household_json, outputs=outputs_json
+                )
+            else:
+                prepared = _prepare_template_household(
+                    country_id, template_id, payload
+                )
+            response_format = _response_format(prepared.household)
+            _validate_policy(policy_json)
+            if _starts_session(payload, prepared):
+                session = _start_session(
+                    country_id, country, prepared, policy_json
+                )
+    except _CalculateRequestError as e:
+        return _json_response(e.response_body(), status=e.status)
+
+    if session is None:
+        return _calculate_response(
+            country,
+            prepared,
+            policy_json,
+            response_format,
+            use_cache=_use_result_cache(),
+        )
+
+    # Requests for one session are calculated one after another, so a
+    # patch applies to the household the previous request left.
+    with session.lock:
+        if session_id is not None:
+            try:
+                prepared = _prepare_session_household(
+                    session, payload.get("patch")
+                )
+            except _CalculateRequestError as e:
+                return _json_response(e.response_body(), status=e.status)
+        previous = SESSIONS.calculated_values(session)
+        if session_id is not None:
+            set_attribute(
+                "household_session", "hit" if previous else "values_miss"
+            )
+        incremental = IncrementalCalculation(previous)
+        return _calculate_response(
+            country,
+            prepared,
+            session.policy,
+            response_format,
+            use_cache=False,
+            incremental=incremental,
+            on_success=lambda: SESSIONS.update(
+                session, prepared.household, incremental.values()
+            ),
+            session_id=session.session_id,
+        )
+
+
+def _calculate_response(
+    country,
+    prepared: _PreparedHousehold,
+    policy_json,
+    response_format: str,
+    *,
+    use_cache: bool,
+    incremental: IncrementalCalculation | None = None,
+    on_success: Callable[[], None] | None = None,
+    session_id: str | None = None,
+) -> Response:
+    try:
+        result: dict
+        with segment(SegmentName.CALCULATION):
+            result = country.calculate(
+                prepared.household,
+                policy_json,
+                use_cache=use_cache,
+                period_expansions=prepared.period_expansions,
+                response_format=response_format,
+                requested=prepared.requested,
+                incremental=incremental,
+            )
+    except Exception as e:
+        logging.exception(e)
+        record_error(e, handled=True, status_code=500)
+        response_body = dict(
+            status="error",
+            message=f"Error calculating household under policy: {e}",
+        )
+        return _json_response(
+            response_body,
+            status=500,
+        )
+    if on_success is not None:
+        on_success()
+
+    response_body = dict(
+        status="ok",
+        message=None,
+        result=result,
+        policyengine_bundle=dict(country.policyengine_bundle),
+    )
+    if session_id is not None:
+        response_body["session_id"] = session_id
+
+    if prepared.warnings:
+        # Serialize to strings on the wire; the structured dataclasses
+        # stay available for any future caller that wants the fields.
+        response_body["warnings"] = prepared.warnings
+
+    return _negotiated_response(
+        response_body, columnar=response_format == COLUMNAR_FORMAT
+    )
+
+
+@validate_country
+def get_calculate_batch(country_id: str) -> Response:
+    """Calculate many independent households under one policy.
+
+    Every household runs through the same validation as ``/calculate``;
+    a household that fails it is reported in its own result slot while
+    the rest of the batch still calculates. The valid households are
+    stacked into one simulation (see ``PolicyEngineCountry.calculate_batch``).
+    """
+
+    set_attribute("country_id", country_id)
+
+    with segment(SegmentName.REQUEST_PARSE):
+        payload = json_codec.request_json() or {}
+        households_json = payload.get("households")
+        policy_json = payload.get("policy", {})
 
     country = COUNTRIES.get(country_id)
     set_attribute(
@@ -147,24 +363,347 @@ def get_calculate(country_id: str, add_missing: bool = False) -> Response:
         country.policyengine_bundle.get("model_version"),
     )
 
-    # Validate inbound payload shape before reaching the compute layer.
     try:
         with segment(SegmentName.PAYLOAD_VALIDATION):
-            _validate_household_payload(country_id, household_json)
-            _validate_axes(household_json)
+            _validate_batch_size(households_json)
     except ValueError as e:
         record_error(e, handled=True, status_code=400, include_stack=False)
         return _json_response(
             {"status": "error", "message": str(e)},
             status=400,
         )
+    set_attribute("batch_size", len(households_json))
+
+    items: list[dict | None] = [None] * len(households_json)
+    prepared_by_index: dict[int, _PreparedHousehold] = {}
+    for index, household_json in enumerate(households_json):
+        try:
+            prepared_by_index[index] = _prepare_household(
+                country_id, country, household_json
+            )
+        except _CalculateRequestError as e:
+            items[index] = e.response_body()
+
+    try:
+        _validate_policy(policy_json)
+    except _CalculateRequestError as e:
+        return _json_response(e.response_body(), status=e.status)
+
+    with segment(SegmentName.CALCULATION):
+        results = country.calculate_batch(
+            [prepared.household for prepared in prepared_by_index.values()],
+            policy_json,
+            use_cache=_use_result_cache(),
+        )
+
+    for (index, prepared), result in zip(prepared_by_index.items(), results):
+        if isinstance(result, Exception):
+            record_error(result, handled=True, status_code=500)
+            items[index] = dict(
+                status="error",
+                message=f"Error calculating household under policy: {result}",
+            )
+            continue
+        item = dict(status="ok", message=None, result=result)
+        if prepared.warnings:
+            item["warnings"] = prepared.warnings
+        items[index] = item
+
+    set_attribute(
+        "batch_error_count",
+        sum(1 for item in items if item["status"] != "ok"),
+    )
+    response_body = dict(
+        status="ok",
+        message=None,
+        result=items,
+        policyengine_bundle=dict(country.policyengine_bundle),
+    )
+    return _negotiated_response(response_body)
+
+
+@validate_country
+def get_templates(country_id: str) -> Response:
+    """Register a household template for ``/calculate``.
+
+    The household goes through ``/calculate``'s checks (with its optional
+    ``outputs``) and is stored with everything that depends only on its
+    structure (see ``templates``). The response gives the template's ID
+    and its inputs, in the order a ``/calculate`` request's ``values``
+    fill them.
+    """
+
+    set_attribute("country_id", country_id)
+
+    with segment(SegmentName.REQUEST_PARSE):
+        payload = json_codec.request_json() or {}
+        household_json = payload.get("household", {})
+        outputs_json = payload.get("outputs")
+
+    country = COUNTRIES.get(country_id)
+    model_version = country.policyengine_bundle.get("model_version")
+    set_attribute("model_version", model_version)
+
+    try:
+        prepared = _prepare_household(
+            country_id, country, household_json, outputs=outputs_json
+        )
+        if "axes" in prepared.household:
+            # Each value of a scan is its own input; send the household.
+            e = ValueError("A household template cannot have 'axes'")
+            record_error(e, handled=True, status_code=400, include_stack=False)
+            raise _CalculateRequestError(str(e), 400)
+    except _CalculateRequestError as e:
+        return _json_response(e.response_body(), status=e.status)
+
+    template = household_template(
+        country_id,
+        model_version,
+        prepared.household,
+        warnings=prepared.warnings,
+        period_expansions=prepared.period_expansions,
+        period_budget_slots=prepared.period_budget_slots,
+    )
+    TEMPLATES.register(template)
+    set_attribute("template_input_count", len(template.inputs))
+
+    response_body = dict(
+        status="ok",
+        message=None,
+        result=dict(
+            template_id=template.template_id,
+            inputs=template.describe_inputs(),
+        ),
+        policyengine_bundle=dict(country.policyengine_bundle),
+    )
+    if prepared.warnings:
+        response_body["warnings"] = prepared.warnings
+    return _json_response(response_body, status=200)
+
+
+def _prepare_template_household(
+    country_id: str, template_id, payload: dict
+) -> _PreparedHousehold:
+    """Fill a registered template with the request's ``values``.
+
+    Raises ``_CalculateRequestError``: 404 when this worker does not
+    hold the template, 400 for a malformed request or values that break
+    the monthly budget rule.
+    """
+    try:
+        with segment(SegmentName.PAYLOAD_VALIDATION):
+            if not isinstance(template_id, str):
+                raise ValueError("'template_id' must be a string")
+            if "household" in payload or "outputs" in payload:
+                raise ValueError(
+                    "A 'template_id' request sends the template's 'values' "
+                    "in place of 'household' and 'outputs'"
+                )
+            template = TEMPLATES.get(country_id, template_id)
+            if template is None:
+                set_attribute("household_template", "miss")
+                message = (
+                    f"Unknown household template {template_id!r}; "
+                    f"register it with POST /{country_id}/templates"
+                )
+                record_error(
+                    LookupError(message),
+                    handled=True,
+                    status_code=404,
+                    include_stack=False,
+                )
+                raise _CalculateRequestError(message, 404)
+            set_attribute("household_template", "hit")
+            household = template.fill(payload.get("values"))
+            budget_error = period_budget_error(
+                household, template.period_budget_slots
+            )
+            if budget_error is not None:
+                raise ValueError(budget_error)
+    except ValueError as e:
+        record_error(e, handled=True, status_code=400, include_stack=False)
+        raise _CalculateRequestError(str(e), 400)
+
+    return _PreparedHousehold(
+        household=household,
+        warnings=list(template.warnings),
+        period_expansions=template.period_expansions,
+        period_budget_slots=template.period_budget_slots,
+        requested=template.requested,
+    )
+
+
+def _starts_session(payload: dict, prepared: _PreparedHousehold) -> bool:
+    start_session = payload.get("start_session", False)
+    try:
+        with segment(SegmentName.PAYLOAD_VALIDATION):
+            if not isinstance(start_session, bool):
+                raise ValueError("'start_session' must be a boolean")
+            if start_session and "axes" in prepared.household:
+                # Each value of a scan is its own input; send the
+                # household.
+                raise ValueError("A household session cannot have 'axes'")
+    except ValueError as e:
+        record_error(e, handled=True, status_code=400, include_stack=False)
+        raise _CalculateRequestError(str(e), 400)
+    return start_session
+
+
+def _start_session(
+    country_id: str, country, prepared: _PreparedHousehold, policy_json
+) -> HouseholdSession:
+    template = household_template(
+        country_id,
+        country.policyengine_bundle["model_version"],
+        prepared.household,
+        warnings=prepared.warnings,
+        period_expansions=prepared.period_expansions,
+        period_budget_slots=prepared.period_budget_slots,
+    )
+    set_attribute("household_session", "start")
+    return SESSIONS.start(country_id, template, policy_json)
+
+
+def _household_session(
+    country_id: str, session_id, payload: dict
+) -> HouseholdSession:
+    """The session a follow-up request names.
+
+    Raises ``_CalculateRequestError``: 404 when this worker does not
+    hold the session (never started here, idle too long or dropped for
+    room), 400 for a malformed request.
+    """
+    try:
+        with segment(SegmentName.PAYLOAD_VALIDATION):
+            if not isinstance(session_id, str):
+                raise ValueError("'session_id' must be a string")
+            if not payload.keys() <= {"session_id", "patch", "version"}:
+                raise ValueError(
+                    "A 'session_id' request sends only a 'patch'; the "
+                    "session keeps its household and policy"
+                )
+    except ValueError as e:
+        record_error(e, handled=True, status_code=400, include_stack=False)
+        raise _CalculateRequestError(str(e), 400)
+
+    session = SESSIONS.get(country_id, session_id)
+    if session is None:
+        set_attribute("household_session", "miss")
+        message = (
+            f"Unknown household session {session_id!r}; start a new one "
+            "by sending the household with 'start_session'"
+        )
+        record_error(
+            LookupError(message),
+            handled=True,
+            status_code=404,
+            include_stack=False,
+        )
+        raise _CalculateRequestError(message, 404)
+    return session
+
 
-    with segment(SegmentName.VARIABLE_VALIDATION):
-        variable_errors = validate_household_variables(
-            household=household_json,
-            system=country.tax_benefit_system,
-            model_version=country.policyengine_bundle["model_version"],
+def _prepare_session_household(
+    session: HouseholdSession, patch
+) -> _PreparedHousehold:
+    """Apply a follow-up request's ``patch`` to its session's household.
+
+    A request without one calculates the household unchanged. Raises
+    ``_CalculateRequestError`` (400) for a malformed patch or values
+    that break the monthly budget rule.
+    """
+    template = session.template
+    try:
+        with segment(SegmentName.PAYLOAD_VALIDATION):
+            household = session.patched({} if patch is None else patch)
+            budget_error = period_budget_error(
+                household, template.period_budget_slots
+            )
+            if budget_error is not None:
+                raise ValueError(budget_error)
+    except ValueError as e:
+        record_error(e, handled=True, status_code=400, include_stack=False)
+        raise _CalculateRequestError(str(e), 400)
+
+    return _PreparedHousehold(
+        household=household,
+        warnings=list(template.warnings),
+        period_expansions=template.period_expansions,
+        period_budget_slots=template.period_budget_slots,
+        requested=template.requested,
+    )
+
+
+def _response_format(household: dict) -> str:
+    # `?format=columnar` asks for an axes scan's values as one dense
+    # block instead of lists written back into the echoed household;
+    # `?format=sparse` for the requested slots without the inputs.
+    response_format = request.args.get("format", HOUSEHOLD_FORMAT)
+    if response_format not in RESPONSE_FORMATS:
+        message = (
+            f"'format' must be one of {', '.join(RESPONSE_FORMATS)}; "
+            f"got {response_format!r}"
+        )
+    elif response_format == COLUMNAR_FORMAT and "axes" not in household:
+        message = "'format=columnar' is only available for axes households"
+    else:
+        set_attribute("response_format", response_format)
+        return response_format
+    e = ValueError(message)
+    record_error(e, handled=True, status_code=400, include_stack=False)
+    raise _CalculateRequestError(message, 400)
+
+
+def _use_result_cache() -> bool:
+    if cache_bypass_requested(request.headers.get("Cache-Control")):
+        set_attribute("result_cache", "bypass")
+        return False
+    return True
+
+
+def _validate_batch_size(households_json) -> None:
+    if not isinstance(households_json, list):
+        raise ValueError("'households' must be a list")
+    if not households_json:
+        raise ValueError("'households' must contain at least one household")
+    if len(households_json) > MAX_BATCH_HOUSEHOLDS:
+        raise ValueError(
+            f"'households' may contain at most {MAX_BATCH_HOUSEHOLDS} "
+            f"households; got {len(households_json)}"
         )
+
+
+def _prepare_household(
+    country_id: str, country, household_json, *, outputs=None
+) -> _PreparedHousehold:
+    """Run every per-household check, in the endpoint's error precedence.
+
+    ``outputs`` (``/calculate``'s optional ``outputs`` list) adds a
+    ``None`` slot to the household for each value it names. Raises
+    ``_CalculateRequestError`` carrying the status and body the client
+    should see for the first check that fails.
+    """
+    # Validate inbound payload shape before reaching the compute layer.
+    try:
+        with segment(SegmentName.PAYLOAD_VALIDATION):
+            _validate_household_payload(country_id, household_json)
+            _validate_axes(household_json)
+            if outputs is not None:
+                household_json = with_requested_outputs(
+                    household_json, outputs, country.tax_benefit_system
+                )
+                set_attribute("requested_output_count", len(outputs))
+    except ValueError as e:
+        record_error(e, handled=True, status_code=400, include_stack=False)
+        raise _CalculateRequestError(str(e), 400)
+
+    # One walk yields the variable errors, the deprecated-input-stripped
+    # household, the period-key and budget errors and the period
+    # warnings, checked below in the endpoint's historical precedence.
+    with segment(SegmentName.HOUSEHOLD_WALK):
+        walk = _household_walk(country, household_json)
+
+    variable_errors = walk.variable_errors
     if variable_errors:
         set_attribute("variable_error_count", len(variable_errors))
         record_error(
@@ -173,52 +712,61 @@ def get_calculate(country_id: str, add_missing: bool = False) -> Response:
             status_code=400,
             include_stack=False,
         )
-        return _json_response(
-            {
-                "status": "error",
-                "message": "Invalid household variables.",
-                "errors": [error.message for error in variable_errors],
-            },
-            status=400,
+        raise _CalculateRequestError(
+            "Invalid household variables.",
+            400,
+            errors=[error.message for error in variable_errors],
         )
 
-    # Strip deprecated inputs from a copy before period validation so
-    # partners who still pass removed/renamed variables get a warning +
-    # working response instead of a `VariableNotFoundError` HTTP 500.
-    with segment(SegmentName.DEPRECATED_INPUT_FILTER):
-        deprecated_inputs = drop_deprecated_inputs(household_json)
-    household_json = deprecated_inputs.household
-    deprecation_warnings = deprecated_inputs.warnings
+    # Deprecated inputs are stripped rather than rejected so partners who
+    # still pass removed/renamed variables get a warning + working
+    # response instead of a `VariableNotFoundError` HTTP 500.
+    deprecation_warnings = walk.deprecation_warnings
     set_attribute(
         "deprecated_warning_count",
         len(deprecation_warnings),
     )
 
-    # Validate inbound period data before reaching the compute layer.
-    try:
-        with segment(SegmentName.PERIOD_VALIDATION):
-            validate_period_keys(household_json, country.tax_benefit_system)
-            validate_period_budgets(
-                household_json,
-                country.tax_benefit_system,
-            )
-    except ValueError as e:
+    # Reject bad period data before reaching the compute layer.
+    period_error = walk.period_key_error or walk.period_budget_error
+    if period_error is not None:
+        e = ValueError(period_error)
         record_error(e, handled=True, status_code=400, include_stack=False)
-        return _json_response(
-            {"status": "error", "message": str(e)},
-            status=400,
-        )
+        raise _CalculateRequestError(str(e), 400)
 
-    # Detect partial monthly input + annual output combinations so partners
-    # see a heads-up that some months will read the engine's fallback. v1
-    # has no such warning; this is purely additive diagnostic.
-    with segment(SegmentName.PERIOD_WARNING_DETECTION):
-        period_warnings = detect_period_warnings(
-            household_json,
-            country.tax_benefit_system,
-        )
+    # Partial monthly input + annual output combinations get a heads-up
+    # that some months will read the engine's fallback. v1 has no such
+    # warning; this is purely additive diagnostic.
+    period_warnings = walk.period_warnings
     set_attribute("period_warning_count", len(period_warnings))
 
+    return _PreparedHousehold(
+        household=walk.household,
+        warnings=[w.message for w in deprecation_warnings]
+        + [w.message for w in period_warnings],
+        period_expansions=walk.period_expansions,
+        period_budget_slots=walk.period_budget_slots,
+    )
+
+
+def _household_walk(country, household_json) -> HouseholdWalk:
+    # The analytics decorator walks the same payload object when it
+    # collects variable usage; reuse that walk instead of repeating it.
+    walk = g.get("household_walk")
+    if (
+        walk is not None
+        and walk.source is household_json
+        and walk.system is country.tax_benefit_system
+    ):
+        return walk
+    return walk_household(
+        household_json,
+        country.tax_benefit_system,
+        model_version=country.policyengine_bundle["model_version"],
+    )
+
+
+def _validate_policy(policy_json) -> None:
     # A malformed policy is a client error and should be a 400, but the
     # endpoint has always surfaced bad policy input as a 500 (it used to
     # crash in the engine), so we keep that status for compatibility —
@@ -233,46 +781,28 @@ def get_calculate(country_id: str, add_missing: bool = False) -> Response:
             validate_policy_periods(policy_json)
     except ValueError as e:
         record_error(e, handled=True, status_code=500, include_stack=False)
-        return _json_response(
-            {"status": "error", "message": str(e)},
-            status=500,
-        )
+        raise _CalculateRequestError(str(e), 500)
 
-    try:
-        result: dict
-        with segment(SegmentName.CALCULATION):
-            result = country.calculate(household_json, policy_json)
-    except Exception as e:
-        logging.exception(e)
-        record_error(e, handled=True, status_code=500)
-        response_body = dict(
-            status="error",
-            message=f"Error calculating household under policy: {e}",
-        )
-        return _json_response(
-            response_body,
-            status=500,
-        )
 
-    response_body = dict(
-        status="ok",
-        message=None,
-        result=result,
-        policyengine_bundle=dict(country.policyengine_bundle),
+def _negotiated_response(payload: dict, *, columnar: bool = False) -> Response:
+    # Successful results are encoded as the client's `Accept` asks (see
+    # `response_encoding`); error responses stay JSON so any client can
+    # read them.
+    media_type = negotiate_media_type(
+        request.accept_mimetypes, columnar=columnar
     )
-
-    warning_messages = [w.message for w in deprecation_warnings] + [
-        w.message for w in period_warnings
-    ]
-    if warning_messages:
-        # Serialize to strings on the wire; the structured dataclasses
-        # stay available for any future caller that wants the fields.
-        response_body["warnings"] = warning_messages
-
-    return _json_response(response_body, status=200)
+    set_attribute("response_media_type", media_type)
+    if media_type == JSON_MEDIA_TYPE:
+        response = _json_response(payload, status=200)
+    else:
+        with segment(SegmentName.RESPONSE_SERIALIZATION):
+            body = encode_response_body(payload, media_type)
+        response = Response(body, 200, mimetype=media_type)
+    response.vary.add("Accept")
+    return response
 
 
 def _json_response(payload: dict, *, status: int) -> Response:
     with segment(SegmentName.RESPONSE_SERIALIZATION):
-        body = json.dumps(payload)
+        body = json_codec.dumps(payload)
     return Response(body, status, mimetype="application/json")
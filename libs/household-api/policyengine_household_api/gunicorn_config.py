@@ -0,0 +1,18 @@
+"""Gunicorn settings for running the household API with preloaded workers.
+
+Use with ``gunicorn -c python:policyengine_household_api.gunicorn_config``.
+The master loads the app, finishes its lazy initialization and freezes
+its heap (see ``preload``) before forking, so workers share the country
+systems instead of each holding a copy.
+"""
+
+preload_app = True
+
+
+def when_ready(server):
+    # Runs in the master after the app is loaded, before any fork.
+    if not server.cfg.preload_app:
+        return
+    from policyengine_household_api.preload import finish_preload
+
+    finish_preload()
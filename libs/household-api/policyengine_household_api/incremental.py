@@ -0,0 +1,566 @@
+"""Carry a household's calculated values over to its next simulation.
+
+A household calculated again with a few inputs changed mostly asks for
+values that do not depend on them. ``IncrementalCalculation`` watches a
+simulation calculate and records, per variable, which variables read
+it; the next simulation built for the same household (same entities, in
+the same order) starts with every calculated value whose variable does
+not depend, through those reads, on an input that changed.
+
+Dependencies are tracked by variable name, across all periods, so a
+value a formula finds through a variable's own earlier periods
+(uprating, carried-over inputs, stock variables) is covered too. Reads
+are seen wherever a formula can make them: ``Simulation.calculate``,
+which every population call and ``add``/``divide`` option goes
+through, and ``Population.get_holder``, which formulas reading a
+holder directly call. A variable whose formula calculates in a branch
+or in the attached baseline simulation depends on values copied out of
+this one, so it is recalculated after any change.
+
+The next simulation may also run under another policy. Formulas get a
+view of the parameter tree that records, per variable, the parameters
+they read; so do the parameters the engine reads for a variable itself
+(its uprating index, a parameter-listed ``adds``, its abolition
+switch). A variable is recalculated when a parameter it read, or its
+definition (which a structural reform replaces), differs between the
+two policies. A formula that reaches the tax-benefit system other than
+through its parameters argument is taken to read every parameter.
+
+The next simulation is built from the changed household like any
+other, so its inputs are exactly those a full calculation would see;
+only calculated values are carried over, and only into holders that do
+not already have a value for the period.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import functools
+import inspect
+import sys
+import types
+
+from policyengine_core.parameters import (
+    Parameter,
+    ParameterNode,
+    ParameterNodeAtInstant,
+    ParameterScale,
+    ParameterScaleBracket,
+    VectorialParameterNodeAtInstant,
+)
+from policyengine_observability import set_attribute
+
+# A variable's known values: period -> array.
+PeriodArrays = dict
+
+_PARAMETER_TREE_TYPES = (
+    Parameter,
+    ParameterNode,
+    ParameterNodeAtInstant,
+    ParameterScale,
+    ParameterScaleBracket,
+    VectorialParameterNodeAtInstant,
+)
+
+# Recorded for a read of the whole tree: it matches every parameter.
+ALL_PARAMETERS = ""
+
+
+@dataclass(frozen=True)
+class CalculatedValues:
+    """What one simulation of a household leaves for the next.
+
+    ``inputs`` are the values the simulation was built with and
+    ``values`` those it calculated, by variable. ``readers`` maps a
+    variable to the variables whose formulas read it, and
+    ``parameter_readers`` a parameter name to the variables that read
+    it; ``volatile`` variables are recalculated whatever changes.
+    ``policy`` is the cast reform the simulation ran under (``{}`` for
+    none) and ``definitions`` each calculated variable's definition
+    there (see ``_definition``). ``entity_ids`` is each population's
+    IDs, in order.
+    """
+
+    entity_ids: dict[str, list[str]]
+    inputs: dict[str, PeriodArrays]
+    values: dict[str, PeriodArrays]
+    readers: dict[str, frozenset[str]]
+    volatile: frozenset[str]
+    parameter_readers: dict[str, frozenset[str]] = field(default_factory=dict)
+    policy: dict = field(default_factory=dict)
+    definitions: dict[str, tuple] = field(default_factory=dict)
+
+    @functools.cached_property
+    def nbytes(self) -> int:
+        """Approximate memory held by the stored arrays."""
+        return sum(
+            sys.getsizeof(array)
+            for arrays in (*self.inputs.values(), *self.values.values())
+            for array in arrays.values()
+        )
+
+
+class DependencyRecorder:
+    """Records which variables and parameters each variable reads as
+    ``simulation`` calculates."""
+
+    def __init__(
+        self,
+        simulation,
+        readers: dict[str, set[str]],
+        volatile: set[str],
+        calculated: set[str],
+        parameter_readers: dict[str, set[str]] | None = None,
+    ):
+        self.simulation = simulation
+        self.readers = readers
+        self.volatile = volatile
+        self.calculated = calculated
+        self.parameter_readers = (
+            {} if parameter_readers is None else parameter_readers
+        )
+        self._stack: list[str] = []
+        self._defined: set[str] = set()
+
+    def read(self, simulation, variable_name: str) -> None:
+        if not self._stack:
+            return
+        reader = self._stack[-1]
+        if simulation is not self.simulation:
+            # A branch or the baseline: its values start as copies of
+            # this simulation's, so any change can reach the reader.
+            self.volatile.add(reader)
+        elif variable_name != reader:
+            self.readers.setdefault(variable_name, set()).add(reader)
+
+    def read_parameter(self, parameter_name: str) -> None:
+        if self._stack:
+            self.parameter_readers.setdefault(parameter_name, set()).add(
+                self._stack[-1]
+            )
+
+    def enter(self, variable_name: str) -> None:
+        self.read(self.simulation, variable_name)
+        self.calculated.add(variable_name)
+        self._stack.append(variable_name)
+        if variable_name not in self._defined:
+            self._defined.add(variable_name)
+            variable = self.simulation.tax_benefit_system.variables.get(
+                variable_name
+            )
+            if variable is not None:
+                for parameter_name in _engine_parameter_reads(variable):
+                    self.read_parameter(parameter_name)
+
+    def exit(self) -> None:
+        self._stack.pop()
+
+
+class _RecordedParameters:
+    """A view of a parameter (sub)tree that records what is read from it.
+
+    Sub-trees come back as views in turn; any other value is recorded
+    under the parameter it belongs to, or, when it is not one child
+    (an array index, a method, the node's own attributes), under the
+    whole node's name.
+    """
+
+    __slots__ = ("_node", "_name", "_recorder")
+
+    def __init__(self, node, name: str, recorder: DependencyRecorder):
+        self._node = node
+        self._name = name
+        self._recorder = recorder
+
+    def __getattr__(self, key):
+        return self._child(key, getattr(self._node, key))
+
+    def __getitem__(self, key):
+        return self._child(key, self._node[key])
+
+    def __call__(self, *args, **kwargs):
+        return self._child(None, self._node(*args, **kwargs))
+
+    def __iter__(self):
+        self._recorder.read_parameter(self._name)
+        return iter(self._node)
+
+    def __contains__(self, key) -> bool:
+        self._recorder.read_parameter(self._name)
+        return key in self._node
+
+    def _child(self, key, child):
+        if isinstance(child, _PARAMETER_TREE_TYPES):
+            return _RecordedParameters(
+                child, _parameter_name(child), self._recorder
+            )
+        if isinstance(child, types.MethodType):
+            return functools.partial(self._call, child)
+        children = _parameter_children(self._node)
+        if isinstance(key, str) and key in children:
+            self._recorder.read_parameter(
+                f"{self._name}.{key}" if self._name else key
+            )
+        else:
+            self._recorder.read_parameter(self._name)
+        return child
+
+    def _call(self, method, *args, **kwargs):
+        return self._child(None, method(*args, **kwargs))
+
+
+def _parameter_name(node) -> str:
+    attributes = vars(node)
+    return attributes.get("_name", attributes.get("name")) or ""
+
+
+def _parameter_children(node) -> dict:
+    attributes = vars(node)
+    return attributes.get("_children", attributes.get("children")) or {}
+
+
+def _engine_parameter_reads(variable) -> list[str]:
+    """The parameters the engine itself reads to calculate ``variable``,
+    outside its formulas, and ``ALL_PARAMETERS`` for a variable whose
+    formulas reach the tax-benefit system directly."""
+    names = [f"gov.abolitions.{variable.name}"]
+    if variable.uprating is not None:
+        names.append(variable.uprating)
+    # String entries of `adds`/`subtracts` that are not variables are
+    # parameter names; a single string names a parameter listing them.
+    for listed in (variable.adds, variable.subtracts):
+        if isinstance(listed, str):
+            names.append(listed)
+        elif listed:
+            names.extend(name for name in listed if isinstance(name, str))
+    if any(_reaches_system(formula) for formula in variable.formulas.values()):
+        names.append(ALL_PARAMETERS)
+    return names
+
+
+@functools.cache
+def _reaches_system(function) -> bool:
+    """Whether ``function``, or a module-level function it calls, reads
+    a ``tax_benefit_system`` attribute."""
+    pending, seen = [function], set()
+    while pending:
+        called = pending.pop()
+        if called in seen or not inspect.isfunction(called):
+            continue
+        seen.add(called)
+        codes = [called.__code__]
+        while codes:
+            code = codes.pop()
+            if "tax_benefit_system" in code.co_names:
+                return True
+            codes.extend(
+                const
+                for const in code.co_consts
+                if isinstance(const, types.CodeType)
+            )
+            pending.extend(
+                called.__globals__[name]
+                for name in code.co_names
+                if name in called.__globals__
+            )
+    return False
+
+
+class _RecordingSimulation:
+    def calculate(self, variable_name=None, *args, **kwargs):
+        recorder = self._dependency_recorder
+        if variable_name is None or recorder.simulation is None:
+            return super().calculate(variable_name, *args, **kwargs)
+        if self is not recorder.simulation:
+            recorder.read(self, variable_name)
+            return super().calculate(variable_name, *args, **kwargs)
+        recorder.enter(variable_name)
+        try:
+            return super().calculate(variable_name, *args, **kwargs)
+        finally:
+            recorder.exit()
+
+    def _run_formula(self, variable, population, period):
+        recorder = self._dependency_recorder
+        formula = variable.get_formula(period)
+        if (
+            self is not recorder.simulation
+            or formula is None
+            or self.trace
+            or formula.__code__.co_argcount == 2
+        ):
+            return super()._run_formula(variable, population, period)
+        return formula(
+            population,
+            period,
+            _RecordedParameters(
+                self.tax_benefit_system.parameters, ALL_PARAMETERS, recorder
+            ),
+        )
+
+
+class _RecordingPopulation:
+    def get_holder(self, variable_name: str):
+        recorder = getattr(self.simulation, "_dependency_recorder", None)
+        if recorder is not None and recorder.simulation is not None:
+            recorder.read(self.simulation, variable_name)
+        return super().get_holder(variable_name)
+
+
+@functools.cache
+def _recording_class(mixin: type, cls: type) -> type:
+    # Keep the class name: policyengine-core picks calculate() options
+    # by the simulation class's name.
+    return type(cls.__name__, (mixin, cls), {})
+
+
+def _record(simulation, recorder: DependencyRecorder) -> None:
+    simulation.__class__ = _recording_class(
+        _RecordingSimulation, type(simulation)
+    )
+    simulation._dependency_recorder = recorder
+    for population in simulation.populations.values():
+        population.__class__ = _recording_class(
+            _RecordingPopulation, type(population)
+        )
+
+
+def _known_values(simulation, variable_names) -> dict[str, PeriodArrays]:
+    values = {}
+    for variable_name in variable_names:
+        holder = simulation.get_holder(variable_name)
+        arrays = {
+            period: holder.get_array(period)
+            for period in holder.get_known_periods()
+        }
+        arrays = {
+            period: array
+            for period, array in arrays.items()
+            if array is not None
+        }
+        if arrays:
+            values[variable_name] = arrays
+    return values
+
+
+def _held_variables(simulation) -> list[str]:
+    return [
+        variable_name
+        for variable_name, usage in simulation.get_memory_usage()[
+            "by_variable"
+        ].items()
+        if usage["nb_arrays"]
+    ]
+
+
+def _same_array(left, right) -> bool:
+    if left.dtype != right.dtype or left.shape != right.shape:
+        return False
+    if left.dtype == object:
+        return left.tolist() == right.tolist()
+    return left.tobytes() == right.tobytes()
+
+
+def _changed_inputs(
+    previous: dict[str, PeriodArrays], current: dict[str, PeriodArrays]
+) -> set[str]:
+    changed = set()
+    for variable_name in previous.keys() | current.keys():
+        before = previous.get(variable_name, {})
+        after = current.get(variable_name, {})
+        if before.keys() != after.keys() or not all(
+            _same_array(before[period], after[period]) for period in before
+        ):
+            changed.add(variable_name)
+    return changed
+
+
+def _definition(variable) -> tuple:
+    """What a structural reform can change about ``variable``."""
+    return (
+        type(variable),
+        variable.is_neutralized,
+        tuple(variable.formulas.items()),
+        variable.adds,
+        variable.subtracts,
+        variable.defined_for,
+        variable.uprating,
+    )
+
+
+def _changed_definitions(definitions: dict[str, tuple], system) -> set[str]:
+    changed = set()
+    for variable_name, definition in definitions.items():
+        variable = system.variables.get(variable_name)
+        if variable is None or _definition(variable) != definition:
+            changed.add(variable_name)
+    return changed
+
+
+def _changed_parameters(previous: dict, policy: dict) -> set[str]:
+    return {
+        parameter_name
+        for parameter_name in previous.keys() | policy.keys()
+        if previous.get(parameter_name) != policy.get(parameter_name)
+    }
+
+
+def _parameter_readers(
+    parameter_readers: dict[str, frozenset[str]], changed: set[str]
+) -> set[str]:
+    """The variables that read a parameter in ``changed``, or a node
+    above or below one."""
+    readers = set()
+    for parameter_name, names in parameter_readers.items():
+        if any(
+            _overlaps(parameter_name, changed_name) for changed_name in changed
+        ):
+            readers.update(names)
+    return readers
+
+
+def _overlaps(read: str, changed: str) -> bool:
+    if read == ALL_PARAMETERS or read == changed:
+        return True
+    shorter, longer = sorted((read, changed), key=len)
+    return longer.startswith(shorter) and longer[len(shorter)] in ".["
+
+
+def _stale(
+    changed: set[str],
+    readers: dict[str, frozenset[str]],
+    volatile: frozenset[str],
+) -> set[str]:
+    """Every variable that reads, directly or not, one in ``changed``."""
+    stale = set()
+    pending = [*changed, *volatile]
+    while pending:
+        variable_name = pending.pop()
+        if variable_name in stale:
+            continue
+        stale.add(variable_name)
+        pending.extend(readers.get(variable_name, ()))
+    return stale
+
+
+def _entity_ids(simulation) -> dict[str, list[str]]:
+    return {
+        key: list(population.ids)
+        for key, population in simulation.populations.items()
+    }
+
+
+class IncrementalCalculation:
+    """One calculation of a household, starting from ``previous``.
+
+    Call ``adopt`` with the simulation once it is built, calculate with
+    it, then take ``values()`` for the next calculation.
+    """
+
+    def __init__(self, previous: CalculatedValues | None = None):
+        self.previous = previous
+        self._simulation = None
+        self._policy: dict = {}
+        self._inputs: dict[str, PeriodArrays] = {}
+        self._recorder: DependencyRecorder | None = None
+
+    def adopt(self, simulation, policy: dict | None = None) -> None:
+        """Restore the reusable values into ``simulation``, built under
+        the cast reform ``policy``, and record what it calculates from
+        here on."""
+        self._simulation = simulation
+        self._policy = policy or {}
+        # Everything the simulation holds before it calculates: its
+        # constructor may move inputs to other variables, so this is
+        # wider than ``input_variables``.
+        self._inputs = _known_values(simulation, _held_variables(simulation))
+        readers: dict[str, set[str]] = {}
+        parameter_readers: dict[str, set[str]] = {}
+        volatile: set[str] = set()
+        restored: set[str] = set()
+        previous = self.previous
+        if previous is not None and previous.entity_ids == _entity_ids(
+            simulation
+        ):
+            for variable_name, names in previous.readers.items():
+                readers[variable_name] = set(names)
+            for parameter_name, names in previous.parameter_readers.items():
+                parameter_readers[parameter_name] = set(names)
+            volatile.update(previous.volatile)
+            changed = _changed_inputs(previous.inputs, self._inputs)
+            if previous.policy != self._policy:
+                changed |= _parameter_readers(
+                    previous.parameter_readers,
+                    _changed_parameters(previous.policy, self._policy),
+                )
+                changed |= _changed_definitions(
+                    previous.definitions, simulation.tax_benefit_system
+                )
+            stale = _stale(changed, previous.readers, previous.volatile)
+            restored = self._restore(previous.values, stale)
+            set_attribute("incremental_stale_variables", len(stale))
+            set_attribute("incremental_reused_variables", len(restored))
+
+        self._recorder = DependencyRecorder(
+            simulation, readers, volatile, restored, parameter_readers
+        )
+        _record(simulation, self._recorder)
+        for branch in simulation.branches.values():
+            _record(branch, self._recorder)
+        baseline = getattr(simulation, "baseline", None)
+        if baseline is not None and baseline is not simulation:
+            _record(baseline, self._recorder)
+
+    def _restore(
+        self, values: dict[str, PeriodArrays], stale: set[str]
+    ) -> set[str]:
+        simulation = self._simulation
+        # Core keeps computed arrays in a private per-simulation lookup
+        # in front of the holders; fill it too, or every read of a
+        # restored value takes the slow path.
+        fast_cache = getattr(simulation, "_fast_cache", None)
+        restored = set()
+        for variable_name, arrays in values.items():
+            if variable_name in stale or variable_name in self._inputs:
+                continue
+            holder = simulation.get_holder(variable_name)
+            for period, array in arrays.items():
+                if holder.get_array(period) is not None:
+                    continue
+                holder.put_in_cache(array, period)
+                if fast_cache is not None:
+                    fast_cache[(variable_name, period)] = array
+            restored.add(variable_name)
+        return restored
+
+    def values(self) -> CalculatedValues:
+        """The adopted simulation's inputs and calculated values.
+
+        Stops recording; the simulation is not used afterwards.
+        """
+        recorder = self._recorder
+        recorder.simulation = None
+        simulation = self._simulation
+        self._simulation = None
+        calculated = recorder.calculated - self._inputs.keys()
+        variables = simulation.tax_benefit_system.variables
+        return CalculatedValues(
+            entity_ids=_entity_ids(simulation),
+            inputs=self._inputs,
+            values=_known_values(simulation, calculated),
+            readers={
+                variable_name: frozenset(names)
+                for variable_name, names in recorder.readers.items()
+            },
+            volatile=frozenset(recorder.volatile),
+            parameter_readers={
+                parameter_name: frozenset(names)
+                for parameter_name, names in recorder.parameter_readers.items()
+            },
+            policy=self._policy,
+            definitions={
+                variable_name: _definition(variables[variable_name])
+                for variable_name in calculated
+                if variable_name in variables
+            },
+        )
@@ -0,0 +1,70 @@
+"""Prepare a preloading gunicorn master to fork workers that share memory.
+
+With ``--preload`` the master imports the app, building every country
+system, and forks workers that share those pages copy-on-write. Two
+things un-share them soon after the fork:
+
+- Lazy initialization finished in each worker (parameter instant
+  projections, metadata) is built once per worker instead of once in
+  the master.
+- The cyclic garbage collector writes to the header of every object it
+  examines, so a worker's first full collection copies every page that
+  holds a tracked object (nearly all of a tax-benefit system).
+
+``finish_preload`` builds everything the workers would otherwise build
+lazily, then moves every object the master holds into the collector's
+permanent generation with ``gc.freeze()``, which later collections
+skip. Reference counting still dirties the pages of objects a worker
+actually touches. ``gunicorn_config`` calls it once the app is loaded.
+"""
+
+from __future__ import annotations
+
+import gc
+import logging
+import os
+
+from policyengine_observability import record_event
+
+from policyengine_household_common.process_memory import process_memory
+
+from policyengine_household_api.country import COUNTRIES, _variable_index
+from policyengine_household_api.deployment import parameter_prewarm_instants
+from policyengine_household_api.warmup import warm_parameters
+
+logger = logging.getLogger(__name__)
+
+
+def finish_preload() -> int:
+    """Build everything lazy in the served countries, then freeze the heap.
+
+    Every served country is built, including those ``app.countries``
+    leaves to their first request. Returns the number of objects frozen.
+    """
+    warm_parameters(parameter_prewarm_instants(), metadata=True)
+    for country in COUNTRIES.values():
+        _variable_index(country.tax_benefit_system)
+    gc.freeze()
+    frozen = gc.get_freeze_count()
+    memory = process_memory() or {}
+    logger.info(
+        "Froze %d objects before forking workers (rss %.0f MiB)",
+        frozen,
+        memory.get("rss", 0) / 2**20,
+    )
+    record_event(
+        "preload_frozen",
+        frozen_objects=frozen,
+        rss_bytes=memory.get("rss"),
+    )
+    return frozen
+
+
+def memory_usage() -> dict:
+    """This worker's memory, for comparing workers of one master."""
+    return {
+        "pid": os.getpid(),
+        "parent_pid": os.getppid(),
+        "gc_frozen_objects": gc.get_freeze_count(),
+        "memory_bytes": process_memory(),
+    }
@@ -0,0 +1,140 @@
+"""Copy-on-write parameter overlays for parametric reforms.
+
+``TaxBenefitSystem.clone()`` deep-copies the whole parameter tree
+(~126k nodes for the US system) and leaves the clone with cold
+at-instant projections, though a typical reform touches a handful of
+``Parameter`` leaves. An overlay instead path-copies the tree: only the
+reformed leaves and the ``ParameterNode`` chain above them are copied;
+every other subtree is the shared system's own object.
+
+policyengine-core caches at-instant projections per node
+(``ParameterNode._at_instant_cache``) and builds a node's projection
+from its children's, so an overlay rebuilds projections only along the
+copied paths. Untouched subtrees keep serving the projections already
+built on the shared system, including those from
+``deployment.prewarm_parameter_caches``.
+"""
+
+import copy
+
+from policyengine_core.commons.misc import empty_clone
+from policyengine_core.parameters import Parameter, ParameterNode
+from policyengine_core.periods import instant
+from policyengine_core.taxbenefitsystems import TaxBenefitSystem
+
+
+def overlay_reform(
+    system: TaxBenefitSystem, reform: dict
+) -> TaxBenefitSystem | None:
+    """Return ``system`` with ``reform`` applied through a parameter overlay.
+
+    ``reform`` is a cast policy dict (see
+    ``PolicyEngineCountry._cast_reform_values``). Returns ``None`` when a
+    reformed path runs through a parameter scale (``rates[0].rate``
+    style paths), whose projections are built per bracket rather than
+    per node; callers fall back to a full clone then.
+
+    Variables and entities are copied as in ``TaxBenefitSystem.clone``:
+    country Simulations may apply structural reforms gated by the
+    reformed parameters, and those mutate the system's variables.
+    """
+    parameters = _overlay_parameters(system.parameters, reform)
+    if parameters is None:
+        return None
+
+    overlay = empty_clone(system)
+    overlay_dict = overlay.__dict__
+    for key, value in system.__dict__.items():
+        if key not in (
+            "parameters",
+            "_parameters_at_instant_cache",
+            "variables",
+            "entities",
+            "person_entity",
+            "group_entities",
+        ):
+            overlay_dict[key] = value
+
+    overlay_dict["parameters"] = parameters
+    overlay_dict["_parameters_at_instant_cache"] = {}
+    overlay_dict["variables"] = {
+        variable_name: variable.clone()
+        for variable_name, variable in system.variables.items()
+    }
+    overlay_dict["entities"] = [
+        copy.copy(entity) for entity in system.entities
+    ]
+    overlay_dict["person_entity"] = copy.copy(system.person_entity)
+    overlay_dict["group_entities"] = [
+        copy.copy(entity) for entity in system.group_entities
+    ]
+    for entity in overlay_dict["entities"]:
+        entity.set_tax_benefit_system(overlay)
+    for entity in overlay_dict["group_entities"]:
+        entity.set_tax_benefit_system(overlay)
+    overlay_dict["person_entity"].set_tax_benefit_system(overlay)
+    return overlay
+
+
+def _overlay_parameters(
+    root: ParameterNode, reform: dict
+) -> ParameterNode | None:
+    root_copy = _copy_node(root, parent=None)
+    # Copied nodes by dotted path, so reforms touching siblings share
+    # the copied ancestors instead of copying them once per leaf.
+    copies: dict[str, ParameterNode | Parameter] = {"": root_copy}
+
+    for parameter_name, changes in reform.items():
+        names = parameter_name.split(".")
+        if any("[" in name for name in names):
+            return None
+
+        original = root
+        parent_copy = root_copy
+        for depth, name in enumerate(names):
+            if not isinstance(original, ParameterNode):
+                return None
+            original = original.children.get(name)
+            if original is None:
+                raise ValueError(
+                    f"Could not find the parameter {parameter_name} "
+                    f"(failed at {name})."
+                )
+            path = ".".join(names[: depth + 1])
+            node_copy = copies.get(path)
+            if node_copy is None:
+                if isinstance(original, ParameterNode):
+                    node_copy = _copy_node(original, parent=parent_copy)
+                elif isinstance(original, Parameter):
+                    node_copy = original.clone()
+                    node_copy.parent = parent_copy
+                else:
+                    return None
+                parent_copy.children[name] = node_copy
+                setattr(parent_copy, name, node_copy)
+                copies[path] = node_copy
+            parent_copy = node_copy
+
+        if not isinstance(parent_copy, Parameter):
+            return None
+        for time_period, value in changes.items():
+            start_instant, end_instant = time_period.split(".")
+            parent_copy.update(
+                start=instant(start_instant),
+                stop=instant(end_instant),
+                value=value,
+            )
+
+    return root_copy
+
+
+def _copy_node(node: ParameterNode, parent) -> ParameterNode:
+    # Shallow: children stay shared until a reformed path replaces one.
+    # The copy gets its own projection cache and parent link, so
+    # `Parameter.update` invalidating caches up the copied chain never
+    # reaches the shared tree.
+    node_copy = copy.copy(node)
+    node_copy.children = dict(node.children)
+    node_copy._at_instant_cache = {}
+    node_copy.parent = parent
+    return node_copy
@@ -0,0 +1,173 @@
+"""Binary encodings of calculate responses, chosen by ``Accept``.
+
+JSON stays the default. A client that lists ``application/msgpack`` in
+``Accept`` gets the same response body as MessagePack; a columnar axes
+response (``?format=columnar``) can also be requested as an Arrow IPC
+stream. Numeric arrays in the result are written straight from their
+numpy buffers in both encodings instead of being boxed into one Python
+object per element. Gateways forward ``Accept`` and return the worker's
+body and ``Content-Type`` unchanged, so negotiation happens here only.
+"""
+
+import msgpack
+import numpy as np
+from werkzeug.datastructures import MIMEAccept
+
+from policyengine_household_common import json_codec
+
+from policyengine_household_api.utils.json import json_default
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+# One MessagePack element per array item: the type byte, then the value
+# big-endian (float 64, int 64 and uint 64 families).
+_MSGPACK_ARRAY_ITEMS = {
+    "f": (0xCB, np.dtype([("tag", "u1"), ("value", ">f8")])),
+    "i": (0xD3, np.dtype([("tag", "u1"), ("value", ">i8")])),
+    "u": (0xCF, np.dtype([("tag", "u1"), ("value", ">u8")])),
+}
+_MSGPACK_FALSE, _MSGPACK_TRUE = 0xC2, 0xC3
+
+
+def negotiate_media_type(accept: MIMEAccept, *, columnar: bool) -> str:
+    """Pick the response media type for ``accept``.
+
+    Arrow is only offered for columnar results, the one response shape
+    that is a table. When ``accept`` is missing or matches nothing on
+    offer the response is JSON, as it was before negotiation existed.
+    """
+    offered = [JSON_MEDIA_TYPE, MSGPACK_MEDIA_TYPE]
+    if columnar:
+        offered.append(ARROW_STREAM_MEDIA_TYPE)
+    return accept.best_match(offered) or JSON_MEDIA_TYPE
+
+
+def encode_response_body(payload: dict, media_type: str) -> bytes:
+    if media_type == MSGPACK_MEDIA_TYPE:
+        return encode_msgpack(payload)
+    if media_type == ARROW_STREAM_MEDIA_TYPE:
+        return encode_arrow_stream(payload)
+    return json_codec.dumps(payload)
+
+
+def encode_msgpack(payload) -> bytes:
+    packer = msgpack.Packer(default=json_default)
+    chunks: list[bytes] = []
+    _pack(payload, packer, chunks)
+    return b"".join(chunks)
+
+
+def _pack(value, packer: msgpack.Packer, chunks: list[bytes]) -> None:
+    # Containers are walked so numpy arrays anywhere in the payload can
+    # be written as whole buffers; everything else goes to the packer.
+    if isinstance(value, dict):
+        chunks.append(packer.pack_map_header(len(value)))
+        for key, item in value.items():
+            chunks.append(packer.pack(key))
+            _pack(item, packer, chunks)
+    elif isinstance(value, np.ndarray):
+        chunks.append(_pack_array(value, packer))
+    elif isinstance(value, (list, tuple)) and any(
+        isinstance(item, (dict, list, tuple, np.ndarray)) for item in value
+    ):
+        chunks.append(packer.pack_array_header(len(value)))
+        for item in value:
+            _pack(item, packer, chunks)
+    else:
+        chunks.append(packer.pack(value))
+
+
+def _pack_array(array: np.ndarray, packer: msgpack.Packer) -> bytes:
+    kind = array.dtype.kind
+    if array.ndim != 1 or kind not in "biuf":
+        return packer.pack(array.tolist())
+    header = packer.pack_array_header(len(array))
+    if kind == "b":
+        return (
+            header
+            + np.where(array, _MSGPACK_TRUE, _MSGPACK_FALSE)
+            .astype(np.uint8)
+            .tobytes()
+        )
+    tag, item_dtype = _MSGPACK_ARRAY_ITEMS[kind]
+    items = np.empty(len(array), dtype=item_dtype)
+    items["tag"] = tag
+    items["value"] = array
+    return header + items.tobytes()
+
+
+def encode_arrow_stream(payload: dict) -> bytes:
+    """Encode a columnar axes response as a one-batch Arrow IPC stream.
+
+    Each row is a grid cell. Axis coordinates are columns named
+    ``axis/<variable>/<period>/<entity_id>`` and requested values
+    ``<variable>/<period>/<entity_id>``; every field's metadata also
+    carries its ``role``, ``variable``, ``period`` and ``entity``. A
+    value that could not be calculated is a null column. The payload's
+    other members (``status``, ``policyengine_bundle``, ``warnings``,
+    ...) are JSON-encoded in the schema metadata.
+    """
+    # Imported on first use: it adds about 0.3 s to worker start-up and
+    # most deployments never negotiate Arrow.
+    import pyarrow as pa
+
+    result = payload["result"]
+    cell_count = len(result["axes"][0]["values"])
+    fields = []
+    columns = []
+
+    def add(role, name, variable, period, entity, values):
+        column = (
+            pa.nulls(cell_count, pa.float64())
+            if values is None
+            else pa.array(values)
+        )
+        fields.append(
+            pa.field(
+                name,
+                column.type,
+                metadata={
+                    "role": role,
+                    "variable": variable,
+                    "period": period,
+                    "entity": entity,
+                },
+            )
+        )
+        columns.append(column)
+
+    for axis in result["axes"]:
+        add(
+            "axis",
+            f"axis/{axis['name']}/{axis['period']}/{axis['entity']}",
+            axis["name"],
+            axis["period"],
+            axis["entity"],
+            axis["values"],
+        )
+    for variable, periods in result["values"].items():
+        for period, entities in periods.items():
+            for entity_id, values in entities.items():
+                add(
+                    "value",
+                    f"{variable}/{period}/{entity_id}",
+                    variable,
+                    period,
+                    entity_id,
+                    values,
+                )
+
+    schema = pa.schema(
+        fields,
+        metadata={
+            key: json_codec.dumps(value)
+            for key, value in payload.items()
+            if key != "result"
+        },
+    )
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        writer.write_batch(pa.record_batch(columns, schema=schema))
+    return sink.getvalue().to_pybytes()
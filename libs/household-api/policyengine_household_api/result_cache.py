@@ -0,0 +1,136 @@
+"""In-process cache of calculate results, addressed by request content.
+
+Partners resubmit the same household far more often than they change it
+(a screener posts the same answers on every page load), so a result is
+stored under a hash of everything that determines it: the country, the
+household as handed to the engine, the cast reform and the country
+package's model version. Results are stored as serialized JSON; that
+makes the byte bound exact and hands every hit a fresh, independently
+mutable copy.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from policyengine_household_common import json_codec
+from policyengine_household_common.config_loader import get_config_value
+from policyengine_observability import set_attribute
+
+from policyengine_household_api.utils.json import hash_object
+from policyengine_household_api.utils.lru_cache import BoundedLRUCache
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Clients opt out per request with the standard `Cache-Control` request
+# directives; gateways forward request headers to the worker unchanged.
+BYPASS_CACHE_CONTROL_DIRECTIVES = frozenset({"no-cache", "no-store"})
+
+
+@dataclass(frozen=True)
+class ResultCacheConfig:
+    enabled: bool
+    max_entries: int
+    max_bytes: int
+
+
+def result_cache_config() -> ResultCacheConfig:
+    enabled = get_config_value("app.result_cache.enabled", True)
+    if isinstance(enabled, str):
+        enabled = enabled.lower() not in {"0", "false", "no"}
+    return ResultCacheConfig(
+        enabled=bool(enabled),
+        max_entries=int(
+            get_config_value(
+                "app.result_cache.max_entries", DEFAULT_MAX_ENTRIES
+            )
+        ),
+        max_bytes=int(
+            get_config_value("app.result_cache.max_bytes", DEFAULT_MAX_BYTES)
+        ),
+    )
+
+
+def result_cache_key(
+    country_id: str,
+    household: dict,
+    reform: dict | None,
+    model_version: str,
+    response_format: str = "household",
+) -> str:
+    """Hash the inputs that determine a calculate result.
+
+    ``make_hashable`` sorts mapping keys, so payloads that differ only in
+    key order share an entry. The household is hashed as the response
+    will echo it (after deprecated inputs are dropped, before period
+    keys are normalized): two payloads that normalize to the same engine
+    input can still echo different period keys back.
+    """
+    return hash_object(
+        (country_id, household, reform or {}, model_version, response_format)
+    )
+
+
+def cache_bypass_requested(cache_control: str | None) -> bool:
+    if not cache_control:
+        return False
+    directives = {
+        directive.split("=", 1)[0].strip().lower()
+        for directive in cache_control.split(",")
+    }
+    return not directives.isdisjoint(BYPASS_CACHE_CONTROL_DIRECTIVES)
+
+
+class ResultCache:
+    def __init__(self, max_entries: int, max_bytes: int):
+        self._entries = BoundedLRUCache(
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            sizeof=len,
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._entries.total_bytes
+
+    def get_or_calculate(
+        self, key: str, calculate: Callable[[], dict]
+    ) -> dict:
+        """Return the cached result for ``key`` or calculate and store it.
+
+        Exceptions propagate without being cached; numpy arrays in a
+        result come back from a hit as lists. Records
+        ``result_cache`` (``hit``/``miss``) and, when storing the result
+        pushed older entries out, ``result_cache_evictions`` on the
+        current request.
+        """
+        cached = self._entries.get(key)
+        if cached is not None:
+            set_attribute("result_cache", "hit")
+            return json_codec.loads(cached)
+
+        set_attribute("result_cache", "miss")
+        result = calculate()
+        evicted = self._entries.put(key, json_codec.dumps(result))
+        if evicted:
+            set_attribute("result_cache_evictions", evicted)
+        return result
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def build_result_cache() -> ResultCache | None:
+    config = result_cache_config()
+    if not config.enabled:
+        return None
+    return ResultCache(
+        max_entries=config.max_entries,
+        max_bytes=config.max_bytes,
+    )
+
+
+RESULT_CACHE = build_result_cache()
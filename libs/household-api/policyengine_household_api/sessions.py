@@ -0,0 +1,216 @@
+"""Household sessions: a household calculated again and again, one
+change at a time.
+
+Interactive front-ends recalculate on every keystroke, each time with
+one input changed. A ``/calculate`` request with ``"start_session":
+true`` calculates its household as usual and opens a session for it;
+follow-ups send the session's ID and a ``patch``, a household holding
+only the input values that changed. The worker applies the patch to the
+session's household and recalculates it with the calculated values the
+previous calculation left, minus those that depend on a patched input
+(see ``incremental``).
+
+Sessions live in the worker process that started them. The registry
+holds at most ``app.sessions.max_entries`` of them and drops one left
+idle for ``app.sessions.idle_ttl_seconds``; a request for a session the
+worker no longer holds gets a 404 and the client starts a new one. The
+calculated values, the bulk of a session's memory, are bounded apart by
+``app.sessions.max_bytes``: a session whose values were dropped is
+calculated in full on its next request.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+import secrets
+import threading
+import time
+
+from policyengine_household_common.config_loader import get_config_value
+from policyengine_household_common.household_copy import (
+    CopyOnWriteHousehold,
+)
+from policyengine_observability import set_attribute
+
+from policyengine_household_api.incremental import CalculatedValues
+from policyengine_household_api.templates import (
+    HouseholdTemplate,
+    check_input_value,
+)
+from policyengine_household_api.utils.lru_cache import BoundedLRUCache
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_IDLE_TTL_SECONDS = 900
+
+
+@dataclass(frozen=True)
+class SessionConfig:
+    max_entries: int
+    max_bytes: int
+    idle_ttl_seconds: float
+
+
+def session_config() -> SessionConfig:
+    return SessionConfig(
+        max_entries=int(
+            get_config_value("app.sessions.max_entries", DEFAULT_MAX_ENTRIES)
+        ),
+        max_bytes=int(
+            get_config_value("app.sessions.max_bytes", DEFAULT_MAX_BYTES)
+        ),
+        idle_ttl_seconds=float(
+            get_config_value(
+                "app.sessions.idle_ttl_seconds", DEFAULT_IDLE_TTL_SECONDS
+            )
+        ),
+    )
+
+
+@dataclass
+class HouseholdSession:
+    """A household and the policy it is calculated under.
+
+    ``template`` holds the household's structural checks and plan (see
+    ``templates``); ``household`` is its current values. Requests for
+    one session hold ``lock`` from applying their patch until their
+    result is stored, so each patch applies to the one before it.
+    """
+
+    session_id: str
+    country_id: str
+    template: HouseholdTemplate
+    policy: dict
+    household: dict
+    last_used: float
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def patched(self, patch) -> dict:
+        """``household`` with the values in ``patch`` written over it.
+
+        ``patch`` is shaped like a household and names only inputs the
+        session's household has. Raises ``ValueError`` with a user-safe
+        message otherwise; ``household`` itself is never mutated.
+        """
+        _check_object("patch", patch)
+        inputs = self.template.input_slots
+        patched = CopyOnWriteHousehold(self.household)
+        for entity_plural, entities in patch.items():
+            _check_object(f"patch.{entity_plural}", entities)
+            for entity_id, variables in entities.items():
+                label = f"patch.{entity_plural}.{entity_id}"
+                _check_object(label, variables)
+                for variable_name, period_map in variables.items():
+                    _check_object(f"{label}.{variable_name}", period_map)
+                    for period, value in period_map.items():
+                        slot_label = f"{label}.{variable_name}.{period}"
+                        slot = (
+                            entity_plural,
+                            entity_id,
+                            variable_name,
+                            period,
+                        )
+                        if slot not in inputs:
+                            raise ValueError(
+                                f"{slot_label!r} is not one of the "
+                                "session's inputs"
+                            )
+                        check_input_value(slot_label, value)
+                        patched.writable(
+                            entity_plural, entity_id, variable_name
+                        )[period] = value
+        return patched.household
+
+
+def _check_object(label: str, value) -> None:
+    if not isinstance(value, dict):
+        raise ValueError(f"{label!r} must be an object")
+
+
+class SessionRegistry:
+    """The sessions this worker holds and their calculated values."""
+
+    def __init__(
+        self,
+        config: SessionConfig,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.idle_ttl_seconds = config.idle_ttl_seconds
+        self._clock = clock
+        self._sessions = BoundedLRUCache(max_entries=config.max_entries)
+        self._values = BoundedLRUCache(
+            max_entries=config.max_entries,
+            max_bytes=config.max_bytes,
+            sizeof=lambda values: values.nbytes,
+        )
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def start(
+        self,
+        country_id: str,
+        template: HouseholdTemplate,
+        policy: dict,
+    ) -> HouseholdSession:
+        self._expire()
+        session = HouseholdSession(
+            session_id=secrets.token_urlsafe(16),
+            country_id=country_id,
+            template=template,
+            policy=policy,
+            household=template.household,
+            last_used=self._clock(),
+        )
+        evicted = self._sessions.put((country_id, session.session_id), session)
+        if evicted:
+            set_attribute("session_evictions", evicted)
+        return session
+
+    def get(self, country_id: str, session_id: str) -> HouseholdSession | None:
+        key = (country_id, session_id)
+        session = self._sessions.get(key)
+        if session is None:
+            return None
+        if self._idle(session):
+            self._sessions.pop(key)
+            self._values.pop(key)
+            return None
+        session.last_used = self._clock()
+        return session
+
+    def calculated_values(
+        self, session: HouseholdSession
+    ) -> CalculatedValues | None:
+        return self._values.get((session.country_id, session.session_id))
+
+    def update(
+        self,
+        session: HouseholdSession,
+        household: dict,
+        values: CalculatedValues,
+    ) -> None:
+        """Store the household a session request calculated and the
+        values its calculation left."""
+        session.household = household
+        session.last_used = self._clock()
+        evicted = self._values.put(
+            (session.country_id, session.session_id), values
+        )
+        if evicted:
+            set_attribute("session_value_evictions", evicted)
+
+    def clear(self) -> None:
+        self._sessions.clear()
+        self._values.clear()
+
+    def _idle(self, session: HouseholdSession) -> bool:
+        return self._clock() - session.last_used > self.idle_ttl_seconds
+
+    def _expire(self) -> None:
+        # Sessions are kept in order of last use, so the idle ones are
+        # the oldest.
+        for key in self._sessions.evict_while(self._idle):
+            self._values.pop(key)
+
+
+SESSIONS = SessionRegistry(session_config())
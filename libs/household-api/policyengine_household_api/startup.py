@@ -0,0 +1,263 @@
+"""Build the countries a process serves concurrently, with a timeline.
+
+Starting a worker imports each country package, constructs its
+tax-benefit system and, for Modal's memory snapshots, pre-builds the
+parameter at-instant projections requests read. Each country's steps
+run in order on one thread of a pool of ``app.startup.workers``, so
+countries build alongside each other while a system is only ever
+touched by one thread. Built systems stay in this process, which is
+why the pool holds threads: parameter file reads overlap, but
+pure-Python construction still takes turns on the GIL, and package
+imports take turns outright (see ``country.import_country_package``).
+
+Where the image ships a system snapshot (``app.startup.snapshot_dir``,
+see ``system_snapshot``), prewarmed projections are loaded from it
+before any missing ones are built. Every step is timed per country
+(``import``, ``system_build``, ``metadata``, ``snapshot_load``,
+``prewarm``) and the whole run is reported as one
+``startup_timeline`` event inside a ``startup`` operation, so a cold
+start's time can be attributed in the logs.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import copy_context
+from dataclasses import dataclass, field
+import logging
+from pathlib import Path
+import time
+from typing import Any
+
+from policyengine_household_common.config_loader import get_config_value
+from policyengine_observability import operation, record_event
+
+from policyengine_household_api.constants import COUNTRIES as COUNTRY_IDS
+from policyengine_household_api.country import (
+    COUNTRIES,
+    CountryRegistry,
+    import_country_package,
+    prewarm_country_ids,
+)
+from policyengine_household_api.system_snapshot import (
+    load_snapshot,
+    snapshot_dir as configured_snapshot_dir,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = len(COUNTRY_IDS)
+DEFAULT_METADATA = False
+
+
+def startup_workers() -> int:
+    return max(
+        1, int(get_config_value("app.startup.workers", DEFAULT_WORKERS))
+    )
+
+
+def startup_metadata() -> bool:
+    value = get_config_value("app.startup.metadata", DEFAULT_METADATA)
+    if isinstance(value, str):
+        # Environment overrides (APP__STARTUP__METADATA=true) are strings.
+        return value.strip().lower() in ("1", "true", "yes")
+    return bool(value)
+
+
+@dataclass
+class CountryStartup:
+    """One country's startup steps, in milliseconds, in the order run."""
+
+    country_id: str
+    phases_ms: dict[str, float] = field(default_factory=dict)
+    prewarm_instants: int = 0
+    snapshot: str | None = None
+    error: str | None = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases_ms[name] = round(
+                (time.perf_counter() - started_at) * 1000, 3
+            )
+
+    def fields(self) -> dict[str, Any]:
+        return {
+            **{
+                f"{name}_ms": duration
+                for name, duration in self.phases_ms.items()
+            },
+            "total_ms": round(sum(self.phases_ms.values()), 3),
+            "prewarm_instants": self.prewarm_instants or None,
+            "snapshot": self.snapshot,
+            "error": self.error,
+        }
+
+
+@dataclass
+class StartupTimeline:
+    workers: int
+    countries: dict[str, CountryStartup]
+    total_ms: float = 0.0
+
+    def fields(self) -> dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "total_ms": self.total_ms,
+            "countries": {
+                country_id: {
+                    key: value
+                    for key, value in country.fields().items()
+                    if value is not None
+                }
+                for country_id, country in self.countries.items()
+            },
+        }
+
+
+def prewarm_parameter_instants(system, instants: Sequence[str]) -> None:
+    for instant in instants:
+        system.get_parameters_at_instant(instant)
+
+
+def start_countries(
+    country_ids: Sequence[str] | None = None,
+    *,
+    registry: CountryRegistry | None = None,
+    instants: Sequence[str] = (),
+    metadata: bool | None = None,
+    snapshot_dir: Path | str | None = None,
+    workers: int | None = None,
+    on_started: Callable[[CountryStartup], None] | None = None,
+) -> StartupTimeline:
+    """Build ``country_ids`` (default: ``app.countries.prewarm``).
+
+    Each country is imported and built, then has its metadata built if
+    ``metadata`` (default: ``app.startup.metadata``) and ``instants``
+    pre-built, loading what it can from the snapshot in
+    ``snapshot_dir`` (default: ``app.startup.snapshot_dir``) first.
+    Countries already built skip straight to the later steps.
+    ``on_started`` is called with each country as it finishes. Raises
+    the first country's error once every country has finished.
+    """
+    registry = COUNTRIES if registry is None else registry
+    if country_ids is None:
+        country_ids = prewarm_country_ids()
+    if metadata is None:
+        metadata = startup_metadata()
+    if snapshot_dir is None:
+        snapshot_dir = configured_snapshot_dir()
+
+    def start(country: CountryStartup) -> None:
+        with country.phase("import"):
+            import_country_package(registry.package_name(country.country_id))
+        with country.phase("system_build"):
+            built = registry[country.country_id]
+        if metadata:
+            with country.phase("metadata"):
+                built.metadata
+        if instants and snapshot_dir is not None:
+            with country.phase("snapshot_load"):
+                country.snapshot = load_snapshot(built, snapshot_dir).status
+        if instants:
+            # Instants the snapshot held are already cached.
+            with country.phase("prewarm"):
+                prewarm_parameter_instants(built.tax_benefit_system, instants)
+            country.prewarm_instants = len(instants)
+
+    return run_startup(
+        {
+            country_id: start
+            for country_id in country_ids
+            if country_id in registry
+        },
+        workers=workers,
+        on_started=on_started,
+    )
+
+
+def prewarm_systems(
+    tax_benefit_systems: Mapping[str, Any],
+    instants: Sequence[str],
+    workers: int | None = None,
+) -> StartupTimeline:
+    """Pre-build ``instants`` on already-built tax-benefit systems."""
+
+    def prewarm(system) -> Callable[[CountryStartup], None]:
+        def start(country: CountryStartup) -> None:
+            with country.phase("prewarm"):
+                prewarm_parameter_instants(system, instants)
+            country.prewarm_instants = len(instants)
+
+        return start
+
+    return run_startup(
+        {
+            country_id: prewarm(system)
+            for country_id, system in tax_benefit_systems.items()
+        },
+        workers=workers,
+    )
+
+
+def run_startup(
+    steps: Mapping[str, Callable[[CountryStartup], None]],
+    workers: int | None = None,
+    on_started: Callable[[CountryStartup], None] | None = None,
+) -> StartupTimeline:
+    """Run each country's ``steps`` on a thread pool and time them."""
+    workers = max(1, min(workers or startup_workers(), len(steps) or 1))
+    timeline = StartupTimeline(
+        workers=workers,
+        countries={
+            country_id: CountryStartup(country_id) for country_id in steps
+        },
+    )
+    errors: list[BaseException] = []
+
+    def run(country_id: str) -> None:
+        country = timeline.countries[country_id]
+        try:
+            steps[country_id](country)
+        except Exception as e:
+            country.error = f"{type(e).__name__}: {e}"
+            errors.append(e)
+        logger.info(
+            "Started %s in %.1fs (%s)",
+            country_id,
+            sum(country.phases_ms.values()) / 1000,
+            ", ".join(
+                f"{name} {duration / 1000:.1f}s"
+                for name, duration in country.phases_ms.items()
+            ),
+        )
+        if on_started is not None:
+            on_started(country)
+
+    started_at = time.perf_counter()
+    with operation("startup", flavor="startup", workers=workers):
+        if workers == 1:
+            for country_id in steps:
+                run(country_id)
+        else:
+            # Each country runs in a copy of this context, so segments
+            # its build records (`country_load`) join this operation.
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="startup"
+            ) as pool:
+                futures = [
+                    pool.submit(copy_context().run, run, country_id)
+                    for country_id in steps
+                ]
+                for future in futures:
+                    future.result()
+        timeline.total_ms = round((time.perf_counter() - started_at) * 1000, 3)
+        record_event("startup_timeline", **timeline.fields())
+    if errors:
+        raise errors[0]
+    return timeline
@@ -0,0 +1,155 @@
+"""Persisted parameter projections for workers without memory snapshots.
+
+Modal workers restore a memory snapshot with every country's parameter
+at-instant projections already built (see
+``deployment.prewarm_parameter_caches``). A Cloud Run worker starts
+from nothing, so the image build writes those projections to disk
+instead: one file per country, holding the projection of the whole
+parameter tree at each prewarm instant. At boot the file is
+memory-mapped and unpickled into the freshly built system's caches,
+which takes about half the time building them does.
+
+Only the projections are persisted. A built tax-benefit system cannot
+be pickled (core loads each variable file as its own synthetic module,
+and formulas include closures), and unpickling its processed parameter
+tree takes as long as building it. Projections are plain values
+detached from the tree, so they round-trip exactly.
+
+Each file starts with a header naming the country package,
+policyengine-core and Python versions it was built with; a file built
+with any other versions is stale and ignored, and the projections are
+built as before. Snapshot files are unpickled, so they must come from
+the image build, never from user-writable storage.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import gc
+import mmap
+import os
+from pathlib import Path
+import pickle
+import sys
+from typing import Any, Sequence
+
+from policyengine_core.parameters import ParameterNode
+from policyengine_core.periods import instant as parse_instant
+
+from policyengine_household_common.config_loader import get_config_value
+from policyengine_household_common.constants import get_package_version
+
+from policyengine_household_api.constants import COUNTRY_PACKAGE_VERSIONS
+
+SNAPSHOT_FORMAT = 1
+
+LOADED = "loaded"
+MISSING = "missing"
+STALE = "stale"
+INVALID = "invalid"
+
+
+def snapshot_dir() -> Path | None:
+    """The configured ``app.startup.snapshot_dir``, or ``None``."""
+    value = get_config_value("app.startup.snapshot_dir", None)
+    return Path(value) if value else None
+
+
+def snapshot_key(country_id: str) -> dict[str, Any]:
+    """What a snapshot must have been built with to be loaded."""
+    return {
+        "format": SNAPSHOT_FORMAT,
+        "country_id": country_id,
+        "country_package_version": COUNTRY_PACKAGE_VERSIONS[country_id],
+        "policyengine_core_version": get_package_version("policyengine-core"),
+        "python_version": "{}.{}".format(*sys.version_info[:2]),
+    }
+
+
+def snapshot_path(directory: Path | str, country_id: str) -> Path:
+    return Path(directory) / f"{country_id}.parameters.pickle"
+
+
+def write_snapshot(
+    country, directory: Path | str, instants: Sequence[str]
+) -> Path:
+    """Build ``instants`` on ``country``'s system and write them to disk."""
+    system = country.tax_benefit_system
+    projections = {
+        str(parse_instant(instant)): system.get_parameters_at_instant(instant)
+        for instant in instants
+    }
+    path = snapshot_path(directory, country.country_id)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_suffix(".partial")
+    with open(partial, "wb") as f:
+        pickle.dump(
+            snapshot_key(country.country_id), f, pickle.HIGHEST_PROTOCOL
+        )
+        pickle.dump(projections, f, pickle.HIGHEST_PROTOCOL)
+    os.replace(partial, path)
+    return path
+
+
+@dataclass(frozen=True)
+class SnapshotLoad:
+    status: str
+    instants: int = 0
+
+
+def load_snapshot(country, directory: Path | str) -> SnapshotLoad:
+    """Install ``country``'s snapshot projections into its system's caches.
+
+    Returns ``MISSING`` when there is no snapshot file, ``STALE`` when it
+    was built with other versions and ``INVALID`` when it cannot be read;
+    the system is left untouched in each case.
+    """
+    path = snapshot_path(directory, country.country_id)
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return SnapshotLoad(MISSING)
+    with f:
+        try:
+            source = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            source = f
+        try:
+            # Header and projections are separate pickles, each with its
+            # own memo, so each gets its own unpickler.
+            header = pickle.Unpickler(source).load()
+            if header != snapshot_key(country.country_id):
+                return SnapshotLoad(STALE)
+            # Projections are millions of small objects; the collector
+            # would otherwise rescan them over and over while they load.
+            gc_was_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                projections = pickle.Unpickler(source).load()
+            finally:
+                if gc_was_enabled:
+                    gc.enable()
+        except Exception:
+            return SnapshotLoad(INVALID)
+        finally:
+            if source is not f:
+                source.close()
+
+    system = country.tax_benefit_system
+    for instant_str, projection in projections.items():
+        _install_projection(system.parameters, projection, instant_str)
+        system._parameters_at_instant_cache[parse_instant(instant_str)] = (
+            projection
+        )
+    return SnapshotLoad(LOADED, instants=len(projections))
+
+
+def _install_projection(node: ParameterNode, projection, instant_str: str):
+    # Core caches a projection on every node and builds a node's from
+    # its children's (reform overlays rely on that), so each subtree's
+    # projection goes into its node's cache, as a build would leave it.
+    node._at_instant_cache[instant_str] = projection
+    for name, child in node.children.items():
+        child_projection = projection._children.get(name)
+        if isinstance(child, ParameterNode) and child_projection is not None:
+            _install_projection(child, child_projection, instant_str)
@@ -0,0 +1,208 @@
+"""Household templates: a household's structure registered once, so
+calculate requests can send only its input values.
+
+Screener integrations post the same household on every request -- the
+same entity groups, ``members`` lists, variables and periods -- with
+only the numbers changed. ``POST /<country>/templates`` runs a
+household through every check ``/calculate`` makes and keeps what
+depends on its structure alone: the schema and variable checks, the
+deprecated-input stripping and period warnings, the YEAR-key expansion
+plan and the requested computations. A ``/calculate`` request naming
+the template sends a list of values in the template's ``inputs``
+order; they are written into the stored household, and the monthly
+budget rule, the one check that reads values, is all that runs again.
+
+Templates live in the worker process that registered them, in an LRU
+registry bounded by ``app.templates.max_entries``. An ID hashes the
+country, its model version and the structure, so registering the same
+structure again, on any worker, returns the same ID; a worker that does
+not hold it answers 404 and the client registers it again.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+import functools
+
+from policyengine_household_common.config_loader import get_config_value
+from policyengine_household_common.household_copy import (
+    CopyOnWriteHousehold,
+)
+from policyengine_observability import set_attribute
+
+from policyengine_household_api.country import get_requested_computations
+from policyengine_household_api.utils.json import hash_object
+from policyengine_household_api.utils.lru_cache import BoundedLRUCache
+
+DEFAULT_MAX_ENTRIES = 256
+
+Slot = tuple[str, str, str, str]
+
+
+@dataclass(frozen=True)
+class HouseholdTemplate:
+    """A household that passed every structural check, ready to fill.
+
+    ``household`` is the engine-ready household (deprecated inputs
+    removed) holding the registration's example values; ``inputs`` are
+    its value slots, ``(entity_plural, entity_id, variable_name,
+    period)``, in the order a request's ``values`` fill them.
+    ``warnings``, ``period_expansions`` and ``requested`` are shared by
+    every household filled from it; ``period_budget_slots`` are the
+    period maps whose budget depends on the values.
+    """
+
+    template_id: str
+    country_id: str
+    household: dict
+    inputs: tuple[Slot, ...]
+    warnings: tuple[str, ...]
+    period_expansions: tuple[tuple[str, str, str], ...]
+    period_budget_slots: tuple[tuple[str, str, str], ...]
+    requested: tuple[Slot, ...]
+
+    def fill(self, values) -> dict:
+        """``household`` with ``values`` written into its input slots.
+
+        Only the containers holding an input are copied; ``household``
+        itself is never mutated. Raises ``ValueError`` with a user-safe
+        message unless ``values`` is a list of one number, string or
+        boolean per input.
+        """
+        if not isinstance(values, list):
+            raise ValueError("'values' must be a list")
+        if len(values) != len(self.inputs):
+            raise ValueError(
+                f"'values' must hold one value per template input "
+                f"({len(self.inputs)}); got {len(values)}"
+            )
+        filled = CopyOnWriteHousehold(self.household)
+        for index, (
+            (entity_plural, entity_id, variable_name, period),
+            value,
+        ) in enumerate(zip(self.inputs, values)):
+            check_input_value(f"values[{index}]", value)
+            filled.writable(entity_plural, entity_id, variable_name)[
+                period
+            ] = value
+        return filled.household
+
+    @functools.cached_property
+    def input_slots(self) -> frozenset[Slot]:
+        return frozenset(self.inputs)
+
+    def describe_inputs(self) -> list[dict[str, str]]:
+        """The ``inputs`` as the registration response lists them."""
+        return [
+            {
+                "entity_group": entity_plural,
+                "entity": entity_id,
+                "variable": variable_name,
+                "period": period,
+            }
+            for entity_plural, entity_id, variable_name, period in self.inputs
+        ]
+
+
+def household_template(
+    country_id: str,
+    model_version: str,
+    household: dict,
+    *,
+    warnings: Sequence[str],
+    period_expansions: tuple[tuple[str, str, str], ...],
+    period_budget_slots: tuple[tuple[str, str, str], ...],
+) -> HouseholdTemplate:
+    """Build the template for a household that passed ``/calculate``'s
+    checks, from the results of its walk."""
+    inputs = tuple(_input_slots(household))
+    # The ID covers the structure, not the example values. ``inputs`` is
+    # hashed as well because the hash ignores key order, which decides
+    # the order values are given in.
+    structure = CopyOnWriteHousehold(household)
+    for entity_plural, entity_id, variable_name, period in inputs:
+        period_map = structure.writable(
+            entity_plural, entity_id, variable_name
+        )
+        period_map[period] = ""
+    return HouseholdTemplate(
+        template_id=hash_object(
+            (country_id, model_version, inputs, structure.household)
+        ),
+        country_id=country_id,
+        household=household,
+        inputs=inputs,
+        warnings=tuple(warnings),
+        period_expansions=period_expansions,
+        period_budget_slots=period_budget_slots,
+        requested=tuple(get_requested_computations(household)),
+    )
+
+
+def _input_slots(household: dict):
+    for entity_plural, entities in household.items():
+        if not isinstance(entities, dict):
+            continue
+        for entity_id, entity in entities.items():
+            if not isinstance(entity, dict):
+                continue
+            for variable_name, values in entity.items():
+                if not isinstance(values, dict):
+                    continue
+                for period, value in values.items():
+                    if value is not None:
+                        yield (entity_plural, entity_id, variable_name, period)
+
+
+def check_input_value(label: str, value) -> None:
+    """Raise ``ValueError`` unless ``value`` can fill an input slot."""
+    # A null would turn the input into a requested value, which the
+    # stored computation plan does not cover.
+    if not isinstance(value, (bool, int, float, str)):
+        raise ValueError(
+            f"{label!r} must be a number, string or boolean; "
+            f"got {_json_type(value)}"
+        )
+
+
+def _json_type(value) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, list):
+        return "a list"
+    if isinstance(value, dict):
+        return "an object"
+    return type(value).__name__
+
+
+def template_registry_max_entries() -> int:
+    return int(
+        get_config_value("app.templates.max_entries", DEFAULT_MAX_ENTRIES)
+    )
+
+
+class TemplateRegistry:
+    """The templates this worker holds, least recently used evicted first."""
+
+    def __init__(self, max_entries: int):
+        self._templates = BoundedLRUCache(max_entries=max_entries)
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def register(self, template: HouseholdTemplate) -> None:
+        evicted = self._templates.put(
+            (template.country_id, template.template_id), template
+        )
+        if evicted:
+            set_attribute("template_evictions", evicted)
+
+    def get(
+        self, country_id: str, template_id: str
+    ) -> HouseholdTemplate | None:
+        return self._templates.get((country_id, template_id))
+
+    def clear(self) -> None:
+        self._templates.clear()
+
+
+TEMPLATES = TemplateRegistry(template_registry_max_entries())
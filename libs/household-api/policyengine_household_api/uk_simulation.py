@@ -0,0 +1,146 @@
+"""Build policyengine-uk wrapper Simulations on shared tax-benefit systems.
+
+policyengine-uk's ``Simulation`` constructs a fresh
+``CountryTaxBenefitSystem`` in its constructor, clones it again for the
+``baseline`` it attaches to every simulation, and builds a whole second
+simulation (with a second system) when a scenario is passed. A
+household request therefore never touches the shared, prewarmed
+``COUNTRIES["uk"].tax_benefit_system``.
+
+``UKSimulationFactory`` performs the situation path of that constructor
+against a system the caller supplies: the shared baseline system, or a
+reformed system from ``PolicyEngineCountry``'s reformed-system cache.
+The steps mirror ``policyengine_uk.Simulation.__init__`` (pinned in
+``libs/household-api/pyproject.toml``) with three deliberate
+differences, each sound only because supplied systems are never
+mutated once prepared:
+
+- the structural reforms a system's parameters switch on are applied
+  to the system once, by ``prepare_system``, rather than to every
+  simulation's private system;
+- the parameter caches are not reset after construction, which is what
+  keeps the prewarmed projections alive;
+- the attached ``baseline`` shares its system instead of cloning it.
+"""
+
+from collections.abc import Callable
+import importlib
+from types import SimpleNamespace
+from typing import Any
+
+from policyengine_core.periods import period as parse_period
+from policyengine_core.taxbenefitsystems import TaxBenefitSystem
+from policyengine_core.tracers import SimpleTracer
+
+# Inputs the wrapper moves to their pre-behavioural-response variables
+# so labour supply and capital gains responses can be layered on top.
+_MOVED_INPUTS = (
+    ("capital_gains", "capital_gains_before_response"),
+    ("employment_income", "employment_income_before_lsr"),
+    (
+        "employee_pension_contributions",
+        "employee_pension_contributions_reported",
+    ),
+)
+
+
+class UKSimulationFactory:
+    def __init__(self, country_package):
+        self.country_package = country_package
+        scenarios = importlib.import_module(
+            f"{country_package.__name__}.scenarios"
+        )
+        reforms = importlib.import_module(
+            f"{country_package.__name__}.reforms"
+        )
+        self._universal_credit_reform = (
+            scenarios.universal_credit_july_2025_reform
+        )
+        self._create_structural_reforms = (
+            reforms.create_structural_reforms_from_parameters
+        )
+
+    def reformed_system(self, reform: dict) -> TaxBenefitSystem:
+        """Build a system with ``reform`` applied the way a Scenario is.
+
+        Runs the Scenario's modifiers against a fresh system, exactly as
+        the wrapper does for ``applied_before_data_load`` scenarios.
+        """
+        scenario = self.country_package.Scenario.from_reform(reform)
+        system = self.country_package.CountryTaxBenefitSystem()
+        modified = SimpleNamespace(tax_benefit_system=system)
+        if scenario.simulation_modifier is not None:
+            scenario.simulation_modifier(modified)
+        if scenario.parameter_changes is not None:
+            self.country_package.Simulation.apply_parameter_changes(
+                modified, scenario.parameter_changes
+            )
+        system.reset_parameter_caches()
+        self.prepare_system(system)
+        return system
+
+    def prepare_system(self, system: TaxBenefitSystem) -> None:
+        """Apply the structural reforms ``system``'s parameters switch on.
+
+        The wrapper derives these from parameter values at its
+        ``default_input_period`` and applies them to each simulation's
+        system after building it; current law already switches some on.
+        Doing it once here is what lets simulations share ``system``.
+        """
+        structural_reform = self._create_structural_reforms(
+            system.parameters,
+            parse_period(self.country_package.Simulation.default_input_period),
+        )
+        if structural_reform is not None:
+            structural_reform.apply(system)
+
+    def simulation(
+        self,
+        system: TaxBenefitSystem,
+        situation: dict,
+        baseline_system: TaxBenefitSystem | None = None,
+        prepare: Callable[[Any], None] | None = None,
+    ):
+        """Build a wrapper Simulation for ``situation`` on ``system``.
+
+        ``system`` must have been through ``prepare_system``.
+        ``baseline_system`` is the unreformed system when ``system``
+        carries a reform; the wrapper then attaches a separately built
+        baseline simulation, which reform-aware variables read.
+        ``prepare`` is called with each simulation built (the baseline
+        too) once its situation is loaded, before the wrapper's own
+        input adjustments.
+        """
+        Simulation = self.country_package.Simulation
+        simulation = Simulation.__new__(Simulation)
+        simulation.tax_benefit_system = system
+        simulation.branch_name = "default"
+        simulation.invalidated_caches = set()
+        simulation.debug = False
+        simulation.trace = False
+        simulation.tracer = SimpleTracer()
+        simulation.opt_out_cache = False
+        simulation.max_spiral_loops = 10
+        simulation.memory_config = None
+        simulation._data_storage_dir = None
+        simulation.disable_economic_assumptions = False
+        simulation.branches = {}
+
+        simulation.build_from_situation(situation)
+        if prepare is not None:
+            prepare(simulation)
+        self._universal_credit_reform.simulation_modifier(simulation)
+        for donor, target in _MOVED_INPUTS:
+            simulation.move_values(donor, target)
+        simulation.input_variables = simulation.get_known_variables()
+
+        if baseline_system is not None:
+            simulation.baseline = self.simulation(
+                baseline_system, situation, prepare=prepare
+            )
+        else:
+            simulation.baseline = simulation.clone(
+                clone_tax_benefit_system=False
+            )
+        simulation.calculated_periods = []
+        return simulation
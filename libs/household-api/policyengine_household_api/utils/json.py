@@ -36,3 +36,18 @@ def get_safe_json(value):
     if isinstance(value, list):
         return [get_safe_json(v) for v in value]
     return None
+
+
+def json_default(value):
+    """``json.dumps`` ``default`` for the numpy values results may hold.
+
+    Columnar axes results keep their arrays as numpy buffers until the
+    response is encoded (see ``response_encoding``).
+    """
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(
+        f"Object of type {type(value).__name__} is not JSON serializable"
+    )
@@ -0,0 +1,96 @@
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+import threading
+from typing import Any
+
+
+class BoundedLRUCache:
+    """Thread-safe LRU mapping bounded by entry count and total size.
+
+    ``sizeof`` reports the size of a value in bytes; when it is omitted
+    every entry counts as zero bytes and only ``max_entries`` applies.
+    A value larger than ``max_bytes`` on its own is never stored.
+    Gunicorn runs several threads per worker, so every access takes the
+    lock; the critical sections are dictionary operations only.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: int | None = None,
+        sizeof: Callable[[Any], int] | None = None,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof or (lambda value: 0)
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any) -> int:
+        """Store ``value`` and return how many entries were evicted."""
+        size = self._sizeof(value)
+        if self.max_entries <= 0 or (
+            self.max_bytes is not None and size > self.max_bytes
+        ):
+            return 0
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= previous[1]
+            self._entries[key] = (value, size)
+            self._total_bytes += size
+            evicted = 0
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None
+                and self._total_bytes > self.max_bytes
+            ):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._total_bytes -= evicted_size
+                evicted += 1
+            return evicted
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return default
+            self._total_bytes -= entry[1]
+            return entry[0]
+
+    def evict_while(self, predicate: Callable[[Any], bool]) -> list[Hashable]:
+        """Evict least recently used entries while ``predicate`` holds
+        for the oldest value; return the evicted keys."""
+        evicted = []
+        with self._lock:
+            while self._entries:
+                key, (value, size) = next(iter(self._entries.items()))
+                if not predicate(value):
+                    break
+                del self._entries[key]
+                self._total_bytes -= size
+                evicted.append(key)
+        return evicted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
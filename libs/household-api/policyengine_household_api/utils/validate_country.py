@@ -1,8 +1,8 @@
 from functools import wraps
 from typing import Union
 from flask import Response
-import json
-from policyengine_household_api.constants import COUNTRIES
+from policyengine_household_api.country import COUNTRIES
+from policyengine_household_common import json_codec
 
 
 def validate_country(func):
@@ -24,7 +24,7 @@ def validate_country(func):
                 status="error",
                 message=f"Country {country_id} not found. Available countries are: {', '.join(COUNTRIES)}",
             )
-            return Response(json.dumps(body), status=404)
+            return Response(json_codec.dumps(body), status=404)
         return func(country_id, *args, **kwargs)
 
     return validate_country_wrapper
@@ -0,0 +1,310 @@
+"""How warm this process is, for readiness checks and request logs.
+
+A worker answers as soon as its app is imported, but the first request
+for a cold country pays for building the country's tax-benefit system
+and then its parameter projections (60-105s for the US, issue #1624).
+The process moves through warm levels, in order:
+
+- ``cold``: nothing built.
+- ``systems``: the ``app.countries.prewarm`` countries are built (the
+  api module does this at import).
+- ``parameters``: every served country is built, with its parameter
+  projections over the prewarm window
+  (``deployment.prewarm_parameter_caches``).
+- ``households``: a corpus of representative households has been
+  calculated for every served country, paying the first-call costs
+  left after that (formula imports, vectorisation, lazily filled
+  variable caches). The Modal worker replays the corpus before its
+  memory snapshot is taken.
+
+``/readiness_check`` answers 503 with the warmup's progress until the
+process reaches ``app.warmup.ready_level``. Modal memory snapshots and
+gunicorn's preloading master reach ``parameters`` before serving; the
+Cloud Run worker warms to it on a background thread started at boot,
+so it is live while it warms but takes no traffic until it is ready.
+The level is also set as the ``warm_level`` attribute on every request.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+import importlib
+import json
+import logging
+from pathlib import Path
+import threading
+import time
+from typing import Any
+
+from policyengine_household_common.config_loader import get_config_value
+from policyengine_household_common.worker_dispatch import (
+    dispatch_to_flask_app,
+)
+from policyengine_observability import record_event
+
+from policyengine_household_api.country import COUNTRIES
+from policyengine_household_api.startup import (
+    CountryStartup,
+    StartupTimeline,
+    start_countries,
+)
+
+logger = logging.getLogger(__name__)
+
+COLD = "cold"
+SYSTEMS = "systems"
+PARAMETERS = "parameters"
+HOUSEHOLDS = "households"
+LEVELS = (COLD, SYSTEMS, PARAMETERS, HOUSEHOLDS)
+
+DEFAULT_READY_LEVEL = SYSTEMS
+_REPLAYING: ContextVar[bool] = ContextVar(
+    "policyengine_warmup_replaying", default=False
+)
+
+
+def ready_level() -> str:
+    """The configured ``app.warmup.ready_level``."""
+    level = (
+        str(get_config_value("app.warmup.ready_level", DEFAULT_READY_LEVEL))
+        .strip()
+        .lower()
+    )
+    if level not in LEVELS:
+        raise ValueError(
+            f"app.warmup.ready_level must be one of {', '.join(LEVELS)}, "
+            f"got {level!r}"
+        )
+    return level
+
+
+def corpus_enabled() -> bool:
+    value = get_config_value("app.warmup.corpus", True)
+    if isinstance(value, str):
+        # Environment overrides (APP__WARMUP__CORPUS=false) are strings.
+        return value.strip().lower() in ("1", "true", "yes")
+    return bool(value)
+
+
+def corpus_dir() -> Path | None:
+    """The configured ``app.warmup.corpus_dir``, or ``None`` (bundled)."""
+    value = get_config_value("app.warmup.corpus_dir", None)
+    return Path(value) if value else None
+
+
+class Warmup:
+    """The warm level this process has reached, overall and per country."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._booted_at = time.monotonic()
+        self._thread: threading.Thread | None = None
+        self.level = COLD
+        self.countries: dict[str, str] = {}
+        self.reached_s: dict[str, float] = {}
+        self.error: str | None = None
+
+    def reached(self, level: str) -> bool:
+        return LEVELS.index(self.level) >= LEVELS.index(level)
+
+    def ready(self) -> bool:
+        return self.error is None and self.reached(ready_level())
+
+    def advance(self, level: str) -> None:
+        """Record that the whole process has reached ``level``."""
+        with self._lock:
+            if self.reached(level):
+                return
+            self.level = level
+            self.reached_s[level] = self._elapsed_s()
+        logger.info("Warmed to %s in %.1fs", level, self.reached_s[level])
+        record_event(
+            "warmup_level",
+            warm_level=level,
+            elapsed_ms=round(self.reached_s[level] * 1000, 3),
+        )
+
+    def country_warmed(self, level: str) -> Callable[[CountryStartup], None]:
+        """A ``start_countries`` callback recording each country's level."""
+
+        def warmed(country: CountryStartup) -> None:
+            if country.error is not None:
+                return
+            with self._lock:
+                current = self.countries.get(country.country_id, COLD)
+                if LEVELS.index(level) > LEVELS.index(current):
+                    self.countries[country.country_id] = level
+
+        return warmed
+
+    def start(self, warm: Callable[[], Any]) -> threading.Thread:
+        """Run ``warm`` on a background thread, once per process."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    args=(warm,),
+                    name="warmup",
+                    daemon=True,
+                )
+                self._thread.start()
+            return self._thread
+
+    def _run(self, warm: Callable[[], Any]) -> None:
+        try:
+            warm()
+        except Exception as e:
+            self.error = f"{type(e).__name__}: {e}"
+            logger.exception("Background warmup failed")
+            record_event(
+                "warmup_failed", warm_level=self.level, error=self.error
+            )
+
+    def status(self) -> dict[str, Any]:
+        target = ready_level()
+        if self.error is not None:
+            status = "failed"
+        elif self.reached(target):
+            status = "ready"
+        else:
+            status = "warming"
+        return {
+            "status": status,
+            "warm_level": self.level,
+            "ready_level": target,
+            "countries": {
+                country_id: self.countries.get(country_id, COLD)
+                for country_id in COUNTRIES
+            },
+            "elapsed_s": self._elapsed_s(),
+            "reached_s": dict(self.reached_s),
+            "error": self.error,
+        }
+
+    def _elapsed_s(self) -> float:
+        return round(time.monotonic() - self._booted_at, 3)
+
+
+WARMUP = Warmup()
+
+
+def warm_systems() -> StartupTimeline:
+    """Build the ``app.countries.prewarm`` countries: ``systems``."""
+    timeline = start_countries(on_started=WARMUP.country_warmed(SYSTEMS))
+    WARMUP.advance(SYSTEMS)
+    return timeline
+
+
+def warm_parameters(
+    instants: Sequence[str], *, metadata: bool | None = None
+) -> StartupTimeline:
+    """Build every served country and its ``instants``: ``parameters``."""
+    timeline = start_countries(
+        tuple(COUNTRIES),
+        instants=instants,
+        metadata=metadata,
+        on_started=WARMUP.country_warmed(PARAMETERS),
+    )
+    WARMUP.advance(PARAMETERS)
+    return timeline
+
+
+def load_corpus(
+    country_id: str, directory: Path | str | None = None
+) -> dict[str, dict]:
+    """``country_id``'s corpus households by name, or none.
+
+    Read from ``<country_id>.json`` in ``directory`` (default:
+    ``app.warmup.corpus_dir``), or from the bundled ``warmup_corpus``.
+    """
+    directory = directory or corpus_dir()
+    if directory is None:
+        try:
+            module = importlib.import_module(
+                f"policyengine_household_api.warmup_corpus.{country_id}"
+            )
+        except ModuleNotFoundError:
+            return {}
+        return module.HOUSEHOLDS
+    path = Path(directory) / f"{country_id}.json"
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def replaying() -> bool:
+    """Whether the current request is a replayed corpus household."""
+    return _REPLAYING.get()
+
+
+@contextmanager
+def _replaying() -> Iterator[None]:
+    token = _REPLAYING.set(True)
+    try:
+        yield
+    finally:
+        _REPLAYING.reset(token)
+
+
+def replay_corpus(
+    flask_app, directory: Path | str | None = None
+) -> dict[str, dict[str, float]]:
+    """Calculate every served country's corpus households: ``households``.
+
+    Each household is dispatched to ``flask_app``'s public
+    ``/<country>/calculate_demo`` as a gateway request would be,
+    bypassing the result cache so every one is simulated; the rate
+    limit exempts them (see ``replaying``). A household that fails is
+    logged and skipped. Does nothing when ``app.warmup.corpus`` is off.
+    Returns each household's latency in milliseconds, by country.
+    """
+    if not corpus_enabled():
+        return {}
+    latencies: dict[str, dict[str, float]] = {}
+    failed = 0
+    started_at = time.perf_counter()
+    for country_id in COUNTRIES:
+        corpus = load_corpus(country_id, directory)
+        country = CountryStartup(country_id)
+        for name, household in corpus.items():
+            with country.phase(name), _replaying():
+                result = dispatch_to_flask_app(
+                    flask_app, _corpus_request(country_id, household)
+                )
+            if result["status_code"] != 200:
+                failed += 1
+                country.error = f"{name} answered {result['status_code']}"
+                logger.warning(
+                    "Warmup household %s/%s", country_id, country.error
+                )
+        if corpus:
+            latencies[country_id] = country.phases_ms
+            WARMUP.country_warmed(HOUSEHOLDS)(country)
+    households = sum(len(names) for names in latencies.values())
+    total_ms = round((time.perf_counter() - started_at) * 1000, 3)
+    logger.info(
+        "Replayed %d warmup households in %.1fs", households, total_ms / 1000
+    )
+    record_event(
+        "warmup_corpus",
+        households=households,
+        failed=failed,
+        total_ms=total_ms,
+        latencies_ms=latencies,
+    )
+    WARMUP.advance(HOUSEHOLDS)
+    return latencies
+
+
+def _corpus_request(country_id: str, household: dict) -> dict[str, Any]:
+    return {
+        "method": "POST",
+        "path": f"/{country_id}/calculate_demo",
+        "headers": {
+            "Content-Type": "application/json",
+            "Cache-Control": "no-cache",
+        },
+        "body": json.dumps({"household": household}).encode(),
+    }
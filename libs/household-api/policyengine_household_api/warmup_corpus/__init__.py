@@ -0,0 +1,6 @@
+"""Households calculated to warm a process, one module per country.
+
+Each module's ``HOUSEHOLDS`` maps a name to a household. They are
+Python rather than data files so they ship wherever the package's
+source does (Modal images copy only Python files).
+"""
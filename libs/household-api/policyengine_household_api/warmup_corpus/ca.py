@@ -0,0 +1,21 @@
+"""A Canadian single parent."""
+
+HOUSEHOLDS = {
+    "single_parent": {
+        "people": {
+            "parent": {
+                "age": {"2026": 40},
+                "employment_income": {"2026": 30000},
+            },
+            "child": {"age": {"2026": 5}},
+        },
+        "households": {
+            "household": {
+                "members": ["parent", "child"],
+                "province_code_str": {"2026": "ON"},
+                "child_benefit": {"2026": None},
+                "household_benefits": {"2026": None},
+            }
+        },
+    }
+}
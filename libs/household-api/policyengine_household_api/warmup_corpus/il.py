@@ -0,0 +1,15 @@
+"""An Israeli single earner."""
+
+HOUSEHOLDS = {
+    "single_earner": {
+        "people": {
+            "you": {"age": {"2026": 40}, "employment_income": {"2026": 30000}}
+        },
+        "households": {
+            "household": {
+                "members": ["you"],
+                "household_net_income": {"2026": None},
+            }
+        },
+    }
+}
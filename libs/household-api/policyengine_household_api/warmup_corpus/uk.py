@@ -0,0 +1,55 @@
+"""UK households from tests/data/uk_households.py."""
+
+HOUSEHOLDS = {
+    "universal_credit": {
+        "people": {
+            "parent": {
+                "age": {"2026": 30},
+                "employment_income": {"2026": 15000},
+            },
+            "child": {"age": {"2026": 5}},
+        },
+        "benunits": {
+            "benunit": {
+                "members": ["parent", "child"],
+                "universal_credit": {"2026": None},
+            }
+        },
+        "households": {
+            "household": {
+                "members": ["parent", "child"],
+                "region": {"2026": "LONDON"},
+                "tenure_type": {"2026": "RENT_PRIVATELY"},
+                "rent": {"2026": 15600},
+            }
+        },
+    },
+    "income_tax": {
+        "people": {
+            "parent": {
+                "age": {"2026": 30},
+                "employment_income": {"2026": 15000},
+                "income_tax": {"2026": None},
+            }
+        },
+        "benunits": {"benunit": {"members": ["parent"]}},
+        "households": {"household": {"members": ["parent"]}},
+    },
+    "marriage_allowance": {
+        "people": {
+            "earner": {
+                "age": {"2026": 40},
+                "employment_income": {"2026": 80000},
+                "marriage_allowance": {"2026": None},
+            },
+            "partner": {"age": {"2026": 40}, "employment_income": {"2026": 0}},
+        },
+        "benunits": {
+            "benunit": {
+                "members": ["earner", "partner"],
+                "is_married": {"2026": True},
+            }
+        },
+        "households": {"household": {"members": ["earner", "partner"]}},
+    },
+}
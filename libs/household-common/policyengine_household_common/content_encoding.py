@@ -0,0 +1,226 @@
+"""Negotiated ``Content-Encoding`` for request and response bodies.
+
+Axes and batch responses are hundreds of KiB of repetitive JSON, and a
+request crosses three hops (client, gateway, worker), so bodies travel
+compressed end to end:
+
+- The household API inflates ``gzip`` and ``zstd`` request bodies before
+  Flask sees them, so ``MAX_CONTENT_LENGTH`` applies to the inflated
+  size. Inflation stops as soon as that size is exceeded, so a small
+  compressed body cannot expand without bound.
+- Its responses are compressed with the best encoding the client's
+  ``Accept-Encoding`` allows, once they reach ``app.compression.min_bytes``.
+- The gateways forward request and response bytes as they are, with
+  their ``Content-Encoding``; only the worker inflates or compresses.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+import gzip
+import io
+from typing import Any
+
+from flask import Flask, Response, request
+from policyengine_observability import set_attribute
+from werkzeug.exceptions import (
+    BadRequest,
+    HTTPException,
+    RequestEntityTooLarge,
+    UnsupportedMediaType,
+)
+from werkzeug.wsgi import get_input_stream
+import zstandard
+
+from policyengine_household_common.config_loader import get_config_value
+from policyengine_household_common.request_limits import (
+    DEFAULT_MAX_CONTENT_LENGTH_BYTES,
+)
+
+GZIP = "gzip"
+ZSTD = "zstd"
+IDENTITY = "identity"
+# In server preference order, for clients that accept both equally.
+SUPPORTED_CONTENT_ENCODINGS = (ZSTD, GZIP)
+
+DEFAULT_MIN_BYTES = 1024
+DEFAULT_GZIP_LEVEL = 6
+DEFAULT_ZSTD_LEVEL = 3
+_READ_CHUNK_BYTES = 64 * 1024
+
+
+@dataclass(frozen=True)
+class CompressionConfig:
+    min_bytes: int
+    gzip_level: int
+    zstd_level: int
+
+
+def compression_config() -> CompressionConfig:
+    return CompressionConfig(
+        min_bytes=int(
+            get_config_value("app.compression.min_bytes", DEFAULT_MIN_BYTES)
+        ),
+        gzip_level=int(
+            get_config_value("app.compression.gzip_level", DEFAULT_GZIP_LEVEL)
+        ),
+        zstd_level=int(
+            get_config_value("app.compression.zstd_level", DEFAULT_ZSTD_LEVEL)
+        ),
+    )
+
+
+def compress_body(
+    body: bytes, encoding: str, config: CompressionConfig | None = None
+) -> bytes:
+    config = config or compression_config()
+    if encoding == GZIP:
+        return gzip.compress(body, compresslevel=config.gzip_level, mtime=0)
+    if encoding == ZSTD:
+        return zstandard.ZstdCompressor(level=config.zstd_level).compress(body)
+    raise ValueError(f"Unsupported content encoding {encoding!r}")
+
+
+def decompress_body(body: bytes, encoding: str, *, max_bytes: int) -> bytes:
+    """Inflate ``body``, refusing to produce more than ``max_bytes``.
+
+    Raises 415 for an encoding other than ``gzip``, ``zstd`` or
+    ``identity``, 413 once the inflated body passes ``max_bytes`` and
+    400 for data that is not valid in its encoding.
+    """
+    encoding = encoding.strip().lower()
+    if encoding in ("", IDENTITY):
+        return body
+    if encoding == GZIP:
+        reader = gzip.GzipFile(fileobj=io.BytesIO(body))
+    elif encoding == ZSTD:
+        reader = zstandard.ZstdDecompressor().stream_reader(
+            io.BytesIO(body), read_across_frames=True
+        )
+    else:
+        raise UnsupportedMediaType(
+            f"Unsupported Content-Encoding `{encoding}`; supported "
+            f"encodings are {', '.join(SUPPORTED_CONTENT_ENCODINGS)}"
+        )
+
+    chunks = []
+    size = 0
+    try:
+        with reader:
+            while chunk := reader.read(_READ_CHUNK_BYTES):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise RequestEntityTooLarge(
+                        f"Decompressed request body exceeds {max_bytes} bytes"
+                    )
+                chunks.append(chunk)
+        if encoding == ZSTD and not _zstd_frames_complete(body):
+            raise EOFError("zstd frame ends before its last block")
+    except (EOFError, OSError, zstandard.ZstdError) as exc:
+        raise BadRequest(
+            f"Request body is not valid `{encoding}` data"
+        ) from exc
+    return b"".join(chunks)
+
+
+def _zstd_frames_complete(body: bytes) -> bool:
+    # zstd's stream reader returns what it has at the end of a truncated
+    # frame instead of failing, and its decompression objects, which do
+    # report a frame's end, cannot bound their output. Running them over
+    # a body the stream reader has already inflated within the cap is
+    # bounded by that cap.
+    remaining = body
+    while remaining:
+        decompressor = zstandard.ZstdDecompressor().decompressobj()
+        decompressor.decompress(remaining)
+        if not decompressor.eof:
+            return False
+        remaining = decompressor.unused_data
+    return True
+
+
+class RequestDecompressionMiddleware:
+    """WSGI middleware that inflates compressed request bodies.
+
+    The inflated body replaces ``wsgi.input`` with a matching
+    ``Content-Length`` and no ``Content-Encoding``, so the wrapped app
+    reads and size-checks it like any uncompressed body. ``max_bytes``
+    is read per request; without a cap the Cloud Run platform limit is
+    used, since an uncapped inflation is exactly what a zip bomb needs.
+    """
+
+    def __init__(
+        self, wsgi_app: Callable, max_bytes: Callable[[], int | None]
+    ) -> None:
+        self.wsgi_app = wsgi_app
+        self.max_bytes = max_bytes
+
+    def __call__(self, environ: dict[str, Any], start_response: Callable):
+        encoding = environ.get("HTTP_CONTENT_ENCODING", "").strip().lower()
+        if encoding in ("", IDENTITY):
+            return self.wsgi_app(environ, start_response)
+
+        max_bytes = self.max_bytes() or DEFAULT_MAX_CONTENT_LENGTH_BYTES
+        try:
+            compressed = get_input_stream(
+                environ, max_content_length=max_bytes
+            ).read()
+            body = decompress_body(compressed, encoding, max_bytes=max_bytes)
+        except HTTPException as exc:
+            return exc(environ, start_response)
+
+        environ["wsgi.input"] = io.BytesIO(body)
+        environ["CONTENT_LENGTH"] = str(len(body))
+        environ.pop("HTTP_CONTENT_ENCODING")
+        environ.pop("wsgi.input_terminated", None)
+        environ["policyengine.request_content_encoding"] = encoding
+        return self.wsgi_app(environ, start_response)
+
+
+def compress_response(
+    response: Response, config: CompressionConfig
+) -> Response:
+    """Compress ``response`` for the current request's ``Accept-Encoding``."""
+    if (
+        response.direct_passthrough
+        or response.is_streamed
+        or "Content-Encoding" in response.headers
+        or response.status_code < 200
+        or response.status_code in (204, 304)
+    ):
+        return response
+    body = response.get_data()
+    if len(body) < config.min_bytes:
+        return response
+
+    response.vary.add("Accept-Encoding")
+    encoding = request.accept_encodings.best_match(SUPPORTED_CONTENT_ENCODINGS)
+    if encoding is None:
+        return response
+    response.set_data(compress_body(body, encoding, config))
+    response.headers["Content-Encoding"] = encoding
+    set_attribute("response_content_encoding", encoding)
+    return response
+
+
+def init_content_encoding(app: Flask) -> None:
+    """Inflate compressed requests to, and compress responses from, ``app``.
+
+    Compressed requests are capped at ``app.config["MAX_CONTENT_LENGTH"]``
+    after inflation.
+    """
+    config = compression_config()
+    app.wsgi_app = RequestDecompressionMiddleware(
+        app.wsgi_app, lambda: app.config.get("MAX_CONTENT_LENGTH")
+    )
+
+    @app.before_request
+    def _record_request_content_encoding() -> None:
+        encoding = request.environ.get("policyengine.request_content_encoding")
+        if encoding:
+            set_attribute("request_content_encoding", encoding)
+
+    @app.after_request
+    def _compress_response(response: Response) -> Response:
+        return compress_response(response, config)
@@ -8,9 +8,11 @@ landing — every other output computes normally; only outputs that
 depended on the deprecated input fall back to defaults.
 """
 
-import copy
 from dataclasses import dataclass
 
+from policyengine_household_common.household_copy import (
+    CopyOnWriteHousehold,
+)
 
 # Registry of removed/renamed model variables that legacy partner traffic
 # may still pass. The value is a one-line migration hint surfaced verbatim
@@ -46,7 +48,7 @@ class DeprecatedVariableWarning:
 
 @dataclass(frozen=True)
 class DeprecatedInputsResult:
-    """A household copy with deprecated inputs removed plus warnings."""
+    """A household with deprecated inputs removed plus warnings."""
 
     household: dict
     warnings: list[DeprecatedVariableWarning]
@@ -55,11 +57,12 @@ class DeprecatedInputsResult:
 def drop_deprecated_inputs(
     household: dict,
 ) -> DeprecatedInputsResult:
-    """Return a household copy with deprecated input keys stripped.
+    """Return the household with deprecated input keys stripped.
 
     Returns one warning per (entity, deprecated-key) occurrence. The
-    caller's ``household`` is never mutated; downstream validation and
-    simulation receive the returned copy.
+    caller's ``household`` is never mutated: only the containers that
+    lose a key are copied, and every other subtree is shared with it
+    (the household itself is returned when nothing is deprecated).
 
     Non-dict inputs are returned unchanged with no warnings; the
     Pydantic schema check that runs immediately after will reject the
@@ -70,9 +73,9 @@ def drop_deprecated_inputs(
     if not isinstance(household, dict):
         return DeprecatedInputsResult(household=household, warnings=warnings)
 
-    cleaned_household = copy.deepcopy(household)
+    cleaned_household = CopyOnWriteHousehold(household)
 
-    for entity_plural, entity_group in cleaned_household.items():
+    for entity_plural, entity_group in household.items():
         if entity_plural == "axes":
             continue
         if not isinstance(entity_group, dict):
@@ -80,7 +83,7 @@ def drop_deprecated_inputs(
         for entity_id, variables in entity_group.items():
             if not isinstance(variables, dict):
                 continue
-            for variable_name in list(variables.keys()):
+            for variable_name in variables:
                 hint = DEPRECATED_VARIABLES.get(variable_name)
                 if hint is None:
                     continue
@@ -92,19 +95,22 @@ def drop_deprecated_inputs(
                         hint=hint,
                     )
                 )
-                del variables[variable_name]
+                del cleaned_household.writable(entity_plural, entity_id)[
+                    variable_name
+                ]
 
     _drop_deprecated_axes(cleaned_household, warnings)
 
     return DeprecatedInputsResult(
-        household=cleaned_household, warnings=warnings
+        household=cleaned_household.household, warnings=warnings
     )
 
 
 def _drop_deprecated_axes(
-    household: dict, warnings: list[DeprecatedVariableWarning]
+    household: CopyOnWriteHousehold,
+    warnings: list[DeprecatedVariableWarning],
 ) -> None:
-    axes = household.get("axes")
+    axes = household.household.get("axes")
     if not isinstance(axes, list):
         return
 
@@ -133,9 +139,9 @@ def _drop_deprecated_axes(
     if not changed:
         return
     if retained_entries:
-        household["axes"] = retained_entries
+        household.writable()["axes"] = retained_entries
     else:
-        del household["axes"]
+        del household.writable()["axes"]
 
 
 def _is_deprecated_axis(
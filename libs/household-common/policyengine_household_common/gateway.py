@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-import json
 from typing import Any, Callable
 
 from flask import Flask, Response, jsonify, request
+from werkzeug.exceptions import HTTPException
 
+from policyengine_household_common import json_codec
 from policyengine_household_common.constants import COUNTRIES
+from policyengine_household_common.content_encoding import (
+    compress_body,
+    decompress_body,
+)
 from policyengine_household_common.observability.flask import (
     init_observability,
 )
@@ -27,6 +32,9 @@ from policyengine_household_common.release_manifest import (
     empty_manifest,
     validate_manifest,
 )
+from policyengine_household_common.request_limits import (
+    max_content_length_bytes,
+)
 from policyengine_household_common.routing_metadata import (
     MODAL_ROUTING_PAYLOAD_KEY,
     modal_routing_payload,
@@ -44,7 +52,12 @@ from policyengine_household_common.worker_dispatch import (
 )
 
 
-VERSIONED_ENDPOINTS = {"calculate", "calculate_demo"}
+VERSIONED_ENDPOINTS = {
+    "calculate",
+    "calculate_batch",
+    "calculate_demo",
+    "templates",
+}
 
 
 @dataclass(frozen=True)
@@ -64,6 +77,7 @@ def create_gateway_app(
     worker_request: Callable[[str, dict[str, Any]], Response] | None = None,
 ) -> Flask:
     app = Flask(__name__)
+    app.json = json_codec.JsonCodecProvider(app)
     init_observability(app, service_role="modal_gateway")
     load_manifest = manifest_loader or load_modal_manifest
     route_to_worker_function = worker_request or call_worker_function
@@ -124,7 +138,9 @@ def create_gateway_app(
                 manifest = validate_manifest(load_manifest())
             with segment(SegmentName.VERSION_RESOLUTION):
                 if country_id and endpoint in VERSIONED_ENDPOINTS:
-                    body, requested_version = _extract_requested_version(body)
+                    body, requested_version = _extract_requested_version(
+                        body, request.headers.get("Content-Encoding")
+                    )
                 else:
                     requested_version = "current"
                 resolved_app = resolve_app_for_request(
@@ -229,23 +245,38 @@ def call_worker_function(app_name: str, payload: dict[str, Any]) -> Response:
     )
 
 
-def _extract_requested_version(body: bytes) -> tuple[bytes, str]:
+def _extract_requested_version(
+    body: bytes, content_encoding: str | None = None
+) -> tuple[bytes, str]:
     if not body:
         return body, "current"
 
     try:
-        payload = json.loads(body)
-    except json.JSONDecodeError:
+        document = decompress_body(
+            body,
+            content_encoding or "",
+            max_bytes=max_content_length_bytes(),
+        )
+        payload = json_codec.loads(document)
+    except (HTTPException, ValueError):
+        # Forwarded as is; the worker rejects a body it cannot read.
         return body, "current"
 
     if not isinstance(payload, dict):
         return body, "current"
+    if "version" not in payload:
+        # Nothing to strip: forward the client's bytes as they are.
+        return body, "current"
 
-    requested_version = payload.pop("version", "current") or "current"
+    requested_version = payload.pop("version") or "current"
     if not isinstance(requested_version, str):
         raise GatewayResolutionError("`version` must be a string")
 
-    return json.dumps(payload).encode("utf-8"), requested_version
+    stripped = json_codec.dumps(payload)
+    if document is not body:
+        # Re-encode so the forwarded Content-Encoding still holds.
+        stripped = compress_body(stripped, content_encoding.strip().lower())
+    return stripped, requested_version
 
 
 def _country_and_endpoint(path: str) -> tuple[str | None, str | None]:
@@ -0,0 +1,36 @@
+"""Copy-on-write edits to household situations.
+
+The request pipeline derives several households from a partner's
+payload: one without deprecated inputs, one with YEAR-keyed inputs
+spread across months, and the response echo with computed values
+filled in. Each changes a handful of period maps, so copying the whole
+household for each one dominates allocations on large payloads.
+"""
+
+
+class CopyOnWriteHousehold:
+    """A household whose containers are copied only when written.
+
+    ``writable(*path)`` returns the container at ``path`` (entity group,
+    entity id, variable name, ...), copying it and each of its ancestors
+    the first time that path is written. Every other subtree stays
+    shared with the source household, which is never mutated, so
+    consumers of ``household`` must treat it as read-only too.
+    """
+
+    def __init__(self, household: dict):
+        self.household = household
+        self._copied: set[tuple[str, ...]] = set()
+
+    def writable(self, *path: str) -> dict:
+        if () not in self._copied:
+            self.household = dict(self.household)
+            self._copied.add(())
+        container = self.household
+        for depth in range(1, len(path) + 1):
+            key = path[depth - 1]
+            if path[:depth] not in self._copied:
+                container[key] = dict(container[key])
+                self._copied.add(path[:depth])
+            container = container[key]
+        return container
@@ -0,0 +1,130 @@
+"""The JSON codec every household service hop encodes and decodes with.
+
+A calculate request's JSON is parsed and serialized at each hop: the
+gateway reads the body to route it, the Cloud Run dispatch envelope
+wraps it, and the worker parses the request and serializes the result.
+All of them go through ``loads`` and ``dumps`` here so the codec can be
+swapped in one place with ``app.json_codec``:
+
+- ``orjson`` (the default) parses and serializes in native code and
+  writes numpy arrays and scalars directly. Documents only the standard
+  library accepts (``NaN``/``Infinity`` literals) are parsed by the
+  standard library instead, so no request that parsed before is
+  rejected now. Integers beyond 64 bits parse as floats, and non-finite
+  floats serialize as ``null``.
+- ``stdlib`` is Python's ``json`` module, as every hop used before.
+
+Flask apps install ``JsonCodecProvider`` so ``request.get_json`` and
+``jsonify`` use the codec too, and read the request body through
+``request_json``, which parses it once per request.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+import json
+from typing import Any
+
+from flask import g, request
+from flask.json.provider import DefaultJSONProvider
+import orjson
+
+from policyengine_household_common.config_loader import get_config_value
+
+DEFAULT_JSON_CODEC = "orjson"
+
+
+@dataclass(frozen=True)
+class JsonCodec:
+    name: str
+    loads: Callable[[bytes | str], Any]
+    dumps: Callable[..., bytes]
+
+
+def _to_builtin(value):
+    # numpy arrays and scalars (and anything else array-like) expose
+    # `tolist`; duck-typing it keeps numpy out of this lib's imports.
+    tolist = getattr(value, "tolist", None)
+    if tolist is None:
+        raise TypeError(
+            f"Object of type {type(value).__name__} is not JSON serializable"
+        )
+    return tolist()
+
+
+def _orjson_loads(data: bytes | str) -> Any:
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json.loads(data)
+
+
+def _orjson_dumps(value, *, sort_keys: bool = False) -> bytes:
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    return orjson.dumps(value, default=_to_builtin, option=option)
+
+
+def _stdlib_dumps(value, *, sort_keys: bool = False) -> bytes:
+    return json.dumps(value, default=_to_builtin, sort_keys=sort_keys).encode(
+        "utf-8"
+    )
+
+
+ORJSON_CODEC = JsonCodec(
+    name="orjson", loads=_orjson_loads, dumps=_orjson_dumps
+)
+STDLIB_CODEC = JsonCodec(name="stdlib", loads=json.loads, dumps=_stdlib_dumps)
+JSON_CODECS = {codec.name: codec for codec in (ORJSON_CODEC, STDLIB_CODEC)}
+
+
+def configured_json_codec() -> JsonCodec:
+    name = get_config_value("app.json_codec", DEFAULT_JSON_CODEC)
+    try:
+        return JSON_CODECS[name]
+    except KeyError:
+        raise ValueError(
+            f"app.json_codec must be one of {', '.join(JSON_CODECS)}; "
+            f"got {name!r}"
+        ) from None
+
+
+JSON_CODEC = configured_json_codec()
+
+
+def loads(data: bytes | str) -> Any:
+    return JSON_CODEC.loads(data)
+
+
+def dumps(value, *, sort_keys: bool = False) -> bytes:
+    return JSON_CODEC.dumps(value, sort_keys=sort_keys)
+
+
+class JsonCodecProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by the configured codec."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return dumps(obj, sort_keys=self.sort_keys).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return loads(s)
+
+
+def request_json(*, silent: bool = False):
+    """The current request's JSON body, parsed once per request.
+
+    The parsed body is kept on ``flask.g``. It is read through Flask's
+    own per-request cache, so callers of ``request.get_json`` (the
+    analytics decorator walks the household before the endpoint runs)
+    get the same object rather than a second parse. ``silent`` returns
+    ``None`` for a missing or malformed body instead of raising the
+    error Flask would.
+    """
+    if "request_json" not in g:
+        g.request_json = request.get_json(silent=True)
+    if g.request_json is None and not silent:
+        # Raise the error Flask would for this request.
+        return request.get_json()
+    return g.request_json
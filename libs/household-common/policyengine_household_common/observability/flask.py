@@ -22,6 +22,7 @@ HOUSEHOLD_METRIC_ATTRIBUTE_KEYS = (
     "cloud_run_revision",
     "cloud_run_service",
     "deprecated_warning_count",
+    "first_request",
     "google_cloud_project",
     "modal_app_name",
     "modal_environment",
@@ -30,7 +31,9 @@ HOUSEHOLD_METRIC_ATTRIBUTE_KEYS = (
     "runtime_role",
     "model_version",
     "period_warning_count",
+    "result_cache",
     "variable_error_count",
+    "warm_level",
 )
 
 
@@ -12,11 +12,9 @@ class SegmentName(StrEnum):
 
     REQUEST_PARSE = "request_parse"
     PAYLOAD_VALIDATION = "payload_validation"
-    VARIABLE_VALIDATION = "variable_validation"
-    DEPRECATED_INPUT_FILTER = "deprecated_input_filter"
-    PERIOD_VALIDATION = "period_validation"
-    PERIOD_WARNING_DETECTION = "period_warning_detection"
+    HOUSEHOLD_WALK = "household_walk"
     CALCULATION = "calculation"
+    COUNTRY_LOAD = "country_load"
     RESPONSE_SERIALIZATION = "response_serialization"
 
     ANALYTICS_CONTEXT_BUILD = "analytics_context_build"
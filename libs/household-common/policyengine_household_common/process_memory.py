@@ -0,0 +1,46 @@
+"""How much of a process's memory it shares with its forked siblings.
+
+A preforked server's workers start out sharing every page the master
+built before forking; a page becomes private to a worker once the
+worker writes to it. ``rss`` counts shared pages in full in every
+worker, so the numbers that matter are ``private`` (the unique set
+size, what the worker alone costs) and ``pss`` (each shared page split
+evenly between the processes sharing it, so worker ``pss`` values sum
+to the real total).
+
+Read from Linux's ``/proc/<pid>/smaps_rollup``; elsewhere there is
+nothing to report.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+# smaps_rollup field -> reported key; shared and private sum two fields.
+_FIELDS = {
+    "Rss": "rss",
+    "Pss": "pss",
+    "Shared_Clean": "shared",
+    "Shared_Dirty": "shared",
+    "Private_Clean": "private",
+    "Private_Dirty": "private",
+    "Swap": "swap",
+}
+
+
+def process_memory(pid: int | str = "self") -> dict[str, int] | None:
+    """Memory of ``pid`` in bytes: ``rss``, ``pss``, ``shared``,
+    ``private`` and ``swap``, or ``None`` where the kernel does not
+    report it."""
+    try:
+        lines = Path(f"/proc/{pid}/smaps_rollup").read_text().splitlines()
+    except OSError:
+        return None
+    memory = dict.fromkeys(dict.fromkeys(_FIELDS.values()), 0)
+    for line in lines:
+        name, _, value = line.partition(":")
+        key = _FIELDS.get(name)
+        if key is not None:
+            # Values are in kB.
+            memory[key] += int(value.split()[0]) * 1024
+    return memory
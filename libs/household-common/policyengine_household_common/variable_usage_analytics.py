@@ -94,54 +94,82 @@ def extract_variable_usage(
     if not isinstance(household, dict):
         return []
 
-    entity_type_by_group = _entity_type_by_group(system)
-    accumulators: _VariableUsageAccumulators = {}
-
-    _extract_entity_group_variables(
-        household,
-        system,
-        entity_type_by_group,
-        accumulators,
-    )
-    _extract_axis_variables(
-        household,
-        system,
-        entity_type_by_group,
-        accumulators,
-    )
-
-    return [
-        _to_summary(accumulator, system)
-        for accumulator in sorted(
-            accumulators.values(),
-            key=lambda item: (
-                item.variable_name,
-                item.entity_type,
-                item.source,
-            ),
-        )
-    ]
-
-
-def _extract_entity_group_variables(
-    household: dict,
-    system,
-    entity_type_by_group: dict[str, str],
-    accumulators: _VariableUsageAccumulators,
-) -> None:
+    collector = VariableUsageCollector(system)
     for entity_group, entities in _iter_household_entity_groups(household):
         for entity_id, variable_name, period_map in _iter_entity_variables(
             entities
         ):
-            _add_entity_variable_usage(
-                accumulators,
-                variable_name,
-                entity_group,
-                entity_id,
-                period_map,
-                system,
-                entity_type_by_group,
+            collector.add_entity_variable(
+                entity_group, entity_id, variable_name, period_map
+            )
+    for axis in _iter_axis_specs(household):
+        collector.add_axis(axis)
+
+    return collector.summaries()
+
+
+class VariableUsageCollector:
+    """Accumulate variable usage one household slot at a time.
+
+    ``extract_variable_usage`` drives a collector over a whole payload;
+    callers that already walk the household feed it from their own
+    traversal instead of walking the payload a second time. Entity
+    variables listed in ``VARIABLE_BLACKLIST`` are the caller's to skip.
+    """
+
+    def __init__(self, system):
+        self._system = system
+        self._entity_type_by_group = _entity_type_by_group(system)
+        self._accumulators: _VariableUsageAccumulators = {}
+
+    def add_entity_variable(
+        self,
+        entity_group: str,
+        entity_id: str,
+        variable_name: str,
+        period_map: Any,
+    ) -> None:
+        _add_entity_variable_usage(
+            self._accumulators,
+            variable_name,
+            entity_group,
+            entity_id,
+            period_map,
+            self._system,
+            self._entity_type_by_group,
+        )
+
+    def add_axis(self, axis: dict) -> None:
+        """Record one axis specification; nameless axes are ignored."""
+        variable_name = axis.get("name")
+        if not isinstance(variable_name, str) or variable_name == "":
+            return
+        entity_type = _entity_type_for_variable(
+            variable_name,
+            "axes",
+            self._system,
+            self._entity_type_by_group,
+        )
+        accumulator = _get_accumulator(
+            self._accumulators,
+            variable_name,
+            entity_type,
+            VariableSource.AXIS,
+        )
+        accumulator.add_axis_period(axis.get("period"))
+
+    def summaries(self) -> list[VariableUsageSummary]:
+        return [
+            _to_summary(accumulator, self._system)
+            for accumulator in sorted(
+                self._accumulators.values(),
+                key=lambda item: (
+                    item.variable_name,
+                    item.entity_type,
+                    item.source,
+                ),
             )
+        ]
 
 
 def _iter_household_entity_groups(household: dict):
@@ -188,12 +216,7 @@ def _add_entity_variable_usage(
     )
 
 
-def _extract_axis_variables(
-    household: dict,
-    system,
-    entity_type_by_group: dict[str, str],
-    accumulators: _VariableUsageAccumulators,
-) -> None:
+def _iter_axis_specs(household: dict):
     axes = household.get("axes")
     if not isinstance(axes, list):
         return
@@ -201,24 +224,8 @@ def _extract_axis_variables(
     for entry in axes:
         axis_specs = entry if isinstance(entry, list) else [entry]
         for axis in axis_specs:
-            if not isinstance(axis, dict):
-                continue
-            variable_name = axis.get("name")
-            if not isinstance(variable_name, str) or variable_name == "":
-                continue
-            entity_type = _entity_type_for_variable(
-                variable_name,
-                "axes",
-                system,
-                entity_type_by_group,
-            )
-            accumulator = _get_accumulator(
-                accumulators,
-                variable_name,
-                entity_type,
-                VariableSource.AXIS,
-            )
-            accumulator.add_axis_period(axis.get("period"))
+            if isinstance(axis, dict):
+                yield axis
 
 
 def _get_accumulator(
@@ -9,9 +9,11 @@ from policyengine_household_common.routing_metadata import (
 from policyengine_observability import segment
 
 
+# ``Content-Encoding`` is not among them: the body is returned exactly as
+# the app encoded it, so a compressed response stays compressed through
+# the gateway to the client.
 HOP_BY_HOP_RESPONSE_HEADERS = {
     "connection",
-    "content-encoding",
     "content-length",
     "transfer-encoding",
 }
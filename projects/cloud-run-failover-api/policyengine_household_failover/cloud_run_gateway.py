@@ -16,6 +16,7 @@ from google.auth import exceptions as google_auth_exceptions
 from google.auth.transport.requests import Request as GoogleAuthRequest
 from google.oauth2 import id_token
 
+from policyengine_household_common import json_codec
 from policyengine_household_common.constants import COUNTRIES
 from policyengine_household_common.dispatch_codec import (
     decode_dispatch_response,
@@ -352,7 +353,7 @@ class GcsFailoverManifestLoader:
 
         client = storage.Client()
         blob = client.bucket(self.bucket_name).blob(self.blob_name)
-        return json.loads(blob.download_as_text())
+        return json_codec.loads(blob.download_as_bytes())
 
 
 def create_gateway_app(
@@ -374,6 +375,7 @@ def create_gateway_app(
     modal_canary_timeout_seconds: float | None = None,
 ) -> Flask:
     app = Flask(__name__)
+    app.json = json_codec.JsonCodecProvider(app)
     init_observability(app, service_role="failover_gateway")
     # Reject oversized request bodies before buffering them via
     # ``request.get_data()`` on a small gateway container.
@@ -479,7 +481,9 @@ def create_gateway_app(
         try:
             with segment(SegmentName.VERSION_RESOLUTION):
                 if country_id and endpoint in VERSIONED_ENDPOINTS:
-                    body, requested_version = _extract_requested_version(body)
+                    body, requested_version = _extract_requested_version(
+                        body, request.headers.get("Content-Encoding")
+                    )
                 else:
                     requested_version = "current"
                 resolved = resolve_failover_channel_for_request(
@@ -602,7 +606,7 @@ def call_cloud_run_worker(
         resolved.cloud_run_worker_url,
         "/_internal/dispatch",
     )
-    body = json.dumps(encode_dispatch_request(payload)).encode("utf-8")
+    body = json_codec.dumps(encode_dispatch_request(payload))
     try:
         with segment(SegmentName.CLOUD_RUN_AUTH, backend="cloud_run"):
             headers = {
@@ -623,7 +627,7 @@ def call_cloud_run_worker(
                     CLOUD_RUN_WORKER_TIMEOUT_SECONDS,
                 ),
             ) as response:
-                response_payload = json.loads(response.read().decode("utf-8"))
+                response_payload = json_codec.loads(response.read())
         with segment(
             SegmentName.CLOUD_RUN_RESPONSE_DECODE, backend="cloud_run"
         ):
@@ -665,7 +669,7 @@ def warm_cloud_run_worker(resolved: ResolvedFailoverChannel) -> None:
 def fetch_modal_status() -> dict[str, Any]:
     with segment(SegmentName.MODAL_STATUS_CHECK, backend="modal"):
         with urllib_request.urlopen(MODAL_STATUS_URL, timeout=5) as response:
-            return json.loads(response.read().decode("utf-8"))
+            return json_codec.loads(response.read())
 
 
 def _route_to_backend(
@@ -8,6 +8,7 @@ from policyengine_observability import record_error
 from policyengine_observability import set_attribute
 from werkzeug.exceptions import BadRequest
 
+from policyengine_household_common.json_codec import JsonCodecProvider
 from policyengine_household_common.dispatch_codec import (
     decode_dispatch_request,
     encode_dispatch_response,
@@ -31,6 +32,7 @@ def create_worker_app(
     flask_app: Flask | None = None,
     dispatcher: Callable[[Flask, dict[str, Any]], dict[str, Any]]
     | None = None,
+    warmup: Any | None = None,
 ) -> Flask:
     if flask_app is None:
         configure_process_observability(
@@ -38,20 +40,35 @@ def create_worker_app(
             service_role="cloud_run_worker",
         )
     app = Flask(__name__)
+    app.json = JsonCodecProvider(app)
     # Reject oversized dispatch payloads before buffering them. The gateway
     # base64-encodes the original request body into this payload, so the cap
     # is the Cloud Run platform limit rather than the household body limit.
     app.config["MAX_CONTENT_LENGTH"] = max_content_length_bytes()
-    household_app = flask_app or _load_household_app()
+    if flask_app is None:
+        household_app = _load_household_app()
+        warmup = _start_household_warmup()
+    else:
+        household_app = flask_app
     init_observability(app, service_role="cloud_run_worker")
     dispatch = dispatcher or dispatch_to_flask_app
 
+    if warmup is not None:
+
+        @app.before_request
+        def set_warm_level() -> None:
+            set_attribute("warm_level", warmup.level)
+
     @app.get("/liveness_check")
     def liveness_check() -> Response:
         return Response("OK", status=200, mimetype="text/plain")
 
     @app.get("/readiness_check")
     def readiness_check() -> Response:
+        # The startup probe polls this, so Cloud Run routes no traffic
+        # here until the background warmup reaches the ready level.
+        if warmup is not None and not warmup.ready():
+            return jsonify(warmup.status()), 503
         return Response("OK", status=200, mimetype="text/plain")
 
     @app.post("/_internal/dispatch")
@@ -100,5 +117,19 @@ def _load_household_app() -> Flask:
     return household_app
 
 
+def _start_household_warmup():
+    # There is no memory snapshot to restore here, so the parameter
+    # projections Modal bakes into its snapshot are loaded from the
+    # image's system snapshots (app.startup.snapshot_dir), or built, on
+    # a background thread while the worker already answers probes.
+    from policyengine_household_api.deployment import (
+        prewarm_parameter_caches,
+    )
+    from policyengine_household_api.warmup import WARMUP
+
+    WARMUP.start(prewarm_parameter_caches)
+    return WARMUP
+
+
 def _set_dispatch_attribute(key: str, value: Any) -> None:
     set_attribute(key, value)
@@ -170,9 +170,18 @@ class HouseholdWorker:
 
         prewarm_parameter_caches()
 
+        # Then calculate a corpus of representative households, so the
+        # snapshot also holds what the first simulations build lazily
+        # (formula imports, vectorisation, variable caches).
+        from policyengine_household_api.warmup import WARMUP, replay_corpus
+
+        replay_corpus(flask_app)
+        self.warm_level = WARMUP.level
+
     @modal.enter(snap=False)
     def reset_post_snapshot_state(self) -> None:
         reset_post_snapshot_process_state(self.flask_app)
+        self.first_request_pending = True
 
     @modal.method()
     def handle_household_request(
@@ -188,6 +197,12 @@ class HouseholdWorker:
         ):
             set_attribute("method", str(payload.get("method") or "GET"))
             set_attribute("path", str(payload.get("path") or ""))
+            # A restored container's first request, by the warm level
+            # its snapshot was taken at, is what the warmup pays for.
+            first_request = getattr(self, "first_request_pending", False)
+            self.first_request_pending = False
+            set_attribute("first_request", first_request)
+            set_attribute("warm_level", getattr(self, "warm_level", None))
             result = dispatch_to_flask_app(self.flask_app, payload)
             set_attribute("status_code", str(result.get("status_code")))
             return result
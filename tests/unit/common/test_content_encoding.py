@@ -0,0 +1,165 @@
+"""Tests for negotiated request and response Content-Encoding."""
+
+import gzip
+import json
+
+from flask import Flask, request
+import pytest
+from werkzeug.exceptions import (
+    BadRequest,
+    RequestEntityTooLarge,
+    UnsupportedMediaType,
+)
+import zstandard
+
+from policyengine_household_common.content_encoding import (
+    CompressionConfig,
+    compress_body,
+    decompress_body,
+    init_content_encoding,
+)
+
+BODY = json.dumps({"household": {"people": {"you": {"age": {"2026": 40}}}}})
+CONFIG = CompressionConfig(min_bytes=64, gzip_level=6, zstd_level=3)
+
+
+def _decompress(body: bytes, encoding: str) -> bytes:
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    return zstandard.ZstdDecompressor().decompress(body)
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    app.config["MAX_CONTENT_LENGTH"] = 4096
+    init_content_encoding(app)
+
+    @app.post("/echo")
+    def echo():
+        return {"received": request.get_json(), "padding": "x" * 2000}
+
+    return app
+
+
+class TestDecompressBody:
+    @pytest.mark.parametrize("encoding", ["gzip", "zstd"])
+    def test__round_trips_each_encoding(self, encoding):
+        compressed = compress_body(BODY.encode(), encoding, CONFIG)
+
+        assert _decompress(compressed, encoding) == BODY.encode()
+        assert (
+            decompress_body(compressed, f" {encoding.upper()}", max_bytes=4096)
+            == BODY.encode()
+        )
+
+    def test__identity_is_returned_as_is(self):
+        body = BODY.encode()
+
+        assert decompress_body(body, "identity", max_bytes=1) is body
+
+    @pytest.mark.parametrize("encoding", ["gzip", "zstd"])
+    def test__inflation_stops_at_the_cap(self, encoding):
+        bomb = compress_body(b"0" * (64 * 1024 * 1024), encoding, CONFIG)
+
+        with pytest.raises(RequestEntityTooLarge):
+            decompress_body(bomb, encoding, max_bytes=1024 * 1024)
+
+    @pytest.mark.parametrize("encoding", ["gzip", "zstd"])
+    def test__invalid_data_is_a_bad_request(self, encoding):
+        truncated = compress_body(BODY.encode(), encoding, CONFIG)[:-8]
+
+        with pytest.raises(BadRequest):
+            decompress_body(b"not compressed", encoding, max_bytes=4096)
+        with pytest.raises(BadRequest):
+            decompress_body(truncated, encoding, max_bytes=4096)
+
+    def test__unknown_encoding_is_unsupported(self):
+        with pytest.raises(UnsupportedMediaType):
+            decompress_body(b"", "br", max_bytes=4096)
+
+
+class TestRequestDecompression:
+    @pytest.mark.parametrize("encoding", ["gzip", "zstd"])
+    def test__compressed_body_is_read_as_json(self, app, encoding):
+        response = app.test_client().post(
+            "/echo",
+            data=compress_body(BODY.encode(), encoding, CONFIG),
+            content_type="application/json",
+            headers={"Content-Encoding": encoding},
+        )
+
+        assert response.status_code == 200
+        assert response.get_json()["received"] == json.loads(BODY)
+
+    def test__content_length_limit_applies_to_the_inflated_body(self, app):
+        body = json.dumps({"padding": "x" * 8192}).encode()
+
+        response = app.test_client().post(
+            "/echo",
+            data=gzip.compress(body),
+            content_type="application/json",
+            headers={"Content-Encoding": "gzip"},
+        )
+
+        assert len(gzip.compress(body)) < app.config["MAX_CONTENT_LENGTH"]
+        assert response.status_code == 413
+
+    def test__unsupported_encoding_returns_415(self, app):
+        response = app.test_client().post(
+            "/echo",
+            data=BODY,
+            content_type="application/json",
+            headers={"Content-Encoding": "br"},
+        )
+
+        assert response.status_code == 415
+
+
+class TestResponseCompression:
+    @pytest.mark.parametrize(
+        "accept_encoding,encoding",
+        [
+            ("gzip, zstd", "zstd"),
+            ("gzip", "gzip"),
+            ("zstd;q=0.5, gzip", "gzip"),
+            ("*", "zstd"),
+        ],
+    )
+    def test__best_accepted_encoding_is_used(
+        self, app, accept_encoding, encoding
+    ):
+        response = app.test_client().post(
+            "/echo", json={}, headers={"Accept-Encoding": accept_encoding}
+        )
+
+        assert response.headers["Content-Encoding"] == encoding
+        assert "Accept-Encoding" in response.headers["Vary"]
+        assert json.loads(_decompress(response.data, encoding)) == {
+            "received": {},
+            "padding": "x" * 2000,
+        }
+
+    @pytest.mark.parametrize("accept_encoding", [None, "identity", "br"])
+    def test__no_accepted_encoding_leaves_the_body_as_is(
+        self, app, accept_encoding
+    ):
+        headers = (
+            {"Accept-Encoding": accept_encoding} if accept_encoding else {}
+        )
+
+        response = app.test_client().post("/echo", json={}, headers=headers)
+
+        assert "Content-Encoding" not in response.headers
+        assert response.get_json()["received"] == {}
+
+    def test__small_responses_are_not_compressed(self, app):
+        @app.get("/small")
+        def small():
+            return {"status": "ok"}
+
+        response = app.test_client().get(
+            "/small", headers={"Accept-Encoding": "gzip"}
+        )
+
+        assert "Content-Encoding" not in response.headers
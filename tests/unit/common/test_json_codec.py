@@ -0,0 +1,128 @@
+"""Tests for the shared JSON codec."""
+
+import json
+from unittest import mock
+
+from flask import Flask, g, request
+import numpy as np
+import pytest
+
+from policyengine_household_common import json_codec
+from policyengine_household_common.json_codec import (
+    ORJSON_CODEC,
+    STDLIB_CODEC,
+    JsonCodecProvider,
+    configured_json_codec,
+    request_json,
+)
+
+PAYLOAD = {
+    "household": {
+        "people": {"you": {"age": {"2026": 40}, "name": "Zoë"}},
+        "axes": [[{"name": "employment_income", "count": 3, "min": 0}]],
+    },
+    "policy": {"gov.irs.credits.ctc.amount.base[0].amount": {"2026": 2e3}},
+    "flags": [True, False, None],
+}
+
+
+@pytest.mark.parametrize("codec", [ORJSON_CODEC, STDLIB_CODEC])
+class TestCodecs:
+    def test__round_trips_like_the_standard_library(self, codec):
+        encoded = codec.dumps(PAYLOAD)
+
+        assert json.loads(encoded) == PAYLOAD
+        assert codec.loads(json.dumps(PAYLOAD)) == PAYLOAD
+
+    def test__writes_numpy_values_as_their_lists(self, codec):
+        grid = np.arange(6, dtype=float).reshape(2, 3)
+        value = {
+            "floats": np.array([0.1, 2.5, -3.0]),
+            "strided": grid.T[0],
+            "names": np.array(["CA", "NY"]),
+            "flags": np.array([True, False]),
+            "scalar": np.int32(7),
+        }
+
+        assert json.loads(codec.dumps(value)) == {
+            "floats": [0.1, 2.5, -3.0],
+            "strided": [0.0, 3.0],
+            "names": ["CA", "NY"],
+            "flags": [True, False],
+            "scalar": 7,
+        }
+
+    def test__sort_keys(self, codec):
+        assert codec.dumps({"b": 1, "a": 2}, sort_keys=True).index(
+            b'"a"'
+        ) < codec.dumps({"b": 1, "a": 2}, sort_keys=True).index(b'"b"')
+
+
+class TestOrjsonCodec:
+    @pytest.mark.parametrize(
+        "document,expected",
+        [('{"value": NaN}', "nan"), ('{"value": -Infinity}', "-inf")],
+    )
+    def test__parses_non_finite_literals_like_the_standard_library(
+        self, document, expected
+    ):
+        assert str(ORJSON_CODEC.loads(document)["value"]) == expected
+
+    def test__malformed_documents_raise_value_error(self):
+        with pytest.raises(ValueError):
+            ORJSON_CODEC.loads(b'{"household": ')
+
+
+class TestConfiguredCodec:
+    @pytest.mark.parametrize("name", ["orjson", "stdlib"])
+    def test__selects_the_configured_codec(self, name):
+        with mock.patch.object(
+            json_codec, "get_config_value", return_value=name
+        ):
+            assert configured_json_codec().name == name
+
+    def test__unknown_codec_is_rejected(self):
+        with mock.patch.object(
+            json_codec, "get_config_value", return_value="simplejson"
+        ):
+            with pytest.raises(ValueError, match="app.json_codec"):
+                configured_json_codec()
+
+
+class TestRequestJson:
+    def test__body_is_parsed_once_per_request(self):
+        app = Flask(__name__)
+        app.json = JsonCodecProvider(app)
+        body = json.dumps(PAYLOAD)
+
+        with mock.patch.object(
+            json_codec, "loads", wraps=json_codec.loads
+        ) as loads:
+            with app.test_request_context(
+                "/us/calculate",
+                method="POST",
+                data=body,
+                content_type="application/json",
+            ):
+                first = request_json()
+                assert request_json() is first
+                assert request.get_json(silent=True) is first
+                assert g.request_json is first
+
+        assert first == PAYLOAD
+        assert loads.call_count == 1
+
+    def test__silent_returns_none_for_a_malformed_body(self):
+        app = Flask(__name__)
+        app.json = JsonCodecProvider(app)
+
+        with app.test_request_context(
+            "/us/calculate",
+            method="POST",
+            data=b'{"household": ',
+            content_type="application/json",
+        ):
+            assert request_json(silent=True) is None
+            with pytest.raises(Exception) as error:
+                request_json()
+            assert getattr(error.value, "code", None) == 400
@@ -0,0 +1,23 @@
+"""Tests for reading a process's shared and private memory."""
+
+import sys
+
+import pytest
+
+from policyengine_household_common.process_memory import process_memory
+
+
+@pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="reads /proc smaps_rollup"
+)
+def test__own_memory_splits_rss_into_shared_and_private():
+    memory = process_memory()
+
+    assert set(memory) == {"rss", "pss", "shared", "private", "swap"}
+    assert memory["private"] > 0
+    assert memory["shared"] + memory["private"] == memory["rss"]
+    assert memory["private"] <= memory["pss"] <= memory["rss"]
+
+
+def test__unreported_process_is_none():
+    assert process_memory(pid="no-such-process") is None
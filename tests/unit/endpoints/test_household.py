@@ -1,9 +1,15 @@
+import copy
+import gzip
 import json
 
+import msgpack
+import pyarrow as pa
 import pytest
+from policyengine_household_api.api import limiter
 from policyengine_household_api.constants import COUNTRY_PACKAGE_VERSIONS
 from policyengine_household_api.country import validate_policy_periods
 from policyengine_household_api.endpoints.household import _validate_axes
+from policyengine_household_api.sessions import SESSIONS
 from policyengine_household_common.routing_metadata import (
     REQUESTED_VERSION_ENVIRON_KEY,
     RESOLVED_CHANNEL_ENVIRON_KEY,
@@ -89,7 +95,7 @@ class TestCalculateEndpoint:
             json={
                 "household": {
                     **valid_household_requesting_ctc_calculation,
-                    "axes": [[{"name": "employment_income", "count": 500}]],
+                    "axes": [[{"name": "employment_income", "count": 10_001}]],
                 }
             },
             headers=self.auth_headers,
@@ -460,6 +466,779 @@ class TestCalculateEndpoint:
         assert calculate_analytics_capture.unsupported_variable_count == 2
 
 
+class TestColumnarFormat:
+    auth_headers = TestCalculateEndpoint.auth_headers
+    household = {
+        "people": {
+            "you": {"age": {"2024": 40}, "employment_income": {"2024": None}}
+        },
+        "tax_units": {
+            "tax_unit": {"members": ["you"], "income_tax": {"2024": None}}
+        },
+        "axes": [
+            [
+                {
+                    "name": "employment_income",
+                    "count": 3,
+                    "min": 0,
+                    "max": 60_000,
+                    "period": "2024",
+                }
+            ]
+        ],
+    }
+
+    def test__returns_coordinates_and_values_once(self, client):
+        echoed = json.loads(
+            client.post(
+                "/us/calculate",
+                json={"household": self.household},
+                headers=self.auth_headers,
+            ).data
+        )["result"]
+
+        response = client.post(
+            "/us/calculate?format=columnar",
+            json={"household": self.household},
+            headers=self.auth_headers,
+        )
+
+        assert response.status_code == 200
+        result = json.loads(response.data)["result"]
+        assert result["axes"] == [
+            {
+                "name": "employment_income",
+                "period": "2024",
+                "entity": "you",
+                "values": [0.0, 30_000.0, 60_000.0],
+            }
+        ]
+        assert result["values"] == {
+            "income_tax": {
+                "2024": {
+                    "tax_unit": echoed["tax_units"]["tax_unit"]["income_tax"][
+                        "2024"
+                    ]
+                }
+            },
+            "employment_income": {
+                "2024": {
+                    "you": echoed["people"]["you"]["employment_income"]["2024"]
+                }
+            },
+        }
+
+    @pytest.mark.parametrize(
+        "query,household,message",
+        [
+            (
+                "format=csv",
+                household,
+                "'format' must be one of household, columnar, sparse; "
+                "got 'csv'",
+            ),
+            (
+                "format=columnar",
+                valid_household_requesting_ctc_calculation,
+                "'format=columnar' is only available for axes households",
+            ),
+        ],
+    )
+    def test__given_unavailable_format__returns_400(
+        self, client, query, household, message
+    ):
+        response = client.post(
+            f"/us/calculate?{query}",
+            json={"household": household},
+            headers=self.auth_headers,
+        )
+
+        assert response.status_code == 400
+        assert json.loads(response.data)["message"] == message
+
+
+class TestSparseFormat:
+    auth_headers = TestCalculateEndpoint.auth_headers
+    household = {
+        "people": {
+            "you": {
+                "age": {"2024": 40},
+                "employment_income": {"2024": 30_000},
+            }
+        },
+        "tax_units": {
+            "tax_unit": {"members": ["you"], "income_tax": {"2024": None}}
+        },
+    }
+
+    def _post(self, client, path, payload):
+        response = client.post(path, json=payload, headers=self.auth_headers)
+        assert response.status_code == 200, response.data
+        return json.loads(response.data)["result"]
+
+    def test__returns_only_the_requested_slots(self, client):
+        echoed = self._post(
+            client, "/us/calculate", {"household": self.household}
+        )
+
+        result = self._post(
+            client,
+            "/us/calculate?format=sparse",
+            {"household": self.household},
+        )
+
+        assert result == {
+            "tax_units": {
+                "tax_unit": {
+                    "income_tax": echoed["tax_units"]["tax_unit"]["income_tax"]
+                }
+            }
+        }
+
+    def test__outputs_replace_null_placeholders(self, client):
+        household = copy.deepcopy(self.household)
+        del household["tax_units"]["tax_unit"]["income_tax"]
+
+        result = self._post(
+            client,
+            "/us/calculate?format=sparse",
+            {
+                "household": household,
+                "outputs": [
+                    {"variable": "income_tax", "period": "2024"},
+                    {
+                        "variable": "is_adult",
+                        "period": "2024",
+                        "entities": ["you"],
+                    },
+                ],
+            },
+        )
+
+        assert result == self._post(
+            client,
+            "/us/calculate?format=sparse",
+            {
+                "household": self.household,
+                "outputs": [
+                    {"variable": "is_adult", "period": "2024"},
+                ],
+            },
+        )
+        assert result["people"] == {"you": {"is_adult": {"2024": True}}}
+
+    def test__outputs_are_filled_into_the_echoed_household(self, client):
+        result = self._post(
+            client,
+            "/us/calculate",
+            {
+                "household": self.household,
+                "outputs": [{"variable": "is_adult", "period": "2024"}],
+            },
+        )
+
+        assert result["people"]["you"]["is_adult"] == {"2024": True}
+        assert result["people"]["you"]["age"] == {"2024": 40}
+
+    @pytest.mark.parametrize(
+        "outputs,message",
+        [
+            ({"variable": "income_tax"}, "'outputs' must be a list"),
+            (
+                [{"variable": "income_tax"}],
+                "'outputs[0]' must name a 'variable' and a 'period'",
+            ),
+            (
+                [{"variable": "no_such_variable", "period": "2024"}],
+                "'outputs[0]' asks for `no_such_variable`, which is not a "
+                "variable in this model",
+            ),
+            (
+                [{"variable": "snap", "period": "2024"}],
+                "'outputs[0]' asks for `snap`, but the household has no "
+                "`spm_units`",
+            ),
+            (
+                [
+                    {
+                        "variable": "age",
+                        "period": "2024",
+                        "entities": ["me"],
+                    }
+                ],
+                "'outputs[0]' asks for `age` on `people/me`, which is not "
+                "in the household",
+            ),
+            (
+                [{"variable": "age", "period": "2024"}],
+                "'outputs[0]' asks for `age` on `people/you` in 2024, "
+                "which is an input",
+            ),
+        ],
+    )
+    def test__given_invalid_outputs__returns_400(
+        self, client, outputs, message
+    ):
+        response = client.post(
+            "/us/calculate",
+            json={"household": self.household, "outputs": outputs},
+            headers=self.auth_headers,
+        )
+
+        assert response.status_code == 400
+        assert json.loads(response.data)["message"] == message
+
+    def test__output_periods_are_validated_like_placeholders(self, client):
+        response = client.post(
+            "/us/calculate",
+            json={
+                "household": self.household,
+                "outputs": [{"variable": "income_tax", "period": "2024-13"}],
+            },
+            headers=self.auth_headers,
+        )
+
+        assert response.status_code == 400
+        assert (
+            "Invalid period key `2024-13`"
+            in (json.loads(response.data)["message"])
+        )
+
+
+class TestHouseholdTemplates:
+    auth_headers = TestCalculateEndpoint.auth_headers
+    household = {
+        "people": {
+            "you": {
+                "age": {"2024": 40},
+                "employment_income": {"2024": 30_000},
+            }
+        },
+        "tax_units": {
+            "tax_unit": {"members": ["you"], "income_tax": {"2024": None}}
+        },
+    }
+
+    def _register(self, client, household, **payload):
+        response = client.post(
+            "/us/templates",
+            json={"household": household, **payload},
+            headers=self.auth_headers,
+        )
+        assert response.status_code == 200, response.data
+        return json.loads(response.data)["result"]
+
+    def _calculate(self, client, payload, path="/us/calculate"):
+        return client.post(path, json=payload, headers=self.auth_headers)
+
+    def test__values_calculate_like_the_filled_household(self, client):
+        template = self._register(client, self.household)
+        household = copy.deepcopy(self.household)
+        household["people"]["you"]["employment_income"]["2024"] = 55_000
+
+        response = self._calculate(
+            client,
+            {
+                "template_id": template["template_id"],
+                "values": [40, 55_000],
+            },
+        )
+
+        assert template["inputs"] == [
+            {
+                "entity_group": "people",
+                "entity": "you",
+                "variable": "age",
+                "period": "2024",
+            },
+            {
+                "entity_group": "people",
+                "entity": "you",
+                "variable": "employment_income",
+                "period": "2024",
+            },
+        ]
+        assert response.status_code == 200, response.data
+        expected = self._calculate(client, {"household": household})
+        assert (
+            json.loads(response.data)["result"]
+            == (json.loads(expected.data)["result"])
+        )
+
+    def test__registration_outputs_and_formats_apply(self, client):
+        template = self._register(
+            client,
+            self.household,
+            outputs=[{"variable": "is_adult", "period": "2024"}],
+        )
+
+        response = self._calculate(
+            client,
+            {"template_id": template["template_id"], "values": [12, 0]},
+            path="/us/calculate?format=sparse",
+        )
+
+        result = json.loads(response.data)["result"]
+        assert result["people"] == {"you": {"is_adult": {"2024": False}}}
+        assert list(result["tax_units"]["tax_unit"]) == ["income_tax"]
+
+    def test__registering_again_returns_the_same_id(self, client):
+        household = copy.deepcopy(self.household)
+        household["people"]["you"]["age"]["2024"] = 50
+
+        assert (
+            self._register(client, household)["template_id"]
+            == self._register(client, self.household)["template_id"]
+        )
+
+    def test__unknown_template_returns_404(self, client):
+        response = self._calculate(
+            client, {"template_id": "not-registered", "values": []}
+        )
+
+        assert response.status_code == 404
+        assert json.loads(response.data)["message"] == (
+            "Unknown household template 'not-registered'; register it "
+            "with POST /us/templates"
+        )
+
+    @pytest.mark.parametrize(
+        "payload,message",
+        [
+            (
+                {"values": [40, 30_000], "household": {}},
+                "A 'template_id' request sends the template's 'values' in "
+                "place of 'household' and 'outputs'",
+            ),
+            (
+                {"values": [40]},
+                "'values' must hold one value per template input (2); got 1",
+            ),
+        ],
+    )
+    def test__given_invalid_template_request__returns_400(
+        self, client, payload, message
+    ):
+        template = self._register(client, self.household)
+
+        response = self._calculate(
+            client, {"template_id": template["template_id"], **payload}
+        )
+
+        assert response.status_code == 400
+        assert json.loads(response.data)["message"] == message
+
+    def test__values_are_checked_against_the_monthly_budget(self, client):
+        household = copy.deepcopy(self.household)
+        household["spm_units"] = {
+            "spm_unit": {
+                "members": ["you"],
+                "snap_earned_income": {
+                    "2024": 1200,
+                    **{f"2024-{month:02d}": 100 for month in range(1, 13)},
+                },
+            }
+        }
+        template = self._register(client, household)
+        values = [40, 30_000, 1300] + [100] * 12
+
+        response = self._calculate(
+            client, {"template_id": template["template_id"], "values": values}
+        )
+
+        assert response.status_code == 400
+        assert json.loads(response.data)["message"].startswith(
+            "Inconsistent input: monthly values for `snap_earned_income`"
+        )
+
+    def test__axes_household_cannot_be_a_template(self, client):
+        household = copy.deepcopy(self.household)
+        household["axes"] = [
+            [{"name": "employment_income", "count": 2, "min": 0, "max": 1}]
+        ]
+
+        response = client.post(
+            "/us/templates",
+            json={"household": household},
+            headers=self.auth_headers,
+        )
+
+        assert response.status_code == 400
+        assert json.loads(response.data)["message"] == (
+            "A household template cannot have 'axes'"
+        )
+
+
+class TestHouseholdSessions:
+    auth_headers = TestCalculateEndpoint.auth_headers
+    household = {
+        "people": {
+            "you": {
+                "age": {"2024": 40},
+                "employment_income": {"2024": 30_000},
+            },
+            "child": {"age": {"2024": 6}},
+        },
+        "tax_units": {
+            "tax_unit": {
+                "members": ["you", "child"],
+                "income_tax": {"2024": None},
+                "eitc": {"2024": None},
+            }
+        },
+    }
+
+    @pytest.fixture(autouse=True)
+    def reset_rate_limiter(self):
+        # Each test makes several requests; keep them from using up the
+        # per-minute calculate limit of the tests that follow.
+        limiter.reset()
+        yield
+        limiter.reset()
+
+    def _calculate(self, client, payload):
+        return client.post(
+            "/us/calculate", json=payload, headers=self.auth_headers
+        )
+
+    def _start(self, client, household, **payload):
+        response = self._calculate(
+            client, {"household": household, "start_session": True, **payload}
+        )
+        assert response.status_code == 200, response.data
+        return json.loads(response.data)
+
+    def _patch(self, client, session_id, patch):
+        return self._calculate(
+            client, {"session_id": session_id, "patch": patch}
+        )
+
+    def _full(self, client, household, **payload):
+        response = self._calculate(client, {"household": household, **payload})
+        return json.loads(response.data)["result"]
+
+    def test__patches_calculate_like_the_patched_household(self, client):
+        started = self._start(client, self.household)
+        household = copy.deepcopy(self.household)
+
+        for patch in (
+            {"people": {"you": {"employment_income": {"2024": 55_000}}}},
+            {"people": {"child": {"age": {"2024": 17}}}},
+        ):
+            response = self._patch(client, started["session_id"], patch)
+            for entity_id, variables in patch["people"].items():
+                for variable_name, period_map in variables.items():
+                    household["people"][entity_id][variable_name].update(
+                        period_map
+                    )
+
+            assert response.status_code == 200, response.data
+            body = json.loads(response.data)
+            assert body["session_id"] == started["session_id"]
+            assert body["result"] == self._full(client, household)
+        assert started["result"] == self._full(client, self.household)
+
+    def test__session_keeps_its_policy(self, client):
+        policy = {
+            "gov.irs.credits.eitc.max[0].amount": {
+                "2024-01-01.2100-12-31": 1000
+            }
+        }
+        started = self._start(client, self.household, policy=policy)
+        patch = {"people": {"you": {"employment_income": {"2024": 20_000}}}}
+        household = copy.deepcopy(self.household)
+        household["people"]["you"]["employment_income"]["2024"] = 20_000
+
+        response = self._patch(client, started["session_id"], patch)
+
+        assert json.loads(response.data)["result"] == self._full(
+            client, household, policy=policy
+        )
+
+    def test__dropped_values_fall_back_to_a_full_calculation(self, client):
+        started = self._start(client, self.household)
+        SESSIONS._values.clear()
+        patch = {"people": {"you": {"employment_income": {"2024": 55_000}}}}
+        household = copy.deepcopy(self.household)
+        household["people"]["you"]["employment_income"]["2024"] = 55_000
+
+        response = self._patch(client, started["session_id"], patch)
+
+        assert response.status_code == 200, response.data
+        assert json.loads(response.data)["result"] == self._full(
+            client, household
+        )
+
+    def test__unknown_session_returns_404(self, client):
+        response = self._patch(client, "not-started", {})
+
+        assert response.status_code == 404
+        assert json.loads(response.data)["message"] == (
+            "Unknown household session 'not-started'; start a new one by "
+            "sending the household with 'start_session'"
+        )
+
+    @pytest.mark.parametrize(
+        "payload,message",
+        [
+            (
+                {"household": {}},
+                "A 'session_id' request sends only a 'patch'; the session "
+                "keeps its household and policy",
+            ),
+            (
+                {"patch": {"people": {"you": {"is_adult": {"2024": True}}}}},
+                "'patch.people.you.is_adult.2024' is not one of the "
+                "session's inputs",
+            ),
+            (
+                {"patch": {"people": {"you": {"age": {"2024": None}}}}},
+                "'patch.people.you.age.2024' must be a number, string or "
+                "boolean; got null",
+            ),
+            (
+                {"patch": {"people": ["you"]}},
+                "'patch.people' must be an object",
+            ),
+        ],
+    )
+    def test__given_invalid_session_request__returns_400(
+        self, client, payload, message
+    ):
+        started = self._start(client, self.household)
+
+        response = self._calculate(
+            client, {"session_id": started["session_id"], **payload}
+        )
+
+        assert response.status_code == 400
+        assert json.loads(response.data)["message"] == message
+
+    @pytest.mark.parametrize(
+        "start_session,message",
+        [
+            ("yes", "'start_session' must be a boolean"),
+            (True, "A household session cannot have 'axes'"),
+        ],
+    )
+    def test__given_invalid_start__returns_400(
+        self, client, start_session, message
+    ):
+        household = copy.deepcopy(self.household)
+        household["axes"] = [
+            [{"name": "employment_income", "count": 2, "min": 0, "max": 1}]
+        ]
+
+        response = self._calculate(
+            client, {"household": household, "start_session": start_session}
+        )
+
+        assert response.status_code == 400
+        assert json.loads(response.data)["message"] == message
+
+
+class TestResponseEncoding:
+    auth_headers = TestCalculateEndpoint.auth_headers
+
+    def _post(self, client, path, payload, accept):
+        return client.post(
+            path,
+            json=payload,
+            headers={**self.auth_headers, "Accept": accept},
+        )
+
+    @pytest.mark.parametrize(
+        "path,payload",
+        [
+            (
+                "/us/calculate",
+                {"household": valid_household_requesting_ctc_calculation},
+            ),
+            (
+                "/us/calculate_batch",
+                {"households": [valid_household_requesting_ctc_calculation]},
+            ),
+            (
+                "/us/calculate?format=columnar",
+                {"household": TestColumnarFormat.household},
+            ),
+        ],
+    )
+    def test__msgpack_carries_the_json_response(self, client, path, payload):
+        as_json = self._post(client, path, payload, "application/json")
+
+        response = self._post(client, path, payload, "application/msgpack")
+
+        assert response.status_code == 200
+        assert response.mimetype == "application/msgpack"
+        assert "Accept" in response.headers["Vary"]
+        assert msgpack.unpackb(response.data) == json.loads(as_json.data)
+
+    def test__columnar_result_is_available_as_an_arrow_stream(self, client):
+        as_json = json.loads(
+            self._post(
+                client,
+                "/us/calculate?format=columnar",
+                {"household": TestColumnarFormat.household},
+                "application/json",
+            ).data
+        )["result"]
+
+        response = self._post(
+            client,
+            "/us/calculate?format=columnar",
+            {"household": TestColumnarFormat.household},
+            "application/vnd.apache.arrow.stream",
+        )
+
+        assert response.status_code == 200
+        assert response.mimetype == "application/vnd.apache.arrow.stream"
+        table = pa.ipc.open_stream(response.data).read_all()
+        assert (
+            table.column("income_tax/2024/tax_unit").to_pylist()
+            == as_json["values"]["income_tax"]["2024"]["tax_unit"]
+        )
+
+    def test__arrow_for_a_household_response_falls_back_to_json(self, client):
+        response = self._post(
+            client,
+            "/us/calculate",
+            {"household": valid_household_requesting_ctc_calculation},
+            "application/vnd.apache.arrow.stream",
+        )
+
+        assert response.status_code == 200
+        assert response.mimetype == "application/json"
+
+    def test__errors_stay_json(self, client):
+        response = self._post(
+            client,
+            "/us/calculate?format=csv",
+            {"household": valid_household_requesting_ctc_calculation},
+            "application/msgpack",
+        )
+
+        assert response.status_code == 400
+        assert response.mimetype == "application/json"
+
+
+class TestContentEncoding:
+    auth_headers = TestCalculateEndpoint.auth_headers
+
+    def test__compressed_request_gets_a_compressed_response(self, client):
+        household = copy.deepcopy(TestColumnarFormat.household)
+        household["axes"][0][0]["count"] = 200
+        payload = {"household": household}
+        as_json = client.post(
+            "/us/calculate", json=payload, headers=self.auth_headers
+        )
+
+        response = client.post(
+            "/us/calculate",
+            data=gzip.compress(json.dumps(payload).encode()),
+            content_type="application/json",
+            headers={
+                **self.auth_headers,
+                "Content-Encoding": "gzip",
+                "Accept-Encoding": "gzip",
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert len(response.data) < len(as_json.data)
+        assert json.loads(gzip.decompress(response.data)) == json.loads(
+            as_json.data
+        )
+
+
+class TestCalculateBatchEndpoint:
+    auth_headers = TestCalculateEndpoint.auth_headers
+
+    def test__returns_one_result_per_household_in_order(self, client):
+        response = client.post(
+            "/us/calculate_batch",
+            json={
+                "households": [
+                    valid_household_requesting_ctc_calculation,
+                    valid_household_requesting_ctc_calculation,
+                ]
+            },
+            headers=self.auth_headers,
+        )
+
+        assert response.status_code == 200
+        payload = json.loads(response.data)
+        assert payload["status"] == "ok"
+        assert (
+            payload["policyengine_bundle"]["model_version"]
+            == (COUNTRY_PACKAGE_VERSIONS["us"])
+        )
+        assert [item["status"] for item in payload["result"]] == [
+            "ok",
+            "ok",
+        ]
+        assert (
+            payload["result"][0]["result"] == (payload["result"][1]["result"])
+        )
+        assert list(payload["result"][0]["result"]["people"]) == ["you"]
+
+    def test__invalid_household_is_reported_in_its_own_slot(self, client):
+        response = client.post(
+            "/us/calculate_batch",
+            json={
+                "households": [
+                    valid_household_requesting_ctc_calculation,
+                    {
+                        "people": {
+                            "you": {"not_a_variable": {"2024": 1}},
+                        },
+                    },
+                ]
+            },
+            headers=self.auth_headers,
+        )
+
+        assert response.status_code == 200
+        items = json.loads(response.data)["result"]
+        assert items[0]["status"] == "ok"
+        assert items[1]["status"] == "error"
+        assert items[1]["message"] == "Invalid household variables."
+        assert "not_a_variable" in items[1]["errors"][0]
+
+    @pytest.mark.parametrize(
+        "households",
+        [None, [], [valid_household_requesting_ctc_calculation] * 101],
+    )
+    def test__given_invalid_households_field__returns_400(
+        self, client, households
+    ):
+        response = client.post(
+            "/us/calculate_batch",
+            json={"households": households},
+            headers=self.auth_headers,
+        )
+
+        assert response.status_code == 400
+        assert json.loads(response.data)["status"] == "error"
+
+    def test__given_malformed_policy__returns_500(self, client):
+        response = client.post(
+            "/us/calculate_batch",
+            json={
+                "households": [valid_household_requesting_ctc_calculation],
+                "policy": {
+                    "gov.irs.deductions.standard.amount.SINGLE": {
+                        "2024": 30000
+                    }
+                },
+            },
+            headers=self.auth_headers,
+        )
+
+        assert response.status_code == 500
+
+
 class TestAxesValidation:
     @pytest.mark.parametrize(
         "household,message",
@@ -476,11 +1255,21 @@ class TestAxesValidation:
             ),
             (
                 {"axes": [{"name": "employment_income", "count": 0}]},
-                "'axes[0].count' must be between 1 and 100",
+                "'axes[0].count' must be between 1 and 10000",
             ),
             (
                 {"axes": [{"name": "employment_income", "count": -1}]},
-                "'axes[0].count' must be between 1 and 100",
+                "'axes[0].count' must be between 1 and 10000",
+            ),
+            (
+                {
+                    "axes": [
+                        [{"name": "employment_income", "count": 200}],
+                        [{"name": "age", "count": 51}],
+                    ]
+                },
+                "'axes' may span at most 10000 grid points in total; "
+                "got 10200",
             ),
         ],
     )
@@ -497,6 +1286,7 @@ class TestAxesValidation:
             {"axes": []},
             {"axes": [{"name": "employment_income"}]},
             {"axes": [{"name": "employment_income", "count": "2"}]},
+            {"axes": [[{"name": "employment_income", "count": 10_000}]]},
             {
                 "axes": [
                     [
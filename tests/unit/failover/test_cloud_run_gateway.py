@@ -27,6 +27,7 @@ from policyengine_household_failover.cloud_run_gateway import (
     warm_cloud_run_worker,
 )
 from policyengine_household_common.dispatch_codec import (
+    decode_dispatch_request,
     encode_dispatch_response,
 )
 from policyengine_household_failover.manifest import (
@@ -602,6 +603,62 @@ def test_cloud_run_worker_timeout_uses_env(monkeypatch):
     assert captured["timeout"] == 900
 
 
+def test_cloud_run_worker_passes_negotiated_binary_responses_through(
+    monkeypatch,
+):
+    # A MessagePack body is not valid UTF-8.
+    body = b"\x82\xa6status\xa2ok\xa6result\x92\xcb?\xe0\x00\x00\x00\x00\x00\x00\xff"
+    captured = {}
+
+    class FakeResponse:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *_args):
+            return None
+
+        def read(self):
+            return json.dumps(
+                encode_dispatch_response(
+                    {
+                        "status_code": 200,
+                        "body": body,
+                        "headers": [
+                            ("Content-Type", "application/msgpack"),
+                            ("Vary", "Accept"),
+                        ],
+                    }
+                )
+            ).encode("utf-8")
+
+    def fake_urlopen(request, timeout):
+        captured["request"] = decode_dispatch_request(json.loads(request.data))
+        return FakeResponse()
+
+    monkeypatch.setenv("HOUSEHOLD_FAILOVER_DISABLE_CLOUD_RUN_AUTH", "1")
+    monkeypatch.setattr(
+        "policyengine_household_failover.cloud_run_gateway.urllib_request.urlopen",
+        fake_urlopen,
+    )
+
+    response = call_cloud_run_worker(
+        _resolved_channel(),
+        {
+            "method": "POST",
+            "path": "/us/calculate",
+            "query_string": "format=columnar",
+            "headers": {"Accept": "application/msgpack"},
+            "body": b'{"household": {}}',
+        },
+    )
+
+    assert captured["request"]["headers"] == {"Accept": "application/msgpack"}
+    assert response.status_code == 200
+    assert response.mimetype == "application/msgpack"
+    assert response.headers["Vary"] == "Accept"
+    assert response.data == body
+
+
 def test_cloud_run_worker_returns_dispatched_500_response(monkeypatch):
     class FakeResponse:
         def __enter__(self):
@@ -156,3 +156,81 @@ def test_worker_rejects_dispatch_payload_over_limit(monkeypatch):
     )
 
     assert response.status_code == 413
+
+
+class FakeWarmup:
+    def __init__(self, level="systems", ready=False):
+        self.level = level
+        self._ready = ready
+
+    def ready(self):
+        return self._ready
+
+    def status(self):
+        return {"status": "warming", "warm_level": self.level}
+
+
+def test_worker_boot_starts_the_household_warmup(monkeypatch):
+    from policyengine_household_failover import cloud_run_worker
+
+    calls = []
+    monkeypatch.setattr(
+        cloud_run_worker, "configure_process_observability", lambda **_: None
+    )
+    monkeypatch.setattr(
+        cloud_run_worker,
+        "_load_household_app",
+        lambda: calls.append("load") or _household_app(),
+    )
+    monkeypatch.setattr(
+        cloud_run_worker,
+        "_start_household_warmup",
+        lambda: calls.append("warmup") or FakeWarmup(),
+    )
+
+    booted = create_worker_app()
+    create_worker_app(flask_app=_household_app())
+
+    assert calls == ["load", "warmup"]
+    assert booted.test_client().get("/readiness_check").status_code == 503
+
+
+def test_worker_is_not_ready_until_warm():
+    warmup = FakeWarmup()
+    app = create_worker_app(flask_app=_household_app(), warmup=warmup)
+    client = app.test_client()
+
+    response = client.get("/readiness_check")
+
+    assert response.status_code == 503
+    assert response.get_json() == {
+        "status": "warming",
+        "warm_level": "systems",
+    }
+    assert client.get("/liveness_check").status_code == 200
+
+    warmup._ready = True
+
+    response = client.get("/readiness_check")
+
+    assert response.status_code == 200
+    assert response.text == "OK"
+
+
+def test_worker_requests_carry_the_warm_level(monkeypatch):
+    records = []
+    app = create_worker_app(
+        flask_app=_household_app(), warmup=FakeWarmup(level="parameters")
+    )
+    runtime = app.extensions["policyengine_observability"]
+    monkeypatch.setattr(
+        runtime,
+        "emit_request_log",
+        lambda context: records.append(
+            context.as_log_record(trace_id="test-trace", span_id="test-span")
+        ),
+    )
+
+    app.test_client().get("/liveness_check")
+
+    assert records[0]["warm_level"] == "parameters"
@@ -37,3 +37,18 @@ def test_dispatch_response_round_trips_bytes_and_headers():
     decoded = decode_dispatch_response(encode_dispatch_response(result))
 
     assert decoded == result
+
+
+def test_dispatch_response_round_trips_binary_encodings():
+    result = {
+        "status_code": 200,
+        "body": bytes(range(256)),
+        "headers": [
+            ("Content-Type", "application/vnd.apache.arrow.stream"),
+            ("Vary", "Accept"),
+        ],
+    }
+
+    decoded = decode_dispatch_response(encode_dispatch_response(result))
+
+    assert decoded == result
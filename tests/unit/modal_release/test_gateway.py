@@ -1,10 +1,16 @@
+import gzip
 import json
 
-from flask import Response
+from flask import Flask, Response, request
 import modal
+import msgpack
 import pytest
 
+from policyengine_household_common.content_encoding import (
+    init_content_encoding,
+)
 from policyengine_household_common.gateway import (
+    _response_from_dispatch_result,
     create_gateway_app,
     load_modal_manifest,
 )
@@ -14,6 +20,9 @@ from policyengine_household_common.release_manifest import (
 from policyengine_household_common.routing_metadata import (
     MODAL_ROUTING_PAYLOAD_KEY,
 )
+from policyengine_household_common.worker_dispatch import (
+    dispatch_to_flask_app,
+)
 from policyengine_observability import (
     OBSERVABILITY_INTERNAL_DISPATCH_HEADER,
     REQUEST_ID_HEADER,
@@ -452,3 +461,106 @@ def test_call_worker_function_falls_back_to_function_for_legacy_workers(
     assert captured["fn_app_name"] == "current-app"
     assert captured["function_name"] == "handle_household_request"
     assert captured["payload"] == {"household": {"foo": "bar"}}
+
+
+def test_calculate_passes_negotiated_binary_responses_through():
+    worker = Flask(__name__)
+    body = msgpack.packb({"status": "ok", "result": [0.5, 1.5]})
+
+    @worker.post("/us/calculate")
+    def calculate():
+        if request.headers.get("Accept") != "application/msgpack":
+            return Response(status=406)
+        return Response(body, mimetype="application/msgpack")
+
+    app = create_gateway_app(
+        manifest_loader=_manifest,
+        worker_request=lambda app_name, payload: (
+            _response_from_dispatch_result(
+                dispatch_to_flask_app(worker, payload)
+            )
+        ),
+    )
+
+    response = app.test_client().post(
+        "/us/calculate",
+        json={"household": {}},
+        headers={"Accept": "application/msgpack"},
+    )
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/msgpack"
+    assert response.data == body
+
+
+def test_calculate_without_version_forwards_the_body_unchanged():
+    client, worker_requests = _client_with_dispatch()
+    raw_body = b'{ "household": {"people": {}},\n  "policy": {} }'
+
+    response = client.post(
+        "/us/calculate",
+        data=raw_body,
+        content_type="application/json",
+    )
+
+    assert response.status_code == 200
+    _, payload = worker_requests[0]
+    assert payload["body"] == raw_body
+
+
+def test_calculate_forwards_compressed_bodies_end_to_end():
+    worker = Flask(__name__)
+    init_content_encoding(worker)
+
+    @worker.post("/us/calculate")
+    def calculate():
+        return {"status": "ok", "received": request.get_json()}
+
+    forwarded = []
+
+    def worker_request(app_name, payload):
+        forwarded.append(payload)
+        return _response_from_dispatch_result(
+            dispatch_to_flask_app(worker, payload)
+        )
+
+    app = create_gateway_app(
+        manifest_loader=_manifest, worker_request=worker_request
+    )
+    household = {"people": {f"person_{i}": {} for i in range(200)}}
+    compressed = gzip.compress(json.dumps({"household": household}).encode())
+
+    response = app.test_client().post(
+        "/us/calculate",
+        data=compressed,
+        content_type="application/json",
+        headers={"Content-Encoding": "gzip", "Accept-Encoding": "gzip"},
+    )
+
+    # The gateway forwards the client's compressed bytes as they are...
+    assert forwarded[0]["body"] == compressed
+    # ...and the worker's compressed response likewise.
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(response.data)) == {
+        "status": "ok",
+        "received": {"household": household},
+    }
+
+
+def test_calculate_strips_version_from_compressed_bodies():
+    client, worker_requests = _client_with_dispatch()
+
+    response = client.post(
+        "/us/calculate",
+        data=gzip.compress(
+            json.dumps({"version": "frontier", "household": {}}).encode()
+        ),
+        content_type="application/json",
+        headers={"Content-Encoding": "gzip"},
+    )
+
+    assert response.status_code == 200
+    app_name, payload = worker_requests[0]
+    assert app_name == "frontier-app"
+    assert payload["headers"]["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(payload["body"])) == {"household": {}}
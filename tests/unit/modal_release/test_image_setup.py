@@ -77,7 +77,7 @@ def test_preload_country_packages_imports_and_builds_all_countries(
 
     monkeypatch.setattr(_image_setup.importlib, "import_module", import_module)
 
-    _image_setup.preload_country_packages()
+    _image_setup.preload_country_packages(workers=1)
 
     assert loaded_packages == [
         "policyengine_uk",
@@ -87,3 +87,32 @@ def test_preload_country_packages_imports_and_builds_all_countries(
         "policyengine_il",
     ]
     assert initialized_packages == loaded_packages
+
+
+def test_preload_country_packages_builds_each_package_in_a_process_pool(
+    monkeypatch,
+):
+    pools = []
+
+    class RecordingPool:
+        def __init__(self, max_workers):
+            self.max_workers = max_workers
+            self.mapped = []
+            pools.append(self)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            return False
+
+        def map(self, function, package_names):
+            self.mapped = list(package_names)
+            return [(0.0, 0.0) for _ in self.mapped]
+
+    monkeypatch.setattr(_image_setup, "ProcessPoolExecutor", RecordingPool)
+
+    _image_setup.preload_country_packages(workers=3)
+
+    assert [pool.max_workers for pool in pools] == [3]
+    assert pools[0].mapped == list(_image_setup.PRELOAD_PACKAGE_NAMES)
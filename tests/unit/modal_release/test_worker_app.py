@@ -88,6 +88,18 @@ def test_snapshot_hook_prewarms_parameter_caches(worker_app):
     assert "prewarm_parameter_caches()" in source
 
 
+def test_snapshot_hook_replays_the_warmup_corpus_after_prewarm(worker_app):
+    """The corpus households run on prewarmed parameter caches, and what
+    they build lazily must also ride the snapshot."""
+    import inspect
+
+    source = inspect.getsource(worker_app)
+    assert "replay_corpus(flask_app)" in source
+    assert source.index("prewarm_parameter_caches()") < source.index(
+        "replay_corpus(flask_app)"
+    )
+
+
 def test_household_worker_exposes_post_snapshot_reset_hook(worker_app):
     """The class must declare a post-restore hook so network state
     captured in the memory snapshot (SQLAlchemy pool, Cloud SQL
@@ -1,3 +1,5 @@
+import gzip
+
 from flask import Flask, Response, request
 
 from policyengine_household_common.worker_dispatch import (
@@ -136,3 +138,26 @@ def test_dispatch_to_flask_app_removes_hop_by_hop_response_headers():
     assert "Connection" not in response_headers
     assert "Content-Length" not in response_headers
     assert response_headers["X-Diagnostic"] == "kept"
+
+
+def test_dispatch_to_flask_app_keeps_the_response_content_encoding():
+    app = Flask(__name__)
+    body = gzip.compress(b'{"status": "ok"}')
+
+    @app.get("/liveness_check")
+    def liveness_check():
+        return Response(body, headers={"Content-Encoding": "gzip"})
+
+    response = dispatch_to_flask_app(
+        app,
+        {
+            "method": "GET",
+            "path": "/liveness_check",
+            "query_string": "",
+            "headers": {},
+            "body": b"",
+        },
+    )
+
+    assert dict(response["headers"])["Content-Encoding"] == "gzip"
+    assert response["body"] == body
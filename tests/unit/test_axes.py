@@ -0,0 +1,336 @@
+"""Tests for chunked axes scans.
+
+A chunked scan must produce exactly what core's single expansion
+produces, so each case runs the same household both ways.
+"""
+
+import copy
+import gc
+import json
+import weakref
+
+import pytest
+
+from policyengine_household_api.axes import (
+    ESTIMATED_BYTES_PER_ENTITY_CELL,
+    AxesChunkConfig,
+    plan_axes_scan,
+)
+from policyengine_household_api.country import COUNTRIES
+from policyengine_household_api.utils.json import json_default
+
+
+def _household(axes: list) -> dict:
+    return {
+        "people": {
+            "you": {"age": {"2026": 40}, "employment_income": {"2026": None}},
+            "child": {"age": {"2026": 5}},
+        },
+        "tax_units": {
+            "tax_unit": {
+                "members": ["you", "child"],
+                "income_tax": {"2026": None},
+            }
+        },
+        "households": {
+            "household": {
+                "members": ["you", "child"],
+                "state_name": {"2026": "CA"},
+                "household_net_income": {"2026": None},
+            }
+        },
+        "axes": axes,
+    }
+
+
+def _chunked(country, cells_per_chunk: int, workers: int = 1):
+    # The two-person household above, with default groups for every
+    # other entity.
+    system = country.tax_benefit_system
+    entities_per_cell = sum(
+        2 if entity.is_person else 1 for entity in system.entities
+    )
+    return AxesChunkConfig(
+        memory_budget_bytes=(
+            cells_per_chunk
+            * entities_per_cell
+            * ESTIMATED_BYTES_PER_ENTITY_CELL
+        ),
+        workers=workers,
+    )
+
+
+@pytest.fixture(scope="module")
+def us():
+    return COUNTRIES["us"]
+
+
+class TestChunkedAxesScan:
+    @pytest.mark.parametrize(
+        "axes,workers,chunk_count",
+        [
+            (
+                [
+                    [
+                        {
+                            "name": "employment_income",
+                            "count": 7,
+                            "min": 0,
+                            "max": 90_000.5,
+                            "period": "2026",
+                        },
+                        {
+                            "name": "age",
+                            "count": 7,
+                            "min": 1,
+                            "max": 17,
+                            "index": 1,
+                            "period": "2026",
+                        },
+                    ]
+                ],
+                1,
+                3,
+            ),
+            (
+                [
+                    [
+                        {
+                            "name": "employment_income",
+                            "count": 3,
+                            "min": 0,
+                            "max": 60_000,
+                            "period": "2026",
+                        }
+                    ],
+                    [{"name": "age", "count": 1, "min": 30, "max": 60}],
+                    [
+                        {
+                            "name": "spm_unit_assets",
+                            "count": 2,
+                            "min": 0,
+                            "max": 9_000.3,
+                            "period": "2026",
+                        }
+                    ],
+                ],
+                2,
+                2,
+            ),
+        ],
+    )
+    def test__matches_a_single_core_expansion(
+        self, us, monkeypatch, axes, workers, chunk_count
+    ):
+        household = _household(axes)
+        single = us.calculate(copy.deepcopy(household))
+
+        config = _chunked(us, cells_per_chunk=3, workers=workers)
+        monkeypatch.setattr(us, "_axes_chunking", config)
+        scan = plan_axes_scan(household, us.tax_benefit_system, "2026", config)
+        assert len(scan.chunks()) == chunk_count
+        chunked = us.calculate(copy.deepcopy(household))
+
+        assert chunked == single
+
+    def test__uk_scan_matches_a_single_core_expansion(self, monkeypatch):
+        uk = COUNTRIES["uk"]
+        household = {
+            "people": {
+                "you": {
+                    "age": {"2026": 40},
+                    "employment_income": {"2026": None},
+                }
+            },
+            "benunits": {
+                "benunit": {
+                    "members": ["you"],
+                    "universal_credit": {"2026": None},
+                }
+            },
+            "households": {
+                "household": {
+                    "members": ["you"],
+                    "household_net_income": {"2026": None},
+                }
+            },
+            "axes": [
+                [
+                    {
+                        "name": "employment_income",
+                        "count": 5,
+                        "min": 0,
+                        "max": 80_000,
+                        "period": "2026",
+                    }
+                ]
+            ],
+        }
+        single = uk.calculate(copy.deepcopy(household))
+
+        monkeypatch.setattr(
+            uk,
+            "_axes_chunking",
+            AxesChunkConfig(memory_budget_bytes=1, workers=1),
+        )
+        chunked = uk.calculate(copy.deepcopy(household))
+
+        assert chunked == single
+
+    def test__each_chunk_is_freed_before_the_next_is_built(
+        self, us, monkeypatch
+    ):
+        # Peak memory stays at about one chunk only if every chunk's
+        # simulation is freed by reference counting, without waiting
+        # for the cyclic collector.
+        household = _household(
+            [
+                [
+                    {
+                        "name": "employment_income",
+                        "count": 4,
+                        "min": 0,
+                        "max": 50_000,
+                        "period": "2026",
+                    }
+                ]
+            ]
+        )
+        built = []
+        build_simulation = us._build_simulation
+
+        def _build(situation, reform):
+            system, simulation = build_simulation(situation, reform)
+            assert all(reference() is None for reference in built)
+            built.append(weakref.ref(simulation))
+            return system, simulation
+
+        monkeypatch.setattr(us, "_build_simulation", _build)
+        monkeypatch.setattr(us, "_axes_chunking", _chunked(us, 1))
+        gc.disable()
+        try:
+            result = us.calculate(household)
+        finally:
+            gc.enable()
+
+        # Core points the shared system at the newest simulation, so the
+        # last chunk's (emptied) simulation outlives the scan.
+        assert len(built) == 4
+        income_tax = result["tax_units"]["tax_unit"]["income_tax"]["2026"]
+        assert len(income_tax) == 4
+
+
+class TestColumnarFormat:
+    def test__values_match_the_echoed_household(self, us):
+        household = _household(
+            [
+                [
+                    {
+                        "name": "employment_income",
+                        "count": 3,
+                        "min": 0,
+                        "max": 60_000,
+                        "period": "2026",
+                    }
+                ],
+                [
+                    {
+                        "name": "age",
+                        "count": 2,
+                        "min": 1,
+                        "max": 10,
+                        "index": 1,
+                        "period": "2026",
+                    }
+                ],
+            ]
+        )
+        echoed = us.calculate(copy.deepcopy(household))
+
+        columnar = json.loads(
+            json.dumps(
+                us.calculate(
+                    copy.deepcopy(household), response_format="columnar"
+                ),
+                default=json_default,
+            )
+        )
+
+        # Core's grid order: the first axis varies fastest.
+        assert columnar["axes"] == [
+            {
+                "name": "employment_income",
+                "period": "2026",
+                "entity": "you",
+                "values": [0.0, 30_000.0, 60_000.0] * 2,
+            },
+            {
+                "name": "age",
+                "period": "2026",
+                "entity": "child",
+                "values": [1.0] * 3 + [10.0] * 3,
+            },
+        ]
+        assert columnar["values"] == {
+            "employment_income": {
+                "2026": {
+                    "you": echoed["people"]["you"]["employment_income"]["2026"]
+                }
+            },
+            "income_tax": {
+                "2026": {
+                    "tax_unit": echoed["tax_units"]["tax_unit"]["income_tax"][
+                        "2026"
+                    ]
+                }
+            },
+            "household_net_income": {
+                "2026": {
+                    "household": echoed["households"]["household"][
+                        "household_net_income"
+                    ]["2026"]
+                }
+            },
+        }
+
+
+class TestPlanAxesScan:
+    def test__scan_within_one_chunk_is_left_to_core(self, us):
+        household = _household(
+            [[{"name": "employment_income", "count": 3, "min": 0, "max": 1}]]
+        )
+
+        assert (
+            plan_axes_scan(
+                household,
+                us.tax_benefit_system,
+                "2026",
+                _chunked(us, cells_per_chunk=3),
+            )
+            is None
+        )
+
+    @pytest.mark.parametrize(
+        "axes",
+        [
+            [{"name": "employment_income", "count": 9, "min": 0, "max": 1}],
+            [[{"name": "employment_income", "count": "9", "min": 0}]],
+            [[{"name": "state_name", "count": 9, "min": 0, "max": 1}]],
+            [
+                [
+                    {"name": "employment_income", "count": 9, "max": 1},
+                    {"name": "snap", "count": 9, "min": 0, "max": 1},
+                ]
+            ],
+        ],
+    )
+    def test__axes_core_reads_differently_are_left_to_core(self, us, axes):
+        assert (
+            plan_axes_scan(
+                _household(axes),
+                us.tax_benefit_system,
+                "2026",
+                AxesChunkConfig(memory_budget_bytes=1, workers=1),
+            )
+            is None
+        )
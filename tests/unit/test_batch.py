@@ -0,0 +1,152 @@
+import copy
+
+from policyengine_household_api.batch import (
+    can_stack,
+    stack_households,
+    unstack_result,
+)
+from policyengine_household_api.country import COUNTRIES
+from tests.data.uk_households import (
+    uk_household_married_requesting_marriage_allowance,
+    uk_household_requesting_income_tax,
+    uk_personal_allowance_reform,
+)
+from tests.fixtures.country import (
+    us_household_requesting_income_tax,
+    us_household_with_axes,
+    us_standard_deduction_reform,
+    valid_household_requesting_ctc_calculation,
+)
+
+
+def _us_household_with_income(employment_income: int) -> dict:
+    household = copy.deepcopy(us_household_requesting_income_tax)
+    household["people"]["you"]["employment_income"]["2024"] = employment_income
+    return household
+
+
+class TestStackHouseholds:
+    def test__entity_ids_are_namespaced_per_household(self):
+        system = COUNTRIES["us"].tax_benefit_system
+
+        stacked = stack_households(
+            [
+                valid_household_requesting_ctc_calculation,
+                valid_household_requesting_ctc_calculation,
+            ],
+            system,
+        )
+
+        assert list(stacked.household["people"]) == [
+            "batch_0:you",
+            "batch_1:you",
+        ]
+        assert stacked.household["tax_units"]["batch_1:tax_unit"][
+            "members"
+        ] == ["batch_1:you"]
+
+    def test__missing_group_entity_gets_explicit_default_group(self):
+        # The fixture omits marital_units; core would otherwise give the
+        # person a singleton group only because another household in the
+        # batch declared the entity.
+        system = COUNTRIES["us"].tax_benefit_system
+
+        stacked = stack_households(
+            [us_household_requesting_income_tax],
+            system,
+        )
+
+        assert stacked.household["marital_units"] == {
+            "batch_0:marital_unit": {"members": ["batch_0:you"]}
+        }
+        assert ("marital_units", "batch_0:marital_unit") in (
+            stacked.default_groups
+        )
+
+    def test__unstack_restores_original_ids_and_drops_default_groups(self):
+        system = COUNTRIES["us"].tax_benefit_system
+        stacked = stack_households(
+            [us_household_requesting_income_tax] * 2,
+            system,
+        )
+
+        households = unstack_result(stacked, stacked.household)
+
+        assert households == [us_household_requesting_income_tax] * 2
+
+    def test__households_with_axes_cannot_stack(self):
+        assert can_stack(us_household_requesting_income_tax)
+        assert not can_stack(us_household_with_axes)
+
+
+class TestCalculateBatch:
+    def test__stacked_results_match_individual_calculations(self):
+        country = COUNTRIES["us"]
+        households = [
+            _us_household_with_income(income) for income in (0, 25_000, 80_000)
+        ]
+
+        batch = country.calculate_batch(households)
+
+        assert batch == [
+            country.calculate(household) for household in households
+        ]
+
+    def test__stacked_results_match_under_reform(self):
+        country = COUNTRIES["us"]
+        households = [
+            _us_household_with_income(income) for income in (30_000, 90_000)
+        ]
+
+        batch = country.calculate_batch(
+            households, us_standard_deduction_reform
+        )
+
+        assert batch == [
+            country.calculate(household, us_standard_deduction_reform)
+            for household in households
+        ]
+
+    def test__axes_household_runs_alongside_stacked_households(self):
+        country = COUNTRIES["us"]
+        households = [
+            us_household_requesting_income_tax,
+            us_household_with_axes,
+            us_household_requesting_income_tax,
+        ]
+
+        batch = country.calculate_batch(households)
+
+        assert batch == [
+            country.calculate(household) for household in households
+        ]
+
+    def test__uk_stacked_results_match_individual_calculations(self):
+        country = COUNTRIES["uk"]
+        households = [
+            uk_household_requesting_income_tax,
+            uk_household_married_requesting_marriage_allowance,
+        ]
+
+        batch = country.calculate_batch(
+            households, uk_personal_allowance_reform
+        )
+
+        assert batch == [
+            country.calculate(household, uk_personal_allowance_reform)
+            for household in households
+        ]
+
+    def test__failing_household_is_reported_without_failing_batch(self):
+        country = COUNTRIES["us"]
+        broken = copy.deepcopy(us_household_requesting_income_tax)
+        broken["tax_units"]["tax_unit"]["members"] = ["nobody"]
+
+        batch = country.calculate_batch(
+            [us_household_requesting_income_tax, broken]
+        )
+
+        assert batch[0] == country.calculate(
+            us_household_requesting_income_tax
+        )
+        assert isinstance(batch[1], Exception)
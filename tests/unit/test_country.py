@@ -1,6 +1,11 @@
+import copy
+import threading
+import time
+
+import numpy as np
 import pytest
 
-from policyengine_core.parameters import Parameter
+from policyengine_core.parameters import Parameter, get_parameter
 
 from tests.fixtures.country import (
     valid_household_requesting_ctc_calculation,
@@ -19,10 +24,15 @@ from tests.data.uk_households import (
     uk_marriage_allowance_structural_reform,
     uk_personal_allowance_reform,
 )
+from tests.data.customer_households.amplifi import amplifi_household
 from importlib.metadata import PackageNotFoundError
+from policyengine_household_api import country as country_module
 from policyengine_household_api.country import (
     COUNTRIES,
+    CountryRegistry,
     PolicyEngineCountry,
+    get_requested_computations,
+    served_country_ids,
 )
 from policyengine_household_api.constants import COUNTRY_PACKAGE_VERSIONS
 
@@ -79,6 +89,120 @@ class TestCalculateReturnValue:
         assert income_tax[-1] > income_tax[0]
 
 
+class TestResultExtraction:
+    def test_each_requested_array_is_converted_once(self, monkeypatch):
+        # The amplifi household asks several people for the same
+        # variables; each (entity, variable, period) array should be
+        # converted once and scattered, not once per person.
+        country = COUNTRIES["us"]
+        converted = []
+        result_values = country._result_values
+
+        def _spy(result, variable):
+            converted.append(variable.name)
+            return result_values(result, variable)
+
+        monkeypatch.setattr(country, "_result_values", _spy)
+
+        result = country.calculate(amplifi_household)
+
+        requested = get_requested_computations(amplifi_household)
+        arrays = {
+            (entity_plural, variable_name, period)
+            for entity_plural, _, variable_name, period in requested
+        }
+        assert len(converted) == len(arrays) < len(requested)
+        assert not get_requested_computations(result)
+
+    def test_infinite_results_become_json_infinity_strings(self):
+        country = COUNTRIES["us"]
+
+        class _Variable:
+            value_type = float
+
+        values = country._result_values(
+            np.array([np.inf, -np.inf, 0.1], dtype=np.float32), _Variable
+        )
+
+        # float32 values keep their shortest decimal form.
+        assert values == ["Infinity", "-Infinity", 0.1]
+
+    def test_result_shares_unmodified_subtrees_with_the_input(self):
+        # Only period maps that receive computed values are copied; the
+        # request household itself is left untouched.
+        country = COUNTRIES["us"]
+        household = copy.deepcopy(us_household_requesting_income_tax)
+
+        result = country.calculate(household)
+
+        assert household == us_household_requesting_income_tax
+        person_id, person = next(iter(household["people"].items()))
+        assert result["people"][person_id] is person
+        income_tax = result["tax_units"]["tax_unit"]["income_tax"]
+        assert (
+            income_tax is not household["tax_units"]["tax_unit"]["income_tax"]
+        )
+        assert income_tax["2024"] is not None
+
+
+class TestPeriodRanges:
+    household = {
+        "people": {
+            "you": {"age": {"2026": 30}, "employment_income": {"2026": 20_000}}
+        },
+        "spm_units": {
+            "spm_unit": {
+                "members": ["you"],
+                "snap": {"2026:months": None, "2026-03": None},
+            }
+        },
+        "tax_units": {"tax_unit": {"members": ["you"]}},
+        "households": {
+            "household": {
+                "members": ["you"],
+                "state_code_str": {"2026": "TX"},
+            }
+        },
+    }
+
+    def test_range_returns_one_value_per_month(self):
+        country = COUNTRIES["us"]
+        household = copy.deepcopy(self.household)
+        months = [f"2026-{month:02d}" for month in range(1, 13)]
+        household["spm_units"]["spm_unit"]["snap"] = dict.fromkeys(months)
+        monthly = country.calculate(household)["spm_units"]["spm_unit"]
+
+        result = country.calculate(self.household)
+
+        snap = result["spm_units"]["spm_unit"]["snap"]
+        assert snap["2026:months"] == [monthly["snap"][m] for m in months]
+        assert snap["2026-03"] == monthly["snap"]["2026-03"]
+
+    def test_range_months_are_calculated_once(self, monkeypatch):
+        # The range and the single month it overlaps share one array.
+        country = COUNTRIES["us"]
+        converted = []
+        result_values = country._result_values
+
+        def _spy(result, variable):
+            converted.append(variable.name)
+            return result_values(result, variable)
+
+        monkeypatch.setattr(country, "_result_values", _spy)
+
+        country.calculate(self.household)
+
+        assert converted.count("snap") == 12
+
+    def test_ranges_can_cross_years(self):
+        household = copy.deepcopy(self.household)
+        household["spm_units"]["spm_unit"]["snap"] = {"2026-11:3": None}
+
+        result = COUNTRIES["us"].calculate(household)
+
+        assert len(result["spm_units"]["spm_unit"]["snap"]["2026-11:3"]) == 3
+
+
 @pytest.fixture(scope="module")
 def uk_country():
     # Reuse the instance the endpoints serve instead of building a second
@@ -197,6 +321,53 @@ class TestCalculateUK:
         assert country == ["ENGLAND", "ENGLAND", "ENGLAND"]
 
 
+class TestReformSystemCache:
+    def test_repeat_reform_reuses_reformed_system(self):
+        country = COUNTRIES["us"]
+        reform = country._cast_reform_values(us_standard_deduction_reform)
+
+        first = country._reformed_system(reform)
+        second = country._reformed_system(
+            country._cast_reform_values(
+                {
+                    name: {period: float(value)}
+                    for name, changes in us_standard_deduction_reform.items()
+                    for period, value in changes.items()
+                }
+            )
+        )
+
+        assert second is first
+        assert first is not country.tax_benefit_system
+
+    def test_reform_leaves_shared_system_untouched(self):
+        country = COUNTRIES["us"]
+        reform = country._cast_reform_values(us_standard_deduction_reform)
+        parameter_name = next(iter(reform))
+
+        reformed = country._reformed_system(reform)
+
+        def standard_deduction(system):
+            return get_parameter(system.parameters, parameter_name)(
+                "2024-06-01"
+            )
+
+        assert standard_deduction(reformed) == 30_000
+        assert standard_deduction(country.tax_benefit_system) != 30_000
+
+    def test_different_reforms_get_different_systems(self):
+        country = COUNTRIES["us"]
+        reform = country._cast_reform_values(us_standard_deduction_reform)
+        other = {
+            name: {period: value + 1 for period, value in changes.items()}
+            for name, changes in reform.items()
+        }
+
+        assert country._reformed_system(reform) is not (
+            country._reformed_system(other)
+        )
+
+
 class TestCastReformValue:
     @staticmethod
     def _parameter(values: dict) -> Parameter:
@@ -279,6 +450,112 @@ class TestPolicyEngineBundle:
         )
 
 
+class TestCountryRegistry:
+    PACKAGES = {"uk": "policyengine_uk", "us": "policyengine_us"}
+
+    def _registry(self, factory=None):
+        built = []
+
+        def build(package_name, country_id):
+            built.append(country_id)
+            return (factory or (lambda *args: object()))(
+                package_name, country_id
+            )
+
+        return CountryRegistry(self.PACKAGES, factory=build), built
+
+    def test__lookup_builds_each_country_once(self):
+        registry, built = self._registry()
+
+        first = registry["us"]
+
+        assert registry["us"] is first
+        assert registry.get("us") is first
+        assert built == ["us"]
+        assert registry.loaded() == ("us",)
+
+    def test__membership_and_iteration_build_nothing(self):
+        registry, built = self._registry()
+
+        assert "us" in registry
+        assert "ca" not in registry
+        assert list(registry) == ["uk", "us"]
+        assert len(registry) == 2
+        assert registry.get("ca") is None
+        assert built == []
+
+    def test__concurrent_lookups_share_one_build(self):
+        def slow_build(package_name, country_id):
+            time.sleep(0.05)
+            return object()
+
+        registry, built = self._registry(slow_build)
+        countries = []
+
+        threads = [
+            threading.Thread(target=lambda: countries.append(registry["us"]))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert built == ["us"]
+        assert len({id(country) for country in countries}) == 1
+
+    def test__failed_build_is_retried_by_the_next_lookup(self):
+        attempts = []
+
+        def flaky_build(package_name, country_id):
+            attempts.append(country_id)
+            if len(attempts) == 1:
+                raise ImportError(package_name)
+            return object()
+
+        registry, _ = self._registry(flaky_build)
+
+        with pytest.raises(ImportError):
+            registry["uk"]
+        assert registry["uk"] is not None
+        assert attempts == ["uk", "uk"]
+
+    def test__prewarm_builds_only_served_countries(self):
+        registry, built = self._registry()
+
+        registry.prewarm(["us", "ca"])
+
+        assert built == ["us"]
+
+    def test__served_countries_are_read_from_config(self, monkeypatch):
+        values = {"app.countries.serve": "us, uk"}
+        monkeypatch.setattr(
+            country_module,
+            "get_config_value",
+            lambda path, default=None: values.get(path, default),
+        )
+
+        assert served_country_ids() == ("us", "uk")
+
+        values["app.countries.serve"] = ["us", "fr"]
+        with pytest.raises(ValueError, match="fr"):
+            served_country_ids()
+
+    def test__unserved_country_returns_404(self, client, monkeypatch):
+        from policyengine_household_api.utils import validate_country
+
+        monkeypatch.setattr(
+            validate_country,
+            "COUNTRIES",
+            CountryRegistry({"uk": "policyengine_uk"}),
+        )
+
+        response = client.post("/us/calculate", json={"household": {}})
+
+        assert response.status_code == 404
+        assert b"Available countries are: uk" in response.data
+
+
 def test_country_package_versions_falls_back_per_package(monkeypatch):
     from policyengine_household_api import constants
 
@@ -0,0 +1,217 @@
+"""Tests for the single-pass household walk.
+
+``walk_household`` replaces separate walks for variable validation,
+deprecated-input filtering, period validation, warning detection,
+YEAR-key expansion and analytics variable usage; these tests pin that
+it reports exactly what those rules report on their own.
+"""
+
+import copy
+import tracemalloc
+
+from flask import g
+import pytest
+
+from policyengine_household_api.api import app
+from policyengine_household_api.country import (
+    COUNTRIES,
+    _normalize_period_keys,
+    _parsed_period,
+    _variable_index,
+    detect_period_warnings,
+    walk_household,
+)
+from policyengine_household_api.endpoints.household import _household_walk
+from policyengine_household_api.utils.variable_validation import (
+    validate_household_variables,
+)
+from policyengine_household_common.deprecated_inputs import (
+    drop_deprecated_inputs,
+)
+from policyengine_household_common.variable_usage_analytics import (
+    extract_variable_usage,
+)
+
+MIXED_HOUSEHOLD = {
+    "people": {
+        "you": {
+            "age": {"2026": 40},
+            "medical_out_of_pocket_expenses": {"2026": 500},
+        },
+    },
+    "spm_units": {
+        "spm_unit": {
+            "members": ["you"],
+            "snap_earned_income": {"2026-01": 900, "2026": None},
+            "snap": {"2026": None},
+        },
+    },
+    "axes": [
+        [{"name": "medical_out_of_pocket_expenses", "count": 2}],
+        {"name": "not_a_variable", "count": 2},
+    ],
+}
+
+
+@pytest.fixture(scope="module")
+def us_system():
+    return COUNTRIES["us"].tax_benefit_system
+
+
+class TestWalkHousehold:
+    def test__matches_each_rule_run_separately(self, us_system):
+        walk = walk_household(
+            MIXED_HOUSEHOLD,
+            us_system,
+            model_version="1.0.0",
+            collect_usage=True,
+        )
+        dropped = drop_deprecated_inputs(MIXED_HOUSEHOLD)
+
+        assert walk.variable_errors == validate_household_variables(
+            MIXED_HOUSEHOLD, us_system, model_version="1.0.0"
+        )
+        assert walk.household == dropped.household
+        assert walk.deprecation_warnings == dropped.warnings
+        assert walk.period_warnings == detect_period_warnings(
+            dropped.household, us_system
+        )
+        assert walk.period_warnings
+        assert walk.variable_usage == extract_variable_usage(
+            MIXED_HOUSEHOLD, us_system
+        )
+
+    def test__deprecated_inputs_are_dropped_without_mutating_source(
+        self, us_system
+    ):
+        household = copy.deepcopy(MIXED_HOUSEHOLD)
+
+        walk = walk_household(household, us_system)
+
+        assert household == MIXED_HOUSEHOLD
+        person = walk.household["people"]["you"]
+        assert "medical_out_of_pocket_expenses" not in person
+        assert walk.household["axes"] == [
+            {"name": "not_a_variable", "count": 2}
+        ]
+        # Untouched containers are shared, not copied.
+        assert walk.household["spm_units"] is household["spm_units"]
+
+    def test__household_without_deprecated_inputs_is_returned_as_is(
+        self, us_system
+    ):
+        household = {"people": {"you": {"age": {"2026": 40}}}}
+
+        assert walk_household(household, us_system).household is household
+
+    def test__period_key_and_budget_errors_are_reported_separately(
+        self, us_system
+    ):
+        household = {
+            "people": {"you": {"age": {"2026-13": 40}}},
+            "spm_units": {
+                "spm_unit": {
+                    "snap_earned_income": {
+                        "2026": 1000,
+                        **{f"2026-{month:02d}": 100 for month in range(1, 13)},
+                    }
+                }
+            },
+        }
+
+        walk = walk_household(household, us_system)
+
+        assert "`2026-13`" in walk.period_key_error
+        assert "sum to 1200.0" in walk.period_budget_error
+
+    def test__budget_check_reads_each_year_independently(self, us_system):
+        period_map = {}
+        for year in range(2020, 2030):
+            period_map[str(year)] = 1200
+            for month in range(1, 13):
+                period_map[f"{year}-{month:02d}"] = 100
+        household = {
+            "spm_units": {"spm_unit": {"snap_earned_income": period_map}}
+        }
+
+        walk = walk_household(household, us_system)
+
+        assert walk.period_budget_error is None
+        assert walk.period_expansions == (
+            ("spm_units", "spm_unit", "snap_earned_income"),
+        )
+
+    def test__variable_index_is_built_once_per_system(self, us_system):
+        assert _variable_index(us_system) is _variable_index(us_system)
+
+    def test__period_keys_are_parsed_once(self):
+        _parsed_period.cache_clear()
+
+        for _ in range(3):
+            _parsed_period("2026-04")
+
+        assert _parsed_period.cache_info().misses == 1
+
+
+class TestEndpointReusesAnalyticsWalk:
+    def test__walk_stored_by_analytics_is_reused(self, us_system):
+        country = COUNTRIES["us"]
+        household = {"people": {"you": {"age": {"2026": 40}}}}
+        walk = walk_household(household, us_system)
+
+        with app.test_request_context():
+            g.household_walk = walk
+            assert _household_walk(country, household) is walk
+            assert _household_walk(country, dict(household)) is not walk
+
+
+class TestCopyFreePipeline:
+    def test__preparing_a_large_household_allocates_a_fraction_of_a_copy(
+        self, us_system
+    ):
+        # Every person carries monthly inputs; one deprecated input and
+        # one YEAR-keyed input are the only edits, so the prepared
+        # household should cost a small fraction of one deep copy.
+        people = {
+            f"person_{index}": {
+                "age": {"2026": 40},
+                "employment_income": {
+                    f"2026-{month:02d}": 1000 for month in range(1, 13)
+                },
+            }
+            for index in range(300)
+        }
+        people["person_0"]["medical_out_of_pocket_expenses"] = {"2026": 1}
+        household = {
+            "people": people,
+            "spm_units": {
+                "spm_unit": {
+                    "members": list(people),
+                    "snap_earned_income": {"2026": 1200},
+                }
+            },
+        }
+
+        copy_bytes = _peak_allocated_bytes(lambda: copy.deepcopy(household))
+
+        def prepare():
+            walk = walk_household(household, us_system)
+            return _normalize_period_keys(
+                walk.household, us_system, walk.period_expansions
+            )
+
+        prepare()
+        prepared_bytes = _peak_allocated_bytes(prepare)
+
+        assert prepared_bytes < copy_bytes * 0.1
+
+
+def _peak_allocated_bytes(function) -> int:
+    tracemalloc.start()
+    try:
+        result = function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak
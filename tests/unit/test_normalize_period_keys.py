@@ -396,6 +396,55 @@ class TestValidatePeriodKeys:
 
         validate_period_keys(household, us_system)  # must not raise
 
+    def test__period_ranges_on_requested_values__no_error(self, us_system):
+        household = {
+            "spm_units": {
+                "spm_unit_1": {
+                    "snap": {"2026:months": None, "2026-07:12": None}
+                }
+            }
+        }
+
+        validate_period_keys(household, us_system)  # must not raise
+
+    @pytest.mark.parametrize(
+        "period_key,value,message",
+        [
+            ("2026:months", 100, "Invalid period key `2026:months`"),
+            ("2026-01:0", None, "Invalid period key `2026-01:0`"),
+            ("2026-01:121", None, "Invalid period key `2026-01:121`"),
+            ("2026-13:12", None, "Invalid period key `2026-13:12`"),
+            ("2026:weeks", None, "Invalid period key `2026:weeks`"),
+            ("2026-01:months", None, "Invalid period key `2026-01:months`"),
+        ],
+    )
+    def test__invalid_period_range__raises(
+        self, us_system, period_key, value, message
+    ):
+        household = {
+            "spm_units": {"spm_unit_1": {"snap": {period_key: value}}}
+        }
+
+        with pytest.raises(ValueError, match=message):
+            validate_period_keys(household, us_system)
+
+    def test__period_range_on_year_defined_variable__raises(self, us_system):
+        household = {"tax_units": {"t": {"income_tax": {"2026:months": None}}}}
+
+        with pytest.raises(
+            ValueError, match="needs a variable defined by month"
+        ):
+            validate_period_keys(household, us_system)
+
+    def test__period_range_with_axes__raises(self, us_system):
+        household = {
+            "axes": [[{"name": "employment_income", "count": 2}]],
+            "spm_units": {"spm_unit_1": {"snap": {"2026:months": None}}},
+        }
+
+        with pytest.raises(ValueError, match="households with axes"):
+            validate_period_keys(household, us_system)
+
 
 # ---------------------------------------------------------------------------
 # validate_period_budgets: explicit months exceeding annual -> 400
@@ -0,0 +1,79 @@
+"""Tests for preparing a preloading gunicorn master to fork."""
+
+import gc
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from policyengine_household_api import gunicorn_config, preload
+from policyengine_household_api.deployment import parameter_prewarm_instants
+
+
+@pytest.fixture
+def unfreeze():
+    yield
+    gc.unfreeze()
+
+
+class TestFinishPreload:
+    def test__builds_every_served_country_then_freezes(
+        self, monkeypatch, unfreeze
+    ):
+        calls = []
+        systems = {"uk": object(), "us": object()}
+        monkeypatch.setattr(
+            preload,
+            "COUNTRIES",
+            {
+                country_id: SimpleNamespace(tax_benefit_system=system)
+                for country_id, system in systems.items()
+            },
+        )
+        monkeypatch.setattr(
+            preload,
+            "warm_parameters",
+            lambda instants, **kwargs: calls.append(
+                (len(instants), kwargs["metadata"], gc.get_freeze_count())
+            ),
+        )
+        monkeypatch.setattr(
+            preload,
+            "_variable_index",
+            lambda system: calls.append((system, gc.get_freeze_count())),
+        )
+        monkeypatch.setattr(preload, "record_event", lambda *a, **k: None)
+
+        frozen = preload.finish_preload()
+
+        assert calls == [
+            (len(parameter_prewarm_instants()), True, 0),
+            (systems["uk"], 0),
+            (systems["us"], 0),
+        ]
+        assert frozen > 0
+
+    @pytest.mark.parametrize("preload_app,finished", [(True, 1), (False, 0)])
+    def test__gunicorn_finishes_only_a_preloading_master(
+        self, monkeypatch, preload_app, finished
+    ):
+        calls = []
+        monkeypatch.setattr(
+            preload, "finish_preload", lambda: calls.append("finished")
+        )
+        server = SimpleNamespace(cfg=SimpleNamespace(preload_app=preload_app))
+
+        gunicorn_config.when_ready(server)
+
+        assert len(calls) == finished
+
+
+def test__memory_usage_endpoint_reports_the_answering_worker(client):
+    response = client.get("/memory_usage")
+
+    assert response.status_code == 200
+    usage = response.get_json()
+    assert usage["pid"] == os.getpid()
+    assert usage["gc_frozen_objects"] == gc.get_freeze_count()
+    if usage["memory_bytes"] is not None:
+        assert usage["memory_bytes"]["private"] > 0
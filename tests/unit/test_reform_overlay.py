@@ -0,0 +1,106 @@
+import pytest
+from policyengine_core.parameters import get_parameter
+
+from policyengine_household_api.country import COUNTRIES
+from policyengine_household_api.reform_overlay import overlay_reform
+from tests.fixtures.country import (
+    us_household_requesting_income_tax,
+    us_standard_deduction_reform,
+)
+
+INSTANT = "2024-06-01"
+PARAMETER = "gov.irs.deductions.standard.amount.SINGLE"
+
+
+@pytest.fixture
+def us_country():
+    return COUNTRIES["us"]
+
+
+@pytest.fixture
+def reform(us_country):
+    return us_country._cast_reform_values(us_standard_deduction_reform)
+
+
+class TestOverlayReform:
+    def test__reformed_parameter_takes_reform_value(self, us_country, reform):
+        overlay = overlay_reform(us_country.tax_benefit_system, reform)
+
+        assert get_parameter(overlay.parameters, PARAMETER)(INSTANT) == 30_000
+        at_instant = overlay.get_parameters_at_instant(INSTANT)
+        assert at_instant.gov.irs.deductions.standard.amount.SINGLE == 30_000
+
+    def test__shared_system_is_untouched(self, us_country, reform):
+        system = us_country.tax_benefit_system
+        baseline_value = get_parameter(system.parameters, PARAMETER)(INSTANT)
+        baseline_at_instant = system.get_parameters_at_instant(INSTANT)
+
+        overlay = overlay_reform(system, reform)
+        overlay.get_parameters_at_instant(INSTANT)
+
+        assert (
+            get_parameter(system.parameters, PARAMETER)(INSTANT)
+            == baseline_value
+        )
+        assert system.get_parameters_at_instant(INSTANT) is (
+            baseline_at_instant
+        )
+        # Updating the reformed leaf must not invalidate the shared
+        # tree's per-node projection caches.
+        assert INSTANT in system.parameters.gov.irs._at_instant_cache
+
+    def test__untouched_subtrees_share_baseline_projections(
+        self, us_country, reform
+    ):
+        system = us_country.tax_benefit_system
+        baseline_at_instant = system.get_parameters_at_instant(INSTANT)
+
+        overlay = overlay_reform(system, reform)
+        overlay_at_instant = overlay.get_parameters_at_instant(INSTANT)
+
+        assert overlay.parameters.gov.hhs is system.parameters.gov.hhs
+        assert overlay_at_instant.gov.hhs is baseline_at_instant.gov.hhs
+        assert overlay_at_instant.gov.irs is not baseline_at_instant.gov.irs
+
+    def test__sibling_parameters_share_copied_ancestors(self, us_country):
+        reform = us_country._cast_reform_values(
+            {
+                f"gov.irs.deductions.standard.amount.{status}": {
+                    "2024-01-01.2024-12-31": "20000",
+                }
+                for status in ("SINGLE", "JOINT")
+            }
+        )
+
+        overlay = overlay_reform(us_country.tax_benefit_system, reform)
+
+        amount = overlay.parameters.gov.irs.deductions.standard.amount
+        assert amount.SINGLE(INSTANT) == 20_000
+        assert amount.JOINT(INSTANT) == 20_000
+
+    def test__bracket_paths_are_not_overlaid(self, us_country):
+        assert (
+            overlay_reform(
+                us_country.tax_benefit_system,
+                {
+                    "gov.irs.credits.eitc.phase_out.start[0].amount": {
+                        "2024-01-01.2024-12-31": 1.0,
+                    }
+                },
+            )
+            is None
+        )
+
+    def test__calculation_matches_full_clone(self, us_country, reform):
+        household = us_household_requesting_income_tax
+
+        def income_tax(system):
+            simulation = us_country.country_package.Simulation(
+                tax_benefit_system=system,
+                situation=household,
+            )
+            return simulation.calculate("income_tax", 2024)[0]
+
+        assert income_tax(
+            overlay_reform(us_country.tax_benefit_system, reform)
+        ) == income_tax(us_country._cloned_reform_system(reform))
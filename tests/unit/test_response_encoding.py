@@ -0,0 +1,134 @@
+"""Tests for the negotiated MessagePack and Arrow response encodings."""
+
+import json
+
+import msgpack
+import numpy as np
+import pyarrow as pa
+import pytest
+from werkzeug.datastructures import MIMEAccept
+from werkzeug.http import parse_accept_header
+
+from policyengine_household_api.response_encoding import (
+    ARROW_STREAM_MEDIA_TYPE,
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    encode_arrow_stream,
+    encode_msgpack,
+    negotiate_media_type,
+)
+from policyengine_household_api.utils.json import json_default
+
+COLUMNAR_PAYLOAD = {
+    "status": "ok",
+    "message": None,
+    "result": {
+        "axes": [
+            {
+                "name": "employment_income",
+                "period": "2026",
+                "entity": "you",
+                "values": np.array([0.0, 50_000.0, 100_000.0]),
+            }
+        ],
+        "values": {
+            "income_tax": {
+                "2026": {"tax_unit": np.array([0.0, 4_321.5, 15_000.25])}
+            },
+            "is_tax_unit_head": {
+                "2026": {"you": np.array([True, True, True])}
+            },
+            "state_name": {"2026": {"household": np.array(["CA"] * 3)}},
+            "snap": {"2026": {"spm_unit": None}},
+        },
+    },
+    "policyengine_bundle": {"model_version": "1.0.0"},
+}
+
+
+def _accept(header: str) -> MIMEAccept:
+    return parse_accept_header(header, MIMEAccept)
+
+
+def _as_json(payload):
+    return json.loads(json.dumps(payload, default=json_default))
+
+
+class TestNegotiateMediaType:
+    @pytest.mark.parametrize(
+        "header,columnar,expected",
+        [
+            ("", False, JSON_MEDIA_TYPE),
+            ("*/*", True, JSON_MEDIA_TYPE),
+            ("text/html", False, JSON_MEDIA_TYPE),
+            (MSGPACK_MEDIA_TYPE, False, MSGPACK_MEDIA_TYPE),
+            (
+                f"{MSGPACK_MEDIA_TYPE}, {JSON_MEDIA_TYPE};q=0.5",
+                False,
+                MSGPACK_MEDIA_TYPE,
+            ),
+            (ARROW_STREAM_MEDIA_TYPE, True, ARROW_STREAM_MEDIA_TYPE),
+            # Only a columnar result is a table.
+            (ARROW_STREAM_MEDIA_TYPE, False, JSON_MEDIA_TYPE),
+        ],
+    )
+    def test__picks_the_best_offered_type(self, header, columnar, expected):
+        assert (
+            negotiate_media_type(_accept(header), columnar=columnar)
+            == expected
+        )
+
+
+class TestEncodeMsgpack:
+    def test__decodes_to_the_json_response(self):
+        payload = {
+            **COLUMNAR_PAYLOAD,
+            "counts": np.array([1, -2, 3], dtype=np.int32),
+            "nested": [{"values": np.array([2.5])}, [1, "two", None]],
+            "scalar": np.int64(7),
+        }
+
+        assert msgpack.unpackb(encode_msgpack(payload)) == _as_json(payload)
+
+    def test__float_arrays_are_written_as_standard_float_64_arrays(self):
+        values = np.linspace(0, 1, 70_000)
+
+        assert encode_msgpack(values) == msgpack.packb(values.tolist())
+
+
+class TestEncodeArrowStream:
+    def test__one_column_per_axis_and_requested_value(self):
+        table = pa.ipc.open_stream(
+            encode_arrow_stream(COLUMNAR_PAYLOAD)
+        ).read_all()
+
+        assert table.num_rows == 3
+        assert table.column_names == [
+            "axis/employment_income/2026/you",
+            "income_tax/2026/tax_unit",
+            "is_tax_unit_head/2026/you",
+            "state_name/2026/household",
+            "snap/2026/spm_unit",
+        ]
+        assert table.column("income_tax/2026/tax_unit").to_pylist() == [
+            0.0,
+            4_321.5,
+            15_000.25,
+        ]
+        assert table.column("snap/2026/spm_unit").null_count == 3
+        assert table.schema.field(
+            "axis/employment_income/2026/you"
+        ).metadata == {
+            b"role": b"axis",
+            b"variable": b"employment_income",
+            b"period": b"2026",
+            b"entity": b"you",
+        }
+        assert {
+            key.decode(): json.loads(value)
+            for key, value in table.schema.metadata.items()
+        } == {
+            "status": "ok",
+            "message": None,
+            "policyengine_bundle": {"model_version": "1.0.0"},
+        }
@@ -0,0 +1,135 @@
+import json
+from unittest import mock
+
+import pytest
+
+from policyengine_household_api.country import PolicyEngineCountry
+from policyengine_household_api.result_cache import (
+    RESULT_CACHE,
+    ResultCache,
+    cache_bypass_requested,
+    result_cache_key,
+)
+from policyengine_household_common.config_loader import get_config_value
+from tests.fixtures.country import (
+    us_household_requesting_income_tax,
+    us_standard_deduction_reform,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_result_cache():
+    RESULT_CACHE.clear()
+    yield
+    RESULT_CACHE.clear()
+
+
+class TestResultCacheKey:
+    def test__key_ignores_mapping_order(self):
+        reordered = dict(reversed(us_household_requesting_income_tax.items()))
+
+        assert result_cache_key(
+            "us", us_household_requesting_income_tax, None, "1.0.0"
+        ) == result_cache_key("us", reordered, None, "1.0.0")
+
+    @pytest.mark.parametrize(
+        "other",
+        [
+            ("uk", us_household_requesting_income_tax, None, "1.0.0"),
+            ("us", {"people": {}}, None, "1.0.0"),
+            (
+                "us",
+                us_household_requesting_income_tax,
+                us_standard_deduction_reform,
+                "1.0.0",
+            ),
+            ("us", us_household_requesting_income_tax, None, "1.0.1"),
+            (
+                "us",
+                us_household_requesting_income_tax,
+                None,
+                "1.0.0",
+                "columnar",
+            ),
+        ],
+    )
+    def test__key_changes_with_each_input(self, other):
+        assert result_cache_key(
+            "us", us_household_requesting_income_tax, None, "1.0.0"
+        ) != result_cache_key(*other)
+
+
+class TestResultCache:
+    def test__hit_returns_independent_copy_without_calculating(self):
+        cache = ResultCache(max_entries=4, max_bytes=1024)
+        calculate = mock.Mock(return_value={"people": {"you": {"a": 1}}})
+
+        first = cache.get_or_calculate("key", calculate)
+        first["people"]["you"]["a"] = 2
+        second = cache.get_or_calculate("key", calculate)
+
+        assert calculate.call_count == 1
+        assert second == {"people": {"you": {"a": 1}}}
+
+    def test__exceptions_are_not_cached(self):
+        cache = ResultCache(max_entries=4, max_bytes=1024)
+        calculate = mock.Mock(side_effect=[ValueError("boom"), {"a": 1}])
+
+        with pytest.raises(ValueError):
+            cache.get_or_calculate("key", calculate)
+
+        assert cache.get_or_calculate("key", calculate) == {"a": 1}
+        assert calculate.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "cache_control, expected",
+    [
+        (None, False),
+        ("", False),
+        ("max-age=0", False),
+        ("no-cache", True),
+        ("No-Store", True),
+        ("max-age=0, no-cache", True),
+    ],
+)
+def test_cache_bypass_requested(cache_control, expected):
+    assert cache_bypass_requested(cache_control) is expected
+
+
+class TestCalculateEndpointResultCache:
+    auth_headers = {
+        "Authorization": f"Bearer {get_config_value('auth.auth0.test_token')}",
+    }
+
+    def _post(self, client, headers=None):
+        return client.post(
+            "/us/calculate",
+            json={"household": us_household_requesting_income_tax},
+            headers={**self.auth_headers, **(headers or {})},
+        )
+
+    def test__repeated_request_is_served_from_cache(self, client):
+        with mock.patch.object(
+            PolicyEngineCountry,
+            "_calculate",
+            autospec=True,
+            side_effect=PolicyEngineCountry._calculate,
+        ) as calculate:
+            first = self._post(client)
+            second = self._post(client)
+
+        assert calculate.call_count == 1
+        assert json.loads(first.data) == json.loads(second.data)
+
+    def test__no_cache_header_bypasses_cache(self, client):
+        with mock.patch.object(
+            PolicyEngineCountry,
+            "_calculate",
+            autospec=True,
+            side_effect=PolicyEngineCountry._calculate,
+        ) as calculate:
+            self._post(client)
+            self._post(client, {"Cache-Control": "no-cache"})
+
+        assert calculate.call_count == 2
@@ -0,0 +1,153 @@
+import numpy as np
+import pytest
+
+from policyengine_household_api.incremental import CalculatedValues
+from policyengine_household_api.sessions import (
+    SessionConfig,
+    SessionRegistry,
+)
+from policyengine_household_api.templates import household_template
+
+HOUSEHOLD = {
+    "people": {
+        "you": {
+            "age": {"2026": 40},
+            "employment_income": {"2026": 30_000},
+        }
+    },
+    "tax_units": {
+        "tax_unit": {"members": ["you"], "income_tax": {"2026": None}}
+    },
+}
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _registry(clock=None, **config) -> SessionRegistry:
+    config = {
+        "max_entries": 4,
+        "max_bytes": 1024 * 1024,
+        "idle_ttl_seconds": 60,
+        **config,
+    }
+    return SessionRegistry(SessionConfig(**config), clock=clock or _Clock())
+
+
+def _start(registry, country_id="us"):
+    template = household_template(
+        country_id,
+        "1.0.0",
+        HOUSEHOLD,
+        warnings=[],
+        period_expansions=(),
+        period_budget_slots=(),
+    )
+    return registry.start(country_id, template, {})
+
+
+def _values(nbytes: int) -> CalculatedValues:
+    return CalculatedValues(
+        entity_ids={},
+        inputs={},
+        values={"income_tax": {"2026": np.zeros(nbytes, dtype=np.int8)}},
+        readers={},
+        volatile=frozenset(),
+    )
+
+
+class TestHouseholdSession:
+    def test__patch_writes_values_without_touching_the_household(self):
+        session = _start(_registry())
+
+        patched = session.patched(
+            {"people": {"you": {"employment_income": {"2026": 5}}}}
+        )
+
+        assert patched["people"]["you"] == {
+            "age": {"2026": 40},
+            "employment_income": {"2026": 5},
+        }
+        assert patched["tax_units"] is session.household["tax_units"]
+        assert session.household["people"]["you"]["employment_income"] == {
+            "2026": 30_000
+        }
+
+    @pytest.mark.parametrize(
+        "patch,message",
+        [
+            ([], "'patch' must be an object"),
+            (
+                {"people": {"you": {"age": {"2025": 40}}}},
+                "'patch.people.you.age.2025' is not one of the session's "
+                "inputs",
+            ),
+            (
+                {"tax_units": {"tax_unit": {"income_tax": {"2026": 1}}}},
+                "'patch.tax_units.tax_unit.income_tax.2026' is not one of "
+                "the session's inputs",
+            ),
+            (
+                {"people": {"you": {"age": {"2026": [41]}}}},
+                "'patch.people.you.age.2026' must be a number, string or "
+                "boolean; got a list",
+            ),
+            (
+                {"people": {"you": {"age": 41}}},
+                "'patch.people.you.age' must be an object",
+            ),
+        ],
+    )
+    def test__patch_rejects_anything_but_input_values(self, patch, message):
+        with pytest.raises(ValueError) as error:
+            _start(_registry()).patched(patch)
+
+        assert str(error.value) == message
+
+
+class TestSessionRegistry:
+    def test__sessions_are_held_per_country(self):
+        registry = _registry()
+        session = _start(registry)
+
+        assert registry.get("us", session.session_id) is session
+        assert registry.get("uk", session.session_id) is None
+
+    def test__idle_sessions_expire(self):
+        clock = _Clock()
+        registry = _registry(clock)
+        idle = _start(registry)
+        registry.update(idle, HOUSEHOLD, _values(8))
+        clock.now = 50
+        active = _start(registry)
+        clock.now = 100
+
+        assert registry.get("us", active.session_id) is active
+        assert registry.get("us", idle.session_id) is None
+        assert registry.calculated_values(idle) is None
+
+    def test__starting_a_session_drops_the_idle_ones(self):
+        clock = _Clock()
+        registry = _registry(clock)
+        _start(registry)
+        clock.now = 100
+
+        _start(registry)
+
+        assert len(registry) == 1
+
+    def test__values_are_dropped_past_the_byte_bound(self):
+        registry = _registry(max_bytes=2048)
+        first, second = _start(registry), _start(registry)
+        registry.update(first, HOUSEHOLD, _values(1024))
+
+        registry.update(second, HOUSEHOLD, _values(1024))
+
+        assert registry.get("us", first.session_id) is first
+        assert registry.calculated_values(first) is None
+        assert registry.calculated_values(second) is not None
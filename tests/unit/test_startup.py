@@ -0,0 +1,144 @@
+"""Tests for the concurrent startup builder and its timeline."""
+
+import threading
+
+import pytest
+
+from policyengine_household_api import startup
+from policyengine_household_api.country import CountryRegistry
+from policyengine_household_api.startup import start_countries
+
+# Cheap real modules stand in for country packages: the builder imports
+# them before building.
+PACKAGES = {"uk": "json", "us": "csv"}
+
+
+class FakeSystem:
+    def __init__(self):
+        self.instants = []
+
+    def get_parameters_at_instant(self, instant):
+        self.instants.append(instant)
+
+
+class FakeCountry:
+    def __init__(self, package_name, country_id):
+        self.country_id = country_id
+        self.tax_benefit_system = FakeSystem()
+        self.metadata_builds = 0
+
+    @property
+    def metadata(self):
+        self.metadata_builds += 1
+        return {}
+
+
+@pytest.fixture
+def events(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(
+        startup,
+        "record_event",
+        lambda event, **fields: recorded.append((event, fields)),
+    )
+    return recorded
+
+
+class TestStartCountries:
+    def test__countries_build_concurrently(self, events):
+        # Each build waits for the other, so they only finish if the
+        # pool runs them at the same time.
+        barrier = threading.Barrier(2, timeout=5)
+
+        def build(package_name, country_id):
+            barrier.wait()
+            return FakeCountry(package_name, country_id)
+
+        registry = CountryRegistry(PACKAGES, factory=build)
+
+        timeline = start_countries(["uk", "us"], registry=registry, workers=2)
+
+        assert registry.loaded() == ("uk", "us")
+        assert timeline.workers == 2
+
+    def test__timeline_times_every_step_per_country(self, events):
+        registry = CountryRegistry(PACKAGES, factory=FakeCountry)
+        instants = ["2026-01-01", "2026-02-01"]
+
+        start_countries(
+            ["uk", "us"],
+            registry=registry,
+            instants=instants,
+            metadata=True,
+            workers=2,
+        )
+
+        assert registry["us"].tax_benefit_system.instants == instants
+        assert registry["us"].metadata_builds == 1
+        [(event, fields)] = events
+        assert event == "startup_timeline"
+        assert fields["workers"] == 2
+        assert set(fields["countries"]) == {"uk", "us"}
+        us = fields["countries"]["us"]
+        assert list(us) == [
+            "import_ms",
+            "system_build_ms",
+            "metadata_ms",
+            "prewarm_ms",
+            "total_ms",
+            "prewarm_instants",
+        ]
+        assert us["prewarm_instants"] == 2
+        assert fields["total_ms"] >= 0
+
+    def test__built_countries_skip_to_the_later_steps(self, events):
+        built = []
+
+        def build(package_name, country_id):
+            built.append(country_id)
+            return FakeCountry(package_name, country_id)
+
+        registry = CountryRegistry(PACKAGES, factory=build)
+        registry["us"]
+
+        start_countries(["us"], registry=registry, instants=["2026-01-01"])
+
+        assert built == ["us"]
+        assert "metadata_ms" not in events[0][1]["countries"]["us"]
+        assert registry["us"].metadata_builds == 0
+
+    def test__unserved_countries_are_skipped(self, events):
+        registry = CountryRegistry({"us": "csv"}, factory=FakeCountry)
+
+        timeline = start_countries(["uk", "us"], registry=registry)
+
+        assert list(timeline.countries) == ["us"]
+        assert registry.loaded() == ("us",)
+
+    def test__a_failed_build_raises_after_the_others_finish(self, events):
+        def build(package_name, country_id):
+            if country_id == "uk":
+                raise RuntimeError("parameters missing")
+            return FakeCountry(package_name, country_id)
+
+        registry = CountryRegistry(PACKAGES, factory=build)
+        started = []
+
+        with pytest.raises(RuntimeError, match="parameters missing"):
+            start_countries(
+                ["uk", "us"],
+                registry=registry,
+                workers=2,
+                on_started=lambda country: started.append(
+                    (country.country_id, country.error)
+                ),
+            )
+
+        assert sorted(started) == [
+            ("uk", "RuntimeError: parameters missing"),
+            ("us", None),
+        ]
+        assert registry.loaded() == ("us",)
+        countries = events[0][1]["countries"]
+        assert countries["uk"]["error"] == "RuntimeError: parameters missing"
+        assert "error" not in countries["us"]
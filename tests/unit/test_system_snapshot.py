@@ -0,0 +1,123 @@
+"""Tests for persisted parameter projections (system snapshots)."""
+
+import pickle
+
+import pytest
+
+from policyengine_household_api import system_snapshot
+from policyengine_household_api.country import PolicyEngineCountry
+from policyengine_household_api.system_snapshot import (
+    INVALID,
+    LOADED,
+    MISSING,
+    STALE,
+    load_snapshot,
+    snapshot_path,
+    write_snapshot,
+)
+
+INSTANTS = ["2025-01-01", "2026-01-01", "2026-07-01"]
+
+
+def _canada():
+    # A fresh system per test: snapshots install into its caches.
+    return PolicyEngineCountry("policyengine_canada", "ca")
+
+
+def _values(projection) -> dict:
+    values = {}
+    for name, child in projection._children.items():
+        if hasattr(child, "_children"):
+            values.update(
+                {
+                    f"{name}.{key}": value
+                    for key, value in _values(child).items()
+                }
+            )
+        else:
+            values[name] = pickle.dumps(child)
+    return values
+
+
+@pytest.fixture(scope="module")
+def snapshot_dir(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("snapshots")
+    write_snapshot(_canada(), directory, INSTANTS)
+    return directory
+
+
+class TestSystemSnapshot:
+    def test__loaded_projections_match_built_ones(self, snapshot_dir):
+        loaded = _canada()
+        built = _canada()
+
+        result = load_snapshot(loaded, snapshot_dir)
+
+        assert result.status == LOADED
+        assert result.instants == len(INSTANTS)
+        for instant in INSTANTS:
+            assert _values(
+                loaded.tax_benefit_system.get_parameters_at_instant(instant)
+            ) == _values(
+                built.tax_benefit_system.get_parameters_at_instant(instant)
+            )
+
+    def test__every_node_caches_its_subtree_projection(self, snapshot_dir):
+        country = _canada()
+
+        load_snapshot(country, snapshot_dir)
+
+        parameters = country.tax_benefit_system.parameters
+        root = parameters._at_instant_cache["2026-01-01"]
+        assert parameters.gov._at_instant_cache["2026-01-01"] is root.gov
+        assert (
+            country.tax_benefit_system.get_parameters_at_instant("2026-01-01")
+            is root
+        )
+
+    def test__missing_snapshot_leaves_the_system_cold(self, tmp_path):
+        country = _canada()
+
+        assert load_snapshot(country, tmp_path).status == MISSING
+        assert country.tax_benefit_system.parameters._at_instant_cache == {}
+
+    def test__snapshot_from_other_versions_is_stale(
+        self, snapshot_dir, monkeypatch
+    ):
+        monkeypatch.setitem(
+            system_snapshot.COUNTRY_PACKAGE_VERSIONS, "ca", "0.0.1"
+        )
+        country = _canada()
+
+        assert load_snapshot(country, snapshot_dir).status == STALE
+        assert country.tax_benefit_system.parameters._at_instant_cache == {}
+
+    def test__unreadable_snapshot_is_invalid(self, tmp_path):
+        snapshot_path(tmp_path, "ca").write_bytes(b"not a pickle")
+
+        assert load_snapshot(_canada(), tmp_path).status == INVALID
+
+    def test__startup_loads_the_snapshot_before_building(
+        self, snapshot_dir, monkeypatch
+    ):
+        from policyengine_household_api import startup
+        from policyengine_household_api.country import CountryRegistry
+
+        monkeypatch.setattr(startup, "record_event", lambda *a, **k: None)
+        registry = CountryRegistry(
+            {"ca": "policyengine_canada"}, factory=PolicyEngineCountry
+        )
+
+        timeline = startup.start_countries(
+            ["ca"],
+            registry=registry,
+            instants=INSTANTS + ["2027-01-01"],
+            snapshot_dir=snapshot_dir,
+        )
+
+        country = timeline.countries["ca"]
+        assert country.snapshot == LOADED
+        assert list(country.phases_ms)[-2:] == ["snapshot_load", "prewarm"]
+        assert set(
+            registry["ca"].tax_benefit_system.parameters._at_instant_cache
+        ) == {"2025-01-01", "2026-01-01", "2026-07-01", "2027-01-01"}
@@ -0,0 +1,155 @@
+import copy
+
+import pytest
+
+from policyengine_household_api.templates import (
+    TemplateRegistry,
+    household_template,
+)
+
+HOUSEHOLD = {
+    "people": {
+        "you": {
+            "age": {"2026": 40},
+            "employment_income": {"2026": 30_000},
+        },
+        "child": {"age": {"2026": 6}},
+    },
+    "tax_units": {
+        "tax_unit": {
+            "members": ["you", "child"],
+            "income_tax": {"2026": None},
+        }
+    },
+}
+
+
+def _template(household=HOUSEHOLD, country_id="us", model_version="1.0.0"):
+    return household_template(
+        country_id,
+        model_version,
+        household,
+        warnings=[],
+        period_expansions=(),
+        period_budget_slots=(),
+    )
+
+
+class TestHouseholdTemplate:
+    def test__inputs_and_plan_follow_the_household(self):
+        template = _template()
+
+        assert template.inputs == (
+            ("people", "you", "age", "2026"),
+            ("people", "you", "employment_income", "2026"),
+            ("people", "child", "age", "2026"),
+        )
+        assert template.requested == (
+            ("tax_units", "tax_unit", "income_tax", "2026"),
+        )
+
+    def test__fill_writes_values_without_touching_the_template(self):
+        template = _template(copy.deepcopy(HOUSEHOLD))
+        stored = copy.deepcopy(template.household)
+
+        filled = template.fill([35, 50_000.5, 3])
+
+        assert filled["people"] == {
+            "you": {
+                "age": {"2026": 35},
+                "employment_income": {"2026": 50_000.5},
+            },
+            "child": {"age": {"2026": 3}},
+        }
+        assert filled["tax_units"] is template.household["tax_units"]
+        assert template.household == stored
+
+    @pytest.mark.parametrize(
+        "values,message",
+        [
+            ({"age": 35}, "'values' must be a list"),
+            (
+                [35, 50_000],
+                "'values' must hold one value per template input (3); got 2",
+            ),
+            (
+                [35, None, 3],
+                "'values[1]' must be a number, string or boolean; got null",
+            ),
+            (
+                [35, 50_000, [3]],
+                "'values[2]' must be a number, string or boolean; got a list",
+            ),
+        ],
+    )
+    def test__fill_rejects_malformed_values(self, values, message):
+        with pytest.raises(ValueError) as error:
+            _template().fill(values)
+
+        assert str(error.value) == message
+
+    def test__id_covers_the_structure_not_the_values(self):
+        other_values = copy.deepcopy(HOUSEHOLD)
+        other_values["people"]["you"]["employment_income"]["2026"] = 1
+
+        assert _template(other_values).template_id == _template().template_id
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            lambda household: household["people"]["you"].update(
+                {"age": {"2025": 40}}
+            ),
+            lambda household: household["tax_units"]["tax_unit"].update(
+                {"members": ["you"]}
+            ),
+            lambda household: household["tax_units"]["tax_unit"].update(
+                {"eitc": {"2026": None}}
+            ),
+            # Same mapping, other key order: the inputs' order differs.
+            lambda household: household["people"]["you"].update(
+                {"age": household["people"]["you"].pop("age")}
+            ),
+        ],
+    )
+    def test__id_changes_with_the_structure(self, change):
+        household = copy.deepcopy(HOUSEHOLD)
+        change(household)
+
+        assert _template(household).template_id != _template().template_id
+
+    def test__id_changes_with_the_country_and_model_version(self):
+        ids = {
+            _template().template_id,
+            _template(country_id="uk").template_id,
+            _template(model_version="1.0.1").template_id,
+        }
+
+        assert len(ids) == 3
+
+
+class TestTemplateRegistry:
+    def test__templates_are_held_per_country(self):
+        registry = TemplateRegistry(max_entries=4)
+        template = _template()
+
+        registry.register(template)
+
+        assert registry.get("us", template.template_id) is template
+        assert registry.get("uk", template.template_id) is None
+
+    def test__least_recently_used_template_is_dropped(self):
+        registry = TemplateRegistry(max_entries=2)
+        first, second, third = (
+            _template(model_version=version)
+            for version in ("1.0.0", "1.0.1", "1.0.2")
+        )
+
+        registry.register(first)
+        registry.register(second)
+        registry.get("us", first.template_id)
+        registry.register(third)
+
+        assert registry.get("us", second.template_id) is None
+        assert registry.get("us", first.template_id) is first
+        assert len(registry) == 2
@@ -0,0 +1,102 @@
+from unittest import mock
+
+import pytest
+
+from policyengine_household_api.country import (
+    COUNTRIES,
+    _set_spread_year_inputs,
+)
+from tests.data.uk_households import (
+    uk_household_married_requesting_marriage_allowance,
+    uk_household_requesting_enum_outputs,
+    uk_household_requesting_income_tax,
+    uk_household_requesting_universal_credit,
+    uk_household_single_adult_no_income,
+    uk_household_with_axes,
+    uk_marriage_allowance_structural_reform,
+    uk_personal_allowance_reform,
+)
+
+
+@pytest.fixture
+def uk_country():
+    return COUNTRIES["uk"]
+
+
+def _wrapper_simulation(country):
+    """Build simulations the way policyengine-uk's own constructor does."""
+
+    def build(normalized_household, reform, spread=None):
+        scenario = None
+        if reform:
+            scenario = country.country_package.Scenario.from_reform(reform)
+            scenario.applied_before_data_load = True
+        simulation = country.country_package.Simulation(
+            scenario=scenario,
+            situation=normalized_household,
+        )
+        if spread:
+            _set_spread_year_inputs(simulation, spread)
+        return country.tax_benefit_system, simulation
+
+    return build
+
+
+class TestUKSimulationFactory:
+    @pytest.mark.parametrize(
+        "household, reform",
+        [
+            (uk_household_requesting_universal_credit, None),
+            (uk_household_single_adult_no_income, None),
+            (uk_household_requesting_enum_outputs, None),
+            (uk_household_with_axes, None),
+            (uk_household_requesting_income_tax, uk_personal_allowance_reform),
+            (
+                uk_household_married_requesting_marriage_allowance,
+                uk_marriage_allowance_structural_reform,
+            ),
+        ],
+    )
+    def test__results_match_wrapper_constructor(
+        self, uk_country, household, reform
+    ):
+        pooled = uk_country.calculate(household, reform)
+        with mock.patch.object(
+            uk_country, "_build_simulation", _wrapper_simulation(uk_country)
+        ):
+            wrapped = uk_country.calculate(household, reform)
+
+        assert pooled == wrapped
+
+    def test__baseline_simulation_runs_on_shared_system(self, uk_country):
+        system, simulation = uk_country._build_simulation(
+            uk_household_requesting_income_tax, None
+        )
+
+        assert system is uk_country.tax_benefit_system
+        assert simulation.tax_benefit_system is uk_country.tax_benefit_system
+        assert simulation.baseline.tax_benefit_system is system
+
+    def test__calculation_keeps_shared_parameter_projections(self, uk_country):
+        parameters = uk_country.tax_benefit_system.parameters
+        projection = parameters.get_at_instant("2026-01-01")
+
+        uk_country.calculate(uk_household_requesting_income_tax)
+
+        assert parameters.get_at_instant("2026-01-01") is projection
+
+    def test__reformed_systems_are_reused(self, uk_country):
+        reform = uk_country._cast_reform_values(uk_personal_allowance_reform)
+
+        first, simulation = uk_country._build_simulation(
+            uk_household_requesting_income_tax, reform
+        )
+        second, _ = uk_country._build_simulation(
+            uk_household_requesting_income_tax, reform
+        )
+
+        assert first is second
+        assert first is not uk_country.tax_benefit_system
+        assert simulation.baseline.tax_benefit_system is (
+            uk_country.tax_benefit_system
+        )
@@ -0,0 +1,204 @@
+"""Tests for warm-level tracking, background warmup and readiness."""
+
+import json
+import threading
+
+import pytest
+
+from policyengine_household_api import warmup as warmup_module
+from policyengine_household_api.startup import CountryStartup
+from policyengine_household_api.warmup import (
+    COLD,
+    HOUSEHOLDS,
+    PARAMETERS,
+    SYSTEMS,
+    Warmup,
+    ready_level,
+)
+
+
+@pytest.fixture
+def config(monkeypatch):
+    values = {}
+    monkeypatch.setattr(
+        warmup_module,
+        "get_config_value",
+        lambda path, default=None: values.get(path, default),
+    )
+    return values
+
+
+@pytest.fixture
+def events(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(
+        warmup_module,
+        "record_event",
+        lambda event, **fields: recorded.append((event, fields)),
+    )
+    return recorded
+
+
+class TestWarmup:
+    def test__levels_only_advance(self, events):
+        warmup = Warmup()
+
+        warmup.advance(PARAMETERS)
+        warmup.advance(SYSTEMS)
+
+        assert warmup.level == PARAMETERS
+        assert warmup.reached(SYSTEMS)
+        assert list(warmup.reached_s) == [PARAMETERS]
+        assert [event for event, _ in events] == ["warmup_level"]
+        assert events[0][1]["warm_level"] == PARAMETERS
+
+    def test__countries_record_the_level_they_reached(self):
+        warmup = Warmup()
+        failed = CountryStartup("ca", error="ImportError: boom")
+
+        warmup.country_warmed(PARAMETERS)(CountryStartup("us"))
+        warmup.country_warmed(SYSTEMS)(CountryStartup("us"))
+        warmup.country_warmed(SYSTEMS)(CountryStartup("uk"))
+        warmup.country_warmed(SYSTEMS)(failed)
+
+        assert warmup.countries == {"us": PARAMETERS, "uk": SYSTEMS}
+
+    def test__ready_once_the_configured_level_is_reached(self, config, events):
+        config["app.warmup.ready_level"] = "Parameters"
+        warmup = Warmup()
+        warmup.advance(SYSTEMS)
+
+        assert not warmup.ready()
+        status = warmup.status()
+        assert status["status"] == "warming"
+        assert status["warm_level"] == SYSTEMS
+        assert status["ready_level"] == PARAMETERS
+        assert set(status["countries"].values()) == {COLD}
+
+        warmup.advance(PARAMETERS)
+
+        assert warmup.ready()
+        assert warmup.status()["status"] == "ready"
+
+    def test__unknown_ready_level_is_rejected(self, config):
+        config["app.warmup.ready_level"] = "hot"
+
+        with pytest.raises(ValueError, match="hot"):
+            ready_level()
+
+    def test__background_warmup_runs_once(self, events):
+        warmup = Warmup()
+        release = threading.Event()
+        calls = []
+
+        def warm():
+            calls.append("warm")
+            release.wait(5)
+            warmup.advance(PARAMETERS)
+
+        thread = warmup.start(warm)
+        assert warmup.start(warm) is thread
+        assert thread.daemon
+        release.set()
+        thread.join(5)
+
+        assert calls == ["warm"]
+        assert warmup.level == PARAMETERS
+
+    def test__failed_warmup_is_never_ready(self, config, events):
+        config["app.warmup.ready_level"] = "cold"
+        warmup = Warmup()
+
+        def warm():
+            raise RuntimeError("no memory")
+
+        warmup.start(warm).join(5)
+
+        assert not warmup.ready()
+        status = warmup.status()
+        assert status["status"] == "failed"
+        assert status["error"] == "RuntimeError: no memory"
+        assert events[-1][0] == "warmup_failed"
+
+
+class TestReadinessCheck:
+    def test__ready_api_answers_ok(self, client):
+        response = client.get("/readiness_check")
+
+        assert response.status_code == 200
+        assert response.text == "OK"
+
+    def test__cold_api_reports_progress(self, client, monkeypatch):
+        monkeypatch.setattr(warmup_module.WARMUP, "level", COLD)
+
+        response = client.get("/readiness_check")
+
+        assert response.status_code == 503
+        status = response.get_json()
+        assert status["status"] == "warming"
+        assert status["warm_level"] == COLD
+        assert status["ready_level"] == SYSTEMS
+
+
+class TestReplayCorpus:
+    def test__bundled_us_corpus_is_the_customer_households(self):
+        from tests.data.customer_households import (
+            amplifi_household,
+            amplifi_household_2025,
+            impactica_household,
+            my_friend_ben_household,
+        )
+
+        assert list(warmup_module.load_corpus("us").values()) == [
+            amplifi_household,
+            amplifi_household_2025,
+            impactica_household,
+            my_friend_ben_household,
+        ]
+
+    def test__every_served_country_has_a_corpus(self):
+        from policyengine_household_api.country import COUNTRIES
+
+        for country_id in COUNTRIES:
+            assert warmup_module.load_corpus(country_id), country_id
+
+    def test__replays_households_past_the_demo_rate_limit(
+        self, tmp_path, monkeypatch, events
+    ):
+        from policyengine_household_api.api import app
+
+        monkeypatch.setattr(warmup_module, "WARMUP", Warmup())
+        household = warmup_module.load_corpus("uk")["universal_credit"]
+        (tmp_path / "uk.json").write_text(
+            json.dumps({"first": household, "second": household})
+        )
+
+        latencies = warmup_module.replay_corpus(app, tmp_path)
+
+        assert list(latencies) == ["uk"]
+        assert list(latencies["uk"]) == ["first", "second"]
+        assert warmup_module.WARMUP.level == HOUSEHOLDS
+        assert warmup_module.WARMUP.countries == {"uk": HOUSEHOLDS}
+        fields = dict(events)["warmup_corpus"]
+        assert fields["households"] == 2
+        assert fields["failed"] == 0
+
+    def test__failed_households_leave_the_country_unmarked(
+        self, tmp_path, monkeypatch, events
+    ):
+        from policyengine_household_api.api import app
+
+        monkeypatch.setattr(warmup_module, "WARMUP", Warmup())
+        (tmp_path / "uk.json").write_text(
+            json.dumps({"broken": {"people": {"you": {"no_such": {}}}}})
+        )
+
+        warmup_module.replay_corpus(app, tmp_path)
+
+        assert warmup_module.WARMUP.countries == {}
+        assert dict(events)["warmup_corpus"]["failed"] == 1
+
+    def test__disabled_corpus_is_not_replayed(self, config):
+        config["app.warmup.corpus"] = "false"
+
+        assert warmup_module.replay_corpus(object()) == {}
@@ -0,0 +1,230 @@
+"""Differential tests for the engine-side YEAR-input path.
+
+``_calculate`` takes YEAR-keyed inputs on MONTH-defined variables out of
+the situation and sets their months on the built simulation
+(``_split_year_inputs`` / ``_set_spread_year_inputs``) instead of
+writing the months into the situation (``_normalize_period_keys``).
+Every case here builds one simulation each way and requires identical
+engine state: the same inputs, byte for byte, and the same results.
+The period maps are the ``test_normalize_period_keys`` cases.
+"""
+
+import copy
+
+import pytest
+
+from policyengine_household_api.country import (
+    COUNTRIES,
+    _normalize_period_keys,
+    _split_year_inputs,
+)
+
+
+def _us_household(spm_unit: dict, person: dict | None = None) -> dict:
+    return {
+        "people": {
+            "person_1": {"age": {"2026": 34}, "rent": {"2026": 10800}},
+            "person_2": {"age": {"2026": 8}},
+        }
+        | ({"person_1": person} if person else {}),
+        "tax_units": {"tax_unit_1": {"members": ["person_1", "person_2"]}},
+        "spm_units": {
+            "spm_unit_1": {
+                "members": ["person_1", "person_2"],
+                "snap": {"2026": None, "2026-06": None},
+                "snap_assets": {"2026": 0},
+                **spm_unit,
+            }
+        },
+        "households": {
+            "household_1": {
+                "members": ["person_1", "person_2"],
+                "state_name": {"2026": "WA"},
+            }
+        },
+        "families": {"family_1": {"members": ["person_1", "person_2"]}},
+        "marital_units": {"marital_unit_1": {"members": ["person_1"]}},
+    }
+
+
+def _two_spm_units(first: dict, second: dict) -> dict:
+    # Entities sharing a variable with different explicit months: the
+    # month arrays must keep each entity's own spread.
+    household = _us_household(first)
+    household["people"]["person_3"] = {"age": {"2026": 40}}
+    household["tax_units"]["tax_unit_2"] = {"members": ["person_3"]}
+    household["spm_units"]["spm_unit_2"] = {"members": ["person_3"], **second}
+    household["households"]["household_1"]["members"].append("person_3")
+    household["families"]["family_1"]["members"].append("person_3")
+    household["marital_units"]["marital_unit_2"] = {"members": ["person_3"]}
+    return household
+
+
+_TWELVE_MONTHS = {f"2026-{month:02d}": 100 for month in range(1, 13)}
+
+US_CASES = {
+    "year_only": _us_household({"snap_earned_income": {"2026": 31932}}),
+    "year_plus_partial_months": _us_household(
+        {"snap_earned_income": {"2026": 1200, "2026-06": 600}}
+    ),
+    "year_plus_months_summing_to_year": _us_household(
+        {
+            "snap_earned_income": {
+                "2026": 600,
+                "2026-01": 300,
+                "2026-02": 300,
+            }
+        }
+    ),
+    "year_plus_all_twelve_months": _us_household(
+        {"snap_earned_income": {"2026": 1200, **_TWELVE_MONTHS}}
+    ),
+    "monthly_only": _us_household({"snap_earned_income": {"2026-01": 3000}}),
+    "negative_year_only": _us_household(
+        {"snap_earned_income": {"2026": -1200}}
+    ),
+    "year_input_with_month_output": _us_household(
+        {"snap_earned_income": {"2026": 1200, "2026-03": None}}
+    ),
+    "two_years": _us_household(
+        {"snap_earned_income": {"2025": 2400, "2026": 1200, "2026-06": 50}}
+    ),
+    "boolean_true": _us_household({}, {"is_incarcerated": {"2026": True}}),
+    "boolean_false_with_month_override": _us_household(
+        {}, {"is_incarcerated": {"2026": False, "2026-06": True}}
+    ),
+    "enum_year": _us_household(
+        {"snap_utility_allowance_type": {"2026": "SUA"}}
+    ),
+    "enum_year_with_month_output": _us_household(
+        {"snap_utility_allowance_type": {"2026": "SUA", "2026-06": None}}
+    ),
+    "enum_year_with_month_override": _us_household(
+        {"snap_utility_allowance_type": {"2026": "SUA", "2026-06": "LUA"}}
+    ),
+    "entities_with_different_explicit_months": _two_spm_units(
+        {"snap_earned_income": {"2026": 1200, "2026-06": 600}},
+        {"snap_earned_income": {"2026": 2400, "2026-02": 0, "2026-09": 10}},
+    ),
+    "one_entity_explicit_month_only": _two_spm_units(
+        {"snap_earned_income": {"2026": 1200}},
+        {"snap_earned_income": {"2026-06": 600}},
+    ),
+    "year_defined_variables_only": _us_household(
+        {}, {"employment_income": {"2026": 31932}}
+    ),
+}
+
+UK_HOUSEHOLD = {
+    "people": {
+        "person": {
+            "age": {"2026": 30},
+            "employment_income": {"2026": 30_000},
+        }
+    },
+    "benunits": {"benunit": {"members": ["person"]}},
+    "households": {
+        "household": {
+            "members": ["person"],
+            "monthly_domestic_energy_consumption": {
+                "2026": 1200,
+                "2026-01": 300,
+            },
+        }
+    },
+}
+UK_REFORM = {
+    "gov.hmrc.income_tax.allowances.personal_allowance.amount": {
+        "2026-01-01.2100-12-31": 15_000
+    }
+}
+
+
+def _engine_state(simulation) -> dict:
+    """Every stored input and calculated array, as raw bytes where the
+    array holds numbers."""
+    state = {}
+    for variable_name in simulation.tax_benefit_system.variables:
+        holder = simulation.get_holder(variable_name)
+        for period in holder.get_known_periods():
+            array = holder.get_array(period)
+            state[(variable_name, str(period))] = (
+                str(array.dtype),
+                # Object (string) arrays hold pointers; compare values.
+                array.tolist() if array.dtype == object else array.tobytes(),
+            )
+    return state
+
+
+def _both_ways(country, household, reform=None):
+    system = country.tax_benefit_system
+    reform = country._cast_reform_values(reform)
+    _, written_out = country._build_simulation(
+        _normalize_period_keys(household, system), reform
+    )
+    situation, spread = _split_year_inputs(household, system)
+    _, native = country._build_simulation(situation, reform, spread)
+    return written_out, native
+
+
+def _assert_identical(written_out, native, outputs):
+    assert _engine_state(native) == _engine_state(written_out)
+    assert set(native.input_variables) == set(written_out.input_variables)
+    for variable_name, period in outputs:
+        assert (
+            native.calculate(variable_name, period).tobytes()
+            == written_out.calculate(variable_name, period).tobytes()
+        )
+    assert _engine_state(native) == _engine_state(written_out)
+
+
+class TestYearInputsMatchTheNormalizer:
+    @pytest.mark.parametrize("name", list(US_CASES))
+    def test_us_engine_state_is_identical(self, name):
+        household = copy.deepcopy(US_CASES[name])
+
+        written_out, native = _both_ways(COUNTRIES["us"], household)
+
+        _assert_identical(
+            written_out,
+            native,
+            [("snap", "2026"), ("snap", "2026-06"), ("income_tax", "2026")],
+        )
+        assert household == US_CASES[name]
+
+    def test_uk_engine_state_is_identical_under_a_reform(self):
+        written_out, native = _both_ways(
+            COUNTRIES["uk"], UK_HOUSEHOLD, UK_REFORM
+        )
+
+        _assert_identical(
+            written_out,
+            native,
+            [
+                ("monthly_domestic_energy_consumption", "2026-01"),
+                ("monthly_domestic_energy_consumption", "2026-02"),
+                ("household_net_income", "2026"),
+            ],
+        )
+        assert _engine_state(native.baseline) == _engine_state(
+            written_out.baseline
+        )
+
+    def test_situation_keeps_only_the_partners_own_month_keys(self):
+        household = US_CASES["year_plus_partial_months"]
+
+        situation, spread = _split_year_inputs(
+            household, COUNTRIES["us"].tax_benefit_system
+        )
+
+        assert situation["spm_units"]["spm_unit_1"]["snap_earned_income"] == {
+            "2026-06": 600
+        }
+        assert len(spread) == 11
+        assert spread[("spm_units", "snap_earned_income", "2026-01")] == {
+            "spm_unit_1": pytest.approx(600 / 11)
+        }
+        assert household["spm_units"]["spm_unit_1"]["snap_earned_income"] == {
+            "2026": 1200,
+            "2026-06": 600,
+        }
@@ -53,8 +53,8 @@ class TestDropDeprecatedInputs:
         result = drop_deprecated_inputs(household)
 
         assert result.warnings == []
-        assert result.household == household
-        assert result.household is not household
+        # Nothing to drop, so the request household is returned as is.
+        assert result.household is household
         assert household == original
 
     def test__deprecated_variable_on_multiple_people__warns_each(self):
@@ -0,0 +1,46 @@
+import copy
+
+from policyengine_household_common.household_copy import (
+    CopyOnWriteHousehold,
+)
+
+HOUSEHOLD = {
+    "people": {
+        "you": {"age": {"2026": 40}, "employment_income": {"2026": 1}},
+        "partner": {"age": {"2026": 38}},
+    },
+    "tax_units": {"tax_unit": {"members": ["you", "partner"]}},
+}
+
+
+class TestCopyOnWriteHousehold:
+    def test__unwritten_household_is_the_source(self):
+        household = CopyOnWriteHousehold(HOUSEHOLD)
+
+        assert household.household is HOUSEHOLD
+
+    def test__writes_copy_only_the_written_path(self):
+        source = copy.deepcopy(HOUSEHOLD)
+        household = CopyOnWriteHousehold(source)
+
+        household.writable("people", "you", "age")["2026"] = 41
+
+        assert source == HOUSEHOLD
+        assert household.household["people"]["you"]["age"] == {"2026": 41}
+        people = household.household["people"]
+        assert (
+            people["you"]["employment_income"]
+            is (source["people"]["you"]["employment_income"])
+        )
+        assert people["partner"] is source["people"]["partner"]
+        assert household.household["tax_units"] is source["tax_units"]
+
+    def test__each_container_is_copied_once(self):
+        household = CopyOnWriteHousehold(HOUSEHOLD)
+
+        first = household.writable("people", "you", "age")
+        first["2027"] = 42
+        second = household.writable("people", "you", "age")
+
+        assert second is first
+        assert household.writable("people") is household.household["people"]
@@ -0,0 +1,63 @@
+from policyengine_household_api.utils.lru_cache import BoundedLRUCache
+
+
+class TestBoundedLRUCache:
+    def test__evicts_least_recently_used_entry_over_entry_bound(self):
+        cache = BoundedLRUCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+
+        evicted = cache.put("c", 3)
+
+        assert evicted == 1
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+
+    def test__evicts_until_under_byte_bound(self):
+        cache = BoundedLRUCache(max_entries=10, max_bytes=10, sizeof=len)
+        cache.put("a", b"1234")
+        cache.put("b", b"1234")
+
+        evicted = cache.put("c", b"12345678")
+
+        assert evicted == 2
+        assert len(cache) == 1
+        assert cache.total_bytes == 8
+
+    def test__never_stores_value_larger_than_byte_bound(self):
+        cache = BoundedLRUCache(max_entries=10, max_bytes=4, sizeof=len)
+
+        assert cache.put("a", b"12345") == 0
+        assert "a" not in cache
+        assert cache.total_bytes == 0
+
+    def test__replacing_a_key_updates_its_size(self):
+        cache = BoundedLRUCache(max_entries=10, max_bytes=10, sizeof=len)
+        cache.put("a", b"12345678")
+        cache.put("a", b"12")
+
+        assert cache.total_bytes == 2
+        assert cache.get("a") == b"12"
+
+    def test__pop_and_clear_release_bytes(self):
+        cache = BoundedLRUCache(max_entries=10, max_bytes=10, sizeof=len)
+        cache.put("a", b"12")
+        cache.put("b", b"34")
+
+        assert cache.pop("a") == b"12"
+        assert cache.total_bytes == 2
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.total_bytes == 0
+
+    def test__evict_while_stops_at_first_kept_entry(self):
+        cache = BoundedLRUCache(max_entries=10, max_bytes=10, sizeof=len)
+        cache.put("a", b"1")
+        cache.put("b", b"123")
+        cache.put("c", b"1")
+
+        assert cache.evict_while(lambda value: len(value) == 1) == ["a"]
+        assert list(cache.evict_while(lambda value: True)) == ["b", "c"]
+        assert cache.total_bytes == 0